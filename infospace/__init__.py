@@ -10,14 +10,60 @@ Core concepts:
 - Transformations between spaces
 - Contact points for energy transitions
 - Structure analysis and clustering
+
+Submodules and top-level names are loaded on first access, so
+``import infospace`` itself does not import NumPy or any subsystem.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 __author__ = "Information Speed Theory Research"
 
-from .core.space import InformationSpace, EMSpace, GravitationalSpace, HypotheticalSpace
-from .core.energy import Energy
-from .core.constants import SPEED_OF_LIGHT, PLANCK_CONSTANT, PLANCK_LENGTH
+# Top-level name -> module that defines it
+_LAZY_ATTRIBUTES = {
+    'InformationSpace': '.core.space',
+    'EMSpace': '.core.space',
+    'GravitationalSpace': '.core.space',
+    'HypotheticalSpace': '.core.space',
+    'Energy': '.core.energy',
+    'EnergyArray': '.core.energy',
+    'SPEED_OF_LIGHT': '.core.constants',
+    'PLANCK_CONSTANT': '.core.constants',
+    'PLANCK_LENGTH': '.core.constants',
+}
+
+# Subpackages imported on attribute access (infospace.transforms, ...)
+_SUBPACKAGES = (
+    'core',
+    'transforms',
+    'interactions',
+    'simulation',
+    'analysis',
+    'optimize',
+    'benchmarks',
+)
+
+if TYPE_CHECKING:
+    from .core.space import InformationSpace, EMSpace, GravitationalSpace, HypotheticalSpace
+    from .core.energy import Energy, EnergyArray
+    from .core.constants import SPEED_OF_LIGHT, PLANCK_CONSTANT, PLANCK_LENGTH
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_SUBPACKAGES))
+
 
 __all__ = [
     'InformationSpace',
@@ -25,6 +71,7 @@ __all__ = [
     'GravitationalSpace',
     'HypotheticalSpace',
     'Energy',
+    'EnergyArray',
     'SPEED_OF_LIGHT',
     'PLANCK_CONSTANT',
     'PLANCK_LENGTH',
@@ -0,0 +1,29 @@
+"""
+FFT backend shared by the grid solvers.
+
+Uses scipy.fft with a worker pool when SciPy is installed (the [scipy]
+extra) and falls back to single-threaded numpy.fft otherwise.
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+try:
+    import scipy.fft as _scipy_fft
+except ImportError:  # pragma: no cover - depends on the environment
+    _scipy_fft = None
+
+
+def rfftn(a: np.ndarray, workers: Optional[int] = None) -> np.ndarray:
+    """Real n-dimensional FFT; workers=None uses all cores with SciPy."""
+    if _scipy_fft is not None:
+        return _scipy_fft.rfftn(a, workers=workers if workers is not None else -1)
+    return np.fft.rfftn(a)
+
+
+def irfftn(a: np.ndarray, shape: Sequence[int], workers: Optional[int] = None) -> np.ndarray:
+    """Inverse of rfftn for a real array of the given shape."""
+    if _scipy_fft is not None:
+        return _scipy_fft.irfftn(a, s=shape, workers=workers if workers is not None else -1)
+    return np.fft.irfftn(a, s=shape, axes=tuple(range(-len(shape), 0)))
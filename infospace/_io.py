@@ -0,0 +1,44 @@
+"""
+Atomic file writes shared by the checkpointing and snapshot code.
+
+Each helper writes to a temporary file next to the target and renames it
+into place, so readers and resumed runs never see a partially written file.
+Checkpoints that span several files key each file by its step and prune
+older ones with remove_stale once the state file points past them.
+"""
+
+import glob
+import os
+
+import numpy as np
+
+
+def atomic_save(path: str, array: np.ndarray) -> None:
+    """Write one array as .npy atomically."""
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        np.save(f, array)
+    os.replace(tmp, path)
+
+
+def atomic_savez(path: str, **arrays) -> None:
+    """Write named arrays as .npz atomically."""
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)
+
+
+def atomic_write_text(path: str, text: str) -> None:
+    """Write a text file atomically."""
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def remove_stale(directory: str, pattern: str, keep: str) -> None:
+    """Remove files in directory matching a glob pattern, except keep."""
+    for path in glob.glob(os.path.join(directory, pattern)):
+        if os.path.basename(path) != keep:
+            os.remove(path)
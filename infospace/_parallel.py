@@ -0,0 +1,69 @@
+"""
+Process-pool helpers shared by the sweep, analysis and optimization code.
+
+Keeps worker-count resolution and seeding in one place so every parallel
+path is deterministic regardless of how many workers run.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional
+
+import numpy as np
+
+
+def resolve_workers(n_workers: Optional[int]) -> int:
+    """
+    Resolve a worker-count argument.
+    
+    Args:
+        n_workers: None for all cores, 0 or 1 to run in-process
+    
+    Returns:
+        Number of worker processes (0 means in-process)
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if n_workers < 0:
+        raise ValueError("n_workers must be non-negative")
+    return 0 if n_workers <= 1 else n_workers
+
+
+def make_executor(n_workers: Optional[int]) -> Optional[ProcessPoolExecutor]:
+    """Create a process pool, or None when work should run in-process."""
+    n_workers = resolve_workers(n_workers)
+    return ProcessPoolExecutor(max_workers=n_workers) if n_workers else None
+
+
+def parallel_map(func: Callable, tasks: Iterable, n_workers: Optional[int] = None) -> List:
+    """
+    Map a picklable function over tasks, preserving order.
+    
+    Args:
+        func: Module-level function taking one task
+        tasks: Task arguments
+        n_workers: Worker processes (None for all cores, 0/1 in-process)
+    
+    Returns:
+        Results in task order
+    """
+    tasks = list(tasks)
+    executor = make_executor(min(resolve_workers(n_workers), len(tasks)))
+    if executor is None:
+        return [func(task) for task in tasks]
+    with executor:
+        return list(executor.map(func, tasks))
+
+
+def child_seeds(seed: Optional[int], n: int) -> List[np.random.SeedSequence]:
+    """Independent child seed sequences of a root seed, one per task."""
+    return np.random.SeedSequence(seed).spawn(n)
+
+
+def stream_rng(seed: int, *key: int) -> np.random.Generator:
+    """
+    Generator for the stream identified by key under a root seed.
+    
+    The stream depends only on (seed, key), never on scheduling.
+    """
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=key))
@@ -0,0 +1,16 @@
+"""
+Sparse-matrix backend shared by the contact-point kinetics and Hamiltonian.
+
+SciPy is optional (the [scipy] extra); sparse paths import it on first use
+and fail with an install hint when it is missing.
+"""
+
+
+def scipy_sparse():
+    """Import scipy.sparse and scipy.sparse.linalg, or explain how to install SciPy."""
+    try:
+        import scipy.sparse
+        import scipy.sparse.linalg
+    except ImportError:  # pragma: no cover - depends on the environment
+        raise ImportError("Sparse solvers require SciPy; install infospace[scipy]") from None
+    return scipy.sparse
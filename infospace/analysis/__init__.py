@@ -0,0 +1,39 @@
+"""
+Analysis of observational data against the theory's protocols.
+
+Includes the CMB angular correlation estimator (Protocol 2), the quasar
+Δc/c trend analysis (Protocol 3), the multi-messenger precursor
+coincidence engine (Protocol 4), the GRB vacuum-dispersion fitter
+(Protocol 5) and Bayesian inference of the LHC threshold model (Protocol 1).
+"""
+
+from .coincidence import (
+    EventList, CoincidenceEngine, angular_separation, predicted_delay, delay_window,
+)
+from .cmb import AngularCorrelation, horizon_angle, super_horizon_report
+from .dispersion import (
+    PhotonList, BurstCatalog, DispersionFitter, to_joules, from_joules,
+)
+from .quasar import AbsorberCatalog, ManyMultipletFitter, RedshiftTrend
+from .inference import MissingEnergyLikelihood, EnsembleSampler
+
+__all__ = [
+    'EventList',
+    'CoincidenceEngine',
+    'angular_separation',
+    'predicted_delay',
+    'delay_window',
+    'AngularCorrelation',
+    'horizon_angle',
+    'super_horizon_report',
+    'PhotonList',
+    'BurstCatalog',
+    'DispersionFitter',
+    'to_joules',
+    'from_joules',
+    'AbsorberCatalog',
+    'ManyMultipletFitter',
+    'RedshiftTrend',
+    'MissingEnergyLikelihood',
+    'EnsembleSampler',
+]
@@ -0,0 +1,77 @@
+"""
+Column-store helpers for large event catalogs.
+
+A catalog is a directory with one .npy file per column, an offsets.npy
+giving each record's [start, stop) rows and a meta.json with per-record
+metadata. Columns open as read-only memory maps, so a catalog of any size
+is never loaded into RAM as a whole.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+OFFSETS = 'offsets.npy'
+META = 'meta.json'
+
+
+def write_columns(directory: str, records: Sequence[Mapping[str, np.ndarray]],
+                  columns: Sequence[str], meta: Sequence[Dict[str, Any]]) -> None:
+    """
+    Write records as concatenated .npy columns.
+    
+    Columns are preallocated with open_memmap and filled one record at a
+    time, so records may themselves be memory maps.
+    
+    Args:
+        directory: Output directory (created if missing)
+        records: Per-record column name -> 1-D array
+        columns: Column names to write (all records must provide them)
+        meta: Per-record JSON-serializable metadata
+    """
+    if len(records) != len(meta):
+        raise ValueError("Need one metadata entry per record")
+    os.makedirs(directory, exist_ok=True)
+    
+    sizes = [len(record[columns[0]]) for record in records]
+    offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+    
+    for name in columns:
+        out = np.lib.format.open_memmap(os.path.join(directory, f'{name}.npy'), mode='w+',
+                                        dtype=np.float64, shape=(int(offsets[-1]),))
+        for record, start, stop in zip(records, offsets[:-1], offsets[1:]):
+            values = np.asarray(record[name], dtype=np.float64)
+            if values.shape != (stop - start,):
+                raise ValueError(f"Column {name!r} must match the record length")
+            out[start:stop] = values
+        out.flush()
+        del out
+    
+    np.save(os.path.join(directory, OFFSETS), offsets)
+    with open(os.path.join(directory, META), 'w') as f:
+        json.dump(list(meta), f, indent=2)
+
+
+def read_layout(directory: str) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+    """Record offsets and metadata of a catalog."""
+    offsets = np.load(os.path.join(directory, OFFSETS))
+    with open(os.path.join(directory, META)) as f:
+        meta = json.load(f)
+    return offsets, meta
+
+
+def open_column(directory: str, name: str) -> Optional[np.ndarray]:
+    """Memory-map one column read-only, or None if the catalog lacks it."""
+    path = os.path.join(directory, f'{name}.npy')
+    if not os.path.exists(path):
+        return None
+    return np.load(path, mmap_mode='r')
+
+
+def chunk_ranges(n: int, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    """Consecutive [start, stop) ranges of at most chunk_size covering n rows."""
+    for start in range(0, n, max(1, chunk_size)):
+        yield start, min(start + chunk_size, n)
@@ -0,0 +1,277 @@
+"""
+CMB angular correlation C(θ) and super-horizon power (Protocol 2).
+
+    C(θ) = Σ w_i w_j T_i T_j / Σ w_i w_j   over pixel pairs at separation θ
+
+Pixels are first aggregated into an equal-area grid of cells (equal bands
+in z = cos θ, equal steps in φ), in chunks, so a map of any size costs
+O(N) to read and O(cells) memory. Pair sums then run over cells in row
+blocks sized by a memory cap, spread over a process pool.
+
+This is an approximation, not an exact pair count: every pixel pair is
+binned at the separation of its cells' weighted centres, and pairs inside
+one cell are dropped. The estimator is therefore only accurate for bins
+at least one cell wide, and narrower bins are rejected. The wide bins
+that Protocol 2 looks at (θ > 60°) are far above the default resolution
+of about 1.1°.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .._parallel import parallel_map, resolve_workers
+from ..core.constants import SPEED_OF_LIGHT
+
+
+# Protocol 2 looks for correlations beyond the light horizon
+SUPER_HORIZON_DEG = 60.0
+
+# Angular horizon of the light channel at last scattering in standard
+# cosmology, θ_horizon ≈ 1° (Protocol 2, bg/final/ЕксперименталниПротоколи.md).
+# horizon_angle scales it linearly with Vmax/c.
+LIGHT_HORIZON_DEG = 1.0
+
+
+def horizon_angle(vmax: float, light_horizon: float = LIGHT_HORIZON_DEG) -> float:
+    """
+    Angular horizon of a channel with maximum speed vmax.
+    
+    θ_h = light_horizon × Vmax/c: a channel that is k times faster than
+    light causally connects regions k times wider at last scattering.
+    
+    Args:
+        vmax: Maximum speed (m/s)
+        light_horizon: Horizon of the light channel (degrees); the default
+            is the standard-cosmology value θ_horizon ≈ 1° of Protocol 2
+    
+    Returns:
+        Horizon angle (degrees), capped at 180
+    """
+    return float(min(180.0, light_horizon * vmax / SPEED_OF_LIGHT))
+
+
+def _unit_vectors(lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+    lon, lat = np.radians(lon), np.radians(lat)
+    cos_lat = np.cos(lat)
+    return np.stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def _count_block(task: Tuple) -> Tuple[np.ndarray, np.ndarray]:
+    """Binned pair sums for cell rows [start, stop); runs in worker processes."""
+    directions, values, weights, cos_edges, start, stop = task
+    n_bins = len(cos_edges) - 1
+    
+    cos_sep = np.clip(directions[start:stop] @ directions.T, -1.0, 1.0)
+    # cos_edges decrease, so bin k holds cos_edges[k] > cos >= cos_edges[k+1]
+    index = np.searchsorted(-cos_edges, -cos_sep, side='left') - 1
+    index[cos_sep == cos_edges[0]] = 0
+    rows = np.arange(stop - start)
+    index[rows, rows + start] = -1  # a cell is not paired with itself
+    
+    valid = (index >= 0) & (index < n_bins)
+    numerator = np.bincount(index[valid],
+                            weights=np.outer(values[start:stop], values)[valid],
+                            minlength=n_bins)
+    denominator = np.bincount(index[valid],
+                              weights=np.outer(weights[start:stop], weights)[valid],
+                              minlength=n_bins)
+    return numerator, denominator
+
+
+class AngularCorrelation:
+    """
+    Streaming estimator of the angular correlation function C(θ).
+    
+    Feed the map with `accumulate` (any number of calls, e.g. one per file
+    or chunk), then call `compute`.
+    
+    The resolution is one grid cell (`cell_size`, about 143°/n_rings).
+    Pairs are binned at cell-centre separations and pairs within a cell
+    are dropped, so every bin must be at least one cell wide.
+    """
+    
+    def __init__(self,
+                 bins: Sequence[float] = np.linspace(0.0, 180.0, 37),
+                 n_rings: int = 128,
+                 chunk_size: int = 1_000_000,
+                 memory_limit: int = 256 * 2**20,
+                 n_workers: Optional[int] = None):
+        """
+        Initialize the estimator.
+        
+        Args:
+            bins: Increasing θ bin edges (degrees) within [0, 180], each
+                bin at least cell_size wide
+            n_rings: Equal-area bands in z; the grid has 2 n_rings² cells
+            chunk_size: Pixels aggregated per step
+            memory_limit: Approximate bytes per pair-counting block
+            n_workers: Worker processes (None for all cores, 0/1 in-process)
+        """
+        bins = np.asarray(bins, dtype=float)
+        if bins.ndim != 1 or len(bins) < 2 or np.any(np.diff(bins) <= 0):
+            raise ValueError("bins must be an increasing sequence of at least two edges")
+        if bins[0] < 0 or bins[-1] > 180:
+            raise ValueError("bin edges must lie within [0, 180] degrees")
+        if n_rings < 1 or chunk_size < 1:
+            raise ValueError("n_rings and chunk_size must be positive")
+        
+        self.bins = bins
+        self.n_rings = n_rings
+        self.n_phi = 2 * n_rings
+        self.chunk_size = chunk_size
+        self.memory_limit = memory_limit
+        self.n_workers = resolve_workers(n_workers)
+        
+        n_cells = n_rings * self.n_phi
+        self._sum_w = np.zeros(n_cells)
+        self._sum_wt = np.zeros(n_cells)
+        self._sum_wdir = np.zeros((n_cells, 3))
+        self.n_pixels = 0
+        
+        if np.min(np.diff(bins)) < self.cell_size:
+            raise ValueError(f"bins narrower than the {self.cell_size:.3g}° cell size are not "
+                             "resolved; widen the bins or increase n_rings")
+    
+    @property
+    def cell_size(self) -> float:
+        """Typical cell width (degrees)."""
+        return float(np.degrees(np.sqrt(4 * np.pi / len(self._sum_w))))
+    
+    def _cells(self, directions: np.ndarray) -> np.ndarray:
+        ring = np.minimum(((directions[:, 2] + 1.0) * 0.5 * self.n_rings).astype(np.int64),
+                          self.n_rings - 1)
+        phi = np.arctan2(directions[:, 1], directions[:, 0]) % (2 * np.pi)
+        column = np.minimum((phi * self.n_phi / (2 * np.pi)).astype(np.int64), self.n_phi - 1)
+        return ring * self.n_phi + column
+    
+    def accumulate(self, values: np.ndarray, lon: np.ndarray, lat: np.ndarray,
+                   weights: Optional[np.ndarray] = None) -> None:
+        """
+        Add pixels to the map.
+        
+        Args:
+            values: Pixel temperatures (any unit; ΔT/T is typical)
+            lon: Pixel longitudes (degrees)
+            lat: Pixel latitudes (degrees)
+            weights: Pixel weights, e.g. a mask (default 1)
+        """
+        values = np.asarray(values, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        lat = np.asarray(lat, dtype=float)
+        if weights is None:
+            weights = np.ones_like(values)
+        weights = np.asarray(weights, dtype=float)
+        if not values.shape == lon.shape == lat.shape == weights.shape or values.ndim != 1:
+            raise ValueError("values, lon, lat and weights must be 1-D arrays of equal length")
+        
+        n_cells = len(self._sum_w)
+        for start in range(0, len(values), self.chunk_size):
+            part = slice(start, start + self.chunk_size)
+            directions = _unit_vectors(lon[part], lat[part])
+            cells = self._cells(directions)
+            w = weights[part]
+            self._sum_w += np.bincount(cells, weights=w, minlength=n_cells)
+            self._sum_wt += np.bincount(cells, weights=w * values[part], minlength=n_cells)
+            for axis in range(3):
+                self._sum_wdir[:, axis] += np.bincount(cells, weights=w * directions[:, axis],
+                                                       minlength=n_cells)
+        self.n_pixels += len(values)
+    
+    def compute(self, remove_monopole: bool = True) -> Dict[str, np.ndarray]:
+        """
+        Evaluate C(θ) from the accumulated map.
+        
+        Separations are resolved to one cell (see the class docstring).
+        
+        Args:
+            remove_monopole: Subtract the weighted mean temperature first
+        
+        Returns:
+            Dictionary with bin 'edges', bin centers 'theta' (degrees),
+            'correlation' (NaN for empty bins) and pair 'weight' per bin
+        """
+        occupied = self._sum_w > 0
+        if np.count_nonzero(occupied) < 2:
+            raise ValueError("Need pixels in at least two cells")
+        
+        weights = self._sum_w[occupied]
+        temperatures = self._sum_wt[occupied] / weights
+        if remove_monopole:
+            temperatures = temperatures - np.sum(self._sum_wt) / np.sum(self._sum_w)
+        directions = self._sum_wdir[occupied]
+        directions = directions / np.linalg.norm(directions, axis=1, keepdims=True)
+        values = weights * temperatures
+        
+        cos_edges = np.cos(np.radians(self.bins))
+        n = len(weights)
+        # Each block holds a few (rows, n) float64 temporaries
+        rows = max(1, int(self.memory_limit // (32 * n)))
+        tasks = [(directions, values, weights, cos_edges, start, min(start + rows, n))
+                 for start in range(0, n, rows)]
+        
+        numerator = np.zeros(len(self.bins) - 1)
+        denominator = np.zeros(len(self.bins) - 1)
+        for num, den in parallel_map(_count_block, tasks, self.n_workers):
+            numerator += num
+            denominator += den
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            correlation = np.where(denominator > 0, numerator / denominator, np.nan)
+        return {
+            'edges': self.bins,
+            'theta': 0.5 * (self.bins[:-1] + self.bins[1:]),
+            'correlation': correlation,
+            'weight': denominator,
+        }
+    
+    def __repr__(self) -> str:
+        return (f"AngularCorrelation(bins={len(self.bins) - 1}, cells={len(self._sum_w)}, "
+                f"pixels={self.n_pixels})")
+
+
+def super_horizon_report(theta: np.ndarray, correlation: np.ndarray,
+                         spaces: Sequence['InformationSpace'],
+                         threshold: float = SUPER_HORIZON_DEG,
+                         light_horizon: float = LIGHT_HORIZON_DEG) -> List[Dict[str, object]]:
+    """
+    Compare super-horizon power with the horizon each space predicts.
+    
+    Power is the mean C(θ)² over the bins considered. A space with
+    horizon θ_h > threshold predicts non-zero correlation in
+    threshold < θ <= θ_h and none beyond θ_h.
+    
+    Args:
+        theta: Bin centers (degrees)
+        correlation: C(θ) per bin
+        spaces: Candidate spaces (e.g. HypotheticalSpace instances)
+        threshold: Light horizon of Protocol 2 (degrees)
+        light_horizon: Horizon of the light channel (degrees)
+    
+    Returns:
+        One dictionary per space with its Vmax/c, horizon, whether it
+        predicts super-horizon correlation, and the power inside
+        ('predicted_power') and beyond ('excluded_power') its horizon
+    """
+    theta = np.asarray(theta, dtype=float)
+    power = np.asarray(correlation, dtype=float) ** 2
+    finite = np.isfinite(power)
+    
+    def mean_power(mask: np.ndarray) -> float:
+        mask = mask & finite
+        return float(power[mask].mean()) if np.any(mask) else float('nan')
+    
+    super_horizon = theta > threshold
+    report = []
+    for space in spaces:
+        horizon = horizon_angle(space.Vmax, light_horizon)
+        report.append({
+            'name': space.name,
+            'vmax_ratio': space.Vmax / SPEED_OF_LIGHT,
+            'horizon_deg': horizon,
+            'predicts_super_horizon': horizon > threshold,
+            'super_horizon_power': mean_power(super_horizon),
+            'predicted_power': mean_power(super_horizon & (theta <= horizon)),
+            'excluded_power': mean_power(super_horizon & (theta > horizon)),
+        })
+    return report
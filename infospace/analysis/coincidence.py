@@ -0,0 +1,321 @@
+"""
+Multi-messenger precursor coincidences (Protocol 4).
+
+A channel faster than light (Vmax_X > c) delivers its signal from a source
+at distance D ahead of the EM counterpart by
+
+    Δt = t_EM - t_precursor = D (1/c - 1/Vmax_X)
+
+The engine pairs precursor events (GW, neutrino) with later trigger events
+(EM) whose delay falls inside a Vmax-dependent window. Both lists are kept
+sorted by time, so each precursor's partners are one searchsorted interval
+and the whole search costs O(N log N + pairs) instead of O(N²).
+"""
+
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..core.constants import SPEED_OF_LIGHT
+
+
+ArrayLike = Union[float, np.ndarray]
+
+
+class EventList:
+    """
+    Time-sorted detector events stored as parallel arrays.
+    
+    Events are reordered by time on construction; `index` maps each sorted
+    event back to its position in the input arrays.
+    """
+    
+    def __init__(self,
+                 times: np.ndarray,
+                 ra: Optional[np.ndarray] = None,
+                 dec: Optional[np.ndarray] = None,
+                 energies: Optional[np.ndarray] = None,
+                 name: str = ''):
+        """
+        Initialize an event list.
+        
+        Args:
+            times: Arrival times (s)
+            ra: Right ascensions (degrees), optional
+            dec: Declinations (degrees), optional
+            energies: Event energies (J), optional
+            name: Detector name
+        """
+        times = np.asarray(times, dtype=float)
+        if times.ndim != 1:
+            raise ValueError("times must be 1-D")
+        if (ra is None) != (dec is None):
+            raise ValueError("ra and dec must be given together")
+        
+        order = np.argsort(times, kind='stable')
+        self.index = order
+        self.times = times[order]
+        self.ra = self._column(ra, order, 'ra')
+        self.dec = self._column(dec, order, 'dec')
+        self.energies = self._column(energies, order, 'energies')
+        self.name = name
+    
+    def _column(self, values: Optional[np.ndarray], order: np.ndarray, label: str) -> Optional[np.ndarray]:
+        if values is None:
+            return None
+        values = np.asarray(values, dtype=float)
+        if values.shape != (len(order),):
+            raise ValueError(f"{label} must match times in length")
+        return values[order]
+    
+    @property
+    def has_positions(self) -> bool:
+        return self.ra is not None
+    
+    def __len__(self) -> int:
+        return len(self.times)
+    
+    def __repr__(self) -> str:
+        return f"EventList({self.name or 'unnamed'}, n={len(self)})"
+
+
+def angular_separation(ra1: ArrayLike, dec1: ArrayLike,
+                       ra2: ArrayLike, dec2: ArrayLike) -> ArrayLike:
+    """
+    Great-circle separation between sky positions (haversine formula).
+    
+    Args:
+        ra1, dec1: First positions (degrees)
+        ra2, dec2: Second positions (degrees)
+    
+    Returns:
+        Separation (degrees)
+    """
+    ra1, dec1, ra2, dec2 = (np.radians(a) for a in (ra1, dec1, ra2, dec2))
+    h = (np.sin((dec2 - dec1) / 2) ** 2
+         + np.cos(dec1) * np.cos(dec2) * np.sin((ra2 - ra1) / 2) ** 2)
+    return np.degrees(2 * np.arcsin(np.sqrt(np.clip(h, 0.0, 1.0))))
+
+
+def predicted_delay(distances: ArrayLike, vmax_values: ArrayLike,
+                    reference_speed: float = SPEED_OF_LIGHT) -> ArrayLike:
+    """
+    Expected precursor lead time Δt = D (1/c - 1/Vmax_X).
+    
+    Args:
+        distances: Source distances (m), shape (n_sources,)
+        vmax_values: Candidate Vmax_X values (m/s), shape (n_vmax,)
+        reference_speed: Speed of the trigger channel (default c)
+    
+    Returns:
+        Delays (s); shape (n_sources, n_vmax) for array inputs
+    """
+    if np.ndim(distances) == 0 and np.ndim(vmax_values) == 0:
+        return distances * float(_slowness_gap(np.float64(vmax_values), reference_speed))
+    
+    distances = np.asarray(distances, dtype=float)
+    vmax_values = np.asarray(vmax_values, dtype=float)
+    return np.multiply.outer(distances, _slowness_gap(vmax_values, reference_speed))
+
+
+def _slowness_gap(vmax_values: np.ndarray, reference_speed: float) -> np.ndarray:
+    """
+    1/c - 1/Vmax_X without cancellation.
+    
+    Vmax_X is typically c(1 + ε) with tiny ε, where subtracting the
+    reciprocals loses every significant digit; (Vmax_X - c) is exact.
+    """
+    with np.errstate(invalid='ignore'):
+        gap = (vmax_values - reference_speed) / (reference_speed * vmax_values)
+    return np.where(np.isinf(vmax_values), 1.0 / reference_speed, gap)
+
+
+def delay_window(vmax_range: Tuple[float, float], max_distance: float,
+                 tolerance: float = 0.0,
+                 reference_speed: float = SPEED_OF_LIGHT) -> Tuple[float, float]:
+    """
+    Delay window covering every candidate Vmax_X and source distance.
+    
+    Args:
+        vmax_range: (smallest, largest) candidate Vmax_X (m/s)
+        max_distance: Largest source distance (m)
+        tolerance: Timing uncertainty added on both sides (s)
+        reference_speed: Speed of the trigger channel (default c)
+    
+    Returns:
+        (dt_min, dt_max) in seconds
+    """
+    v_lo, v_hi = vmax_range
+    if not 0 < v_lo <= v_hi:
+        raise ValueError("vmax_range must satisfy 0 < min <= max")
+    delays = predicted_delay(np.array([0.0, max_distance]), np.array([v_lo, v_hi]),
+                             reference_speed)
+    return float(delays.min()) - tolerance, float(delays.max()) + tolerance
+
+
+class CoincidenceEngine:
+    """
+    Pairs precursor events with later trigger events across detectors.
+    
+    Detectors are named EventLists; one of them is the trigger (EM)
+    reference that every other detector is matched against.
+    """
+    
+    def __init__(self,
+                 detectors: Mapping[str, EventList],
+                 reference: str = 'EM',
+                 block_pairs: int = 1_000_000):
+        """
+        Initialize the engine.
+        
+        Args:
+            detectors: Detector name -> event list
+            reference: Name of the trigger (EM) detector
+            block_pairs: Maximum candidate pairs materialized at once
+        """
+        if reference not in detectors:
+            raise KeyError(f"Reference detector {reference!r} not in detectors")
+        if block_pairs < 1:
+            raise ValueError("block_pairs must be positive")
+        
+        self.detectors = dict(detectors)
+        self.reference = reference
+        self.block_pairs = block_pairs
+    
+    def pairs(self,
+              precursor: str,
+              window: Tuple[float, float],
+              trigger: Optional[str] = None,
+              max_separation: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        All (precursor, trigger) pairs with t_trigger - t_precursor in window.
+        
+        Args:
+            precursor: Precursor detector name
+            window: (dt_min, dt_max) delay window (s), inclusive
+            trigger: Trigger detector name (default the reference)
+            max_separation: Largest sky separation (degrees); needs positions
+        
+        Returns:
+            Arrays 'precursor_index', 'trigger_index' (input positions),
+            'delay' (s) and, when positions are known, 'separation'
+            (degrees), sorted by precursor time
+        """
+        first = self.detectors[precursor]
+        second = self.detectors[trigger or self.reference]
+        dt_min, dt_max = window
+        if dt_min > dt_max:
+            raise ValueError("window must satisfy dt_min <= dt_max")
+        
+        with_positions = first.has_positions and second.has_positions
+        if max_separation is not None and not with_positions:
+            raise ValueError("max_separation needs sky positions in both detectors")
+        
+        # Each precursor's partners form one contiguous slice of the sorted triggers
+        lo = np.searchsorted(second.times, first.times + dt_min, side='left')
+        hi = np.searchsorted(second.times, first.times + dt_max, side='right')
+        counts = hi - lo
+        
+        keys = ['precursor_index', 'trigger_index', 'delay']
+        if with_positions:
+            keys.append('separation')
+        parts: Dict[str, list] = {key: [] for key in keys}
+        
+        for start, stop in self._blocks(counts):
+            block_counts = counts[start:stop]
+            total = int(block_counts.sum())
+            if total == 0:
+                continue
+            i = np.repeat(np.arange(start, stop), block_counts)
+            offsets = np.arange(total) - np.repeat(np.cumsum(block_counts) - block_counts, block_counts)
+            j = lo[i] + offsets
+            
+            delay = second.times[j] - first.times[i]
+            columns = {'delay': delay}
+            if with_positions:
+                columns['separation'] = angular_separation(first.ra[i], first.dec[i],
+                                                           second.ra[j], second.dec[j])
+            keep = slice(None)
+            if max_separation is not None:
+                keep = columns['separation'] <= max_separation
+            
+            parts['precursor_index'].append(first.index[i][keep])
+            parts['trigger_index'].append(second.index[j][keep])
+            for key, values in columns.items():
+                parts[key].append(values[keep])
+        
+        dtypes = {'precursor_index': np.intp, 'trigger_index': np.intp}
+        return {key: np.concatenate(values) if values else np.empty(0, dtype=dtypes.get(key, float))
+                for key, values in parts.items()}
+    
+    def _blocks(self, counts: np.ndarray):
+        """Split precursors into runs holding at most block_pairs candidates."""
+        if len(counts) == 0:
+            return
+        cumulative = np.cumsum(counts)
+        start = 0
+        while start < len(counts):
+            base = cumulative[start - 1] if start else 0
+            stop = int(np.searchsorted(cumulative, base + self.block_pairs, side='right'))
+            stop = max(stop, start + 1)  # a single precursor may exceed the budget
+            yield start, stop
+            start = stop
+    
+    def search(self,
+               vmax_range: Tuple[float, float],
+               max_distance: float,
+               tolerance: float = 0.0,
+               max_separation: Optional[float] = None) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Match every precursor detector against the reference detector.
+        
+        Args:
+            vmax_range: (smallest, largest) candidate Vmax_X (m/s)
+            max_distance: Largest source distance (m)
+            tolerance: Timing uncertainty (s)
+            max_separation: Largest sky separation (degrees)
+        
+        Returns:
+            Precursor detector name -> pairs (see `pairs`)
+        """
+        window = delay_window(vmax_range, max_distance, tolerance)
+        return {name: self.pairs(name, window, max_separation=max_separation)
+                for name in self.detectors if name != self.reference}
+    
+    @staticmethod
+    def consistent_counts(delays: np.ndarray, distances: np.ndarray,
+                          vmax_values: Sequence[float], tolerance: float) -> np.ndarray:
+        """
+        Number of observed delays matching some catalog source per Vmax_X.
+        
+        A delay counts for a candidate Vmax_X if it lies within tolerance
+        of the predicted delay of any source in the distance catalog.
+        
+        Args:
+            delays: Observed pair delays (s)
+            distances: Source-distance catalog (m)
+            vmax_values: Candidate Vmax_X values (m/s)
+            tolerance: Timing uncertainty (s)
+        
+        Returns:
+            Integer counts, one per candidate Vmax_X
+        """
+        delays = np.asarray(delays, dtype=float)
+        if np.size(distances) == 0:
+            raise ValueError("Distance catalog is empty")
+        predicted = np.sort(predicted_delay(np.asarray(distances, dtype=float),
+                                            np.asarray(vmax_values, dtype=float)), axis=0)
+        counts = np.empty(predicted.shape[1], dtype=np.int64)
+        for k in range(predicted.shape[1]):
+            column = predicted[:, k]
+            # Nearest predicted delay on either side of each observation
+            pos = np.searchsorted(column, delays)
+            below = column[np.maximum(pos - 1, 0)]
+            above = column[np.minimum(pos, len(column) - 1)]
+            nearest = np.minimum(np.abs(delays - below), np.abs(delays - above))
+            counts[k] = int(np.count_nonzero(nearest <= tolerance))
+        return counts
+    
+    def __repr__(self) -> str:
+        sizes = ', '.join(f'{name}={len(events)}' for name, events in self.detectors.items())
+        return f"CoincidenceEngine({sizes}, reference={self.reference!r})"
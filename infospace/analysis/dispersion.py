@@ -0,0 +1,472 @@
+"""
+Vacuum dispersion from GRB photon arrival times (Protocol 5).
+
+An energy-dependent speed v(E) = c + (∂v/∂E)(E - E₀) delays a photon
+emitted at distance d by
+
+    t(E) - t(E₀) = -(d/c²) (∂v/∂E) (E - E₀) = κ (E - E₀)
+
+The fitter estimates κ (and so ∂v/∂E) by weighted least squares with
+the emission time profiled out, which is the Gaussian likelihood
+maximum. Photons are read in chunks and reduced to merged weighted
+moments, so a burst is never held in RAM; catalogs live on disk as
+memory-mapped columns. Bootstrap and permutation significance run in
+parallel, one seeded stream per task so results do not depend on the
+number of workers. Cosmological expansion is not modelled; use the
+effective distance for high-redshift bursts.
+"""
+
+import math
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .._parallel import parallel_map, resolve_workers, stream_rng
+from ..core.constants import SPEED_OF_LIGHT, EV_TO_JOULES, GEV_TO_JOULES
+from ._columns import chunk_ranges, open_column, read_layout, write_columns
+
+
+ArrayLike = Union[float, np.ndarray]
+
+# Energy units accepted by to_joules / from_joules (J per unit)
+ENERGY_UNITS = {
+    'J': 1.0,
+    'eV': EV_TO_JOULES,
+    'keV': 1e3 * EV_TO_JOULES,
+    'MeV': 1e6 * EV_TO_JOULES,
+    'GeV': GEV_TO_JOULES,
+    'TeV': 1e3 * GEV_TO_JOULES,
+}
+
+
+def to_joules(values: ArrayLike, unit: str) -> np.ndarray:
+    """
+    Convert photon energies, frequencies or wavelengths to joules.
+    
+    Args:
+        values: Values in the given unit
+        unit: An energy unit from ENERGY_UNITS, 'Hz' or 'm'
+    
+    Returns:
+        Energies (J)
+    """
+    from ..core.energy import EnergyArray
+    from ..core.space import EMSpace
+    
+    if unit == 'Hz':
+        return EnergyArray(EMSpace()).photon_energy(values)
+    if unit == 'm':
+        return EnergyArray(EMSpace()).wavelength_to_energy(values)
+    if unit not in ENERGY_UNITS:
+        raise ValueError(f"Unknown unit {unit!r}")
+    return np.asarray(values, dtype=float) * ENERGY_UNITS[unit]
+
+
+def from_joules(energies: ArrayLike, unit: str) -> np.ndarray:
+    """
+    Convert energies in joules to another energy unit, 'Hz' or 'm'.
+    
+    Args:
+        energies: Energies (J)
+        unit: Target unit
+    
+    Returns:
+        Values in the target unit
+    """
+    from ..core.energy import EnergyArray
+    from ..core.space import EMSpace
+    
+    if unit == 'Hz':
+        return EnergyArray(EMSpace()).photon_frequency(energies)
+    if unit == 'm':
+        return EnergyArray(EMSpace()).energy_to_wavelength(energies)
+    if unit not in ENERGY_UNITS:
+        raise ValueError(f"Unknown unit {unit!r}")
+    return np.asarray(energies, dtype=float) / ENERGY_UNITS[unit]
+
+
+class PhotonList:
+    """
+    Photon arrival times and energies of one burst.
+    
+    Columns may be in-memory arrays or memory maps. Lists taken from a
+    BurstCatalog pickle as a reference to the catalog, so worker
+    processes reopen the files instead of receiving a copy.
+    """
+    
+    def __init__(self,
+                 times: np.ndarray,
+                 energies: np.ndarray,
+                 timing_error: Optional[np.ndarray] = None,
+                 distance: Optional[float] = None,
+                 name: str = ''):
+        """
+        Initialize a photon list.
+        
+        Args:
+            times: Arrival times (s)
+            energies: Photon energies (J)
+            timing_error: Per-photon timing uncertainty (s), optional
+            distance: Source distance (m)
+            name: Burst name
+        """
+        if len(times) != len(energies):
+            raise ValueError("times and energies must have equal length")
+        if timing_error is not None and len(timing_error) != len(times):
+            raise ValueError("timing_error must match times in length")
+        self.times = times
+        self.energies = energies
+        self.timing_error = timing_error
+        self.distance = distance
+        self.name = name
+        self._source = None  # (catalog directory, start, stop) when catalog-backed
+    
+    def __len__(self) -> int:
+        return len(self.times)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        if self._source is not None:
+            state.update(times=None, energies=None, timing_error=None)
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if self._source is not None:
+            directory, start, stop = self._source
+            self.times = open_column(directory, 'times')[start:stop]
+            self.energies = open_column(directory, 'energies')[start:stop]
+            errors = open_column(directory, 'timing_error')
+            self.timing_error = None if errors is None else errors[start:stop]
+    
+    def __repr__(self) -> str:
+        return f"PhotonList({self.name or 'unnamed'}, n={len(self)})"
+
+
+class BurstCatalog:
+    """
+    Directory of bursts stored as memory-mapped columns.
+    
+    Columns are times, energies and (optionally) timing_error; offsets
+    and per-burst names and distances locate each burst.
+    """
+    
+    def __init__(self, directory: str):
+        """
+        Open a catalog written by BurstCatalog.write.
+        
+        Args:
+            directory: Catalog directory
+        """
+        self.directory = directory
+        self.offsets, self.meta = read_layout(directory)
+        self._index = {entry['name']: k for k, entry in enumerate(self.meta)}
+    
+    @classmethod
+    def write(cls, directory: str, bursts: Sequence[PhotonList]) -> 'BurstCatalog':
+        """
+        Write bursts to a catalog directory.
+        
+        Args:
+            directory: Output directory
+            bursts: Photon lists with names and distances
+        
+        Returns:
+            The opened catalog
+        """
+        columns = ['times', 'energies']
+        with_errors = any(burst.timing_error is not None for burst in bursts)
+        if with_errors:
+            columns.append('timing_error')
+        
+        records = []
+        for burst in bursts:
+            record = {'times': burst.times, 'energies': burst.energies}
+            if with_errors:
+                record['timing_error'] = (np.zeros(len(burst)) if burst.timing_error is None
+                                          else burst.timing_error)
+            records.append(record)
+        meta = [{'name': burst.name or f'burst_{k}', 'distance': burst.distance}
+                for k, burst in enumerate(bursts)]
+        write_columns(directory, records, columns, meta)
+        return cls(directory)
+    
+    @property
+    def names(self) -> List[str]:
+        return [entry['name'] for entry in self.meta]
+    
+    def __len__(self) -> int:
+        return len(self.meta)
+    
+    def __getitem__(self, key: Union[int, str]) -> PhotonList:
+        k = self._index[key] if isinstance(key, str) else key
+        start, stop = int(self.offsets[k]), int(self.offsets[k + 1])
+        errors = open_column(self.directory, 'timing_error')
+        photons = PhotonList(open_column(self.directory, 'times')[start:stop],
+                             open_column(self.directory, 'energies')[start:stop],
+                             None if errors is None else errors[start:stop],
+                             distance=self.meta[k]['distance'],
+                             name=self.meta[k]['name'])
+        photons._source = (self.directory, start, stop)
+        return photons
+    
+    def __iter__(self) -> Iterator[PhotonList]:
+        return (self[k] for k in range(len(self)))
+    
+    def __repr__(self) -> str:
+        return f"BurstCatalog({self.directory!r}, bursts={len(self)}, photons={int(self.offsets[-1])})"
+
+
+class _Moments:
+    """
+    Weighted count, means and co-moments of (x, y), mergeable across chunks.
+    
+    Fields may carry a leading axis of independent replicates.
+    """
+    
+    def __init__(self, n, w, mx, my, cxx, cxy, cyy):
+        self.n, self.w, self.mx, self.my = n, w, mx, my
+        self.cxx, self.cxy, self.cyy = cxx, cxy, cyy
+    
+    @classmethod
+    def empty(cls, shape: Tuple[int, ...] = ()) -> '_Moments':
+        return cls(*(np.zeros(shape) for _ in range(7)))
+    
+    @classmethod
+    def from_chunk(cls, x: np.ndarray, y: np.ndarray, w: np.ndarray,
+                   counts: Optional[np.ndarray] = None) -> '_Moments':
+        """Moments of one chunk; w (and counts) may be (replicates, n)."""
+        n = np.sum(counts, axis=-1) if counts is not None else np.full(np.shape(w)[:-1], x.shape[-1], float)
+        total = np.sum(w, axis=-1)
+        safe = np.where(total > 0, total, 1.0)
+        mx = np.sum(w * x, axis=-1) / safe
+        my = np.sum(w * y, axis=-1) / safe
+        dx = x - mx[..., None]
+        dy = y - my[..., None]
+        return cls(n, total, mx, my, np.sum(w * dx * dx, axis=-1),
+                   np.sum(w * dx * dy, axis=-1), np.sum(w * dy * dy, axis=-1))
+    
+    def merge(self, other: '_Moments') -> '_Moments':
+        """Combine two sets of moments (Chan et al. pairwise update)."""
+        w = self.w + other.w
+        safe = np.where(w > 0, w, 1.0)
+        dx = other.mx - self.mx
+        dy = other.my - self.my
+        share = other.w / safe
+        cross = self.w * other.w / safe
+        return _Moments(self.n + other.n, w,
+                        self.mx + dx * share, self.my + dy * share,
+                        self.cxx + other.cxx + dx * dx * cross,
+                        self.cxy + other.cxy + dx * dy * cross,
+                        self.cyy + other.cyy + dy * dy * cross)
+
+
+class DispersionFitter:
+    """
+    Fits ∂v/∂E to photon arrival times, with resampling significance.
+    """
+    
+    def __init__(self,
+                 reference_energy: float = 0.0,
+                 intrinsic_spread: float = 0.0,
+                 chunk_size: int = 1_000_000,
+                 n_workers: Optional[int] = None):
+        """
+        Initialize the fitter.
+        
+        Photon weights are 1/(timing_error² + intrinsic_spread²); with
+        neither given all photons weigh 1 and errors come from the
+        residual scatter.
+        
+        Args:
+            reference_energy: E₀ (J); the intercept is t(E₀)
+            intrinsic_spread: Intrinsic emission-time spread (s)
+            chunk_size: Photons (times replicates) processed per step
+            n_workers: Worker processes (None for all cores, 0/1 in-process)
+        """
+        if intrinsic_spread < 0:
+            raise ValueError("intrinsic_spread must be non-negative")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self.reference_energy = reference_energy
+        self.intrinsic_spread = intrinsic_spread
+        self.chunk_size = chunk_size
+        self.n_workers = resolve_workers(n_workers)
+    
+    def _chunk(self, photons: PhotonList, start: int, stop: int,
+               energy_index: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(x, y, w) for rows [start, stop), optionally with permuted energies."""
+        if energy_index is None:
+            energies = np.asarray(photons.energies[start:stop], dtype=float)
+        else:
+            energies = np.asarray(photons.energies[energy_index], dtype=float)
+        x = energies - self.reference_energy
+        y = np.asarray(photons.times[start:stop], dtype=float)
+        
+        if photons.timing_error is None and self.intrinsic_spread == 0:
+            return x, y, np.ones_like(y)
+        errors = 0.0 if photons.timing_error is None else np.asarray(photons.timing_error[start:stop], dtype=float)
+        variance = errors**2 + self.intrinsic_spread**2
+        if np.any(variance <= 0):
+            raise ValueError("Photons with zero timing variance; set intrinsic_spread")
+        return x, y, np.ones_like(y) / variance
+    
+    def _moments(self, photons: PhotonList) -> _Moments:
+        total = _Moments.empty()
+        for start, stop in chunk_ranges(len(photons), self.chunk_size):
+            total = total.merge(_Moments.from_chunk(*self._chunk(photons, start, stop)))
+        return total
+    
+    def _weighted(self, photons: PhotonList) -> bool:
+        return photons.timing_error is not None or self.intrinsic_spread > 0
+    
+    def _to_dv_dE(self, photons: PhotonList, slope: ArrayLike) -> ArrayLike:
+        if not photons.distance:
+            raise ValueError("Photon list needs a source distance")
+        return -slope * SPEED_OF_LIGHT**2 / photons.distance
+    
+    def fit(self, photons: PhotonList) -> Dict[str, float]:
+        """
+        Maximum-likelihood dispersion fit.
+        
+        Args:
+            photons: Photon list with a distance
+        
+        Returns:
+            Dictionary with 'slope' κ (s/J), 'slope_error', 'intercept'
+            t(E₀) (s), 'dv_dE' ((m/s)/J), 'dv_dE_error', 'energy_scale'
+            c/|∂v/∂E| (J), 'chi2' and 'n_photons'
+        """
+        if len(photons) < 3:
+            raise ValueError("Need at least three photons")
+        m = self._moments(photons)
+        if m.cxx <= 0:
+            raise ValueError("Photon energies do not vary")
+        
+        slope = float(m.cxy / m.cxx)
+        chi2 = float(m.cyy - m.cxy**2 / m.cxx)
+        # Without known weights, scale the error by the residual scatter
+        scale = 1.0 if self._weighted(photons) else chi2 / (m.n - 2)
+        slope_error = math.sqrt(scale / m.cxx)
+        dv_dE = float(self._to_dv_dE(photons, slope))
+        return {
+            'slope': slope,
+            'slope_error': slope_error,
+            'intercept': float(m.my - slope * m.mx),
+            'dv_dE': dv_dE,
+            'dv_dE_error': abs(float(self._to_dv_dE(photons, slope_error))),
+            'energy_scale': SPEED_OF_LIGHT / abs(dv_dE) if dv_dE else float('inf'),
+            'chi2': chi2,
+            'n_photons': int(m.n),
+        }
+    
+    def log_likelihood(self, photons: PhotonList, dv_dE: ArrayLike) -> ArrayLike:
+        """
+        Profile log-likelihood over candidate ∂v/∂E values.
+        
+        The emission time is profiled out; the result is -χ²/2 up to a
+        constant, evaluated for all candidates from one pass over the data.
+        
+        Args:
+            photons: Photon list with a distance
+            dv_dE: Candidate ∂v/∂E values ((m/s)/J), any shape
+        
+        Returns:
+            Log-likelihood, same shape as dv_dE
+        """
+        m = self._moments(photons)
+        kappa = -np.asarray(dv_dE, dtype=float) * photons.distance / SPEED_OF_LIGHT**2
+        chi2 = m.cyy - 2 * kappa * m.cxy + kappa**2 * m.cxx
+        if not self._weighted(photons):
+            chi2 = chi2 / ((m.cyy - m.cxy**2 / m.cxx) / (m.n - 2))
+        return -0.5 * chi2
+    
+    def bootstrap(self, photons: PhotonList, n_resamples: int = 1000, seed: int = 0,
+                  resamples_per_task: int = 50) -> np.ndarray:
+        """
+        Poisson-bootstrap replicates of ∂v/∂E.
+        
+        Each replicate reweights every photon by a Poisson(1) count, which
+        matches the multinomial bootstrap for large lists but streams.
+        
+        Args:
+            photons: Photon list with a distance
+            n_resamples: Number of replicates
+            seed: Root seed
+            resamples_per_task: Replicates per parallel task
+        
+        Returns:
+            Replicate ∂v/∂E values
+        """
+        tasks = [(self, photons, seed, k, min(resamples_per_task, n_resamples - start))
+                 for k, start in enumerate(range(0, n_resamples, resamples_per_task))]
+        slopes = np.concatenate(parallel_map(_bootstrap_task, tasks, self.n_workers))
+        return self._to_dv_dE(photons, slopes)
+    
+    def permutation_test(self, photons: PhotonList, n_permutations: int = 999, seed: int = 0,
+                         permutations_per_task: int = 10) -> Dict[str, Any]:
+        """
+        Permutation significance of a non-zero ∂v/∂E.
+        
+        Energies are shuffled against times by random affine maps
+        i -> (a i + b) mod N with gcd(a, N) = 1. These form a group, so
+        the test is exact under exchangeability, and each permuted chunk
+        is computed on the fly without an O(N) index.
+        
+        Args:
+            photons: Photon list with a distance
+            n_permutations: Number of permutations
+            seed: Root seed
+            permutations_per_task: Permutations per parallel task
+        
+        Returns:
+            Dictionary with observed 'dv_dE', two-sided 'p_value' and
+            the 'null' distribution of ∂v/∂E
+        """
+        observed = self.fit(photons)
+        tasks = [(self, photons, seed, k, min(permutations_per_task, n_permutations - start))
+                 for k, start in enumerate(range(0, n_permutations, permutations_per_task))]
+        null_slopes = np.concatenate(parallel_map(_permutation_task, tasks, self.n_workers))
+        exceed = np.count_nonzero(np.abs(null_slopes) >= abs(observed['slope']))
+        return {
+            'dv_dE': observed['dv_dE'],
+            'p_value': (1 + exceed) / (1 + len(null_slopes)),
+            'null': self._to_dv_dE(photons, null_slopes),
+        }
+    
+    def __repr__(self) -> str:
+        return (f"DispersionFitter(E0={self.reference_energy:.3e} J, "
+                f"σ_int={self.intrinsic_spread:.3e} s)")
+
+
+def _bootstrap_task(task: Tuple) -> np.ndarray:
+    """Slopes of a group of Poisson-bootstrap replicates; runs in workers."""
+    fitter, photons, seed, index, count = task
+    rng = stream_rng(seed, index)
+    rows = max(1, fitter.chunk_size // count)
+    total = _Moments.empty((count,))
+    for start, stop in chunk_ranges(len(photons), rows):
+        x, y, w = fitter._chunk(photons, start, stop)
+        counts = rng.poisson(1.0, size=(count, stop - start)).astype(float)
+        total = total.merge(_Moments.from_chunk(x, y, counts * w, counts))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return total.cxy / total.cxx
+
+
+def _permutation_task(task: Tuple) -> np.ndarray:
+    """Slopes under a group of random affine permutations; runs in workers."""
+    fitter, photons, seed, index, count = task
+    rng = stream_rng(seed, index)
+    n = len(photons)
+    slopes = np.empty(count)
+    for k in range(count):
+        a = int(rng.integers(1, n)) if n > 1 else 1
+        while math.gcd(a, n) != 1:
+            a = int(rng.integers(1, n))
+        b = int(rng.integers(0, n))
+        total = _Moments.empty()
+        for start, stop in chunk_ranges(n, fitter.chunk_size):
+            permuted = (a * np.arange(start, stop, dtype=np.int64) + b) % n
+            total = total.merge(_Moments.from_chunk(*fitter._chunk(photons, start, stop, permuted)))
+        slopes[k] = total.cxy / total.cxx
+    return slopes
@@ -0,0 +1,558 @@
+"""
+Bayesian inference of the LHC transition model (Protocol 1).
+
+MissingEnergyLikelihood compares the expected missing-energy fraction of
+the LHC model,
+
+    m(E) = P(E) × transition_fraction × (1 - g_eff(E)² f),
+    P(E) = 1 - exp(-(E - E_th)/E_th),   g_eff = min(g₀ (E/E_th)², g_max),
+
+with a measured spectrum (mean missing fraction per collision-energy bin)
+under Gaussian errors, sampling E_th and transition_fraction. The model
+is evaluated for a whole (walkers, bins) block at once, so no per-point
+simulate_lhc_collision calls are needed.
+
+EnsembleSampler is an affine-invariant stretch-move sampler (Goodman &
+Weare). Walkers are split into independent ensembles that advance in
+blocks on a process pool; random streams are keyed by (seed, ensemble,
+block), so chains do not depend on the number of workers, and each block
+is written to disk as it finishes so an interrupted run resumes.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .._io import atomic_save, atomic_savez, atomic_write_text, remove_stale
+from .._parallel import make_executor, resolve_workers, stream_rng
+
+
+PARAMETERS = ('threshold_energy_gev', 'transition_fraction')
+
+DEFAULT_BOUNDS = {
+    'threshold_energy_gev': (1.0, 1e4),
+    'transition_fraction': (0.0, 1.0),
+}
+
+
+class MissingEnergyLikelihood:
+    """
+    Gaussian likelihood of a missing-energy spectrum, vectorized over walkers.
+    
+    Parameters θ = (threshold_energy_gev, transition_fraction) have uniform
+    priors inside bounds: E_th sets where the spectrum rises, the transition
+    fraction the plateau it rises to. Vmax_X, g₀ and g_max are held fixed.
+    They enter only through g_eff² f, which is below 1e-20 (and f is 0.0
+    for the LHC contact point), so the spectrum cannot constrain them.
+    """
+    
+    parameter_names = PARAMETERS
+    
+    def __init__(self,
+                 collision_energy_gev: Sequence[float],
+                 missing_fraction: Sequence[float],
+                 sigma: Optional[Sequence[float]] = None,
+                 covariance: Optional[np.ndarray] = None,
+                 vmax_x_factor: float = 10.0,
+                 base_coupling: float = 1e-40,
+                 max_coupling: float = 1e-10,
+                 bounds: Optional[Mapping[str, Tuple[float, float]]] = None):
+        """
+        Initialize the likelihood.
+        
+        Args:
+            collision_energy_gev: Bin collision energies (GeV)
+            missing_fraction: Measured mean missing fraction per bin
+            sigma: Per-bin standard errors
+            covariance: Full bin covariance, in place of sigma
+            vmax_x_factor: Vmax_X / c ratio of the contact point
+            base_coupling: Coupling g₀ at the threshold energy
+            max_coupling: Upper bound g_max on the effective coupling
+            bounds: Prior bounds per parameter name (default DEFAULT_BOUNDS)
+        """
+        from ..simulation.lhc import _lhc_contact
+        
+        self.collision_energy_gev = np.asarray(collision_energy_gev, dtype=float)
+        self.missing_fraction = np.asarray(missing_fraction, dtype=float)
+        n_bins = len(self.collision_energy_gev)
+        if self.collision_energy_gev.shape != (n_bins,) or self.missing_fraction.shape != (n_bins,):
+            raise ValueError("collision_energy_gev and missing_fraction must be 1-D of equal length")
+        if (sigma is None) == (covariance is None):
+            raise ValueError("Give exactly one of sigma or covariance")
+        
+        if covariance is None:
+            sigma = np.broadcast_to(np.asarray(sigma, dtype=float), (n_bins,))
+            if np.any(sigma <= 0):
+                raise ValueError("sigma must be positive")
+            self._whiten = 1.0 / sigma
+            log_det = 2.0 * np.sum(np.log(sigma))
+        else:
+            covariance = np.asarray(covariance, dtype=float)
+            if covariance.shape != (n_bins, n_bins):
+                raise ValueError(f"covariance must have shape ({n_bins}, {n_bins})")
+            try:
+                cholesky = np.linalg.cholesky(covariance)
+            except np.linalg.LinAlgError:
+                raise ValueError("covariance must be positive definite") from None
+            # Residuals r are whitened as r L^-T, so χ² = |r L^-T|²
+            self._whiten = np.linalg.inv(cholesky).T
+            log_det = 2.0 * np.sum(np.log(np.diag(cholesky)))
+        self._log_norm = -0.5 * (log_det + n_bins * np.log(2.0 * np.pi))
+        
+        self.vmax_x_factor = vmax_x_factor
+        self.base_coupling = base_coupling
+        self.max_coupling = max_coupling
+        self.compatibility = _lhc_contact(vmax_x_factor).compatibility()
+        
+        bounds = dict(DEFAULT_BOUNDS, **(bounds or {}))
+        unknown = set(bounds) - set(PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown parameters: {sorted(unknown)}")
+        self.bounds = np.array([bounds[name] for name in PARAMETERS], dtype=float)
+        if np.any(self.bounds[:, 0] >= self.bounds[:, 1]):
+            raise ValueError("Each bound needs low < high")
+        if self.bounds[0, 0] <= 0:
+            raise ValueError("threshold_energy_gev must be bounded away from zero")
+        if self.bounds[1, 0] < 0 or self.bounds[1, 1] > 1:
+            raise ValueError("transition_fraction bounds must lie in [0, 1]")
+        # Below every allowed threshold the model is 0 whatever θ is
+        if self.collision_energy_gev.max() <= self.bounds[0, 0]:
+            raise ValueError("No collision energy lies above the lowest allowed threshold")
+    
+    @classmethod
+    def from_runs(cls, collision_energy_gev: Sequence[float], runs: Sequence[Dict[str, Any]],
+                  **kwargs) -> 'MissingEnergyLikelihood':
+        """
+        Build a likelihood from LHCMonteCarlo.run results.
+        
+        Args:
+            collision_energy_gev: Collision energy of each run (GeV)
+            runs: Result dictionaries with mean_missing_fraction and std_error
+            **kwargs: Passed to the constructor
+        
+        Returns:
+            Likelihood of the runs' mean missing fractions
+        """
+        return cls(collision_energy_gev,
+                   [run['mean_missing_fraction'] for run in runs],
+                   sigma=[run['std_error'] for run in runs], **kwargs)
+    
+    @property
+    def n_parameters(self) -> int:
+        return len(PARAMETERS)
+    
+    def model(self, theta: np.ndarray) -> np.ndarray:
+        """
+        Expected missing fraction for each parameter vector and bin.
+        
+        Matches LHCMonteCarlo.expected_missing_fraction.
+        
+        Args:
+            theta: (..., 2) parameter vectors
+        
+        Returns:
+            (..., n_bins) expected missing fractions
+        """
+        theta = np.asarray(theta, dtype=float)
+        threshold = theta[..., 0:1]
+        transition_fraction = theta[..., 1:2]
+        E = self.collision_energy_gev
+        
+        probability = -np.expm1(-np.maximum(E - threshold, 0.0) / threshold)
+        # Same power law as lhc_coupling_model, written out to vectorize over E_th
+        coupling = np.minimum(self.base_coupling * (np.maximum(E, 0.0) / threshold) ** 2,
+                              self.max_coupling)
+        return probability * transition_fraction * (1.0 - coupling ** 2 * self.compatibility)
+    
+    def log_likelihood(self, theta: np.ndarray) -> np.ndarray:
+        """
+        Gaussian log-likelihood of the spectrum.
+        
+        Args:
+            theta: (..., 2) parameter vectors
+        
+        Returns:
+            (...) log-likelihoods
+        """
+        residual = self.model(theta) - self.missing_fraction
+        if self._whiten.ndim == 1:
+            whitened = residual * self._whiten
+        else:
+            whitened = residual @ self._whiten
+        return self._log_norm - 0.5 * np.einsum('...i,...i->...', whitened, whitened)
+    
+    def log_prior(self, theta: np.ndarray) -> np.ndarray:
+        """
+        Uniform log-prior over the bounds (-inf outside).
+        
+        Args:
+            theta: (..., 2) parameter vectors
+        
+        Returns:
+            (...) log-priors
+        """
+        theta = np.asarray(theta, dtype=float)
+        low, high = self.bounds[:, 0], self.bounds[:, 1]
+        inside = np.all((theta >= low) & (theta <= high), axis=-1)
+        return np.where(inside, -np.sum(np.log(high - low)), -np.inf)
+    
+    def __call__(self, theta: np.ndarray) -> np.ndarray:
+        """
+        Log-posterior (up to the evidence).
+        
+        Args:
+            theta: (..., 2) parameter vectors
+        
+        Returns:
+            (...) log-posteriors; -inf outside the prior
+        """
+        theta = np.asarray(theta, dtype=float)
+        log_prior = self.log_prior(theta)
+        inside = np.isfinite(log_prior)
+        if inside.all():
+            return log_prior + self.log_likelihood(theta)
+        result = np.full(log_prior.shape, -np.inf)
+        result[inside] = log_prior[inside] + self.log_likelihood(theta[inside])
+        return result
+    
+    def sample_prior(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        """
+        Draw parameter vectors from the prior.
+        
+        Args:
+            rng: Random generator
+            n: Number of draws
+        
+        Returns:
+            (n, 2) parameter vectors
+        """
+        low, high = self.bounds[:, 0], self.bounds[:, 1]
+        return low + (high - low) * rng.random((n, len(PARAMETERS)))
+    
+    def describe(self) -> Dict[str, Any]:
+        """JSON-serializable summary identifying the likelihood."""
+        data = np.concatenate([self.collision_energy_gev, self.missing_fraction,
+                               np.ravel(self._whiten)])
+        return {
+            'type': type(self).__name__,
+            'n_bins': len(self.collision_energy_gev),
+            'data': hashlib.blake2b(data.tobytes(), digest_size=16).hexdigest(),
+            'vmax_x_factor': self.vmax_x_factor,
+            'base_coupling': self.base_coupling,
+            'max_coupling': self.max_coupling,
+            'bounds': self.bounds.tolist(),
+        }
+    
+    def __repr__(self) -> str:
+        return f"MissingEnergyLikelihood(bins={len(self.collision_energy_gev)})"
+
+
+def _advance_block(task: Tuple) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Advance a group of ensembles by one block of stretch moves; runs in workers.
+    
+    Returns:
+        (chain (steps/thin, G, K, d), log_prob chain (steps/thin, G, K),
+        positions (G, K, d), log_prob (G, K), accepted (G, K))
+    """
+    log_prob, positions, log_probs, seed, ensembles, block, n_steps, thin, stretch = task
+    positions, log_probs = positions.copy(), log_probs.copy()
+    n_groups, n_walkers, dim = positions.shape
+    half = n_walkers // 2
+    
+    # All random numbers of the block, drawn per ensemble from its own stream
+    z, partner, log_u = [], [], []
+    for ensemble in ensembles:
+        rng = stream_rng(seed, ensemble, block)
+        z.append(((stretch - 1.0) * rng.random((n_steps, 2, half)) + 1.0) ** 2 / stretch)
+        partner.append(rng.integers(0, half, (n_steps, 2, half)))
+        log_u.append(np.log(rng.random((n_steps, 2, half))))
+    z, partner, log_u = (np.stack(a, axis=1) for a in (z, partner, log_u))
+    
+    chain = np.empty((n_steps // thin, n_groups, n_walkers, dim))
+    chain_log_prob = np.empty((n_steps // thin, n_groups, n_walkers))
+    accepted = np.zeros((n_groups, n_walkers), dtype=np.int64)
+    for step in range(n_steps):
+        for s in (0, 1):
+            active = slice(s * half, (s + 1) * half)
+            other = positions[:, (1 - s) * half:(2 - s) * half]
+            x = positions[:, active]
+            y_partner = np.take_along_axis(other, partner[step, :, s, :, None], axis=1)
+            zs = z[step, :, s]
+            proposal = y_partner + zs[..., None] * (x - y_partner)
+            proposal_log_prob = np.asarray(log_prob(proposal.reshape(-1, dim))).reshape(n_groups, half)
+            with np.errstate(invalid='ignore'):
+                log_q = (dim - 1) * np.log(zs) + proposal_log_prob - log_probs[:, active]
+            accept = log_u[step, :, s] < log_q
+            x[accept] = proposal[accept]
+            log_probs[:, active][accept] = proposal_log_prob[accept]
+            accepted[:, active] += accept
+        if (step + 1) % thin == 0:
+            chain[step // thin] = positions
+            chain_log_prob[step // thin] = log_probs
+    return chain, chain_log_prob, positions, log_probs, accepted
+
+
+class EnsembleSampler:
+    """
+    Parallel, resumable affine-invariant ensemble MCMC.
+    
+    The walkers are split into n_ensembles independent stretch-move
+    ensembles. For each block of block_size steps, groups of ensembles
+    advance in worker processes with no communication between steps, and
+    the log-probability is called once per half-step for every walker of
+    the group at once. With output_dir, each block's chain is saved as
+    .npy files and the walker state as a checkpoint; a new sampler on the
+    same directory continues from the last complete block.
+    """
+    
+    STATE = 'sampler.json'
+    # Keyed by block, so the state file always names the matching walkers
+    WALKERS = 'walkers_{:05d}.npz'
+    
+    def __init__(self,
+                 log_prob: Callable[[np.ndarray], np.ndarray],
+                 initial: np.ndarray,
+                 n_ensembles: Optional[int] = None,
+                 output_dir: Optional[str] = None,
+                 seed: int = 0,
+                 n_workers: Optional[int] = None,
+                 block_size: int = 1000,
+                 thin: int = 1,
+                 stretch: float = 2.0):
+        """
+        Initialize the sampler.
+        
+        Args:
+            log_prob: Picklable vectorized log-density, (n, d) -> (n,)
+            initial: (n_walkers, d) starting positions
+            n_ensembles: Independent ensembles the walkers are split into
+                (default up to 8 equal ones of at least 4d walkers)
+            output_dir: Directory for chains and checkpoints (None keeps
+                everything in memory)
+            seed: Root seed
+            n_workers: Worker processes (None for all cores, 0/1 in-process)
+            block_size: Steps between checkpoints
+            thin: Keep every thin-th step
+            stretch: Stretch-move scale a > 1
+        """
+        initial = np.array(initial, dtype=float)
+        if initial.ndim != 2:
+            raise ValueError("initial must have shape (n_walkers, n_dimensions)")
+        n_walkers, dim = initial.shape
+        if n_ensembles is None:
+            n_ensembles = max(1, min(8, n_walkers // (4 * dim)))
+            while n_ensembles > 1 and n_walkers % (2 * n_ensembles):
+                n_ensembles -= 1
+        if n_ensembles < 1 or n_walkers % n_ensembles:
+            raise ValueError("n_walkers must split evenly into n_ensembles")
+        per_ensemble = n_walkers // n_ensembles
+        if per_ensemble % 2 or per_ensemble < 2 * dim:
+            raise ValueError("Each ensemble needs an even number of at least 2d walkers")
+        if block_size < 1 or thin < 1 or block_size % thin:
+            raise ValueError("block_size must be a positive multiple of thin")
+        if stretch <= 1:
+            raise ValueError("stretch must be greater than 1")
+        
+        self.log_prob = log_prob
+        self.n_walkers = n_walkers
+        self.n_dimensions = dim
+        self.n_ensembles = n_ensembles
+        self.output_dir = output_dir
+        self.seed = seed
+        self.n_workers = resolve_workers(n_workers)
+        self.block_size = block_size
+        self.thin = thin
+        self.stretch = stretch
+        
+        self.positions = initial
+        self.current_log_prob = None
+        self.accepted = np.zeros(n_walkers, dtype=np.int64)
+        self.n_blocks = 0
+        self._chain: List[np.ndarray] = []
+        self._chain_log_prob: List[np.ndarray] = []
+        
+        if output_dir is not None:
+            self._resume()
+    
+    @property
+    def n_steps(self) -> int:
+        """Steps taken per walker."""
+        return self.n_blocks * self.block_size
+    
+    def _settings(self) -> Dict[str, Any]:
+        describe = getattr(self.log_prob, 'describe', None)
+        return {
+            'log_prob': describe() if describe else type(self.log_prob).__name__,
+            'n_walkers': self.n_walkers,
+            'n_dimensions': self.n_dimensions,
+            'n_ensembles': self.n_ensembles,
+            'seed': self.seed,
+            'block_size': self.block_size,
+            'thin': self.thin,
+            'stretch': self.stretch,
+        }
+    
+    def _block_path(self, kind: str, block: int) -> str:
+        return os.path.join(self.output_dir, f'{kind}_{block:05d}.npy')
+    
+    def _resume(self) -> None:
+        path = os.path.join(self.output_dir, self.STATE)
+        if not os.path.exists(path):
+            return
+        with open(path) as f:
+            state = json.load(f)
+        if state['settings'] != json.loads(json.dumps(self._settings())):
+            raise ValueError(f"{self.output_dir} holds a different sampler run")
+        n_blocks = state['n_blocks']
+        with np.load(os.path.join(self.output_dir, self.WALKERS.format(n_blocks))) as data:
+            self.positions = data['positions']
+            self.current_log_prob = data['log_prob']
+            self.accepted = data['accepted']
+        self.n_blocks = n_blocks
+    
+    def _checkpoint(self, chain: np.ndarray, chain_log_prob: np.ndarray) -> None:
+        if self.output_dir is None:
+            self._chain.append(chain)
+            self._chain_log_prob.append(chain_log_prob)
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        atomic_save(self._block_path('chain', self.n_blocks - 1), chain)
+        atomic_save(self._block_path('log_prob', self.n_blocks - 1), chain_log_prob)
+        walkers = self.WALKERS.format(self.n_blocks)
+        atomic_savez(os.path.join(self.output_dir, walkers), positions=self.positions,
+                     log_prob=self.current_log_prob, accepted=self.accepted)
+        # Until this write the state still names the previous block's walkers
+        atomic_write_text(os.path.join(self.output_dir, self.STATE), json.dumps({
+            'settings': self._settings(),
+            'n_blocks': self.n_blocks,
+        }, indent=2))
+        remove_stale(self.output_dir, self.WALKERS.replace('{:05d}', '*'), walkers)
+    
+    def run(self, n_steps: int,
+            progress: Optional[Callable[[int, float], None]] = None) -> 'EnsembleSampler':
+        """
+        Run until at least n_steps steps per walker are taken (resuming if needed).
+        
+        Steps are taken in whole blocks, so n_steps is rounded up to a
+        multiple of block_size.
+        
+        Args:
+            n_steps: Total steps per walker, including any already taken
+            progress: Optional callback (steps taken, acceptance fraction)
+        
+        Returns:
+            The sampler
+        """
+        if self.current_log_prob is None:
+            self.current_log_prob = np.asarray(self.log_prob(self.positions), dtype=float)
+            if not np.all(np.isfinite(self.current_log_prob)):
+                raise ValueError("Initial walkers must have finite log-probability")
+        if self.n_steps >= n_steps:
+            return self
+        
+        n_groups = max(1, min(self.n_workers, self.n_ensembles))
+        groups = np.array_split(np.arange(self.n_ensembles), n_groups)
+        per_ensemble = self.n_walkers // self.n_ensembles
+        executor = make_executor(self.n_workers) if n_groups > 1 else None
+        try:
+            while self.n_steps < n_steps:
+                positions = self.positions.reshape(self.n_ensembles, per_ensemble, -1)
+                log_probs = self.current_log_prob.reshape(self.n_ensembles, per_ensemble)
+                tasks = [(self.log_prob, positions[g], log_probs[g], self.seed, g.tolist(),
+                          self.n_blocks, self.block_size, self.thin, self.stretch) for g in groups]
+                if executor is None:
+                    results = [_advance_block(task) for task in tasks]
+                else:
+                    results = list(executor.map(_advance_block, tasks))
+                
+                def gather(i: int, axis: int) -> np.ndarray:
+                    joined = np.concatenate([r[i] for r in results], axis=axis)
+                    return joined.reshape(joined.shape[:axis] + (self.n_walkers,) + joined.shape[axis + 2:])
+                
+                chain, chain_log_prob = gather(0, 1), gather(1, 1)
+                self.positions, self.current_log_prob = gather(2, 0), gather(3, 0)
+                self.accepted = self.accepted + gather(4, 0)
+                self.n_blocks += 1
+                self._checkpoint(chain, chain_log_prob)
+                if progress:
+                    progress(self.n_steps, float(self.acceptance_fraction.mean()))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return self
+    
+    @property
+    def acceptance_fraction(self) -> np.ndarray:
+        """Fraction of accepted proposals per walker."""
+        return self.accepted / max(self.n_steps, 1)
+    
+    def get_chain(self, burn: int = 0, flat: bool = False) -> np.ndarray:
+        """
+        Stored chain.
+        
+        Args:
+            burn: Stored steps to drop from the start
+            flat: Merge steps and walkers into one sample axis
+        
+        Returns:
+            (steps, n_walkers, d) positions, or (steps × n_walkers, d) if flat
+        """
+        chain = self._load('chain', self._chain, (self.n_walkers, self.n_dimensions))[burn:]
+        return chain.reshape(-1, self.n_dimensions) if flat else chain
+    
+    def get_log_prob(self, burn: int = 0, flat: bool = False) -> np.ndarray:
+        """
+        Stored log-probabilities, aligned with get_chain.
+        
+        Returns:
+            (steps, n_walkers), or (steps × n_walkers,) if flat
+        """
+        log_prob = self._load('log_prob', self._chain_log_prob, (self.n_walkers,))[burn:]
+        return log_prob.ravel() if flat else log_prob
+    
+    def _load(self, kind: str, memory: List[np.ndarray], shape: Tuple[int, ...]) -> np.ndarray:
+        if self.output_dir is None:
+            blocks = memory
+        else:
+            blocks = [np.load(self._block_path(kind, k), mmap_mode='r') for k in range(self.n_blocks)]
+        if not blocks:
+            return np.zeros((0,) + shape)
+        return np.concatenate(blocks)
+    
+    def autocorrelation_time(self, burn: int = 0, window: float = 5.0) -> np.ndarray:
+        """
+        Integrated autocorrelation time per parameter, in stored steps.
+        
+        Uses the walker-averaged autocorrelation function (FFT) with
+        Sokal's automatic window M ≥ window × τ.
+        
+        Args:
+            burn: Stored steps to drop from the start
+            window: Window constant
+        
+        Returns:
+            (d,) autocorrelation times
+        """
+        chain = np.asarray(self.get_chain(burn))
+        n = len(chain)
+        if n < 2:
+            raise ValueError("Need at least two stored steps")
+        centred = chain - chain.mean(axis=0)
+        spectrum = np.fft.rfft(centred, n=2 * n, axis=0)
+        acf = np.fft.irfft(spectrum * spectrum.conj(), axis=0)[:n].mean(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            acf = acf / acf[0]
+        tau = 2.0 * np.cumsum(acf, axis=0) - 1.0
+        tau = np.nan_to_num(tau, nan=1.0)
+        m = np.arange(n)[:, None]
+        cut = np.argmax(m >= window * tau, axis=0)
+        cut = np.where(np.any(m >= window * tau, axis=0), cut, n - 1)
+        return tau[cut, np.arange(self.n_dimensions)]
+    
+    def __repr__(self) -> str:
+        return (f"EnsembleSampler(walkers={self.n_walkers}, ensembles={self.n_ensembles}, "
+                f"steps={self.n_steps})")
@@ -0,0 +1,342 @@
+"""
+Quasar absorber Δα/α and its redshift trend (Protocol 3).
+
+α = e²/(4πε₀ℏc), so a varying c shows up as Δα/α ≈ -Δc/c. Lines of an
+absorber at redshift z shift with α through their sensitivity
+coefficients q (many-multiplet method):
+
+    ω₀ = (1 + z) ω_obs - q x,    x = (α_z/α₀)² - 1 ≈ 2 Δα/α
+
+Dividing by ω_obs turns each absorber into a straight-line fit of
+y = ω₀/ω_obs against u = q/ω_obs with intercept 1 + z and slope -x.
+Lines are stored as memory-mapped columns grouped by absorber, and all
+absorbers in a chunk are fitted at once with grouped reductions
+(np.add.reduceat). The survey-level trend of Δc/c with redshift gets
+bootstrap and permutation significance on a process pool.
+"""
+
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .._parallel import parallel_map, resolve_workers, stream_rng
+from ..core.constants import FINE_STRUCTURE_CONSTANT
+from ._columns import open_column, read_layout, write_columns
+
+
+LINE_COLUMNS = ('wavelength', 'wavelength_error', 'lab_wavenumber', 'q')
+
+
+class AbsorberCatalog:
+    """
+    Absorption lines grouped by absorber, as memory-mapped columns.
+    
+    Per-line columns (SI units; multiply cm⁻¹ by 100 for m⁻¹):
+        wavelength        observed vacuum wavelength (m)
+        wavelength_error  its 1σ uncertainty (m)
+        lab_wavenumber    laboratory wavenumber ω₀ (m⁻¹)
+        q                 sensitivity coefficient (m⁻¹)
+    """
+    
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Open a catalog written by AbsorberCatalog.write.
+        
+        Args:
+            directory: Catalog directory (None for an empty in-memory catalog)
+        """
+        self.directory = directory
+        self.columns: Dict[str, np.ndarray] = {}
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.meta = []
+        if directory is not None:
+            self.offsets, self.meta = read_layout(directory)
+            self.columns = {name: open_column(directory, name) for name in LINE_COLUMNS}
+    
+    @classmethod
+    def from_arrays(cls, columns: Mapping[str, np.ndarray], offsets: np.ndarray,
+                    meta: Optional[Sequence[Dict[str, Any]]] = None) -> 'AbsorberCatalog':
+        """
+        Build an in-memory catalog.
+        
+        Args:
+            columns: LINE_COLUMNS name -> per-line array
+            offsets: Absorber k owns lines [offsets[k], offsets[k + 1])
+            meta: Per-absorber metadata (default just names)
+        """
+        catalog = cls()
+        catalog.columns = {name: np.asarray(columns[name], dtype=float) for name in LINE_COLUMNS}
+        catalog.offsets = np.asarray(offsets, dtype=np.int64)
+        n = len(catalog.offsets) - 1
+        catalog.meta = list(meta) if meta is not None else [{'name': f'absorber_{k}'} for k in range(n)]
+        catalog._validate()
+        return catalog
+    
+    @classmethod
+    def write(cls, directory: str, absorbers: Sequence[Mapping[str, Any]]) -> 'AbsorberCatalog':
+        """
+        Write absorbers to a catalog directory.
+        
+        Args:
+            directory: Output directory
+            absorbers: Per-absorber mappings holding the LINE_COLUMNS arrays
+                plus optional 'name' and 'quasar'
+        
+        Returns:
+            The opened catalog
+        """
+        meta = [{'name': absorber.get('name', f'absorber_{k}'), 'quasar': absorber.get('quasar', '')}
+                for k, absorber in enumerate(absorbers)]
+        write_columns(directory, absorbers, LINE_COLUMNS, meta)
+        catalog = cls(directory)
+        catalog._validate()
+        return catalog
+    
+    def _validate(self) -> None:
+        if np.any(np.diff(self.offsets) < 1):
+            raise ValueError("Every absorber needs at least one line")
+        for name in LINE_COLUMNS:
+            if len(self.columns[name]) != self.offsets[-1]:
+                raise ValueError(f"Column {name!r} does not match the offsets")
+    
+    @property
+    def names(self):
+        return [entry['name'] for entry in self.meta]
+    
+    @property
+    def n_lines(self) -> int:
+        return int(self.offsets[-1])
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    def __repr__(self) -> str:
+        return f"AbsorberCatalog(absorbers={len(self)}, lines={self.n_lines})"
+
+
+def _fit_group_rows(columns: Dict[str, np.ndarray], offsets: np.ndarray,
+                    first: int, last: int) -> Dict[str, np.ndarray]:
+    """Fit absorbers [first, last) whose lines are contiguous rows."""
+    rows = slice(int(offsets[first]), int(offsets[last]))
+    wavelength = np.asarray(columns['wavelength'][rows], dtype=float)
+    error = np.asarray(columns['wavelength_error'][rows], dtype=float)
+    y = np.asarray(columns['lab_wavenumber'][rows], dtype=float) * wavelength
+    u = np.asarray(columns['q'][rows], dtype=float) * wavelength
+    # σ_y / y = σ_λ / λ
+    w = (wavelength / (y * error))**2
+    
+    counts = np.diff(offsets[first:last + 1])
+    starts = offsets[first:last] - offsets[first]
+    total = np.add.reduceat(w, starts)
+    mu = np.add.reduceat(w * u, starts) / total
+    my = np.add.reduceat(w * y, starts) / total
+    du = u - np.repeat(mu, counts)
+    dy = y - np.repeat(my, counts)
+    cuu = np.add.reduceat(w * du * du, starts)
+    cuy = np.add.reduceat(w * du * dy, starts)
+    cyy = np.add.reduceat(w * dy * dy, starts)
+    
+    fitted = (counts >= 2) & (cuu > 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = np.where(fitted, cuy / cuu, np.nan)
+        slope_error = np.where(fitted, 1.0 / np.sqrt(cuu), np.nan)
+        chi2 = np.where(counts > 2, cyy - cuy * slope, np.nan)
+        # Intercept error at u = 0: var = 1/W + mu²/Cuu
+        intercept_error = np.where(fitted, np.sqrt(1.0 / total + mu**2 / cuu), np.nan)
+    return {
+        'redshift': my - slope * mu - 1.0,
+        'redshift_error': intercept_error,
+        'x': -slope,
+        'x_error': slope_error,
+        'chi2': chi2,
+        'n_lines': counts,
+    }
+
+
+class ManyMultipletFitter:
+    """
+    Per-absorber fits of redshift and Δα/α in vectorized batches.
+    """
+    
+    def __init__(self, chunk_size: int = 1_000_000, scale_errors: bool = False):
+        """
+        Initialize the fitter.
+        
+        Args:
+            chunk_size: Approximate lines read per batch
+            scale_errors: Inflate errors by sqrt(χ²/dof) where that exceeds 1
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self.chunk_size = chunk_size
+        self.scale_errors = scale_errors
+    
+    def _batches(self, offsets: np.ndarray):
+        """Absorber ranges holding about chunk_size lines each."""
+        n = len(offsets) - 1
+        first = 0
+        while first < n:
+            last = int(np.searchsorted(offsets, offsets[first] + self.chunk_size, side='right')) - 1
+            last = min(max(last, first + 1), n)
+            yield first, last
+            first = last
+    
+    def fit(self, catalog: AbsorberCatalog) -> Dict[str, np.ndarray]:
+        """
+        Fit every absorber.
+        
+        Absorbers with a single line (or no spread in q) get NaN results.
+        
+        Args:
+            catalog: Absorber catalog
+        
+        Returns:
+            Per-absorber arrays 'redshift', 'redshift_error',
+            'delta_alpha' (Δα/α), 'delta_alpha_error', 'delta_c' (Δc/c),
+            'delta_c_error', 'alpha' (α at the absorber), 'chi2' and 'n_lines'
+        """
+        parts = [_fit_group_rows(catalog.columns, catalog.offsets, first, last)
+                 for first, last in self._batches(catalog.offsets)]
+        result = {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+        
+        x, x_error = result.pop('x'), result.pop('x_error')
+        if self.scale_errors:
+            dof = result['n_lines'] - 2
+            with np.errstate(invalid='ignore', divide='ignore'):
+                factor = np.sqrt(np.maximum(result['chi2'] / dof, 1.0))
+            factor = np.where(np.isfinite(factor), factor, 1.0)
+            x_error = x_error * factor
+            result['redshift_error'] = result['redshift_error'] * factor
+        
+        # x = (α_z/α₀)² - 1, and α ∝ 1/c
+        delta_alpha = np.sqrt(1.0 + x) - 1.0
+        delta_alpha_error = 0.5 * x_error / np.sqrt(1.0 + x)
+        result.update({
+            'delta_alpha': delta_alpha,
+            'delta_alpha_error': delta_alpha_error,
+            'delta_c': -delta_alpha,
+            'delta_c_error': delta_alpha_error,
+            'alpha': FINE_STRUCTURE_CONSTANT * (1.0 + delta_alpha),
+        })
+        return result
+    
+    def __repr__(self) -> str:
+        return f"ManyMultipletFitter(chunk_size={self.chunk_size})"
+
+
+def _weighted_line(x: np.ndarray, y: np.ndarray, w: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Weighted least-squares slope and intercept along the last axis."""
+    total = np.sum(w, axis=-1)
+    mx = np.sum(w * x, axis=-1) / total
+    my = np.sum(w * y, axis=-1) / total
+    dx = x - mx[..., None]
+    slope = np.sum(w * dx * (y - my[..., None]), axis=-1) / np.sum(w * dx * dx, axis=-1)
+    return slope, my - slope * mx
+
+
+def _trend_task(task: Tuple) -> np.ndarray:
+    """Slopes of a group of bootstrap or permutation replicates; runs in workers."""
+    kind, z, values, weights, seed, index, count = task
+    rng = stream_rng(seed, index)
+    n = len(z)
+    if kind == 'bootstrap':
+        picks = rng.integers(0, n, size=(count, n))
+        slopes, _ = _weighted_line(z[picks], values[picks], weights[picks])
+    else:
+        order = rng.permuted(np.broadcast_to(np.arange(n), (count, n)), axis=1)
+        # Values and their weights move together against the redshifts
+        slopes, _ = _weighted_line(np.broadcast_to(z, (count, n)), values[order], weights[order])
+    return slopes
+
+
+class RedshiftTrend:
+    """
+    Linear trend of Δc/c with redshift across absorbers.
+    """
+    
+    def __init__(self, extra_scatter: float = 0.0, n_workers: Optional[int] = None):
+        """
+        Initialize the trend fit.
+        
+        Args:
+            extra_scatter: Scatter added in quadrature to each error, for
+                unmodelled systematics
+            n_workers: Worker processes (None for all cores, 0/1 in-process)
+        """
+        if extra_scatter < 0:
+            raise ValueError("extra_scatter must be non-negative")
+        self.extra_scatter = extra_scatter
+        self.n_workers = resolve_workers(n_workers)
+    
+    def _inputs(self, redshift, delta_c, error) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        redshift, delta_c, error = (np.asarray(a, dtype=float) for a in (redshift, delta_c, error))
+        keep = np.isfinite(redshift) & np.isfinite(delta_c) & np.isfinite(error)
+        if np.count_nonzero(keep) < 3:
+            raise ValueError("Need at least three fitted absorbers")
+        weights = 1.0 / (error[keep]**2 + self.extra_scatter**2)
+        return redshift[keep], delta_c[keep], weights
+    
+    def fit(self, redshift: np.ndarray, delta_c: np.ndarray, error: np.ndarray) -> Dict[str, float]:
+        """
+        Weighted linear fit Δc/c = intercept + slope · z.
+        
+        Absorbers with non-finite values are skipped.
+        
+        Args:
+            redshift: Absorber redshifts
+            delta_c: Δc/c per absorber
+            error: 1σ errors of Δc/c
+        
+        Returns:
+            Dictionary with 'slope', 'slope_error', 'intercept', 'chi2'
+            and 'n_absorbers'
+        """
+        z, values, weights = self._inputs(redshift, delta_c, error)
+        slope, intercept = _weighted_line(z, values, weights)
+        mz = np.sum(weights * z) / np.sum(weights)
+        residual = values - intercept - slope * z
+        return {
+            'slope': float(slope),
+            'slope_error': float(1.0 / np.sqrt(np.sum(weights * (z - mz)**2))),
+            'intercept': float(intercept),
+            'chi2': float(np.sum(weights * residual**2)),
+            'n_absorbers': len(z),
+        }
+    
+    def _replicates(self, kind: str, redshift, delta_c, error, n: int, seed: int,
+                    per_task: int) -> np.ndarray:
+        z, values, weights = self._inputs(redshift, delta_c, error)
+        tasks = [(kind, z, values, weights, seed, k, min(per_task, n - start))
+                 for k, start in enumerate(range(0, n, per_task))]
+        return np.concatenate(parallel_map(_trend_task, tasks, self.n_workers))
+    
+    def bootstrap(self, redshift, delta_c, error, n_resamples: int = 1000, seed: int = 0,
+                  resamples_per_task: int = 100) -> np.ndarray:
+        """
+        Trend slopes of absorber-bootstrap resamples.
+        
+        Returns:
+            Replicate slopes
+        """
+        return self._replicates('bootstrap', redshift, delta_c, error, n_resamples, seed,
+                                resamples_per_task)
+    
+    def permutation_test(self, redshift, delta_c, error, n_permutations: int = 999,
+                         seed: int = 0, permutations_per_task: int = 100) -> Dict[str, Any]:
+        """
+        Permutation significance of a non-zero trend.
+        
+        Δc/c values (with their errors) are shuffled across redshifts.
+        
+        Returns:
+            Dictionary with the observed 'slope', two-sided 'p_value' and
+            the 'null' slopes
+        """
+        observed = self.fit(redshift, delta_c, error)['slope']
+        null = self._replicates('permutation', redshift, delta_c, error, n_permutations, seed,
+                                permutations_per_task)
+        exceed = np.count_nonzero(np.abs(null) >= abs(observed))
+        return {'slope': observed, 'p_value': (1 + exceed) / (1 + len(null)), 'null': null}
+    
+    def __repr__(self) -> str:
+        return f"RedshiftTrend(extra_scatter={self.extra_scatter:.2e})"
@@ -0,0 +1,19 @@
+"""
+Performance benchmarks for the library's hot paths.
+
+Run with ``python -m infospace.benchmarks run`` and compare against a
+stored baseline with ``python -m infospace.benchmarks compare``.
+"""
+
+from .runner import BENCHMARKS, benchmark, run_benchmarks, machine_metadata, save_results, load_results, compare_results
+from . import suite
+
+__all__ = [
+    'BENCHMARKS',
+    'benchmark',
+    'run_benchmarks',
+    'machine_metadata',
+    'save_results',
+    'load_results',
+    'compare_results',
+]
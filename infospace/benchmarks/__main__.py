@@ -0,0 +1,66 @@
+"""
+Command-line entry point for the benchmark suite.
+
+    python -m infospace.benchmarks run -o results.json [--baseline base.json]
+    python -m infospace.benchmarks compare base.json results.json
+"""
+
+import argparse
+import sys
+
+from .runner import BENCHMARKS, compare_results, load_results, run_benchmarks, save_results
+from . import suite  # noqa: F401  (registers the benchmarks)
+
+
+def _report(rows, tolerance: float) -> int:
+    print(f"{'benchmark':<45} {'size':>9} {'baseline':>11} {'current':>11} {'ratio':>7}")
+    for row in rows:
+        flag = '  SLOWER' if row['regression'] else ''
+        print(f"{row['name']:<45} {row['size']:>9} {row['baseline']:>11.3e} "
+              f"{row['current']:>11.3e} {row['ratio']:>7.2f}{flag}")
+    regressions = [row for row in rows if row['regression']]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {tolerance:.0%}")
+        return 1
+    print(f"\nNo regressions beyond {tolerance:.0%}")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m infospace.benchmarks')
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    run = commands.add_parser('run', help='run benchmarks and write JSON results')
+    run.add_argument('-o', '--output', default='benchmarks.json')
+    run.add_argument('-k', '--filter', default='', help='only names containing this text')
+    run.add_argument('--sizes', type=int, nargs='+', help='override input sizes')
+    run.add_argument('--repeat', type=int, default=5)
+    run.add_argument('--min-time', type=float, default=0.05)
+    run.add_argument('--baseline', help='compare against this result file afterwards')
+    run.add_argument('--tolerance', type=float, default=0.25)
+    
+    compare = commands.add_parser('compare', help='flag slowdowns against a baseline')
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--tolerance', type=float, default=0.25)
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == 'run':
+        names = [name for name in sorted(BENCHMARKS) if args.filter in name]
+        document = run_benchmarks(
+            names, sizes=args.sizes, repeat=args.repeat, min_time=args.min_time,
+            progress=lambda name, n, t: print(f"{name:<45} n={n:<9} {t:.3e} s"))
+        save_results(document, args.output)
+        print(f"\nWrote {args.output}")
+        if args.baseline:
+            return _report(compare_results(load_results(args.baseline), document,
+                                           args.tolerance), args.tolerance)
+        return 0
+    
+    return _report(compare_results(load_results(args.baseline), load_results(args.current),
+                                   args.tolerance), args.tolerance)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
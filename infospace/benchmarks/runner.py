@@ -0,0 +1,168 @@
+"""
+Benchmark registry, timing, result files and regression comparison.
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+# name -> {'setup': setup(n) -> zero-arg callable, 'sizes': default sizes, 'group': hot path}
+BENCHMARKS: Dict[str, Dict] = {}
+
+
+def benchmark(name: str, sizes: Sequence[int], group: Optional[str] = None) -> Callable:
+    """
+    Register a benchmark.
+    
+    The decorated function takes an input size n and returns a zero-argument
+    callable that performs the timed work on n items.
+    
+    Args:
+        name: Unique benchmark name
+        sizes: Default input sizes
+        group: Hot path the benchmark belongs to (defaults to name)
+    """
+    def register(setup: Callable[[int], Callable[[], object]]) -> Callable:
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark {name!r} already registered")
+        BENCHMARKS[name] = {'setup': setup, 'sizes': tuple(sizes), 'group': group or name}
+        return setup
+    return register
+
+
+def _time_call(func: Callable[[], object], repeat: int, min_time: float) -> List[float]:
+    """Seconds per call over `repeat` rounds, each at least min_time long."""
+    func()  # warm-up
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, int(1.2 * min_time / elapsed))
+    
+    rounds = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        rounds.append((time.perf_counter() - start) / loops)
+    return rounds
+
+
+def machine_metadata() -> Dict[str, object]:
+    """Describe the machine and software the benchmarks ran on."""
+    from .. import __version__
+    
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'infospace': __version__,
+    }
+
+
+def run_benchmarks(names: Optional[Sequence[str]] = None,
+                   sizes: Optional[Sequence[int]] = None,
+                   repeat: int = 5,
+                   min_time: float = 0.05,
+                   progress: Optional[Callable[[str, int, float], None]] = None) -> Dict[str, object]:
+    """
+    Run registered benchmarks.
+    
+    Args:
+        names: Benchmarks to run (default all)
+        sizes: Override the input sizes of every benchmark
+        repeat: Timing rounds per size
+        min_time: Minimum seconds per round
+        progress: Optional callback (name, size, seconds per call)
+    
+    Returns:
+        Result document with machine metadata and per-size timings
+    """
+    if names is None:
+        names = sorted(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise KeyError(f"Unknown benchmarks: {sorted(unknown)}")
+    
+    results = {}
+    for name in names:
+        spec = BENCHMARKS[name]
+        entries = []
+        for n in (sizes or spec['sizes']):
+            rounds = _time_call(spec['setup'](n), repeat, min_time)
+            best = min(rounds)
+            entries.append({
+                'size': n,
+                'best': best,
+                'median': float(np.median(rounds)),
+                'per_item': best / n,
+            })
+            if progress:
+                progress(name, n, best)
+        results[name] = {'group': spec['group'], 'sizes': entries}
+    
+    return {'metadata': machine_metadata(), 'results': results}
+
+
+def save_results(document: Dict[str, object], path: str) -> None:
+    """Write a result document as JSON."""
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, object]:
+    """Read a result document written by save_results."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_results(baseline: Dict[str, object], current: Dict[str, object],
+                    tolerance: float = 0.25) -> List[Dict[str, object]]:
+    """
+    Compare two result documents.
+    
+    Benchmarks and sizes present in only one document are skipped.
+    
+    Args:
+        baseline: Stored baseline document
+        current: New document
+        tolerance: Allowed relative slowdown of the best time (0.25 = 25%)
+    
+    Returns:
+        One row per shared (benchmark, size) with the time ratio and a
+        'regression' flag
+    """
+    rows = []
+    for name, entry in current['results'].items():
+        base_entry = baseline['results'].get(name)
+        if base_entry is None:
+            continue
+        base_by_size = {e['size']: e for e in base_entry['sizes']}
+        for e in entry['sizes']:
+            base = base_by_size.get(e['size'])
+            if base is None:
+                continue
+            ratio = e['best'] / base['best'] if base['best'] > 0 else np.inf
+            rows.append({
+                'name': name,
+                'size': e['size'],
+                'baseline': base['best'],
+                'current': e['best'],
+                'ratio': ratio,
+                'regression': ratio > 1.0 + tolerance,
+            })
+    return rows
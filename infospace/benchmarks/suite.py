@@ -0,0 +1,246 @@
+"""
+Benchmarks for the hot paths, each at several input sizes.
+
+Scalar variants loop over n inputs in Python; batched variants process
+the same n inputs in one call, so per_item times are comparable.
+"""
+
+import numpy as np
+
+from ..analysis.inference import EnsembleSampler, MissingEnergyLikelihood
+from ..core.constants import GEV_TO_JOULES, SPEED_OF_LIGHT
+from ..core.energy import Energy, EnergyArray
+from ..core.lightcone import LightConeIndex
+from ..core.space import EMSpace, GravitationalSpace, HypotheticalSpace
+from ..interactions.contact_point import ContactPoint
+from ..interactions.coupling import PowerLawCoupling
+from ..interactions.hamiltonian import ContactHamiltonian, LevelStructure, clear_spectrum_cache
+from ..interactions.kinetics import ContactKinetics
+from ..interactions.network import ContactNetwork
+from ..optimize.pareto import non_dominated_sort
+from ..simulation.lhc import LHCMonteCarlo, simulate_lhc_collision
+from ..simulation.store import ResultStore
+from ..simulation.waves import CoupledWaveSolver
+from ..transforms.lorentz import BatchedLorentzTransform, LorentzTransform
+from ..transforms.projection import ProjectionOperator
+from .runner import benchmark
+
+
+SCALAR_SIZES = (100, 1_000, 10_000)
+BATCH_SIZES = (1_000, 100_000, 1_000_000)
+
+
+def _velocities(n: int) -> np.ndarray:
+    return np.random.default_rng(0).uniform(-0.99, 0.99, n) * SPEED_OF_LIGHT
+
+
+@benchmark('gamma_factor.scalar', SCALAR_SIZES, group='gamma_factor')
+def gamma_factor_scalar(n):
+    em = EMSpace()
+    velocities = _velocities(n).tolist()
+    return lambda: [em.gamma_factor(v) for v in velocities]
+
+
+@benchmark('gamma_factor.array', BATCH_SIZES, group='gamma_factor')
+def gamma_factor_array(n):
+    em = EMSpace()
+    velocities = _velocities(n)
+    return lambda: em.gamma_factor(velocities)
+
+
+@benchmark('lorentz.construct.scalar', SCALAR_SIZES, group='lorentz')
+def lorentz_construct_scalar(n):
+    em = EMSpace()
+    velocities = _velocities(n).tolist()
+    return lambda: [LorentzTransform(em, v) for v in velocities]
+
+
+@benchmark('lorentz.construct.batched', BATCH_SIZES, group='lorentz')
+def lorentz_construct_batched(n):
+    em = EMSpace()
+    velocities = _velocities(n)
+    return lambda: BatchedLorentzTransform(em, velocities)
+
+
+@benchmark('lorentz.transform_position.scalar', SCALAR_SIZES, group='lorentz')
+def lorentz_position_scalar(n):
+    transform = LorentzTransform(EMSpace(), 0.5 * SPEED_OF_LIGHT)
+    xs = np.linspace(0, 1e9, n).tolist()
+    return lambda: [transform.transform_position(x, 1.0) for x in xs]
+
+
+@benchmark('lorentz.transform_events.batched', BATCH_SIZES, group='lorentz')
+def lorentz_events_batched(n):
+    batch = BatchedLorentzTransform(EMSpace(), _velocities(n))
+    events = np.random.default_rng(1).normal(size=(n, 4))
+    return lambda: batch.transform_events(events)
+
+
+def _contact() -> ContactPoint:
+    x_space = HypotheticalSpace(Vmax=10 * SPEED_OF_LIGHT, lambda_scale=1e-15, rho_density=1e25)
+    return ContactPoint(x_space, EMSpace(), coupling_strength=1e-5)
+
+
+@benchmark('contact.transition_efficiency.cached', SCALAR_SIZES, group='contact')
+def contact_efficiency_cached(n):
+    contact = _contact()
+    return lambda: [contact.transition_efficiency() for _ in range(n)]
+
+
+@benchmark('contact.transition_efficiency.uncached', SCALAR_SIZES, group='contact')
+def contact_efficiency_uncached(n):
+    contact = _contact()
+    
+    def run():
+        for _ in range(n):
+            contact.invalidate_cache()
+            contact.transition_efficiency()
+    return run
+
+
+@benchmark('contact.transition_many', BATCH_SIZES, group='contact')
+def contact_transition_many(n):
+    contact = _contact()
+    energies = EnergyArray(contact.space_x, np.ones(n))
+    return lambda: contact.transition_many(energies)
+
+
+@benchmark('coupling.table_lookup', BATCH_SIZES, group='contact')
+def coupling_table_lookup(n):
+    model = PowerLawCoupling(1e-40, 15.0 * GEV_TO_JOULES, exponent=2.0, max_coupling=1e-10)
+    energies = np.geomspace(1.0, 1e4, n) * GEV_TO_JOULES
+    model(energies[:1])
+    return lambda: model(energies)
+
+
+@benchmark('kinetics.sweep', (10, 100, 1_000), group='contact')
+def kinetics_sweep(n):
+    spaces = [HypotheticalSpace(Vmax=(2 + k) * SPEED_OF_LIGHT, lambda_scale=1e-10 * (1 + 0.01 * k),
+                                rho_density=1e29) for k in range(100)]
+    kinetics = ContactKinetics(ContactNetwork(spaces, 0.1), 1e-34)
+    populations = np.eye(1, len(spaces))[0]
+    scales = np.linspace(0.5, 2.0, n)
+    times = np.geomspace(1e-3, 1e3, 16)
+    return lambda: kinetics.sweep(populations, times, efficiency_scale=scales, n_workers=0)
+
+
+@benchmark('hamiltonian.spectrum', (10_000, 100_000, 1_000_000), group='contact')
+def hamiltonian_spectrum(n):
+    em = EMSpace()
+    x = HypotheticalSpace(Vmax=2 * SPEED_OF_LIGHT, lambda_scale=1e-10, rho_density=1e29)
+    em_levels, x_levels = LevelStructure(em, n // 2), LevelStructure(x, n // 2)
+    contact = ContactPoint(x, em, 0.3)
+    
+    def run():
+        clear_spectrum_cache()
+        ContactHamiltonian(contact, em_levels, x_levels).spectrum(6)
+    return run
+
+
+@benchmark('pareto.non_dominated_sort', (10_000, 100_000, 1_000_000), group='optimize')
+def pareto_non_dominated_sort(n):
+    objectives = np.random.default_rng(0).random((n, 2))
+    return lambda: non_dominated_sort(objectives)
+
+
+@benchmark('energy.add.scalar', SCALAR_SIZES, group='energy')
+def energy_add_scalar(n):
+    em = EMSpace()
+    energies = [Energy(em, float(i)) for i in range(n)]
+    
+    def run():
+        total = Energy(em, 0.0)
+        for energy in energies:
+            total = total + energy
+        return total
+    return run
+
+
+@benchmark('energy.add.array', BATCH_SIZES, group='energy')
+def energy_add_array(n):
+    energies = EnergyArray(EMSpace(), np.arange(n, dtype=float))
+    return lambda: (energies + energies).sum()
+
+
+@benchmark('projection.project_velocity.scalar', SCALAR_SIZES, group='projection')
+def projection_velocity_scalar(n):
+    projection = ProjectionOperator(HypotheticalSpace(Vmax=10 * SPEED_OF_LIGHT), EMSpace())
+    velocities = (_velocities(n) * 5).tolist()
+    return lambda: [projection.project_velocity(v) for v in velocities]
+
+
+@benchmark('projection.project_velocity.array', BATCH_SIZES, group='projection')
+def projection_velocity_array(n):
+    projection = ProjectionOperator(HypotheticalSpace(Vmax=10 * SPEED_OF_LIGHT), EMSpace())
+    velocities = _velocities(n) * 5
+    return lambda: projection.project_velocity(velocities)
+
+
+@benchmark('projection.project_stream', BATCH_SIZES, group='projection')
+def projection_stream(n):
+    projection = ProjectionOperator(HypotheticalSpace(Vmax=10 * SPEED_OF_LIGHT), EMSpace())
+    chunks = np.array_split(_velocities(n) * 5, max(1, n // 65_536))
+    return lambda: [stats for _, stats in projection.project_stream(chunks)][-1]
+
+
+@benchmark('lightcone.count', SCALAR_SIZES, group='lightcone')
+def lightcone_count(n):
+    rng = np.random.default_rng(0)
+    n_events = 200_000
+    index = LightConeIndex(rng.uniform(0, 1, n_events),
+                           rng.uniform(-5, 5, (n_events, 3)) * SPEED_OF_LIGHT)
+    spaces = [EMSpace(), GravitationalSpace(), HypotheticalSpace(Vmax=3 * SPEED_OF_LIGHT)]
+    queries = rng.integers(0, n_events, n)
+    return lambda: index.count(spaces, queries)
+
+
+@benchmark('lhc.simulate_lhc_collision.scalar', SCALAR_SIZES, group='lhc')
+def lhc_scalar(n):
+    energies = np.linspace(5000, 30000, n).tolist()
+    return lambda: [simulate_lhc_collision(E, threshold_energy_gev=15000) for E in energies]
+
+
+@benchmark('lhc.monte_carlo.batched', BATCH_SIZES, group='lhc')
+def lhc_monte_carlo(n):
+    engine = LHCMonteCarlo(threshold_energy_gev=15000, resolution=0.05, seed=0)
+    return lambda: engine.run(n, collision_energy_gev=20000)
+
+
+@benchmark('lhc.store.select', BATCH_SIZES, group='lhc')
+def lhc_store_select(n):
+    import atexit
+    import shutil
+    import tempfile
+    
+    path = tempfile.mkdtemp(prefix='infospace-store-')
+    atexit.register(shutil.rmtree, path, True)
+    store = ResultStore(path, {'threshold_gev': 'f8', 'collision_energy_gev': 'f8',
+                               'missing_fraction': 'f8'}, parameters=['threshold_gev'])
+    rng = np.random.default_rng(0)
+    for start in range(0, n, 65_536):
+        size = min(65_536, n - start)
+        store.append({'threshold_gev': rng.uniform(1, 100, size),
+                      'collision_energy_gev': rng.uniform(1, 200, size),
+                      'missing_fraction': rng.random(size)})
+    where = {'threshold_gev': (10.0, 11.0), 'collision_energy_gev': (50.0, 150.0)}
+    return lambda: store.select(['missing_fraction'], where)
+
+
+@benchmark('lhc.inference.sample', (10_000, 100_000, 1_000_000), group='lhc')
+def lhc_inference_sample(n):
+    energies = np.linspace(5.0, 200.0, 50)
+    likelihood = MissingEnergyLikelihood(energies, np.full(50, 0.5), sigma=0.05)
+    initial = likelihood.sample_prior(np.random.default_rng(0), 64)
+    steps = -(-n // 64)
+    return lambda: EnsembleSampler(likelihood, initial, n_workers=0, block_size=steps).run(steps)
+
+
+@benchmark('waves.step', BATCH_SIZES, group='waves')
+def waves_step(n):
+    side = max(3, round(n ** (1 / 3)))
+    fast = HypotheticalSpace(Vmax=3 * SPEED_OF_LIGHT, lambda_scale=1e-10, rho_density=1e29)
+    contact = ContactPoint(fast, EMSpace(), coupling_strength=0.1)
+    solver = CoupledWaveSolver([fast, EMSpace()], (side,) * 3, spacing=1.0,
+                               contacts=[(contact, None)], dtype=np.float32)
+    solver.set_field(fast, np.random.default_rng(0).normal(size=(side,) * 3))
+    return solver.step
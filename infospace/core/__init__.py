@@ -1,7 +1,8 @@
 """Core module for infospace library."""
 
 from .space import InformationSpace, EMSpace, GravitationalSpace, HypotheticalSpace, SourceSpace
-from .energy import Energy
+from .energy import Energy, EnergyArray
+from .lightcone import LightConeIndex
 from .constants import *
 
 __all__ = [
@@ -11,4 +12,6 @@ __all__ = [
     'HypotheticalSpace',
     'SourceSpace',
     'Energy',
+    'EnergyArray',
+    'LightConeIndex',
 ]
@@ -43,3 +43,7 @@ EV_TO_JOULES = ELEMENTARY_CHARGE
 GEV_TO_JOULES = 1e9 * EV_TO_JOULES
 JOULES_TO_EV = 1.0 / EV_TO_JOULES
 JOULES_TO_GEV = 1.0 / GEV_TO_JOULES
+
+# Astronomical distances (m)
+PARSEC = 3.0856775814913673e16
+MEGAPARSEC = 1e6 * PARSEC
@@ -5,10 +5,13 @@ Energy is represented per carrier and depends on the information space.
 """
 
 import numpy as np
-from typing import Optional
+from typing import Optional, Sequence, Tuple, Union
 from .constants import HBAR, SPEED_OF_LIGHT
 
 
+ArrayLike = Union[float, np.ndarray]
+
+
 class Energy:
     """
     Energy in an information space.
@@ -46,7 +49,7 @@ class Energy:
         Returns:
             Total energy (J)
         """
-        return mass * self.space.Vmax ** 2
+        return mass * self.space.Vmax_sq
     
     def relativistic_energy(self, momentum: float, mass: float) -> float:
         """
@@ -62,7 +65,7 @@ class Energy:
             Total relativistic energy (J)
         """
         p_term = (momentum * self.space.Vmax) ** 2
-        m_term = (mass * self.space.Vmax ** 2) ** 2
+        m_term = (mass * self.space.Vmax_sq) ** 2
         return np.sqrt(p_term + m_term)
     
     def kinetic_energy(self, velocity: float, mass: float) -> float:
@@ -79,7 +82,7 @@ class Energy:
             Kinetic energy (J)
         """
         gamma = self.space.gamma_factor(velocity)
-        return (gamma - 1) * mass * self.space.Vmax ** 2
+        return (gamma - 1) * mass * self.space.Vmax_sq
     
     def photon_energy(self, frequency: float) -> float:
         """
@@ -169,8 +172,239 @@ class Energy:
     
     def __add__(self, other: 'Energy') -> 'Energy':
         """Add energies (must be in same space)."""
+        if not isinstance(other, Energy):
+            return NotImplemented
         if self.space != other.space:
             raise ValueError("Cannot add energies from different spaces")
         if self.carrier_energy is None or other.carrier_energy is None:
             raise ValueError("Cannot add energies without carrier_energy set")
         return Energy(self.space, self.carrier_energy + other.carrier_energy)
+
+
+class EnergyArray:
+    """
+    Energies of many carriers in one information space.
+    
+    Struct-of-arrays counterpart of Energy: carrier energies live in a
+    single float64 array tagged with one space, so arithmetic checks the
+    space once per operation instead of once per carrier.
+    """
+    
+    def __init__(self, space: 'InformationSpace', carrier_energies: Optional[ArrayLike] = None):
+        """
+        Initialize energies in a given space.
+        
+        Args:
+            space: Information space
+            carrier_energies: Energy per carrier (J), array-like, optional
+        """
+        from .space import InformationSpace
+        
+        if not isinstance(space, InformationSpace):
+            raise TypeError("space must be an InformationSpace instance")
+        
+        self.space = space
+        if carrier_energies is None:
+            self.carrier_energies = None
+        else:
+            self.carrier_energies = np.atleast_1d(np.asarray(carrier_energies, dtype=np.float64))
+    
+    @classmethod
+    def from_energies(cls, energies: Sequence[Energy]) -> 'EnergyArray':
+        """
+        Pack Energy objects sharing one space into an EnergyArray.
+        
+        Args:
+            energies: Energy objects with carrier_energy set
+            
+        Returns:
+            Energy array in their common space
+        """
+        if len(energies) == 0:
+            raise ValueError("Need at least one Energy")
+        space = energies[0].space
+        values = np.empty(len(energies))
+        for i, energy in enumerate(energies):
+            if energy.space != space:
+                raise ValueError("Cannot pack energies from different spaces")
+            if energy.carrier_energy is None:
+                raise ValueError("Cannot pack energies without carrier_energy set")
+            values[i] = energy.carrier_energy
+        return cls(space, values)
+    
+    def total_energy(self, mass: ArrayLike) -> np.ndarray:
+        """
+        Calculate total energies, E = m·Vmax².
+        
+        Args:
+            mass: Masses (kg)
+            
+        Returns:
+            Total energies (J)
+        """
+        return np.asarray(mass, dtype=float) * self.space.Vmax_sq
+    
+    def relativistic_energy(self, momentum: ArrayLike, mass: ArrayLike) -> np.ndarray:
+        """
+        Calculate relativistic energies, E² = (p·Vmax)² + (m·Vmax²)².
+        
+        Args:
+            momentum: Momenta (kg·m/s)
+            mass: Rest masses (kg)
+            
+        Returns:
+            Total relativistic energies (J)
+        """
+        p_term = (np.asarray(momentum, dtype=float) * self.space.Vmax) ** 2
+        m_term = (np.asarray(mass, dtype=float) * self.space.Vmax_sq) ** 2
+        return np.sqrt(p_term + m_term)
+    
+    def kinetic_energy(self, velocity: ArrayLike, mass: ArrayLike,
+                       invalid: str = 'raise') -> np.ndarray:
+        """
+        Calculate kinetic energies, K = (γ - 1)·m·Vmax².
+        
+        Args:
+            velocity: Velocities (m/s)
+            mass: Masses (kg)
+            invalid: Policy for |v| >= Vmax, see InformationSpace.gamma_factor
+            
+        Returns:
+            Kinetic energies (J)
+        """
+        gamma = self.space.gamma_factor(np.atleast_1d(np.asarray(velocity, dtype=float)),
+                                        invalid=invalid)
+        return (gamma - 1) * np.asarray(mass, dtype=float) * self.space.Vmax_sq
+    
+    def photon_energy(self, frequency: ArrayLike) -> np.ndarray:
+        """
+        Calculate photon energies, E = h·f.
+        
+        Args:
+            frequency: Frequencies (Hz)
+            
+        Returns:
+            Photon energies (J)
+        """
+        return HBAR * 2 * np.pi * np.asarray(frequency, dtype=float)
+    
+    def photon_frequency(self, energy: ArrayLike) -> np.ndarray:
+        """
+        Calculate photon frequencies, f = E/h.
+        
+        Args:
+            energy: Energies (J)
+            
+        Returns:
+            Frequencies (Hz)
+        """
+        return np.asarray(energy, dtype=float) / (HBAR * 2 * np.pi)
+    
+    def wavelength_to_energy(self, wavelength: ArrayLike) -> np.ndarray:
+        """
+        Convert wavelengths to energies, E = h·c/λ.
+        
+        Args:
+            wavelength: Wavelengths (m)
+            
+        Returns:
+            Energies (J)
+        """
+        return HBAR * 2 * np.pi * SPEED_OF_LIGHT / np.asarray(wavelength, dtype=float)
+    
+    def energy_to_wavelength(self, energy: ArrayLike) -> np.ndarray:
+        """
+        Convert energies to wavelengths, λ = h·c/E.
+        
+        Args:
+            energy: Energies (J)
+            
+        Returns:
+            Wavelengths (m)
+        """
+        return HBAR * 2 * np.pi * SPEED_OF_LIGHT / np.asarray(energy, dtype=float)
+    
+    def sum(self) -> Energy:
+        """Total carrier energy as a single Energy."""
+        return Energy(self.space, float(np.sum(self._values())))
+    
+    def mean(self) -> Energy:
+        """Mean carrier energy as a single Energy."""
+        return Energy(self.space, float(np.mean(self._values())))
+    
+    def histogram(self, bins=10, range: Optional[Tuple[float, float]] = None,
+                  weights: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Histogram of carrier energies.
+        
+        Args:
+            bins: Number of bins or bin edges (J), as for numpy.histogram
+            range: Lower and upper range of the bins (J)
+            weights: Per-carrier weights
+            
+        Returns:
+            (counts, bin_edges)
+        """
+        return np.histogram(self._values(), bins=bins, range=range, weights=weights)
+    
+    def _values(self) -> np.ndarray:
+        if self.carrier_energies is None:
+            raise ValueError("EnergyArray has no carrier_energies set")
+        return self.carrier_energies
+    
+    def _other_values(self, other) -> ArrayLike:
+        """Values of another Energy/EnergyArray after one space check."""
+        if other.space != self.space:
+            raise ValueError("Cannot combine energies from different spaces")
+        if isinstance(other, EnergyArray):
+            return other._values()
+        if other.carrier_energy is None:
+            raise ValueError("Cannot combine energies without carrier_energy set")
+        return other.carrier_energy
+    
+    def __len__(self) -> int:
+        return 0 if self.carrier_energies is None else len(self.carrier_energies)
+    
+    def __getitem__(self, index) -> Union[Energy, 'EnergyArray']:
+        values = self._values()[index]
+        if np.ndim(values) == 0:
+            return Energy(self.space, float(values))
+        return EnergyArray(self.space, values)
+    
+    def __repr__(self) -> str:
+        if self.carrier_energies is not None:
+            return f"EnergyArray(space={self.space.name}, n={len(self)})"
+        else:
+            return f"EnergyArray(space={self.space.name})"
+    
+    def __mul__(self, scalar: ArrayLike) -> 'EnergyArray':
+        """Multiply energies by a scalar or per-carrier factors."""
+        if isinstance(scalar, (Energy, EnergyArray)):
+            return NotImplemented
+        return EnergyArray(self.space, self._values() * scalar)
+    
+    def __rmul__(self, scalar: ArrayLike) -> 'EnergyArray':
+        """Right multiplication."""
+        return self.__mul__(scalar)
+    
+    def __truediv__(self, scalar: ArrayLike) -> 'EnergyArray':
+        """Divide energies by a scalar or per-carrier divisors."""
+        if isinstance(scalar, (Energy, EnergyArray)):
+            return NotImplemented
+        return EnergyArray(self.space, self._values() / scalar)
+    
+    def __add__(self, other: Union[Energy, 'EnergyArray']) -> 'EnergyArray':
+        """Add energies (must be in same space)."""
+        if not isinstance(other, (Energy, EnergyArray)):
+            return NotImplemented
+        return EnergyArray(self.space, self._values() + self._other_values(other))
+    
+    def __radd__(self, other: Energy) -> 'EnergyArray':
+        """Right addition."""
+        return self.__add__(other)
+    
+    def __sub__(self, other: Union[Energy, 'EnergyArray']) -> 'EnergyArray':
+        """Subtract energies (must be in same space)."""
+        if not isinstance(other, (Energy, EnergyArray)):
+            return NotImplemented
+        return EnergyArray(self.space, self._values() - self._other_values(other))
@@ -0,0 +1,298 @@
+"""
+Light-cone index for causal queries over large event sets.
+
+Events (t, x, y, z) are organized in a kd-tree whose nodes are 4-D boxes
+in time and space. For a query event and speed Vmax, a node is
+
+    outside the cone  if its nearest point is farther than Vmax·Δt_max
+    inside the cone   if its farthest point is nearer than Vmax·Δt_min
+
+and only nodes that are neither are opened. Queries are traversed
+together, one frontier of (query, node) pairs per level, and every Vmax
+is tested in the same pass, so counts for several spaces cost little
+more than for one. Causality follows InformationSpace.is_causal:
+Δt > Δx / Vmax, with SourceSpace connecting every pair.
+"""
+
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .constants import SPEED_OF_LIGHT
+
+
+DIRECTIONS = ('past', 'future', 'both')
+
+
+def _speeds(spaces: Sequence[Union['InformationSpace', float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Vmax per space and a mask of spaces where every pair is causal."""
+    from .space import SourceSpace
+    
+    speeds = np.array([getattr(space, 'Vmax', space) for space in spaces], dtype=float)
+    everything = np.array([isinstance(space, SourceSpace) for space in spaces], dtype=bool)
+    if np.any(speeds <= 0):
+        raise ValueError("Vmax must be positive")
+    return speeds, everything
+
+
+class LightConeIndex:
+    """
+    Spatio-temporal tree over events for batch light-cone queries.
+    """
+    
+    def __init__(self,
+                 times: np.ndarray,
+                 positions: np.ndarray,
+                 leaf_size: int = 64,
+                 reference_speed: float = SPEED_OF_LIGHT):
+        """
+        Build the index.
+        
+        Args:
+            times: Event times (s), shape (N,)
+            positions: Event positions (m), shape (N, 3)
+            leaf_size: Most events per leaf
+            reference_speed: Speed converting time extents to lengths when
+                choosing split axes (pick the typical Vmax queried)
+        """
+        times = np.asarray(times, dtype=float)
+        positions = np.asarray(positions, dtype=float)
+        if times.ndim != 1 or positions.shape != (len(times), 3):
+            raise ValueError("times must have shape (N,) and positions (N, 3)")
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be positive")
+        
+        self.leaf_size = leaf_size
+        self.reference_speed = reference_speed
+        self._build(np.column_stack([times, positions]))
+    
+    def _build(self, events: np.ndarray) -> None:
+        n = len(events)
+        order = np.argsort(events[:, 0], kind='stable')
+        events = events[order]
+        scale = np.array([self.reference_speed, 1.0, 1.0, 1.0])
+        
+        starts: List[int] = []
+        stops: List[int] = []
+        lows: List[np.ndarray] = []
+        highs: List[np.ndarray] = []
+        children: List[List[int]] = []
+        
+        stack = [(0, n, -1)]
+        while stack:
+            start, stop, parent = stack.pop()
+            node = len(starts)
+            if parent >= 0:
+                children[parent].append(node)
+            block = events[start:stop]
+            low, high = block.min(axis=0), block.max(axis=0)
+            starts.append(start)
+            stops.append(stop)
+            lows.append(low)
+            highs.append(high)
+            children.append([])
+            if stop - start <= self.leaf_size:
+                continue
+            
+            axis = int(np.argmax((high - low) * scale))
+            mid = (start + stop) // 2
+            part = np.argpartition(block[:, axis], mid - start)
+            events[start:stop] = block[part]
+            order[start:stop] = order[start:stop][part]
+            stack.append((mid, stop, node))
+            stack.append((start, mid, node))
+        
+        self._events = events
+        self.order = order
+        self._rank = np.empty(n, dtype=np.int64)
+        self._rank[order] = np.arange(n)
+        self._start = np.array(starts, dtype=np.int64)
+        self._stop = np.array(stops, dtype=np.int64)
+        self._low = np.array(lows).reshape(-1, 4)
+        self._high = np.array(highs).reshape(-1, 4)
+        self._left = np.array([c[0] if c else -1 for c in children], dtype=np.int64)
+        self._right = np.array([c[1] if c else -1 for c in children], dtype=np.int64)
+    
+    def __len__(self) -> int:
+        return len(self._events)
+    
+    @property
+    def n_nodes(self) -> int:
+        return len(self._start)
+    
+    def _queries(self, queries: Optional[np.ndarray]) -> np.ndarray:
+        """Tree ranks of query events given by original index."""
+        if queries is None:
+            return self._rank
+        queries = np.asarray(queries, dtype=np.int64)
+        if np.any((queries < 0) | (queries >= len(self))):
+            raise IndexError("Query index out of range")
+        return self._rank[queries]
+    
+    def _walk(self, ranks: np.ndarray, speeds: np.ndarray,
+              direction: str) -> Iterator[Tuple[str, np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Traverse the tree for query ranks against every speed.
+        
+        Yields ('node', q, node, inside) for nodes resolved as a whole and
+        ('leaf', q, j, inside) for individual events, where q indexes
+        ranks and inside is a (pairs, speeds) boolean mask.
+        """
+        sign = 1.0 if direction == 'past' else -1.0
+        query_t = self._events[ranks, 0]
+        query_x = self._events[ranks, 1:]
+        frontier_q = np.arange(len(ranks))
+        frontier_n = np.zeros(len(ranks), dtype=np.int64)
+        
+        while len(frontier_q):
+            t, x = query_t[frontier_q], query_x[frontier_q]
+            low, high = self._low[frontier_n], self._high[frontier_n]
+            if sign > 0:
+                dt_max, dt_min = t - low[:, 0], t - high[:, 0]
+            else:
+                dt_max, dt_min = high[:, 0] - t, low[:, 0] - t
+            
+            gap = np.maximum(np.maximum(low[:, 1:] - x, x - high[:, 1:]), 0.0)
+            d_min = np.sqrt(np.sum(gap**2, axis=1))
+            spread = np.maximum(np.abs(x - low[:, 1:]), np.abs(x - high[:, 1:]))
+            d_max = np.sqrt(np.sum(spread**2, axis=1))
+            
+            with np.errstate(invalid='ignore'):
+                outside = ((dt_max <= 0)[:, None]
+                           | (d_min[:, None] >= speeds * np.maximum(dt_max, 0.0)[:, None]))
+                inside = (dt_min > 0)[:, None] & (d_max[:, None] < speeds * dt_min[:, None])
+            resolved = np.all(outside | inside, axis=1)
+            
+            if np.any(resolved & np.any(inside, axis=1)):
+                keep = resolved & np.any(inside, axis=1)
+                yield 'node', frontier_q[keep], frontier_n[keep], inside[keep]
+            
+            open_q, open_n = frontier_q[~resolved], frontier_n[~resolved]
+            is_leaf = self._left[open_n] < 0
+            
+            leaf_q, leaf_n = open_q[is_leaf], open_n[is_leaf]
+            if len(leaf_q):
+                sizes = self._stop[leaf_n] - self._start[leaf_n]
+                q = np.repeat(leaf_q, sizes)
+                j = (np.repeat(self._start[leaf_n], sizes) + np.arange(sizes.sum())
+                     - np.repeat(np.cumsum(sizes) - sizes, sizes))
+                dt = sign * (query_t[q] - self._events[j, 0])
+                d = np.sqrt(np.sum((self._events[j, 1:] - query_x[q])**2, axis=1))
+                with np.errstate(invalid='ignore'):
+                    mask = (dt > 0)[:, None] & (d[:, None] < speeds * dt[:, None])
+                hit = np.any(mask, axis=1)
+                if np.any(hit):
+                    yield 'leaf', q[hit], j[hit], mask[hit]
+            
+            inner_q, inner_n = open_q[~is_leaf], open_n[~is_leaf]
+            frontier_q = np.concatenate([inner_q, inner_q])
+            frontier_n = np.concatenate([self._left[inner_n], self._right[inner_n]])
+    
+    def _directions(self, direction: str) -> Tuple[str, ...]:
+        if direction not in DIRECTIONS:
+            raise ValueError(f"direction must be one of {DIRECTIONS}, got {direction!r}")
+        return ('past', 'future') if direction == 'both' else (direction,)
+    
+    def count(self,
+              spaces: Sequence[Union['InformationSpace', float]],
+              queries: Optional[np.ndarray] = None,
+              direction: str = 'past',
+              batch_size: int = 4096) -> np.ndarray:
+        """
+        Number of events causally connected to each query event.
+        
+        Args:
+            spaces: Information spaces (or bare Vmax values in m/s)
+            queries: Original indices of query events (default all)
+            direction: 'past' (events that can influence the query),
+                'future' (events it can influence) or 'both'
+            batch_size: Queries traversed together (bounds memory)
+        
+        Returns:
+            Counts of shape (n_queries, n_spaces)
+        """
+        directions = self._directions(direction)
+        speeds, everything = _speeds(spaces)
+        ranks = self._queries(queries)
+        counts = np.zeros((len(ranks), len(speeds)), dtype=np.int64)
+        
+        finite = ~everything
+        if np.any(finite):
+            for first in range(0, len(ranks), batch_size):
+                batch = ranks[first:first + batch_size]
+                block = np.zeros((len(batch), np.count_nonzero(finite)), dtype=np.int64)
+                for walk_direction in directions:
+                    for kind, q, where, inside in self._walk(batch, speeds[finite], walk_direction):
+                        weight = (self._stop[where] - self._start[where]) if kind == 'node' else 1
+                        for k in range(block.shape[1]):
+                            block[:, k] += np.bincount(q, weights=inside[:, k] * weight,
+                                                       minlength=len(batch)).astype(np.int64)
+                counts[first:first + len(batch), finite] = block
+        # I_0 connects every pair of distinct events
+        counts[:, everything] = len(self) - 1
+        return counts
+    
+    def pairs(self,
+              space: Union['InformationSpace', float],
+              queries: Optional[np.ndarray] = None,
+              direction: str = 'future',
+              batch_size: int = 4096) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Causal adjacency: all (query, event) pairs connected in one space.
+        
+        Args:
+            space: Information space (or a bare Vmax in m/s)
+            queries: Original indices of query events (default all)
+            direction: 'future' (event inside the query's future cone),
+                'past' or 'both'
+            batch_size: Queries traversed together
+        
+        Returns:
+            (sources, targets) original indices, sorted by source then target
+        """
+        directions = self._directions(direction)
+        speeds, everything = _speeds([space])
+        ranks = self._queries(queries)
+        originals = self.order[ranks]
+        
+        if everything[0]:
+            sources = np.repeat(originals, len(self))
+            targets = np.tile(np.arange(len(self)), len(originals))
+            keep = sources != targets
+            sources, targets = sources[keep], targets[keep]
+        else:
+            source_parts, target_parts = [], []
+            for first in range(0, len(ranks), batch_size):
+                batch = ranks[first:first + batch_size]
+                for walk_direction in directions:
+                    for kind, q, where, _ in self._walk(batch, speeds, walk_direction):
+                        if kind == 'node':
+                            sizes = self._stop[where] - self._start[where]
+                            q = np.repeat(q, sizes)
+                            where = (np.repeat(self._start[where], sizes) + np.arange(sizes.sum())
+                                     - np.repeat(np.cumsum(sizes) - sizes, sizes))
+                        source_parts.append(originals[first + q])
+                        target_parts.append(self.order[where])
+            sources = np.concatenate(source_parts) if source_parts else np.empty(0, dtype=np.int64)
+            targets = np.concatenate(target_parts) if target_parts else np.empty(0, dtype=np.int64)
+        
+        order = np.lexsort((targets, sources))
+        return sources[order], targets[order]
+    
+    def cone(self, event: int, space: Union['InformationSpace', float],
+             direction: str = 'past') -> np.ndarray:
+        """
+        Original indices of events in one event's light cone.
+        
+        Args:
+            event: Original index of the apex event
+            space: Information space (or a bare Vmax in m/s)
+            direction: 'past', 'future' or 'both'
+        
+        Returns:
+            Sorted event indices
+        """
+        return self.pairs(space, np.array([event]), direction)[1]
+    
+    def __repr__(self) -> str:
+        return f"LightConeIndex(events={len(self)}, nodes={self.n_nodes})"
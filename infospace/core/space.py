@@ -4,12 +4,64 @@ Information Space classes.
 Defines different types of information spaces with their characteristic properties.
 """
 
+import math
+import threading
+import weakref
+
 import numpy as np
-from typing import Optional, Literal
+from typing import Optional, Literal, Union
 from .constants import SPEED_OF_LIGHT, PLANCK_LENGTH
 
 
-class InformationSpace:
+# Scalars keep their scalar code paths; anything with ndim > 0 is broadcast.
+ArrayLike = Union[float, np.ndarray]
+
+# How array kinematics treat entries with |v| >= Vmax
+InvalidPolicy = Literal['raise', 'nan', 'mask']
+INVALID_POLICIES = ('raise', 'nan', 'mask')
+
+
+def _is_scalar(*values) -> bool:
+    """True if every value is a scalar (0-d)."""
+    return all(np.ndim(value) == 0 for value in values)
+
+
+def _check_invalid_policy(invalid: str) -> None:
+    if invalid not in INVALID_POLICIES:
+        raise ValueError(f"invalid must be one of {INVALID_POLICIES}, got {invalid!r}")
+
+
+# Canonical instance per (class, parameters); entries vanish with their last user.
+_REGISTRY: 'weakref.WeakValueDictionary' = weakref.WeakValueDictionary()
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _intern(space: 'InformationSpace') -> 'InformationSpace':
+    """Return the registered space equal to `space`, registering it if new."""
+    key = (type(space), space._key, space.name)
+    with _REGISTRY_LOCK:
+        existing = _REGISTRY.get(key)
+        if existing is None:
+            _REGISTRY[key] = space
+            existing = space
+    return existing
+
+
+def _restore_space(cls: type, state: tuple) -> 'InformationSpace':
+    """Unpickle a space without re-running subclass constructors."""
+    space = object.__new__(cls)
+    InformationSpace._set_fields(space, *state)
+    return _intern(space)
+
+
+class _InternedSpaceMeta(type):
+    """Metaclass that interns every constructed space."""
+    
+    def __call__(cls, *args, **kwargs):
+        return _intern(super().__call__(*args, **kwargs))
+
+
+class InformationSpace(metaclass=_InternedSpaceMeta):
     """
     Base class for information spaces.
     
@@ -19,8 +71,18 @@ class InformationSpace:
     - rho_density: Information density (bits/m³)
     - topology: Topology type (local/extended/global)
     - carrier: Physical carrier name
+    
+    Spaces are immutable and interned: constructing a space with the same
+    parameters returns the same object, so spaces can key dicts and sets.
+    Derived constants (Vmax², 1/Vmax², log scales) are computed once here.
     """
     
+    __slots__ = (
+        'Vmax', 'lambda_scale', 'rho_density', 'topology', 'carrier', 'name',
+        'Vmax_sq', 'inv_Vmax_sq', 'log_lambda_scale', 'log10_lambda_scale',
+        'log_rho_density', '_key', '_hash', '__weakref__',
+    )
+    
     def __init__(
         self,
         Vmax: float,
@@ -47,60 +109,113 @@ class InformationSpace:
             raise ValueError("lambda_scale must be positive")
         if rho_density <= 0:
             raise ValueError("rho_density must be positive")
-            
-        self.Vmax = Vmax
-        self.lambda_scale = lambda_scale
-        self.rho_density = rho_density
-        self.topology = topology
-        self.carrier = carrier
-        self.name = name
-    
-    def metric_signature(self, dt: float, dx: float, dy: float, dz: float) -> float:
+        
+        self._set_fields(Vmax, lambda_scale, rho_density, topology, carrier, name)
+    
+    def _set_fields(self, Vmax, lambda_scale, rho_density, topology, carrier, name) -> None:
+        """Assign parameters and derived constants on a new instance."""
+        Vmax = float(Vmax)
+        lambda_scale = float(lambda_scale)
+        rho_density = float(rho_density)
+        
+        fields = {
+            'Vmax': Vmax,
+            'lambda_scale': lambda_scale,
+            'rho_density': rho_density,
+            'topology': topology,
+            'carrier': carrier,
+            'name': name,
+            'Vmax_sq': Vmax**2,
+            'inv_Vmax_sq': 1.0 / Vmax**2,
+            'log_lambda_scale': math.log(lambda_scale),
+            'log10_lambda_scale': math.log10(lambda_scale),
+            'log_rho_density': math.log(rho_density),
+            # Everything that affects physics; the name is only a label
+            '_key': (Vmax, lambda_scale, rho_density, topology, carrier),
+        }
+        fields['_hash'] = hash(fields['_key'])
+        for field, value in fields.items():
+            object.__setattr__(self, field, value)
+    
+    def metric_signature(self, dt: ArrayLike, dx: ArrayLike,
+                         dy: ArrayLike, dz: ArrayLike) -> ArrayLike:
         """
         Calculate spacetime interval in this space.
         
         ds² = -Vmax² dt² + dx² + dy² + dz²
         
+        Arrays are broadcast against each other.
+        
         Args:
-            dt, dx, dy, dz: Coordinate differentials
+            dt, dx, dy, dz: Coordinate differentials (scalars or arrays)
             
         Returns:
-            Spacetime interval ds²
+            Spacetime interval ds² (scalar or array)
         """
-        return -(self.Vmax**2) * dt**2 + dx**2 + dy**2 + dz**2
+        if not _is_scalar(dt, dx, dy, dz):
+            dt, dx, dy, dz = (np.asarray(d, dtype=float) for d in (dt, dx, dy, dz))
+        return -self.Vmax_sq * dt**2 + dx**2 + dy**2 + dz**2
     
-    def is_causal(self, delta_t: float, delta_x: float) -> bool:
+    def is_causal(self, delta_t: ArrayLike, delta_x: ArrayLike) -> Union[bool, np.ndarray]:
         """
         Check if two events are causally connected in this space.
         
         Events are causal if: Δt > Δx/Vmax
         
         Args:
-            delta_t: Time separation (s)
-            delta_x: Spatial separation (m)
+            delta_t: Time separation (s), scalar or array
+            delta_x: Spatial separation (m), scalar or array
             
         Returns:
-            True if causally connected
+            True if causally connected (boolean array for array input)
         """
+        if not _is_scalar(delta_t, delta_x):
+            delta_t = np.asarray(delta_t, dtype=float)
+            delta_x = np.asarray(delta_x, dtype=float)
         return delta_t > delta_x / self.Vmax
     
-    def gamma_factor(self, velocity: float) -> float:
+    def gamma_factor(self, velocity: ArrayLike, invalid: InvalidPolicy = 'raise') -> ArrayLike:
         """
         Calculate Lorentz gamma factor for this space.
         
         γ = 1/√(1 - v²/Vmax²)
         
         Args:
-            velocity: Velocity (m/s)
+            velocity: Velocity (m/s), scalar or array
+            invalid: Policy for entries with |v| >= Vmax or NaN:
+                'raise' raises ValueError, 'nan' returns NaN in their place,
+                'mask' returns a masked array with them masked out
             
         Returns:
-            Gamma factor
+            Gamma factor (scalar, ndarray or masked array)
         """
-        if abs(velocity) >= self.Vmax:
-            raise ValueError(f"Velocity {velocity} exceeds Vmax {self.Vmax}")
+        _check_invalid_policy(invalid)
+        
+        # NaN velocities compare False and therefore count as invalid
+        if _is_scalar(velocity):
+            if not abs(velocity) < self.Vmax:
+                if invalid == 'raise':
+                    raise ValueError(f"Velocity {velocity} exceeds Vmax {self.Vmax}")
+                return np.nan if invalid == 'nan' else np.ma.masked
+            
+            beta_squared = (velocity / self.Vmax) ** 2
+            return 1.0 / np.sqrt(1.0 - beta_squared)
+        
+        velocity = np.asarray(velocity, dtype=float)
+        bad = ~(np.abs(velocity) < self.Vmax)
+        if invalid == 'raise' and bad.any():
+            first = velocity[bad].flat[0]
+            raise ValueError(f"Velocity {first} exceeds Vmax {self.Vmax} "
+                             f"({np.count_nonzero(bad)} of {velocity.size} entries)")
         
         beta_squared = (velocity / self.Vmax) ** 2
-        return 1.0 / np.sqrt(1.0 - beta_squared)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            gamma = 1.0 / np.sqrt(1.0 - beta_squared)
+        
+        if invalid == 'mask':
+            return np.ma.masked_array(gamma, mask=bad)
+        gamma[bad] = np.nan
+        return gamma
     
     def __repr__(self) -> str:
         return (f"{self.__class__.__name__}(name='{self.name}', "
@@ -108,11 +223,31 @@ class InformationSpace:
                 f"ρ={self.rho_density:.2e})")
     
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, InformationSpace):
             return False
-        return (np.isclose(self.Vmax, other.Vmax) and
-                np.isclose(self.lambda_scale, other.lambda_scale) and
-                np.isclose(self.rho_density, other.rho_density))
+        return self._key == other._key
+    
+    def __hash__(self) -> int:
+        return self._hash
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+    
+    def __reduce__(self):
+        state = (self.Vmax, self.lambda_scale, self.rho_density,
+                 self.topology, self.carrier, self.name)
+        return _restore_space, (self.__class__, state)
+    
+    def __copy__(self) -> 'InformationSpace':
+        return self
+    
+    def __deepcopy__(self, memo) -> 'InformationSpace':
+        return self
 
 
 class EMSpace(InformationSpace):
@@ -122,6 +257,8 @@ class EMSpace(InformationSpace):
     The standard space we inhabit with Vmax = c.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         """Initialize EM space with standard parameters."""
         super().__init__(
@@ -142,6 +279,8 @@ class GravitationalSpace(InformationSpace):
     Note: Vmax measured via EM, so appears to be c.
     """
     
+    __slots__ = ()
+    
     def __init__(self, Vmax: Optional[float] = None):
         """
         Initialize gravitational space.
@@ -169,6 +308,8 @@ class HypotheticalSpace(InformationSpace):
     Custom I_X space with Vmax > c.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         Vmax: float,
@@ -215,6 +356,8 @@ class SourceSpace(InformationSpace):
     Pre-spatial, pre-temporal space. Theoretical construct.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         """Initialize source space."""
         super().__init__(
@@ -226,6 +369,8 @@ class SourceSpace(InformationSpace):
             name='I_0'
         )
     
-    def is_causal(self, delta_t: float, delta_x: float) -> bool:
+    def is_causal(self, delta_t: ArrayLike, delta_x: ArrayLike) -> Union[bool, np.ndarray]:
         """All events are causally connected in I_0."""
-        return True
+        if _is_scalar(delta_t, delta_x):
+            return True
+        return np.ones(np.broadcast(np.asarray(delta_t), np.asarray(delta_x)).shape, dtype=bool)
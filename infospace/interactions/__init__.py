@@ -1,10 +1,24 @@
 """Interactions module."""
 
 from .contact_point import ContactPoint, create_ligo_contact_point, create_neutrino_contact_point, create_dark_matter_contact_point
+from .network import ContactNetwork
+from .coupling import (CouplingModel, CouplingTable, PowerLawCoupling, ThresholdCoupling,
+                       TabulatedCoupling)
+from .kinetics import ContactKinetics
+from .hamiltonian import ContactHamiltonian, LevelStructure
 
 __all__ = [
     'ContactPoint',
     'create_ligo_contact_point',
     'create_neutrino_contact_point',
     'create_dark_matter_contact_point',
+    'ContactNetwork',
+    'CouplingModel',
+    'CouplingTable',
+    'PowerLawCoupling',
+    'ThresholdCoupling',
+    'TabulatedCoupling',
+    'ContactKinetics',
+    'ContactHamiltonian',
+    'LevelStructure',
 ]
@@ -1,12 +1,42 @@
 """
 Contact points between information spaces.
 
-Implements energy transition mechanisms with coupling strength.
+Implements energy transition mechanisms with coupling strength, optionally
+energy dependent through a CouplingModel g_eff(E).
 """
 
+from typing import Optional
+
 import numpy as np
 
 
+def _compatibility_factors(lambda_a, log_rho_a, topology_a,
+                           lambda_b, log_rho_b, topology_b):
+    """
+    Vectorized compatibility factors between spaces given by their parameters.
+    
+    f_λ = exp(-Δλ / min(λ)), f_ρ = exp(-|Δ log ρ|) and f_T = 1 for equal
+    topologies, 0.1 otherwise; zero scales and non-finite densities give 0.
+    Arguments broadcast against each other; topologies may be labels or codes.
+    
+    Returns:
+        (f_λ, f_ρ, f_T) arrays
+    """
+    lambda_a = np.asarray(lambda_a, dtype=float)
+    lambda_b = np.asarray(lambda_b, dtype=float)
+    log_rho_a = np.asarray(log_rho_a, dtype=float)
+    log_rho_b = np.asarray(log_rho_b, dtype=float)
+    
+    lambda_ref = np.minimum(lambda_a, lambda_b)
+    finite = np.isfinite(log_rho_a) & np.isfinite(log_rho_b)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scale = np.where(lambda_ref > 0, np.exp(-np.abs(lambda_a - lambda_b) / lambda_ref), 0.0)
+        delta_log_rho = np.where(finite, np.abs(log_rho_a - log_rho_b), 0.0)
+    density = np.where(finite, np.exp(-delta_log_rho), 0.0)
+    topology = np.where(np.asarray(topology_a) == np.asarray(topology_b), 1.0, 0.1)
+    return scale, density, topology
+
+
 class ContactPoint:
     """
     Contact point between two information spaces.
@@ -19,7 +49,8 @@ class ContactPoint:
                  space_x: 'InformationSpace',
                  space_em: 'InformationSpace',
                  coupling_strength: float,
-                 name: str = 'contact'):
+                 name: str = 'contact',
+                 coupling_model: Optional['CouplingModel'] = None):
         """
         Initialize contact point.
         
@@ -28,21 +59,82 @@ class ContactPoint:
             space_em: Target information space (usually I_EM)
             coupling_strength: Coupling constant g
             name: Contact point identifier
+            coupling_model: Optional energy-dependent g_eff(E); energy
+                transitions then use g_eff at each carrier energy
         """
+        self.space_x = space_x
+        self.space_em = space_em
+        self.g = coupling_strength
+        self.name = name
+        self.coupling_model = coupling_model
+    
+    # Cached factors depend on g and the attached spaces; the setters below
+    # drop the affected cache entries whenever either changes.
+    
+    @property
+    def space_x(self) -> 'InformationSpace':
+        """Source information space."""
+        return self._space_x
+    
+    @space_x.setter
+    def space_x(self, space: 'InformationSpace') -> None:
         from ..core.space import InformationSpace
         
-        if not isinstance(space_x, InformationSpace):
+        if not isinstance(space, InformationSpace):
             raise TypeError("space_x must be an InformationSpace instance")
-        if not isinstance(space_em, InformationSpace):
-            raise TypeError("space_em must be an InformationSpace instance")
+        self._space_x = space
+        self.invalidate_cache()
+    
+    @property
+    def space_em(self) -> 'InformationSpace':
+        """Target information space."""
+        return self._space_em
+    
+    @space_em.setter
+    def space_em(self, space: 'InformationSpace') -> None:
+        from ..core.space import InformationSpace
         
+        if not isinstance(space, InformationSpace):
+            raise TypeError("space_em must be an InformationSpace instance")
+        self._space_em = space
+        self.invalidate_cache()
+    
+    @property
+    def g(self) -> float:
+        """Coupling constant g."""
+        return self._g
+    
+    @g.setter
+    def g(self, coupling_strength: float) -> None:
         if not (0 <= coupling_strength <= 1):
             raise ValueError("Coupling strength must be in [0, 1]")
-            
-        self.space_x = space_x
-        self.space_em = space_em
-        self.g = coupling_strength
-        self.name = name
+        self._g = coupling_strength
+        self._cache.pop('efficiency', None)
+    
+    @property
+    def coupling_model(self) -> Optional['CouplingModel']:
+        """Energy-dependent coupling g_eff(E), or None for the constant g."""
+        return self._coupling_model
+    
+    @coupling_model.setter
+    def coupling_model(self, model: Optional['CouplingModel']) -> None:
+        from .coupling import CouplingModel
+        
+        if model is not None and not isinstance(model, CouplingModel):
+            raise TypeError("coupling_model must be a CouplingModel instance")
+        self._coupling_model = model
+    
+    def invalidate_cache(self) -> None:
+        """Drop all cached compatibility factors and the efficiency."""
+        self._cache = {}
+    
+    def _factor(self, key: str) -> float:
+        if key not in self._cache:
+            x, em = self.space_x, self.space_em
+            factors = _compatibility_factors(x.lambda_scale, x.log_rho_density, x.topology,
+                                             em.lambda_scale, em.log_rho_density, em.topology)
+            self._cache.update(zip(('scale', 'density', 'topology'), map(float, factors)))
+        return self._cache[key]
     
     def scale_compatibility(self) -> float:
         """
@@ -53,13 +145,7 @@ class ContactPoint:
         Returns:
             Scale compatibility (0 to 1)
         """
-        delta_lambda = abs(self.space_x.lambda_scale - self.space_em.lambda_scale)
-        lambda_ref = min(self.space_x.lambda_scale, self.space_em.lambda_scale)
-        
-        if lambda_ref == 0:
-            return 0.0
-        
-        return np.exp(-delta_lambda / lambda_ref)
+        return self._factor('scale')
     
     def density_compatibility(self) -> float:
         """
@@ -70,28 +156,33 @@ class ContactPoint:
         Returns:
             Density compatibility (0 to 1)
         """
-        if self.space_em.rho_density == 0 or not np.isfinite(self.space_x.rho_density):
-            return 0.0
-        
-        ratio = self.space_x.rho_density / self.space_em.rho_density
-        
-        if ratio <= 0 or not np.isfinite(ratio):
-            return 0.0
-        
-        return np.exp(-abs(np.log(ratio)))
+        return self._factor('density')
     
     def topology_compatibility(self) -> float:
         """
         Calculate topology compatibility factor.
         
+        Simple model: same topology = 1, different = 0.1
+        
         Returns:
             Topology compatibility (0 to 1)
         """
-        # Simple model: same topology = 1, different = 0.1
-        if self.space_x.topology == self.space_em.topology:
-            return 1.0
-        else:
-            return 0.1
+        return self._factor('topology')
+    
+    def compatibility(self) -> float:
+        """
+        Calculate the combined compatibility factor (efficiency per g²).
+        
+        f = f_λ × f_ρ × f_T
+        
+        Returns:
+            Compatibility (0 to 1)
+        """
+        if 'compatibility' not in self._cache:
+            self._cache['compatibility'] = (self.scale_compatibility() *
+                                            self.density_compatibility() *
+                                            self.topology_compatibility())
+        return self._cache['compatibility']
     
     def transition_efficiency(self) -> float:
         """
@@ -102,11 +193,9 @@ class ContactPoint:
         Returns:
             Efficiency (0 to 1)
         """
-        scale_compat = self.scale_compatibility()
-        density_compat = self.density_compatibility()
-        topology_compat = self.topology_compatibility()
-        
-        return (self.g ** 2) * scale_compat * density_compat * topology_compat
+        if 'efficiency' not in self._cache:
+            self._cache['efficiency'] = (self.g ** 2) * self.compatibility()
+        return self._cache['efficiency']
     
     def energy_transition(self, energy_x: 'Energy') -> 'Energy':
         """
@@ -116,7 +205,7 @@ class ContactPoint:
         
         Args:
             energy_x: Energy in source space
-            
+        
         Returns:
             Energy in target space
         """
@@ -128,26 +217,70 @@ class ContactPoint:
         if energy_x.carrier_energy is None:
             raise ValueError("Energy must have carrier_energy set")
         
-        eta = self.transition_efficiency()
+        eta = self.efficiency_at(energy_x.carrier_energy)
         converted_energy = energy_x.carrier_energy * eta
         
         return Energy(self.space_em, converted_energy)
     
-    def effective_coupling(self, energy: float) -> float:
+    def transition_many(self, energies_x):
+        """
+        Transition many energies from I_X to I_EM with one multiply.
+        
+        E_EM = η × E_X, with the cached η applied to the whole array (or
+        η(E) from one table lookup when a coupling model is set).
+        
+        Args:
+            energies_x: EnergyArray in source space, or array of energies (J)
+        
+        Returns:
+            EnergyArray in target space (ndarray for plain array input)
+        """
+        from ..core.energy import EnergyArray
+        
+        if isinstance(energies_x, EnergyArray):
+            if energies_x.space != self.space_x:
+                raise ValueError("Energy must be in source space")
+            if energies_x.carrier_energies is None:
+                raise ValueError("Energy must have carrier_energies set")
+            energies = energies_x.carrier_energies
+            return EnergyArray(self.space_em, energies * self.efficiency_at(energies))
+        
+        energies = np.asarray(energies_x, dtype=float)
+        return energies * self.efficiency_at(energies)
+    
+    def effective_coupling(self, energy):
         """
         Calculate effective coupling at given energy.
         
-        Some contact points may have energy-dependent coupling.
+        Uses the coupling model's lookup table when one is set, otherwise
+        the constant g.
+        
+        Args:
+            energy: Energy scale (J), scalar or array
+        
+        Returns:
+            Effective coupling strength(s)
+        """
+        if self._coupling_model is None:
+            return self.g if np.ndim(energy) == 0 else np.full(np.shape(energy), float(self.g))
+        return self._coupling_model(energy)
+    
+    def efficiency_at(self, energy):
+        """
+        Transition efficiency at given energy.
+        
+        η(E) = g_eff(E)² × f_λ × f_ρ × f_T, equal to transition_efficiency()
+        without a coupling model.
         
         Args:
-            energy: Energy scale (J)
-            
+            energy: Energy scale (J), scalar or array
+        
         Returns:
-            Effective coupling strength
+            Efficiency (0 to 1), scalar or array
         """
-        # For now, constant coupling
-        # Could add energy dependence: g_eff(E) = g_0 × (E/Λ)^n
-        return self.g
+        if self._coupling_model is None:
+            return self.transition_efficiency()
+        return self.effective_coupling(energy) ** 2 * self.compatibility()
     
     def __repr__(self) -> str:
         eta = self.transition_efficiency()
@@ -164,7 +297,7 @@ def create_ligo_contact_point(space_gw: 'InformationSpace',
     Args:
         space_gw: Gravitational wave space
         space_em: EM space
-        
+    
     Returns:
         Contact point with g ~ 10^-20
     """
@@ -181,7 +314,7 @@ def create_neutrino_contact_point(space_weak: 'InformationSpace',
     Args:
         space_weak: Weak interaction space
         space_em: EM space
-        
+    
     Returns:
         Contact point with g ~ 10^-5
     """
@@ -198,7 +331,7 @@ def create_dark_matter_contact_point(space_dark: 'InformationSpace',
     Args:
         space_dark: Dark matter space
         space_em: EM space
-        
+    
     Returns:
         Contact point with g ~ 10^-45
     """
@@ -0,0 +1,252 @@
+"""
+Energy-dependent couplings g_eff(E) for contact points.
+
+A coupling model is evaluated once onto a log-spaced energy grid and then
+served by interpolation, so whole event batches cost one vectorized lookup.
+Tables are shared between equal models (same class and parameters), so a
+sweep that rebuilds contact points does not retabulate. Energies outside
+the table fall back to exact evaluation.
+"""
+
+import functools
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Default table range (J): ~1e-11 eV to ~6e28 eV
+DEFAULT_ENERGY_RANGE = (1e-30, 1e10)
+DEFAULT_POINTS_PER_DECADE = 256
+
+
+class CouplingTable:
+    """
+    Lookup table of g_eff on a log-spaced energy grid.
+    
+    Interpolates log g linearly in log E when g > 0 everywhere (exact for
+    power laws), otherwise g itself.
+    """
+    
+    def __init__(self, model: 'CouplingModel', energy_range: Tuple[float, float],
+                 points_per_decade: int):
+        """
+        Tabulate a model.
+        
+        Args:
+            model: Coupling model (used for out-of-range energies)
+            energy_range: (E_min, E_max) of the grid (J)
+            points_per_decade: Grid density
+        """
+        low, high = energy_range
+        if not 0 < low < high:
+            raise ValueError("energy_range must satisfy 0 < E_min < E_max")
+        n = int(np.ceil(np.log10(high / low) * points_per_decade)) + 1
+        
+        self.model = model
+        self.log_low, self.log_high = np.log(low), np.log(high)
+        self.energies = np.exp(np.linspace(self.log_low, self.log_high, n))
+        values = np.asarray(model.evaluate(self.energies), dtype=float)
+        self.log_scale = bool(np.all(values > 0))
+        self._values = np.log(values) if self.log_scale else values
+        self._inv_step = (n - 1) / (self.log_high - self.log_low)
+    
+    def __call__(self, energies):
+        """
+        Interpolated g_eff(E).
+        
+        Args:
+            energies: Energies (J), scalar or array
+        
+        Returns:
+            Couplings, same shape as energies
+        """
+        E = np.asarray(energies, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            u = (np.log(E) - self.log_low) * self._inv_step
+        last = len(self._values) - 1
+        inside = (u >= 0) & (u <= last)
+        
+        u = np.clip(np.nan_to_num(u), 0.0, last)
+        index = np.minimum(u.astype(np.int64), last - 1)
+        low = self._values[index]
+        result = low + (u - index) * (self._values[index + 1] - low)
+        if self.log_scale:
+            result = np.exp(result, out=result) if result.ndim else np.exp(result)
+        
+        if not np.all(inside):
+            result = np.where(inside, result, self.model.evaluate(np.where(inside, 1.0, E)))
+        return result if result.ndim else float(result)
+
+
+@functools.lru_cache(maxsize=64)
+def _table(model: 'CouplingModel', energy_range: Tuple[float, float],
+           points_per_decade: int) -> CouplingTable:
+    return CouplingTable(model, energy_range, points_per_decade)
+
+
+class CouplingModel(ABC):
+    """
+    Base class for g_eff(E) models.
+    
+    Subclasses implement evaluate() for energy arrays in J and _key() with
+    their parameters, which makes equal models share one lookup table.
+    """
+    
+    energy_range: Tuple[float, float] = DEFAULT_ENERGY_RANGE
+    points_per_decade: int = DEFAULT_POINTS_PER_DECADE
+    
+    @abstractmethod
+    def evaluate(self, energies: np.ndarray) -> np.ndarray:
+        """Exact g_eff(E) for energies in J."""
+    
+    @abstractmethod
+    def _key(self) -> tuple:
+        """Parameters that identify the model (equal keys share a table)."""
+    
+    def table(self) -> CouplingTable:
+        """The model's (shared) lookup table."""
+        return _table(self, tuple(self.energy_range), self.points_per_decade)
+    
+    def __call__(self, energies):
+        """g_eff(E) from the lookup table."""
+        return self.table()(energies)
+    
+    def __eq__(self, other) -> bool:
+        return (type(self) is type(other) and self._key() == other._key()
+                and self.energy_range == other.energy_range
+                and self.points_per_decade == other.points_per_decade)
+    
+    def __hash__(self) -> int:
+        return hash((type(self), self._key(), tuple(self.energy_range), self.points_per_decade))
+
+
+class PowerLawCoupling(CouplingModel):
+    """
+    g_eff(E) = min(g₀ (E/E₀)ⁿ, g_max).
+    """
+    
+    def __init__(self, base_coupling: float, reference_energy: float, exponent: float = 1.0,
+                 max_coupling: float = np.inf,
+                 energy_range: Tuple[float, float] = DEFAULT_ENERGY_RANGE):
+        """
+        Initialize the model.
+        
+        Args:
+            base_coupling: g₀ at the reference energy
+            reference_energy: E₀ (J)
+            exponent: n
+            max_coupling: Upper bound g_max
+            energy_range: Table range (J)
+        """
+        if reference_energy <= 0:
+            raise ValueError("reference_energy must be positive")
+        self.base_coupling = base_coupling
+        self.reference_energy = reference_energy
+        self.exponent = exponent
+        self.max_coupling = max_coupling
+        self.energy_range = tuple(energy_range)
+    
+    def evaluate(self, energies):
+        E = np.maximum(np.asarray(energies, dtype=float), 0.0)
+        return np.minimum(self.base_coupling * (E / self.reference_energy) ** self.exponent,
+                          self.max_coupling)
+    
+    def _key(self) -> tuple:
+        return (self.base_coupling, self.reference_energy, self.exponent, self.max_coupling)
+    
+    def __repr__(self) -> str:
+        return (f"PowerLawCoupling(g0={self.base_coupling:.2e}, E0={self.reference_energy:.2e} J, "
+                f"n={self.exponent}, g_max={self.max_coupling:.2e})")
+
+
+class ThresholdCoupling(CouplingModel):
+    """
+    g_eff switching from g_below to g_above at a threshold energy.
+    
+    With width > 0 the switch is a logistic in ln E of that width;
+    otherwise it is a step.
+    """
+    
+    def __init__(self, threshold_energy: float, coupling_above: float,
+                 coupling_below: float = 0.0, width: float = 0.0,
+                 energy_range: Tuple[float, float] = DEFAULT_ENERGY_RANGE):
+        """
+        Initialize the model.
+        
+        Args:
+            threshold_energy: Switching energy (J)
+            coupling_above: g above threshold
+            coupling_below: g below threshold
+            width: Switching width in ln E (0 for a step)
+            energy_range: Table range (J)
+        """
+        if threshold_energy <= 0 or width < 0:
+            raise ValueError("threshold_energy must be positive and width non-negative")
+        self.threshold_energy = threshold_energy
+        self.coupling_above = coupling_above
+        self.coupling_below = coupling_below
+        self.width = width
+        self.energy_range = tuple(energy_range)
+    
+    def evaluate(self, energies):
+        E = np.asarray(energies, dtype=float)
+        if self.width == 0:
+            above = (E > self.threshold_energy).astype(float)
+        else:
+            with np.errstate(divide='ignore', over='ignore'):
+                x = np.log(np.maximum(E, np.finfo(float).tiny) / self.threshold_energy) / self.width
+                above = 0.5 * (1.0 + np.tanh(0.5 * x))
+        return self.coupling_below + (self.coupling_above - self.coupling_below) * above
+    
+    def _key(self) -> tuple:
+        return (self.threshold_energy, self.coupling_above, self.coupling_below, self.width)
+    
+    def __repr__(self) -> str:
+        return (f"ThresholdCoupling(E_th={self.threshold_energy:.2e} J, "
+                f"g={self.coupling_below:.2e}→{self.coupling_above:.2e})")
+
+
+class TabulatedCoupling(CouplingModel):
+    """
+    g_eff interpolated from measured or computed (E, g) points.
+    
+    Interpolation is log-log when all g > 0 (linear in g otherwise);
+    outside the points g is held at the end values.
+    """
+    
+    def __init__(self, energies: Sequence[float], couplings: Sequence[float],
+                 energy_range: Optional[Tuple[float, float]] = None):
+        """
+        Initialize the model.
+        
+        Args:
+            energies: Energies (J), strictly increasing and positive
+            couplings: g at those energies
+            energy_range: Table range (J), default the span of the points
+        """
+        energies = np.asarray(energies, dtype=float)
+        couplings = np.asarray(couplings, dtype=float)
+        if energies.ndim != 1 or energies.shape != couplings.shape or len(energies) < 2:
+            raise ValueError("Need matching 1-D energies and couplings with at least 2 points")
+        if energies[0] <= 0 or np.any(np.diff(energies) <= 0):
+            raise ValueError("energies must be positive and strictly increasing")
+        self.energies = energies
+        self.couplings = couplings
+        self.energy_range = tuple(energy_range or (energies[0], energies[-1]))
+        self._log = bool(np.all(couplings > 0))
+    
+    def evaluate(self, energies):
+        E = np.asarray(energies, dtype=float)
+        with np.errstate(divide='ignore'):
+            x = np.log(np.maximum(E, np.finfo(float).tiny))
+        values = np.log(self.couplings) if self._log else self.couplings
+        result = np.interp(x, np.log(self.energies), values)
+        return np.exp(result) if self._log else result
+    
+    def _key(self) -> tuple:
+        return (self.energies.tobytes(), self.couplings.tobytes())
+    
+    def __repr__(self) -> str:
+        return (f"TabulatedCoupling({len(self.energies)} points, "
+                f"E in [{self.energies[0]:.2e}, {self.energies[-1]:.2e}] J)")
@@ -0,0 +1,471 @@
+"""
+Contact-point Hamiltonians (Definition 6.1).
+
+    H_CP = H_EM + H_X + H_int,   H_int = g Σ_nm |n⟩_EM ⟨m|_X + h.c.
+
+acting on the single-excitation space spanned by the EM levels |n⟩ and
+the I_X levels |m⟩. H_EM and H_X are diagonal in their level structures.
+The all-to-all coupling is rank-2, so H_CP is applied in O(N) without
+storing the N_EM × N_X block; with a resonance window only pairs with
+|E_n - E_m| ≤ window couple and the operator is an explicit sparse matrix.
+
+Low-lying spectra use shift-invert Lanczos (scipy.sparse.linalg.eigsh)
+below the spectrum, with the inverse applied through the Woodbury
+identity (all-to-all) or a sparse LU (windowed). Spectra are cached by
+(level structures, g, window, k). Time evolution uses an adaptive Lanczos
+propagator that only needs matrix-vector products.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.constants import HBAR, PLANCK_CONSTANT
+from .._sparse import scipy_sparse
+from .contact_point import ContactPoint
+
+
+# Cached spectra kept across Hamiltonians (each holds N × k eigenvectors)
+SPECTRUM_CACHE_SIZE = 16
+
+_SPECTRA: 'OrderedDict[tuple, Tuple[np.ndarray, np.ndarray]]' = OrderedDict()
+
+# Refuse to materialize more coupling entries than this
+MAX_SPARSE_NONZEROS = 50_000_000
+
+
+def clear_spectrum_cache() -> None:
+    """Drop all cached spectra."""
+    _SPECTRA.clear()
+
+
+class LevelStructure:
+    """
+    Energy levels of one information space.
+    
+    Defaults to the ladder E_k = E_0 + ℏω (k + 1/2) with the space's natural
+    frequency ω = 2π Vmax / λ.
+    """
+    
+    def __init__(self,
+                 space: 'InformationSpace',
+                 n_levels: Optional[int] = None,
+                 energies: Optional[Sequence[float]] = None,
+                 ground_energy: float = 0.0):
+        """
+        Initialize the levels.
+        
+        Args:
+            space: Information space the levels belong to
+            n_levels: Number of ladder levels (when energies is not given)
+            energies: Explicit level energies (J)
+            ground_energy: Offset E_0 of the ladder (J)
+        """
+        self.space = space
+        if energies is None:
+            if n_levels is None or n_levels < 1:
+                raise ValueError("Give energies or a positive n_levels")
+            if not np.isfinite(space.Vmax):
+                raise ValueError("Ladder levels need a finite Vmax")
+            quantum = PLANCK_CONSTANT * space.Vmax / space.lambda_scale
+            energies = ground_energy + quantum * (np.arange(n_levels) + 0.5)
+        energies = np.array(energies, dtype=float).ravel()
+        if len(energies) == 0 or not np.all(np.isfinite(energies)):
+            raise ValueError("energies must be finite and non-empty")
+        energies.flags.writeable = False
+        self.energies = energies
+        spacings = np.diff(np.sort(energies))
+        self.spacing = float(np.median(spacings)) if len(spacings) else abs(float(energies[0]))
+        self._digest = hashlib.blake2b(energies.tobytes(), digest_size=16).hexdigest()
+    
+    def __len__(self) -> int:
+        return len(self.energies)
+    
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, LevelStructure) and self.space == other.space
+                and self._digest == other._digest)
+    
+    def __hash__(self) -> int:
+        return hash((self.space, self._digest))
+    
+    def __repr__(self) -> str:
+        return (f"LevelStructure({self.space.name}, {len(self)} levels, "
+                f"E in [{self.energies.min():.2e}, {self.energies.max():.2e}] J)")
+
+
+class ContactHamiltonian:
+    """
+    H_CP for a contact point between two level structures.
+    
+    States are ordered EM levels first, then I_X levels; the dimension is
+    N_EM + N_X.
+    """
+    
+    def __init__(self,
+                 contact: ContactPoint,
+                 em_levels: LevelStructure,
+                 x_levels: LevelStructure,
+                 coupling: Optional[float] = None,
+                 window: Optional[float] = None):
+        """
+        Assemble the Hamiltonian.
+        
+        Args:
+            contact: Contact point joining the two spaces
+            em_levels: Levels of contact.space_em
+            x_levels: Levels of contact.space_x
+            coupling: Coupling matrix element (J); default contact.g in
+                units of the EM level spacing
+            window: Only couple levels with |E_n - E_m| ≤ window (J);
+                None couples every pair
+        """
+        if em_levels.space != contact.space_em or x_levels.space != contact.space_x:
+            raise ValueError("Level structures must belong to the contact point's spaces")
+        if window is not None and window < 0:
+            raise ValueError("window must be non-negative")
+        
+        self.contact = contact
+        self.em_levels = em_levels
+        self.x_levels = x_levels
+        if coupling is None:
+            coupling = contact.g * em_levels.spacing
+        self.g = float(coupling)
+        self.window = window
+        
+        self.n_em = len(em_levels)
+        self.diagonal = np.concatenate([em_levels.energies, x_levels.energies])
+        self.dimension = len(self.diagonal)
+        
+        if window is None:
+            self._pairs = None
+            self._coupling_norm = abs(self.g) * np.sqrt(self.n_em * len(x_levels))
+        else:
+            self._pairs = self._resonant_pairs(em_levels.energies, x_levels.energies, window)
+            em_degree = np.bincount(self._pairs[0], minlength=self.n_em)
+            x_degree = np.bincount(self._pairs[1], minlength=len(x_levels))
+            self._coupling_norm = abs(self.g) * np.sqrt(em_degree.max(initial=0) *
+                                                        x_degree.max(initial=0))
+        self._inverse = None
+    
+    @staticmethod
+    def _resonant_pairs(em: np.ndarray, x: np.ndarray,
+                        window: float) -> Tuple[np.ndarray, np.ndarray]:
+        """(EM index, X index) of all pairs with |E_n - E_m| ≤ window."""
+        order = np.argsort(x, kind='stable')
+        sorted_x = x[order]
+        lo = np.searchsorted(sorted_x, em - window, side='left')
+        hi = np.searchsorted(sorted_x, em + window, side='right')
+        counts = hi - lo
+        em_index = np.repeat(np.arange(len(em)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return em_index, order[np.repeat(lo, counts) + offsets]
+    
+    @property
+    def key(self) -> tuple:
+        """Cache key: (level structures, g, window)."""
+        return (self.em_levels, self.x_levels, self.g, self.window)
+    
+    @property
+    def n_couplings(self) -> int:
+        """Number of coupled (EM, X) pairs."""
+        return self.n_em * len(self.x_levels) if self._pairs is None else len(self._pairs[0])
+    
+    def spectral_bounds(self) -> Tuple[float, float]:
+        """Interval guaranteed to contain the spectrum (J)."""
+        return (float(self.diagonal.min() - self._coupling_norm),
+                float(self.diagonal.max() + self._coupling_norm))
+    
+    def matvec(self, psi: np.ndarray) -> np.ndarray:
+        """
+        Apply H_CP without forming it.
+        
+        Args:
+            psi: State(s), (N,) or (N, m), real or complex
+        
+        Returns:
+            H_CP psi, same shape
+        """
+        psi = np.asarray(psi)
+        shape = (-1,) + (1,) * (psi.ndim - 1)
+        out = self.diagonal.reshape(shape) * psi
+        em, x = psi[:self.n_em], psi[self.n_em:]
+        if self._pairs is None:
+            out[:self.n_em] += self.g * x.sum(axis=0)
+            out[self.n_em:] += self.g * em.sum(axis=0)
+        else:
+            i, j = self._pairs
+            np.add.at(out, i, self.g * x[j])
+            np.add.at(out, self.n_em + j, self.g * em[i])
+        return out
+    
+    def to_sparse(self):
+        """
+        Assemble H_CP as a scipy.sparse CSR matrix.
+        
+        Returns:
+            (N, N) Hermitian sparse matrix
+        """
+        sparse = scipy_sparse()
+        if self.n_couplings > MAX_SPARSE_NONZEROS:
+            raise ValueError(f"{self.n_couplings} couplings is too many to store; "
+                             "use a resonance window or as_linear_operator()")
+        if self._pairs is None:
+            i = np.repeat(np.arange(self.n_em), len(self.x_levels))
+            j = np.tile(np.arange(len(self.x_levels)), self.n_em)
+        else:
+            i, j = self._pairs
+        diagonal = np.arange(self.dimension)
+        rows = np.concatenate([diagonal, i, self.n_em + j])
+        cols = np.concatenate([diagonal, self.n_em + j, i])
+        values = np.concatenate([self.diagonal, np.full(2 * len(i), self.g)])
+        return sparse.csr_matrix((values, (rows, cols)), shape=(self.dimension,) * 2)
+    
+    def as_linear_operator(self):
+        """H_CP as a scipy LinearOperator backed by matvec()."""
+        linalg = scipy_sparse().linalg
+        return linalg.LinearOperator((self.dimension,) * 2, matvec=self.matvec,
+                                     matmat=self.matvec, rmatvec=self.matvec, dtype=float)
+    
+    def _collective_mode(self) -> Tuple[float, np.ndarray]:
+        """
+        Exact eigenpair below all levels for all-to-all coupling.
+        
+        The rank-2 coupling pushes exactly one state below min(E); its energy
+        solves the secular equation g² s_EM(λ) s_X(λ) = 1 with
+        s(λ) = Σ 1/(E - λ), which is monotonic there, so bisection is exact.
+        """
+        em, x = self.diagonal[:self.n_em], self.diagonal[self.n_em:]
+        
+        def secular(lam):
+            return self.g ** 2 * np.sum(1.0 / (em - lam)) * np.sum(1.0 / (x - lam)) - 1.0
+        
+        lo, hi = self.spectral_bounds()[0], float(self.diagonal.min())
+        lo -= 1e-9 * max(hi - lo, abs(lo))
+        for _ in range(200):
+            mid = 0.5 * (lo + hi)
+            if mid in (lo, hi):
+                break
+            if secular(mid) < 0:
+                lo = mid
+            else:
+                hi = mid
+        lam = 0.5 * (lo + hi)
+        
+        vector = np.concatenate([-self.g * np.sum(1.0 / (x - lam)) / (em - lam), 1.0 / (x - lam)])
+        return lam, vector / np.linalg.norm(vector)
+    
+    def _shift_invert(self):
+        """
+        (σ, (H_CP - σ)^{-1} operator, split-off eigenpair or None).
+        
+        For all-to-all coupling σ sits just below the levels and the
+        collective mode is projected out (it is added back exactly); with a
+        window σ sits below the spectral bound.
+        """
+        if self._inverse is None:
+            sparse = scipy_sparse()
+            mode = None
+            spacings = [s for s in (self.em_levels.spacing, self.x_levels.spacing) if s > 0]
+            d_min = float(self.diagonal.min())
+            offset = 0.5 * (min(spacings) if spacings else max(abs(d_min), 1.0))
+            
+            if self._pairs is None:
+                sigma = d_min - offset
+                
+                # (A + U C Uᵀ)^{-1} with A = D - σ, U = [EM indicator, X indicator]
+                inv_a = 1.0 / (self.diagonal - sigma)
+                em_sum, x_sum = inv_a[:self.n_em].sum(), inv_a[self.n_em:].sum()
+                if self.g == 0:
+                    capacitance = None
+                else:
+                    capacitance = np.linalg.inv(np.array([[em_sum, 1.0 / self.g],
+                                                          [1.0 / self.g, x_sum]]))
+                    mode = self._collective_mode()
+                n_em = self.n_em
+                
+                def solve(b):
+                    b = np.asarray(b, dtype=float)
+                    shape = (-1,) + (1,) * (b.ndim - 1)
+                    if mode is not None:
+                        b = b - np.multiply.outer(mode[1], mode[1] @ b)
+                    y = inv_a.reshape(shape) * b
+                    if capacitance is None:
+                        return y
+                    z = capacitance @ np.stack([y[:n_em].sum(axis=0), y[n_em:].sum(axis=0)])
+                    y[:n_em] -= inv_a[:n_em].reshape(shape) * z[0]
+                    y[n_em:] -= inv_a[n_em:].reshape(shape) * z[1]
+                    if mode is not None:
+                        y -= np.multiply.outer(mode[1], mode[1] @ y)
+                    return y
+            else:
+                sigma = self.spectral_bounds()[0] - offset
+                shifted = self.to_sparse() - sigma * sparse.identity(self.dimension)
+                solve = sparse.linalg.splu(shifted.tocsc()).solve
+            
+            operator = sparse.linalg.LinearOperator((self.dimension,) * 2, matvec=solve,
+                                                    matmat=solve, dtype=float)
+            self._inverse = (sigma, operator, mode)
+        return self._inverse
+    
+    def spectrum(self, k: int = 6, v0: Optional[np.ndarray] = None,
+                 tol: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the k lowest eigenpairs, cached by (levels, g, window, k, tol).
+        
+        Cached arrays are shared between callers and therefore read-only.
+        
+        Args:
+            k: Number of eigenpairs
+            v0: Optional Lanczos starting vector (e.g. from a nearby g)
+            tol: Eigenvalue tolerance passed to eigsh (0 for machine precision)
+        
+        Returns:
+            (energies (k,), states (N, k)), energies ascending (read-only)
+        """
+        if not 0 < k < self.dimension - 1:
+            raise ValueError(f"k must be in [1, {self.dimension - 2}]")
+        key = self.key + (k, float(tol))
+        if key in _SPECTRA:
+            _SPECTRA.move_to_end(key)
+            return _SPECTRA[key]
+        
+        sigma, inverse, mode = self._shift_invert()
+        energies, states = np.zeros(0), np.zeros((self.dimension, 0))
+        n_iterative = k if mode is None else k - 1
+        if n_iterative:
+            energies, states = scipy_sparse().linalg.eigsh(self.as_linear_operator(),
+                                                            k=n_iterative, sigma=sigma,
+                                                            which='LM', OPinv=inverse,
+                                                            v0=v0, tol=tol)
+        if mode is not None:
+            energies = np.concatenate([[mode[0]], energies])
+            states = np.column_stack([mode[1], states])
+        order = np.argsort(energies)
+        result = (energies[order], states[:, order])
+        for array in result:
+            array.flags.writeable = False
+        
+        _SPECTRA[key] = result
+        while len(_SPECTRA) > SPECTRUM_CACHE_SIZE:
+            _SPECTRA.popitem(last=False)
+        return result
+    
+    def evolve(self, psi0: np.ndarray, times: Sequence[float], krylov_dim: int = 30,
+               tol: float = 1e-10) -> np.ndarray:
+        """
+        Propagate |ψ(t)⟩ = exp(-i H_CP t / ℏ) |ψ0⟩ with adaptive Lanczos steps.
+        
+        Args:
+            psi0: Initial state (N,)
+            times: Non-negative output times (s)
+            krylov_dim: Lanczos subspace size per step
+            tol: Local error tolerance per step
+        
+        Returns:
+            States of shape (n_times, N), complex
+        """
+        psi = np.asarray(psi0, dtype=complex)
+        if psi.shape != (self.dimension,):
+            raise ValueError(f"psi0 must have shape ({self.dimension},)")
+        times = np.asarray(times, dtype=float).ravel()
+        if np.any(times < 0):
+            raise ValueError("times must be non-negative")
+        
+        # Work relative to the spectral centre so phases stay small
+        low, high = self.spectral_bounds()
+        centre, width = 0.5 * (low + high), max(high - low, np.finfo(float).tiny)
+        
+        result = np.empty((len(times), self.dimension), dtype=complex)
+        now = 0.0
+        for k in np.argsort(times, kind='stable'):
+            while times[k] > now:
+                psi, step = self._lanczos_step(psi, (times[k] - now) / HBAR, centre, width,
+                                               krylov_dim, tol)
+                now = times[k] if step >= (times[k] - now) / HBAR else now + step * HBAR
+            result[k] = psi
+        return result
+    
+    def _lanczos_step(self, psi: np.ndarray, tau: float, centre: float, width: float,
+                      m: int, tol: float) -> Tuple[np.ndarray, float]:
+        """Advance by up to tau (in ℏ units); returns (state, step taken)."""
+        norm = np.linalg.norm(psi)
+        if norm == 0:
+            return psi, tau
+        m = min(m, self.dimension)
+        basis = np.empty((m, self.dimension), dtype=complex)
+        alpha, beta = np.zeros(m), np.zeros(m)
+        basis[0] = psi / norm
+        size = m
+        for j in range(m):
+            w = self.matvec(basis[j]) - centre * basis[j]
+            alpha[j] = np.vdot(basis[j], w).real
+            w -= alpha[j] * basis[j]
+            if j:
+                w -= beta[j - 1] * basis[j - 1]
+            beta[j] = np.linalg.norm(w)
+            if j + 1 == m or beta[j] < 1e-12 * width:
+                size = j + 1
+                break
+            basis[j + 1] = w / beta[j]
+        
+        T = np.diag(alpha[:size]) + np.diag(beta[:size - 1], 1) + np.diag(beta[:size - 1], -1)
+        theta, Q = np.linalg.eigh(T)
+        exhausted = beta[size - 1] < 1e-12 * width
+        
+        step = tau
+        while True:
+            coefficients = Q @ (np.exp(-1j * theta * step) * Q[0])
+            # Residual estimate τ β_m |(e^{-iτT})_{m1}| of the truncated subspace
+            if exhausted or step * beta[size - 1] * abs(coefficients[-1]) <= tol:
+                phase = np.exp(-1j * centre * step)
+                return (norm * phase) * (coefficients @ basis[:size]), step
+            step *= 0.5
+    
+    def populations(self, states: np.ndarray) -> np.ndarray:
+        """
+        Probability in the EM and I_X sectors.
+        
+        Args:
+            states: (..., N) states
+        
+        Returns:
+            (..., 2) array of (P_EM, P_X)
+        """
+        weights = np.abs(np.asarray(states)) ** 2
+        return np.stack([weights[..., :self.n_em].sum(axis=-1),
+                         weights[..., self.n_em:].sum(axis=-1)], axis=-1)
+    
+    def __repr__(self) -> str:
+        return (f"ContactHamiltonian(N={self.dimension}, g={self.g:.2e}, "
+                f"couplings={self.n_couplings})")
+
+
+def spectrum_sweep(contact: ContactPoint, em_levels: LevelStructure, x_levels: LevelStructure,
+                   couplings: Sequence[float], k: int = 6,
+                   window: Optional[float] = None) -> np.ndarray:
+    """
+    Lowest k energies for a sequence of couplings.
+    
+    Each solve starts Lanczos from the previous coupling's ground state and
+    reuses cached spectra for couplings seen before.
+    
+    Args:
+        contact: Contact point joining the two spaces
+        em_levels: Levels of contact.space_em
+        x_levels: Levels of contact.space_x
+        couplings: Coupling values g (J)
+        k: Eigenpairs per coupling
+        window: Resonance window (J), None for all-to-all coupling
+    
+    Returns:
+        (n_couplings, k) energies
+    """
+    energies = np.empty((len(couplings), k))
+    v0 = None
+    for n, g in enumerate(couplings):
+        hamiltonian = ContactHamiltonian(contact, em_levels, x_levels, coupling=g, window=window)
+        energies[n], states = hamiltonian.spectrum(k, v0=v0)
+        v0 = states[:, 0]
+    return energies
@@ -0,0 +1,354 @@
+"""
+Population kinetics over networks of contact points.
+
+Energy flows between spaces at the Fermi-golden-rule rate of Theorem 6.1,
+
+    Γ_{i→j} = (2π/ℏ) η_ij ρ_j,
+
+with η_ij the contact efficiency (g² × compatibility) and ρ_j the density
+of final states in the target space (1/J). Populations obey the master
+equation dP/dt = K P with the sparse generator K[j, i] = Γ_{i→j} and
+K[i, i] = -Σ_j Γ_{i→j}.
+
+Because η is symmetric, K satisfies detailed balance with stationary
+populations ∝ ρ, so D^{-1/2} K D^{1/2} (D = diag ρ) is symmetric. That
+gives exact propagation at any time from one symmetric eigendecomposition,
+batched over thousands of parameter sets; large sparse networks use
+Krylov propagation (scipy.sparse.linalg.expm_multiply) instead.
+"""
+
+from typing import Callable, Optional, Sequence, Union
+
+import numpy as np
+
+from ..core.constants import HBAR
+from .._parallel import parallel_map
+from .._sparse import scipy_sparse
+from .contact_point import ContactPoint
+from .network import ContactNetwork
+
+
+GOLDEN_RULE_PREFACTOR = 2 * np.pi / HBAR
+
+# Networks up to this size are propagated spectrally by default
+SPECTRAL_MAX_SPACES = 2048
+
+StateDensity = Union[float, Sequence[float], np.ndarray, Callable[['InformationSpace'], float]]
+
+
+def _propagate_spectral(w: np.ndarray, V: np.ndarray, sqrt_rho: np.ndarray,
+                        populations: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """
+    Propagate populations with a symmetrized eigendecomposition.
+    
+    Works batched: w (..., n), V (..., n, n), sqrt_rho and populations
+    (..., n). Returns (..., n_times, n).
+    """
+    VT = np.swapaxes(V, -1, -2)
+    coefficients = np.matmul(VT, (populations / sqrt_rho)[..., np.newaxis])[..., 0]
+    decay = np.exp(np.minimum(w, 0.0)[..., np.newaxis, :] * times[:, np.newaxis])
+    modes = decay * coefficients[..., np.newaxis, :]
+    return np.matmul(modes, VT) * sqrt_rho[..., np.newaxis, :]
+
+
+def _sweep_task(args) -> np.ndarray:
+    """Propagate one chunk of parameter sets (module level for pickling)."""
+    rows, cols, indptr, eta, rho, populations, times, n = args
+    sqrt_rho = np.sqrt(rho)
+    batch = len(eta)
+    
+    # Symmetrized generator: off-diagonal c η_ij √(ρ_i ρ_j), diagonal -Σ_j c η_ij ρ_j
+    M = np.zeros((batch, n, n))
+    M[:, cols, rows] = GOLDEN_RULE_PREFACTOR * eta * sqrt_rho[:, rows] * sqrt_rho[:, cols]
+    # Edges are grouped by source row (CSR), so row sums are segment sums
+    flux = GOLDEN_RULE_PREFACTOR * eta * rho[:, cols]
+    out_rates = np.zeros((batch, n))
+    present = np.diff(indptr) > 0
+    if len(cols):
+        out_rates[:, present] = np.add.reduceat(flux, indptr[:-1][present], axis=1)
+    M[:, np.arange(n), np.arange(n)] = -out_rates
+    
+    w, V = np.linalg.eigh(M)
+    return _propagate_spectral(w, V, sqrt_rho, populations, times)
+
+
+class ContactKinetics:
+    """
+    Time-dependent energy transfer over a contact network.
+    
+    Edges of the network carry Fermi-golden-rule rates; populations (energy
+    held by each space) are propagated exactly with the matrix exponential,
+    so the cost does not depend on how stiff the rates are.
+    """
+    
+    def __init__(self, network: ContactNetwork, state_density: StateDensity):
+        """
+        Build the rates for a network.
+        
+        Args:
+            network: Contact network providing η on each directed edge
+            state_density: Density of final states ρ (1/J) per space: a
+                scalar, an array aligned with network.spaces, or a callable
+                of the space
+        """
+        self.network = network
+        self.spaces = network.spaces
+        n = len(self.spaces)
+        
+        if callable(state_density):
+            rho = np.array([state_density(space) for space in self.spaces], dtype=float)
+        else:
+            rho = np.broadcast_to(np.asarray(state_density, dtype=float), (n,)).copy()
+        if np.any(~np.isfinite(rho) | (rho <= 0)):
+            raise ValueError("state_density must be positive and finite")
+        self.state_density = rho
+        
+        self._rows = np.repeat(np.arange(n), np.diff(network.indptr))
+        self._cols = network.indices
+        self._transpose = self._transpose_edges()
+        # Detailed balance, and with it the symmetric spectral solver, needs η_ij = η_ji
+        if not np.allclose(network.data[self._transpose], network.data, rtol=1e-12, atol=0.0):
+            raise ValueError("Contact efficiencies must be symmetric (η_ij = η_ji)")
+        self.rates = GOLDEN_RULE_PREFACTOR * network.data * rho[self._cols]
+        self.out_rates = np.bincount(self._rows, weights=self.rates, minlength=n)
+        self._spectrum: Optional[tuple] = None
+    
+    @classmethod
+    def from_contact_points(cls, contact_points: Sequence[ContactPoint],
+                            state_density: StateDensity,
+                            energy: Optional[float] = None) -> 'ContactKinetics':
+        """
+        Build kinetics from explicit contact points.
+        
+        Args:
+            contact_points: Contact points; each adds a two-way channel
+            state_density: Density of final states per space (see __init__)
+            energy: Carrier energy (J) for energy-dependent couplings
+        
+        Returns:
+            Kinetics over all spaces the contact points attach to
+        """
+        return cls(ContactNetwork.from_contact_points(contact_points, energy=energy),
+                   state_density)
+    
+    def __len__(self) -> int:
+        return len(self.spaces)
+    
+    def _transpose_edges(self) -> np.ndarray:
+        """Index of edge j→i for every edge i→j; ValueError if one is missing."""
+        by_source = np.lexsort((self._cols, self._rows))
+        by_target = np.lexsort((self._rows, self._cols))
+        if not (np.array_equal(self._rows[by_source], self._cols[by_target]) and
+                np.array_equal(self._cols[by_source], self._rows[by_target])):
+            raise ValueError("Every contact channel needs its reverse channel")
+        transpose = np.empty(len(self._cols), dtype=np.int64)
+        transpose[by_source] = by_target
+        return transpose
+    
+    def rate(self, source, target) -> float:
+        """
+        Get the transfer rate Γ between two spaces.
+        
+        Args:
+            source: Source space or its index
+            target: Target space or its index
+        
+        Returns:
+            Γ_{source→target} (1/s), 0 without a direct contact
+        """
+        j = self.network.index(target)
+        return GOLDEN_RULE_PREFACTOR * self.network.efficiency(source, target) * self.state_density[j]
+    
+    def rate_matrix(self, sparse: bool = True):
+        """
+        Get the generator K of dP/dt = K P.
+        
+        Args:
+            sparse: Return a scipy.sparse CSR matrix (requires SciPy);
+                otherwise a dense ndarray
+        
+        Returns:
+            (n, n) generator with K[j, i] = Γ_{i→j} and columns summing to 0
+        """
+        n = len(self)
+        diagonal = np.arange(n)
+        rows = np.concatenate([self._cols, diagonal])
+        cols = np.concatenate([self._rows, diagonal])
+        values = np.concatenate([self.rates, -self.out_rates])
+        if sparse:
+            return scipy_sparse().csr_matrix((values, (rows, cols)), shape=(n, n))
+        K = np.zeros((n, n))
+        np.add.at(K, (rows, cols), values)
+        return K
+    
+    def derivative(self, populations: np.ndarray) -> np.ndarray:
+        """
+        Evaluate dP/dt = K P without forming K.
+        
+        Args:
+            populations: (n,) or (n, m) populations
+        
+        Returns:
+            Time derivatives, same shape
+        """
+        P = np.asarray(populations, dtype=float)
+        flow = self.rates.reshape((-1,) + (1,) * (P.ndim - 1)) * P[self._rows]
+        result = -self.out_rates.reshape((-1,) + (1,) * (P.ndim - 1)) * P
+        np.add.at(result, self._cols, flow)
+        return result
+    
+    def _eigensystem(self):
+        if self._spectrum is None:
+            sqrt_rho = np.sqrt(self.state_density)
+            M = np.zeros((len(self), len(self)))
+            M[self._cols, self._rows] = self.rates * sqrt_rho[self._rows] / sqrt_rho[self._cols]
+            M[np.diag_indices(len(self))] = -self.out_rates
+            # Symmetric up to rounding; average to keep eigh exact
+            w, V = np.linalg.eigh(0.5 * (M + M.T))
+            self._spectrum = (w, V, sqrt_rho)
+        return self._spectrum
+    
+    def evolve(self, populations: np.ndarray, times: Sequence[float],
+               method: str = 'auto') -> np.ndarray:
+        """
+        Propagate populations to the requested times.
+        
+        Args:
+            populations: Initial populations, (n,) or (n, m) for m initial
+                conditions at once
+            times: Non-negative output times (s)
+            method: 'spectral' (dense eigendecomposition, cached), 'krylov'
+                (sparse expm_multiply, requires SciPy) or 'auto'
+        
+        Returns:
+            Populations of shape (n_times, n) or (n_times, n, m)
+        """
+        P = np.asarray(populations, dtype=float)
+        times = np.asarray(times, dtype=float).ravel()
+        if P.shape[:1] != (len(self),) or P.ndim > 2:
+            raise ValueError(f"populations must have shape ({len(self)},) or ({len(self)}, m)")
+        if np.any(times < 0):
+            raise ValueError("times must be non-negative")
+        if method == 'auto':
+            method = 'spectral' if len(self) <= SPECTRAL_MAX_SPACES else 'krylov'
+        
+        if method == 'spectral':
+            w, V, sqrt_rho = self._eigensystem()
+            columns = P.reshape(len(self), -1).T
+            result = _propagate_spectral(w, V, sqrt_rho, columns, times)
+            return np.moveaxis(result, 0, -1).reshape((len(times),) + P.shape)
+        if method == 'krylov':
+            expm_multiply = scipy_sparse().linalg.expm_multiply
+            K = self.rate_matrix(sparse=True)
+            order = np.argsort(times, kind='stable')
+            result = np.empty((len(times),) + P.shape)
+            current, now = P, 0.0
+            for k in order:
+                if times[k] > now:
+                    current = expm_multiply(K * (times[k] - now), current)
+                    now = times[k]
+                result[k] = current
+            return result
+        raise ValueError(f"Unknown method {method!r}")
+    
+    def relaxation_times(self) -> np.ndarray:
+        """
+        Get the relaxation times -1/λ of the non-stationary modes.
+        
+        Returns:
+            Times (s) in decreasing order
+        """
+        w, _, _ = self._eigensystem()
+        scale = max(float(np.max(np.abs(w), initial=0.0)), np.finfo(float).tiny)
+        return np.sort(-1.0 / w[w < -1e-12 * scale])[::-1]
+    
+    def components(self) -> np.ndarray:
+        """
+        Label the connected components of the network.
+        
+        Returns:
+            Component label (smallest member index) for every space
+        """
+        labels = np.arange(len(self))
+        while True:
+            previous = labels.copy()
+            np.minimum.at(labels, self._cols, labels[self._rows])
+            labels = labels[labels]
+            if np.array_equal(labels, previous):
+                return labels
+    
+    def equilibrium(self, populations: np.ndarray) -> np.ndarray:
+        """
+        Get the t → ∞ populations.
+        
+        Each connected component keeps its total, shared in proportion to ρ.
+        
+        Args:
+            populations: Initial populations, (n,) or (n, m)
+        
+        Returns:
+            Stationary populations, same shape
+        """
+        P = np.asarray(populations, dtype=float)
+        labels = self.components()
+        shape = (-1,) + (1,) * (P.ndim - 1)
+        totals = np.zeros_like(P)
+        np.add.at(totals, labels, P)
+        weights = np.bincount(labels, weights=self.state_density, minlength=len(self))
+        return totals[labels] * (self.state_density / weights[labels]).reshape(shape)
+    
+    def sweep(self, populations: np.ndarray, times: Sequence[float],
+              efficiency_scale: Union[float, np.ndarray] = 1.0,
+              state_density: Optional[np.ndarray] = None,
+              batch_size: int = 256,
+              n_workers: Optional[int] = None) -> np.ndarray:
+        """
+        Propagate populations for many parameter sets at once.
+        
+        Each parameter set rescales the edge efficiencies and/or replaces the
+        state densities; the batch is symmetrized and diagonalized in chunks
+        with batched eigh, optionally spread over worker processes.
+        
+        Args:
+            populations: Initial populations, (n,) or (n_sets, n)
+            times: Non-negative output times (s)
+            efficiency_scale: Factor on η, scalar, (n_sets,) or
+                (n_sets, n_edges) aligned with network.data
+            state_density: Optional (n_sets, n) or (n,) densities of states
+            batch_size: Parameter sets per eigendecomposition chunk
+            n_workers: Worker processes (None for all cores, 0/1 in-process)
+        
+        Returns:
+            Populations of shape (n_sets, n_times, n)
+        """
+        n, n_edges = len(self), len(self.rates)
+        times = np.asarray(times, dtype=float).ravel()
+        if np.any(times < 0):
+            raise ValueError("times must be non-negative")
+        
+        scale = np.asarray(efficiency_scale, dtype=float)
+        rho = self.state_density if state_density is None else np.asarray(state_density, dtype=float)
+        P = np.asarray(populations, dtype=float)
+        n_sets = max(scale.shape[0] if scale.ndim else 1,
+                     rho.shape[0] if rho.ndim == 2 else 1,
+                     P.shape[0] if P.ndim == 2 else 1)
+        
+        if scale.ndim < 2:
+            scale = scale.reshape(-1, 1)
+        eta = np.broadcast_to(scale * self.network.data, (n_sets, n_edges))
+        rho = np.broadcast_to(rho, (n_sets, n))
+        P = np.broadcast_to(P, (n_sets, n))
+        if np.any(eta < 0):
+            raise ValueError("efficiency_scale must be non-negative")
+        if not np.allclose(eta[:, self._transpose], eta, rtol=1e-12, atol=0.0):
+            raise ValueError("efficiency_scale must scale both directions of a channel equally")
+        if np.any(~np.isfinite(rho) | (rho <= 0)):
+            raise ValueError("state_density must be positive and finite")
+        
+        tasks = [(self._rows, self._cols, self.network.indptr, eta[start:start + batch_size],
+                  rho[start:start + batch_size], P[start:start + batch_size], times, n)
+                 for start in range(0, n_sets, batch_size)]
+        return np.concatenate(parallel_map(_sweep_task, tasks, n_workers))
+    
+    def __repr__(self) -> str:
+        return f"ContactKinetics(spaces={len(self)}, channels={len(self.rates)})"
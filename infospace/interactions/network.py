@@ -0,0 +1,279 @@
+"""
+Contact networks over catalogs of information spaces.
+
+Builds the all-pairs compatibility graph of many spaces and routes energy
+along maximum-efficiency multi-hop paths.
+"""
+
+import heapq
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from .contact_point import ContactPoint, _compatibility_factors
+
+
+SpaceRef = Union['InformationSpace', int]
+
+
+class ContactNetwork:
+    """
+    Graph of contact points between information spaces.
+    
+    Edge weights are transition efficiencies η_ij = g_ij² × f_λ × f_ρ × f_T,
+    computed for all pairs at once and stored sparsely (CSR) for entries
+    above a cutoff. The efficiency of a multi-hop route is the product of
+    its edge efficiencies, so the best route is a shortest path on -log η.
+    """
+    
+    def __init__(self,
+                 spaces: Sequence['InformationSpace'],
+                 coupling: Union[float, np.ndarray] = 1.0,
+                 cutoff: float = 0.0,
+                 block_size: int = 256):
+        """
+        Build the network for a catalog of spaces.
+        
+        Args:
+            spaces: Catalog of distinct information spaces
+            coupling: Coupling g, scalar or (n, n) matrix of pairwise values
+            cutoff: Only efficiencies strictly above this are stored
+            block_size: Rows of the pairwise matrix evaluated per block
+        """
+        self._set_spaces(spaces)
+        n = len(self.spaces)
+        
+        coupling = np.asarray(coupling, dtype=float)
+        if coupling.ndim not in (0, 2) or (coupling.ndim == 2 and coupling.shape != (n, n)):
+            raise ValueError(f"coupling must be a scalar or an ({n}, {n}) matrix")
+        if np.any((coupling < 0) | (coupling > 1)):
+            raise ValueError("Coupling strength must be in [0, 1]")
+        
+        self.coupling = coupling
+        self.cutoff = cutoff
+        
+        lam = np.array([s.lambda_scale for s in self.spaces])
+        log_rho = np.array([s.log_rho_density for s in self.spaces])
+        _, topology = np.unique([s.topology for s in self.spaces], return_inverse=True)
+        
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        indices, data = [], []
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            eta = self._pair_efficiency(lam, log_rho, topology, start, stop)
+            eta[np.arange(stop - start), np.arange(start, stop)] = 0.0
+            
+            rows, cols = np.nonzero(eta > cutoff)
+            indptr[start + 1:stop + 1] = np.bincount(rows, minlength=stop - start)
+            indices.append(cols)
+            data.append(eta[rows, cols])
+        
+        self._set_graph(np.cumsum(indptr),
+                        np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64),
+                        np.concatenate(data) if data else np.zeros(0))
+    
+    def _pair_efficiency(self, lam, log_rho, topology, start, stop) -> np.ndarray:
+        """Efficiency of rows start:stop against all spaces, shape (rows, n)."""
+        rows = slice(start, stop)
+        scale, density, topo = _compatibility_factors(
+            lam[rows, np.newaxis], log_rho[rows, np.newaxis], topology[rows, np.newaxis],
+            lam, log_rho, topology)
+        
+        g = self.coupling if self.coupling.ndim == 0 else self.coupling[start:stop]
+        return g ** 2 * scale * density * topo
+    
+    @classmethod
+    def from_contact_points(cls, contact_points: Sequence[ContactPoint],
+                            energy: Optional[float] = None) -> 'ContactNetwork':
+        """
+        Build a network from explicit contact points.
+        
+        Each contact point adds an undirected edge with its efficiency.
+        
+        Args:
+            contact_points: Contact points, e.g. from the create_* factories
+            energy: Carrier energy (J) at which energy-dependent couplings
+                are evaluated; None uses each point's constant g
+        
+        Returns:
+            Contact network over all spaces the contact points attach to
+        """
+        spaces = []
+        for cp in contact_points:
+            spaces.extend((cp.space_x, cp.space_em))
+        
+        network = cls.__new__(cls)
+        network._set_spaces(list(dict.fromkeys(spaces)))
+        network.coupling = None
+        network.cutoff = 0.0
+        
+        best: Dict[Tuple[int, int], float] = {}
+        for cp in contact_points:
+            i, j = network.index(cp.space_x), network.index(cp.space_em)
+            eta = cp.transition_efficiency() if energy is None else float(cp.efficiency_at(energy))
+            for edge in ((i, j), (j, i)):
+                best[edge] = max(best.get(edge, 0.0), eta)
+        
+        edges = sorted((edge, eta) for edge, eta in best.items() if eta > 0 and edge[0] != edge[1])
+        rows = np.array([e[0][0] for e in edges], dtype=np.int64)
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=len(network.spaces)))])
+        network._set_graph(indptr,
+                           np.array([e[0][1] for e in edges], dtype=np.int64),
+                           np.array([e[1] for e in edges], dtype=float))
+        return network
+    
+    def _set_spaces(self, spaces: Sequence['InformationSpace']) -> None:
+        from ..core.space import InformationSpace
+        
+        self.spaces = list(spaces)
+        for space in self.spaces:
+            if not isinstance(space, InformationSpace):
+                raise TypeError("spaces must be InformationSpace instances")
+        self._index = {space: i for i, space in enumerate(self.spaces)}
+        if len(self._index) != len(self.spaces):
+            raise ValueError("spaces must be distinct")
+    
+    def _set_graph(self, indptr: np.ndarray, indices: np.ndarray, data: np.ndarray) -> None:
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        with np.errstate(divide='ignore'):
+            self._weights = -np.log(data)
+    
+    def index(self, space: SpaceRef) -> int:
+        """
+        Get the catalog index of a space.
+        
+        Args:
+            space: Space in the catalog, or its index
+        
+        Returns:
+            Index into self.spaces
+        """
+        if isinstance(space, (int, np.integer)):
+            if not 0 <= space < len(self.spaces):
+                raise IndexError(f"Space index {space} out of range")
+            return int(space)
+        try:
+            return self._index[space]
+        except KeyError:
+            raise KeyError(f"{space!r} is not in the network") from None
+    
+    @property
+    def n_edges(self) -> int:
+        """Number of stored (directed) edges."""
+        return len(self.data)
+    
+    def efficiency(self, space_a: SpaceRef, space_b: SpaceRef) -> float:
+        """
+        Get the direct (single-hop) efficiency between two spaces.
+        
+        Returns:
+            η, or 0 if the pair is below the cutoff
+        """
+        i, j = self.index(space_a), self.index(space_b)
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        k = np.searchsorted(self.indices[lo:hi], j)
+        if k < hi - lo and self.indices[lo + k] == j:
+            return float(self.data[lo + k])
+        return 0.0
+    
+    def neighbors(self, space: SpaceRef) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the stored neighbors of a space.
+        
+        Returns:
+            (neighbor indices, efficiencies)
+        """
+        i = self.index(space)
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        return self.indices[lo:hi], self.data[lo:hi]
+    
+    def to_dense(self) -> np.ndarray:
+        """Get the stored efficiencies as a dense (n, n) matrix."""
+        n = len(self.spaces)
+        dense = np.zeros((n, n))
+        rows = np.repeat(np.arange(n), np.diff(self.indptr))
+        dense[rows, self.indices] = self.data
+        return dense
+    
+    def contact_point(self, space_x: SpaceRef, space_em: SpaceRef,
+                      name: str = 'contact') -> ContactPoint:
+        """
+        Materialize the contact point for one pair.
+        
+        Only available for networks built from a coupling.
+        """
+        if self.coupling is None:
+            raise ValueError("Network was built from contact points, not a coupling")
+        i, j = self.index(space_x), self.index(space_em)
+        g = float(self.coupling if self.coupling.ndim == 0 else self.coupling[i, j])
+        return ContactPoint(self.spaces[i], self.spaces[j], g, name=name)
+    
+    def path_efficiencies(self, source: SpaceRef) -> np.ndarray:
+        """
+        Get the best multi-hop efficiency from one space to every space.
+        
+        Args:
+            source: Starting space
+        
+        Returns:
+            Array of best path efficiencies (0 where unreachable)
+        """
+        dist, _ = self._dijkstra(self.index(source))
+        return np.exp(-dist)
+    
+    def max_efficiency_path(self, source: SpaceRef,
+                            target: SpaceRef) -> Tuple[List['InformationSpace'], float]:
+        """
+        Find the maximum-efficiency route between two spaces.
+        
+        Args:
+            source: Starting space, e.g. I_k
+            target: Destination space, e.g. I_EM
+        
+        Returns:
+            (spaces along the path, total efficiency); ([], 0.0) if unreachable
+        """
+        i, j = self.index(source), self.index(target)
+        dist, prev = self._dijkstra(i, j)
+        if not np.isfinite(dist[j]):
+            return [], 0.0
+        
+        path = [j]
+        while path[-1] != i:
+            path.append(prev[path[-1]])
+        return [self.spaces[k] for k in reversed(path)], float(np.exp(-dist[j]))
+    
+    def _dijkstra(self, source: int, target: int = -1) -> Tuple[np.ndarray, np.ndarray]:
+        """Shortest paths on -log η; stops early once target is settled."""
+        n = len(self.spaces)
+        dist = np.full(n, np.inf)
+        prev = np.full(n, -1, dtype=np.int64)
+        done = np.zeros(n, dtype=bool)
+        dist[source] = 0.0
+        heap = [(0.0, source)]
+        
+        while heap:
+            d, u = heapq.heappop(heap)
+            if done[u]:
+                continue
+            done[u] = True
+            if u == target:
+                break
+            
+            lo, hi = self.indptr[u], self.indptr[u + 1]
+            nbrs = self.indices[lo:hi]
+            candidate = d + self._weights[lo:hi]
+            better = candidate < dist[nbrs]
+            for v, dv in zip(nbrs[better].tolist(), candidate[better].tolist()):
+                dist[v] = dv
+                prev[v] = u
+                heapq.heappush(heap, (dv, v))
+        
+        return dist, prev
+    
+    def __len__(self) -> int:
+        return len(self.spaces)
+    
+    def __repr__(self) -> str:
+        return f"ContactNetwork(spaces={len(self.spaces)}, edges={self.n_edges})"
@@ -0,0 +1,23 @@
+"""
+Multi-objective optimization of contact-point designs.
+
+Includes resumable, parallel NSGA-II with O(N log N) two-objective
+non-dominated sorting, and the sacrificial-interface problem of Section 8
+(mutual information against collapse probability).
+"""
+
+from .pareto import (
+    Variable, ParetoProblem, ParetoArchive, ParetoOptimizer, non_dominated_sort,
+    crowding_distance,
+)
+from .sacrificial import SacrificialInterfaceProblem
+
+__all__ = [
+    'Variable',
+    'ParetoProblem',
+    'ParetoArchive',
+    'ParetoOptimizer',
+    'non_dominated_sort',
+    'crowding_distance',
+    'SacrificialInterfaceProblem',
+]
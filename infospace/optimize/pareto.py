@@ -0,0 +1,509 @@
+"""
+Multi-objective optimization with non-dominated sorting.
+
+All objectives are minimized. Two-objective sorting runs in O(N log N)
+(sweep over the first objective with a binary search over fronts); more
+objectives fall back to a sequential front search. Constraints use Deb's
+rule: feasible candidates always rank ahead, infeasible ones by violation.
+
+ParetoOptimizer is an NSGA-II loop over a ParetoProblem in the unit
+hypercube. Offspring are evaluated in chunks on a process pool, every
+feasible non-dominated candidate ever seen is merged into a ParetoArchive,
+and population, archive and progress are written atomically after each
+generation so an interrupted run resumes where it stopped.
+"""
+
+import bisect
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .._io import atomic_savez, atomic_write_text, remove_stale
+from .._parallel import make_executor, resolve_workers, stream_rng
+
+
+def non_dominated_sort(objectives: np.ndarray,
+                       violation: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Assign Pareto front ranks (0 = non-dominated), minimizing every column.
+    
+    Args:
+        objectives: (N, M) objective values
+        violation: Optional (N,) constraint violation, 0 when feasible;
+            infeasible candidates rank after all feasible fronts, ordered
+            by violation
+    
+    Returns:
+        (N,) integer front index per candidate
+    """
+    F = np.asarray(objectives, dtype=float)
+    if F.ndim != 2:
+        raise ValueError("objectives must be an (N, M) array")
+    n = len(F)
+    ranks = np.zeros(n, dtype=np.int64)
+    
+    feasible = np.ones(n, dtype=bool) if violation is None else np.asarray(violation) <= 0
+    index = np.flatnonzero(feasible)
+    if len(index):
+        ranks[index] = _sort_feasible(F[index])
+    if not np.all(feasible):
+        bad = np.flatnonzero(~feasible)
+        offset = ranks[index].max() + 1 if len(index) else 0
+        _, level = np.unique(np.asarray(violation, dtype=float)[bad], return_inverse=True)
+        ranks[bad] = offset + level.ravel()
+    return ranks
+
+
+def _sort_feasible(F: np.ndarray) -> np.ndarray:
+    n, m = F.shape
+    ranks = np.empty(n, dtype=np.int64)
+    if m == 1:
+        return np.unique(F[:, 0], return_inverse=True)[1].ravel()
+    
+    order = np.lexsort(F.T[::-1])
+    if m == 2:
+        # Each front keeps the key (f2, f1) of its most recent member. A
+        # front dominates the next point iff its key is smaller, and keys
+        # are non-decreasing across fronts, so bisection finds the front.
+        keys: List[Tuple[float, float]] = []
+        for i, a, b in zip(order.tolist(), F[order, 0].tolist(), F[order, 1].tolist()):
+            k = bisect.bisect_left(keys, (b, a))
+            if k == len(keys):
+                keys.append((b, a))
+            else:
+                keys[k] = (b, a)
+            ranks[i] = k
+        return ranks
+    
+    # Lexicographic order means only earlier points can dominate later ones
+    members: List[List[int]] = []
+    for i in order.tolist():
+        f = F[i]
+        k = 0
+        while k < len(members):
+            other = F[members[k]]
+            if np.any(np.all(other <= f, axis=1) & np.any(other < f, axis=1)):
+                k += 1
+            else:
+                break
+        if k == len(members):
+            members.append([])
+        members[k].append(i)
+        ranks[i] = k
+    return ranks
+
+
+def crowding_distance(objectives: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """
+    NSGA-II crowding distance within each front.
+    
+    Args:
+        objectives: (N, M) objective values
+        ranks: (N,) front indices from non_dominated_sort
+    
+    Returns:
+        (N,) distances; front boundaries get inf
+    """
+    F = np.asarray(objectives, dtype=float)
+    ranks = np.asarray(ranks)
+    n = len(F)
+    distance = np.zeros(n)
+    if n == 0:
+        return distance
+    
+    for m in range(F.shape[1]):
+        order = np.lexsort((F[:, m], ranks))
+        f, r = F[order, m], ranks[order]
+        first = np.r_[True, r[1:] != r[:-1]]
+        last = np.r_[r[1:] != r[:-1], True]
+        
+        group = np.cumsum(first) - 1
+        span = (f[last] - f[first])[group]
+        gap = np.zeros(n)
+        interior = ~(first | last)
+        gap[interior] = f[2:][interior[1:-1]] - f[:-2][interior[1:-1]]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            contribution = np.where(span > 0, gap / span, 0.0)
+        contribution[first | last] = np.inf
+        distance[order] += contribution
+    return distance
+
+
+class Variable:
+    """
+    One decision variable, mapped from the unit interval.
+    
+    Continuous variables span [low, high] (log-uniformly with log=True);
+    categorical variables pick one of options.
+    """
+    
+    def __init__(self, name: str, low: Optional[float] = None, high: Optional[float] = None,
+                 log: bool = False, options: Optional[Sequence] = None):
+        """
+        Initialize the variable.
+        
+        Args:
+            name: Parameter name
+            low: Lower bound (continuous)
+            high: Upper bound (continuous)
+            log: Sample log-uniformly
+            options: Categories (instead of bounds)
+        """
+        self.name = name
+        self.options = None if options is None else list(options)
+        if self.options is None:
+            if low is None or high is None or not low < high:
+                raise ValueError(f"Variable {name!r} needs low < high or options")
+            if log and low <= 0:
+                raise ValueError(f"Log-scaled variable {name!r} needs low > 0")
+        elif not self.options:
+            raise ValueError(f"Variable {name!r} needs at least one option")
+        self.low, self.high, self.log = low, high, log
+    
+    def decode(self, unit: np.ndarray) -> np.ndarray:
+        """Map unit-interval values to parameter values."""
+        unit = np.clip(unit, 0.0, 1.0)
+        if self.options is not None:
+            index = np.minimum((unit * len(self.options)).astype(np.int64), len(self.options) - 1)
+            return np.asarray(self.options, dtype=object)[index]
+        if self.log:
+            return np.exp(np.log(self.low) + unit * (np.log(self.high) - np.log(self.low)))
+        return self.low + unit * (self.high - self.low)
+    
+    def __repr__(self) -> str:
+        if self.options is not None:
+            return f"Variable({self.name!r}, options={self.options})"
+        return f"Variable({self.name!r}, [{self.low}, {self.high}]{', log' if self.log else ''})"
+
+
+class ParetoProblem(ABC):
+    """
+    Base class for problems optimized by ParetoOptimizer.
+    
+    Subclasses set variables, objective_names and implement evaluate(),
+    which receives decoded parameter columns for a whole batch and returns
+    (objectives (N, M) to minimize, constraint violation (N,), 0 when
+    feasible). Instances must be picklable to run on worker processes.
+    """
+    
+    variables: List[Variable] = []
+    objective_names: Tuple[str, ...] = ()
+    
+    def decode(self, unit: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Decode unit-hypercube points.
+        
+        Args:
+            unit: (N, n_variables) values in [0, 1]
+        
+        Returns:
+            Parameter name -> (N,) values
+        """
+        unit = np.atleast_2d(unit)
+        return {v.name: v.decode(unit[:, j]) for j, v in enumerate(self.variables)}
+    
+    @abstractmethod
+    def evaluate(self, params: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate a batch of candidates.
+        
+        Args:
+            params: Parameter name -> (N,) decoded values
+        
+        Returns:
+            (objectives (N, M) to minimize, constraint violation (N,), 0 when feasible)
+        """
+    
+    def describe(self) -> Dict:
+        """JSON-able description used to match resumed runs."""
+        return {'problem': type(self).__name__,
+                'variables': [repr(v) for v in self.variables],
+                'objectives': list(self.objective_names)}
+
+
+def _evaluate_chunk(args) -> Tuple[np.ndarray, np.ndarray]:
+    """Evaluate one chunk of unit points (module level for pickling)."""
+    problem, unit = args
+    objectives, violation = problem.evaluate(problem.decode(unit))
+    return np.asarray(objectives, dtype=float), np.asarray(violation, dtype=float)
+
+
+class ParetoArchive:
+    """
+    Feasible non-dominated set of every candidate seen so far.
+    
+    Merging is incremental: only the archive and the new batch are sorted.
+    With max_size the most crowded members are dropped first.
+    """
+    
+    def __init__(self, n_variables: int, n_objectives: int, max_size: Optional[int] = None):
+        """
+        Initialize an empty archive.
+        
+        Args:
+            n_variables: Decision variables per candidate
+            n_objectives: Objectives per candidate
+            max_size: Optional cap on the archive size
+        """
+        self.unit = np.zeros((0, n_variables))
+        self.objectives = np.zeros((0, n_objectives))
+        self.max_size = max_size
+    
+    def __len__(self) -> int:
+        return len(self.unit)
+    
+    def update(self, unit: np.ndarray, objectives: np.ndarray,
+               violation: Optional[np.ndarray] = None) -> int:
+        """
+        Merge a batch of evaluated candidates.
+        
+        Args:
+            unit: (N, n_variables) unit-hypercube points
+            objectives: (N, M) objective values
+            violation: Optional (N,) constraint violation
+        
+        Returns:
+            Number of batch candidates that entered the archive
+        """
+        keep = np.ones(len(unit), dtype=bool) if violation is None else np.asarray(violation) <= 0
+        X = np.concatenate([self.unit, unit[keep]])
+        F = np.concatenate([self.objectives, objectives[keep]])
+        new = np.r_[np.zeros(len(self), dtype=bool), np.ones(int(keep.sum()), dtype=bool)]
+        
+        X, first = np.unique(X, axis=0, return_index=True)
+        F, new = F[first], new[first]
+        front = non_dominated_sort(F) == 0
+        X, F, new = X[front], F[front], new[front]
+        
+        if self.max_size is not None and len(X) > self.max_size:
+            crowding = crowding_distance(F, np.zeros(len(F), dtype=np.int64))
+            best = np.argsort(-crowding, kind='stable')[:self.max_size]
+            X, F, new = X[best], F[best], new[best]
+        
+        self.unit, self.objectives = X, F
+        return int(new.sum())
+    
+    def save(self, path: str) -> None:
+        atomic_savez(path, unit=self.unit, objectives=self.objectives)
+    
+    def load(self, path: str) -> None:
+        with np.load(path) as data:
+            self.unit, self.objectives = data['unit'], data['objectives']
+    
+    def __repr__(self) -> str:
+        return f"ParetoArchive({len(self)} points)"
+
+
+class ParetoOptimizer:
+    """
+    Resumable, parallel NSGA-II.
+    
+    Variation is simulated binary crossover plus polynomial mutation in the
+    unit hypercube, with random streams keyed by (seed, generation), so a
+    run gives the same result for any number of workers and after resume.
+    """
+    
+    STATE = 'optimizer.json'
+    # Keyed by generation, so the state file always names a complete pair
+    POPULATION = 'population_{:05d}.npz'
+    ARCHIVE = 'archive_{:05d}.npz'
+    
+    def __init__(self,
+                 problem: ParetoProblem,
+                 population_size: int = 100,
+                 output_dir: Optional[str] = None,
+                 seed: int = 0,
+                 n_workers: Optional[int] = None,
+                 crossover_probability: float = 0.9,
+                 crossover_eta: float = 15.0,
+                 mutation_eta: float = 20.0,
+                 archive_size: Optional[int] = None):
+        """
+        Initialize the optimizer.
+        
+        Args:
+            problem: Problem to optimize
+            population_size: Candidates per generation
+            output_dir: Directory for checkpoints (None keeps everything in memory)
+            seed: Root seed
+            n_workers: Worker processes (None for all cores, 0/1 in-process)
+            crossover_probability: Probability that a pair is recombined
+            crossover_eta: SBX distribution index
+            mutation_eta: Polynomial mutation distribution index
+            archive_size: Optional cap on the Pareto archive
+        """
+        if population_size < 4 or population_size % 2:
+            raise ValueError("population_size must be even and at least 4")
+        self.problem = problem
+        self.population_size = population_size
+        self.output_dir = output_dir
+        self.seed = seed
+        self.n_workers = resolve_workers(n_workers)
+        self.crossover_probability = crossover_probability
+        self.crossover_eta = crossover_eta
+        self.mutation_eta = mutation_eta
+        
+        n_var = len(problem.variables)
+        self.archive = ParetoArchive(n_var, len(problem.objective_names), archive_size)
+        self.generation = 0
+        self.n_evaluated = 0
+        self.unit = np.zeros((0, n_var))
+        self.objectives = np.zeros((0, len(problem.objective_names)))
+        self.violation = np.zeros(0)
+        self._executor = None
+        
+        if output_dir is not None:
+            self._resume()
+    
+    def _settings(self) -> Dict:
+        return dict(self.problem.describe(), population_size=self.population_size,
+                    seed=self.seed, crossover_probability=self.crossover_probability,
+                    crossover_eta=self.crossover_eta, mutation_eta=self.mutation_eta,
+                    archive_size=self.archive.max_size)
+    
+    def _resume(self) -> None:
+        path = os.path.join(self.output_dir, self.STATE)
+        if not os.path.exists(path):
+            return
+        with open(path) as f:
+            state = json.load(f)
+        if state['settings'] != json.loads(json.dumps(self._settings())):
+            raise ValueError(f"{self.output_dir} holds a different optimization")
+        generation = state['generation']
+        with np.load(os.path.join(self.output_dir, self.POPULATION.format(generation))) as data:
+            self.unit, self.objectives = data['unit'], data['objectives']
+            self.violation = data['violation']
+        self.archive.load(os.path.join(self.output_dir, self.ARCHIVE.format(generation)))
+        self.generation = generation
+        self.n_evaluated = state['n_evaluated']
+    
+    def _checkpoint(self) -> None:
+        if self.output_dir is None:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        population = self.POPULATION.format(self.generation)
+        archive = self.ARCHIVE.format(self.generation)
+        atomic_savez(os.path.join(self.output_dir, population), unit=self.unit,
+                     objectives=self.objectives, violation=self.violation)
+        self.archive.save(os.path.join(self.output_dir, archive))
+        # Until this write the state still names the previous generation's files
+        atomic_write_text(os.path.join(self.output_dir, self.STATE), json.dumps({
+            'settings': self._settings(),
+            'generation': self.generation,
+            'n_evaluated': self.n_evaluated,
+        }, indent=2))
+        remove_stale(self.output_dir, self.POPULATION.replace('{:05d}', '*'), population)
+        remove_stale(self.output_dir, self.ARCHIVE.replace('{:05d}', '*'), archive)
+    
+    def evaluate(self, unit: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate unit-hypercube points, in chunks across workers.
+        
+        Returns:
+            (objectives (N, M), violation (N,))
+        """
+        if self._executor is None or len(unit) < 2:
+            return _evaluate_chunk((self.problem, unit))
+        chunks = np.array_split(unit, min(len(unit), 4 * self.n_workers))
+        results = list(self._executor.map(_evaluate_chunk,
+                                          [(self.problem, chunk) for chunk in chunks]))
+        return (np.concatenate([r[0] for r in results]),
+                np.concatenate([r[1] for r in results]))
+    
+    def _rank(self, objectives, violation) -> Tuple[np.ndarray, np.ndarray]:
+        ranks = non_dominated_sort(objectives, violation)
+        return ranks, crowding_distance(objectives, ranks)
+    
+    def _offspring(self, rng: np.random.Generator) -> np.ndarray:
+        n, d = self.unit.shape
+        ranks, crowding = self._rank(self.objectives, self.violation)
+        
+        # Binary tournaments on (rank, -crowding)
+        a, b = rng.integers(0, n, (2, n))
+        better = (ranks[a] < ranks[b]) | ((ranks[a] == ranks[b]) & (crowding[a] >= crowding[b]))
+        parents = self.unit[np.where(better, a, b)]
+        p1, p2 = parents[0::2], parents[1::2]
+        
+        # Simulated binary crossover
+        u = rng.random(p1.shape)
+        exponent = 1.0 / (self.crossover_eta + 1.0)
+        beta = np.where(u <= 0.5, (2 * u) ** exponent, (1 / (2 * (1 - u))) ** exponent)
+        swap = (rng.random(p1.shape) < 0.5) & (rng.random((len(p1), 1)) < self.crossover_probability)
+        beta = np.where(swap, beta, 1.0)
+        c1 = 0.5 * ((1 + beta) * p1 + (1 - beta) * p2)
+        c2 = 0.5 * ((1 - beta) * p1 + (1 + beta) * p2)
+        children = np.concatenate([c1, c2])
+        
+        # Polynomial mutation, one variable per child on average
+        u = rng.random(children.shape)
+        exponent = 1.0 / (self.mutation_eta + 1.0)
+        delta = np.where(u < 0.5, (2 * u) ** exponent - 1, 1 - (2 * (1 - u)) ** exponent)
+        children += np.where(rng.random(children.shape) < 1.0 / d, delta, 0.0)
+        return np.clip(children, 0.0, 1.0)
+    
+    def _select(self, unit, objectives, violation) -> None:
+        ranks, crowding = self._rank(objectives, violation)
+        best = np.lexsort((-crowding, ranks))[:self.population_size]
+        self.unit, self.objectives, self.violation = unit[best], objectives[best], violation[best]
+    
+    def run(self, n_generations: int,
+            progress: Optional[Callable[[int, int, int], None]] = None) -> ParetoArchive:
+        """
+        Run until n_generations generations are complete (resuming if needed).
+        
+        Args:
+            n_generations: Total generations, including any already run
+            progress: Optional callback (generation, candidates evaluated,
+                archive size)
+        
+        Returns:
+            The Pareto archive
+        """
+        if self.generation >= n_generations:
+            return self.archive
+        
+        self._executor = make_executor(self.n_workers)
+        try:
+            while self.generation < n_generations:
+                rng = stream_rng(self.seed, self.generation)
+                if self.generation == 0:
+                    unit = rng.random((self.population_size, len(self.problem.variables)))
+                    objectives, violation = self.evaluate(unit)
+                    self.unit, self.objectives, self.violation = unit, objectives, violation
+                else:
+                    unit = self._offspring(rng)
+                    objectives, violation = self.evaluate(unit)
+                    self._select(np.concatenate([self.unit, unit]),
+                                 np.concatenate([self.objectives, objectives]),
+                                 np.concatenate([self.violation, violation]))
+                self.archive.update(unit, objectives, violation)
+                self.n_evaluated += len(unit)
+                self.generation += 1
+                self._checkpoint()
+                if progress:
+                    progress(self.generation, self.n_evaluated, len(self.archive))
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+        return self.archive
+    
+    def front(self) -> Dict[str, np.ndarray]:
+        """
+        Decoded Pareto archive.
+        
+        Returns:
+            Parameter columns plus one column per objective
+        """
+        columns = self.problem.decode(self.archive.unit) if len(self.archive) else {
+            v.name: np.zeros(0) for v in self.problem.variables}
+        columns.update({name: self.archive.objectives[:, j]
+                        for j, name in enumerate(self.problem.objective_names)})
+        return columns
+    
+    def __repr__(self) -> str:
+        return (f"ParetoOptimizer({type(self.problem).__name__}, generation={self.generation}, "
+                f"evaluated={self.n_evaluated}, archive={len(self.archive)})")
@@ -0,0 +1,133 @@
+"""
+Sacrificial interface design (Section 8).
+
+A sacrificial interface is a contact point between a hypothetical space
+I_X and I_EM run until it collapses. Each channel use transfers
+
+    i = ½ log₂(1 + SNR η)   bits,   η = g² f_λ f_ρ f_T,
+
+and deposits the coupled but incompatible fraction g² (1 - f) of the
+signal in the interface, a collapse hazard q = load × g² (1 - f) per use.
+Faster carriers make more uses n = n_uses × Vmax/c in the same window, so
+
+    I(I_X → I_EM) = n i,   P(collapse) = 1 - exp(-n q).
+
+The problem maximizes I subject to P(collapse) ≤ ε over g and the
+I_X parameters (Vmax, λ, ρ, topology).
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from ..core.constants import SPEED_OF_LIGHT
+from ..core.space import EMSpace, HypotheticalSpace, InformationSpace
+from ..interactions.contact_point import ContactPoint, _compatibility_factors
+from .pareto import ParetoProblem, Variable
+
+
+TOPOLOGIES = ('local', 'extended', 'global')
+
+
+class SacrificialInterfaceProblem(ParetoProblem):
+    """
+    Maximize mutual information against collapse probability.
+    
+    Objectives (minimized): -I (bits) and P(collapse); candidates with
+    P(collapse) > ε are infeasible. Compatibility factors match
+    ContactPoint for the same spaces.
+    """
+    
+    objective_names = ('neg_mutual_information', 'collapse_probability')
+    
+    def __init__(self,
+                 epsilon: float = 0.01,
+                 target: Optional[InformationSpace] = None,
+                 snr: float = 1e3,
+                 load: float = 1e-3,
+                 n_uses: float = 1e3,
+                 coupling_range: Tuple[float, float] = (1e-4, 1.0),
+                 vmax_ratio_range: Tuple[float, float] = (1.001, 1e3),
+                 lambda_range: Tuple[float, float] = (1e-12, 1e-8),
+                 rho_range: Tuple[float, float] = (1e25, 1e33)):
+        """
+        Initialize the problem.
+        
+        Args:
+            epsilon: Acceptable collapse probability ε
+            target: Target space (default I_EM)
+            snr: Signal-to-noise ratio of a fully efficient channel use
+            load: Collapse hazard per unit of deposited signal
+            n_uses: Channel uses in the exposure window at Vmax = c
+            coupling_range: Bounds on g (log-scaled)
+            vmax_ratio_range: Bounds on Vmax/c of I_X (log-scaled, > 1)
+            lambda_range: Bounds on λ of I_X (m, log-scaled)
+            rho_range: Bounds on ρ of I_X (log-scaled)
+        """
+        if not 0 < epsilon < 1:
+            raise ValueError("epsilon must be in (0, 1)")
+        if vmax_ratio_range[0] <= 1:
+            raise ValueError("I_X must be faster than light (Vmax/c > 1)")
+        self.epsilon = epsilon
+        self.target = target if target is not None else EMSpace()
+        self.snr = snr
+        self.load = load
+        self.n_uses = n_uses
+        self.variables = [
+            Variable('coupling_strength', *coupling_range, log=True),
+            Variable('vmax_ratio', *vmax_ratio_range, log=True),
+            Variable('lambda_scale', *lambda_range, log=True),
+            Variable('rho_density', *rho_range, log=True),
+            Variable('topology', options=TOPOLOGIES),
+        ]
+    
+    def compatibility(self, params: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Vectorized f_λ × f_ρ × f_T against the target space.
+        
+        Args:
+            params: Decoded parameter columns
+        
+        Returns:
+            (N,) compatibility factors
+        """
+        target = self.target
+        scale, density, topology = _compatibility_factors(
+            params['lambda_scale'], np.log(np.asarray(params['rho_density'], dtype=float)),
+            params['topology'], target.lambda_scale, target.log_rho_density, target.topology)
+        return scale * density * topology
+    
+    def evaluate(self, params: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        g2 = np.asarray(params['coupling_strength'], dtype=float) ** 2
+        f = self.compatibility(params)
+        uses = self.n_uses * np.asarray(params['vmax_ratio'], dtype=float)
+        
+        information = uses * 0.5 * np.log2(1.0 + self.snr * g2 * f)
+        collapse = -np.expm1(-uses * self.load * g2 * (1.0 - f))
+        objectives = np.column_stack([-information, collapse])
+        return objectives, np.maximum(collapse - self.epsilon, 0.0)
+    
+    def contact_point(self, params: Dict[str, np.ndarray], i: int = 0) -> ContactPoint:
+        """
+        Materialize one candidate as a ContactPoint.
+        
+        Args:
+            params: Decoded parameter columns (e.g. ParetoOptimizer.front())
+            i: Row to build
+        
+        Returns:
+            Contact point from the candidate I_X to the target space
+        """
+        space = HypotheticalSpace(Vmax=float(params['vmax_ratio'][i]) * SPEED_OF_LIGHT,
+                                  lambda_scale=float(params['lambda_scale'][i]),
+                                  rho_density=float(params['rho_density'][i]),
+                                  topology=str(params['topology'][i]))
+        return ContactPoint(space, self.target, float(params['coupling_strength'][i]),
+                            name='sacrificial')
+    
+    def describe(self) -> Dict:
+        return dict(super().describe(), epsilon=self.epsilon, target=repr(self.target),
+                    snr=self.snr, load=self.load, n_uses=self.n_uses)
+    
+    def __repr__(self) -> str:
+        return f"SacrificialInterfaceProblem(ε={self.epsilon}, SNR={self.snr}, load={self.load})"
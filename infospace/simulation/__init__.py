@@ -0,0 +1,41 @@
+"""
+Simulation engines built on information spaces.
+
+Includes the event-level Monte Carlo for LHC missing-energy searches,
+the parallel parameter-sweep scheduler, the finite-propagation-speed
+N-body solver, the coupled multi-space wave solver, the vacuum
+phase-transition lattice and the columnar result store.
+"""
+
+from .lhc import simulate_lhc_collision, LHCMonteCarlo, MissingEnergyHistogram
+from .sweep import ParameterGrid, ParameterSweep, MethodMetric
+from .nbody import RetardedPMSolver, NBodySimulation, write_snapshot, load_snapshots
+from .waves import CoupledWaveSolver, write_field_snapshot, load_field_snapshots
+from .vacuum import (PolynomialPotential, VacuumLattice, VmaxField, double_well,
+                     thermal_correction, energy_correction, exponential_ratio)
+from .store import ResultStore, StoreWriter
+
+__all__ = [
+    'simulate_lhc_collision',
+    'LHCMonteCarlo',
+    'MissingEnergyHistogram',
+    'ParameterGrid',
+    'ParameterSweep',
+    'MethodMetric',
+    'RetardedPMSolver',
+    'NBodySimulation',
+    'write_snapshot',
+    'load_snapshots',
+    'CoupledWaveSolver',
+    'write_field_snapshot',
+    'load_field_snapshots',
+    'PolynomialPotential',
+    'VacuumLattice',
+    'VmaxField',
+    'double_well',
+    'thermal_correction',
+    'energy_correction',
+    'exponential_ratio',
+    'ResultStore',
+    'StoreWriter',
+]
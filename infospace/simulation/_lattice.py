@@ -0,0 +1,137 @@
+"""
+Shared machinery for stencil codes on periodic lattices.
+
+Holds the periodic Laplacian and the slab decomposition used by the wave
+and vacuum solvers: state arrays are split into slabs along the first
+grid axis, and with workers they live in memory-mapped files that every
+worker process maps, so slabs are updated in place without pickling.
+"""
+
+import os
+import shutil
+import tempfile
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .._parallel import make_executor, resolve_workers
+
+
+# Memory-mapped arrays opened by this (worker) process
+_SHARED: Dict[str, np.ndarray] = {}
+
+
+def open_shared(reference: Union[str, np.ndarray]) -> np.ndarray:
+    """Array behind a reference: a shared file path, or the array itself."""
+    if not isinstance(reference, str):
+        return reference
+    if reference not in _SHARED:
+        _SHARED[reference] = np.load(reference, mmap_mode='r+')
+    return _SHARED[reference]
+
+
+def add_neighbours(out: np.ndarray, a: np.ndarray, axis: int) -> None:
+    """out += a shifted by +1 and -1 along axis, wrapping periodically."""
+    def at(s):
+        index = [slice(None)] * a.ndim
+        index[axis] = s
+        return tuple(index)
+    
+    out[at(slice(1, None))] += a[at(slice(None, -1))]
+    out[at(slice(0, 1))] += a[at(slice(-1, None))]
+    out[at(slice(None, -1))] += a[at(slice(1, None))]
+    out[at(slice(-1, None))] += a[at(slice(0, 1))]
+
+
+def laplacian(u: np.ndarray) -> np.ndarray:
+    """Periodic second-order Laplacian of a whole grid, in units of 1/h²."""
+    out = -2.0 * u.ndim * u
+    for axis in range(u.ndim):
+        add_neighbours(out, u, axis)
+    return out
+
+
+def slab_laplacian(u: np.ndarray, lo: int, hi: int) -> np.ndarray:
+    """
+    Periodic Laplacian of rows lo:hi (first axis) of u, in units of 1/h².
+    
+    Only the slab and its two neighbouring rows are read.
+    """
+    n = u.shape[0]
+    centre = u[lo:hi]
+    out = centre * (-2.0 * u.ndim)
+    out[1:] += centre[:-1]
+    out[:-1] += centre[1:]
+    out[0] += u[(lo - 1) % n]
+    out[-1] += u[hi % n]
+    for axis in range(1, u.ndim):
+        add_neighbours(out, centre, axis)
+    return out
+
+
+class SlabState:
+    """
+    State array split into slabs, in memory or shared with worker processes.
+    """
+    
+    def __init__(self,
+                 shape: Sequence[int],
+                 rows: int,
+                 dtype=np.float64,
+                 n_workers: Optional[int] = 0,
+                 n_slabs: Optional[int] = None,
+                 work_dir: Optional[str] = None,
+                 prefix: str = 'lattice-'):
+        """
+        Allocate zeroed state.
+        
+        Args:
+            shape: Full state shape
+            rows: Length of the grid axis split into slabs
+            dtype: State precision
+            n_workers: Worker processes (None for all cores, 0/1 in-process)
+            n_slabs: Slabs (default one per worker)
+            work_dir: Directory for shared files when using workers
+            prefix: Name prefix of the temporary directory
+        """
+        self.n_workers = resolve_workers(n_workers)
+        n_slabs = n_slabs or max(1, self.n_workers)
+        bounds = np.linspace(0, rows, min(n_slabs, rows) + 1).astype(int)
+        self.slabs: List[Tuple[int, int]] = list(zip(bounds[:-1], bounds[1:]))
+        
+        self._work_dir = None
+        self._executor = None
+        if self.n_workers:
+            self._work_dir = tempfile.mkdtemp(prefix=prefix, dir=work_dir)
+            self.reference = os.path.join(self._work_dir, 'state.npy')
+            self.array = np.lib.format.open_memmap(self.reference, mode='w+', dtype=dtype,
+                                                   shape=tuple(shape))
+            self._executor = make_executor(self.n_workers)
+        else:
+            self.array = np.zeros(tuple(shape), dtype=dtype)
+            self.reference = self.array
+    
+    def share(self, name: str, values: np.ndarray) -> Union[str, np.ndarray]:
+        """Make an auxiliary array readable by workers; returns its reference."""
+        if self._work_dir is None:
+            return values
+        path = os.path.join(self._work_dir, f'{name}.npy')
+        np.save(path, values)
+        return path
+    
+    def map(self, func: Callable, tasks: Iterable) -> List:
+        """Run module-level func over slab tasks, on workers when available."""
+        if self._executor is None:
+            return [func(task) for task in tasks]
+        return list(self._executor.map(func, tasks))
+    
+    def close(self) -> None:
+        """Stop workers and remove shared files, keeping the state in memory."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._work_dir is not None:
+            self.array = np.array(self.array)
+            self.reference = self.array
+            shutil.rmtree(self._work_dir, ignore_errors=True)
+            self._work_dir = None
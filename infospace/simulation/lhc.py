@@ -0,0 +1,427 @@
+"""
+LHC missing-energy simulation.
+
+Models collisions above an energy threshold leaking energy into a
+hypothetical space I_X, both as a deterministic expectation per collision
+energy and as a seeded, batched event-level Monte Carlo (Protocol 1).
+"""
+
+import functools
+import numpy as np
+from typing import Callable, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+from ..core.constants import SPEED_OF_LIGHT, GEV_TO_JOULES
+from ..core.space import EMSpace, HypotheticalSpace
+from ..interactions.contact_point import ContactPoint
+from ..interactions.coupling import CouplingModel, PowerLawCoupling
+
+
+# Collision energies: a fixed value (GeV) or a sampler (rng, n) -> energies (GeV)
+EnergySpec = Union[float, Callable[[np.random.Generator, int], np.ndarray]]
+
+
+@functools.lru_cache(maxsize=128)
+def _lhc_contact(vmax_x_factor: float) -> ContactPoint:
+    """
+    Unit-coupling contact point between I_X and I_EM for a given Vmax_X.
+    
+    Only its compatibility factors are used; the coupling is energy
+    dependent and applied by the callers.
+    """
+    x_space = HypotheticalSpace(
+        Vmax=vmax_x_factor * SPEED_OF_LIGHT,
+        lambda_scale=1e-18,  # Sub-nuclear scale
+        rho_density=1e35,
+        name=f'I_X(Vmax={vmax_x_factor}c)'
+    )
+    return ContactPoint(x_space, EMSpace(), 1.0, name='LHC_Threshold')
+
+
+@functools.lru_cache(maxsize=128)
+def lhc_coupling_model(threshold_energy_gev: float,
+                       base_coupling: float = 1e-40,
+                       max_coupling: float = 1e-10) -> PowerLawCoupling:
+    """
+    Default LHC coupling g_eff(E) = min(g₀ (E/E_th)², g_max).
+    
+    Args:
+        threshold_energy_gev: Threshold energy E_th (GeV)
+        base_coupling: g₀ at threshold
+        max_coupling: Upper bound g_max
+    
+    Returns:
+        Power-law coupling model over energies in J
+    """
+    return PowerLawCoupling(base_coupling, threshold_energy_gev * GEV_TO_JOULES,
+                            exponent=2.0, max_coupling=max_coupling)
+
+
+def simulate_lhc_collision(collision_energy_gev: float, 
+                           threshold_energy_gev: float = 15.0,
+                           vmax_x_factor: float = 10.0,
+                           coupling_model: Optional[CouplingModel] = None):
+    """
+    Simulate LHC collision with potential I_X transition.
+    
+    Returns the expectation for a single collision energy; use
+    LHCMonteCarlo for sampled events.
+    
+    Args:
+        collision_energy_gev: Collision energy in GeV
+        threshold_energy_gev: Energy threshold for I_X transition
+        vmax_x_factor: Vmax_X / c ratio
+        coupling_model: g_eff(E) over energies in J
+            (default lhc_coupling_model(threshold_energy_gev))
+    
+    Returns:
+        Dictionary with simulation results
+    """
+    # Contact point (very weak at low energies)
+    model = coupling_model or lhc_coupling_model(threshold_energy_gev)
+    effective_coupling = float(model(collision_energy_gev * GEV_TO_JOULES))
+    
+    contact_efficiency = effective_coupling ** 2 * _lhc_contact(vmax_x_factor).compatibility()
+    
+    # Initial energy (all in I_EM)
+    initial_energy_j = collision_energy_gev * GEV_TO_JOULES
+    
+    # Check if above threshold
+    if collision_energy_gev > threshold_energy_gev:
+        # Some energy transitions to I_X
+        transition_prob = 1.0 - np.exp(-(collision_energy_gev - threshold_energy_gev) / threshold_energy_gev)
+        
+        # Energy that transitions, minus what the contact point projects back
+        energy_to_x = initial_energy_j * transition_prob
+        measured_energy_em = energy_to_x * contact_efficiency
+        
+        # Missing energy
+        missing_energy = energy_to_x - measured_energy_em
+        missing_fraction = missing_energy / initial_energy_j
+    else:
+        transition_prob = 0.0
+        missing_energy = 0.0
+        missing_fraction = 0.0
+    
+    return {
+        'collision_energy_gev': collision_energy_gev,
+        'threshold_gev': threshold_energy_gev,
+        'transition_probability': transition_prob,
+        'missing_energy_gev': missing_energy / GEV_TO_JOULES,
+        'missing_fraction': missing_fraction,
+        'contact_efficiency': contact_efficiency,
+        'effective_coupling': effective_coupling,
+    }
+
+
+class MissingEnergyHistogram:
+    """
+    Fixed-binning histogram filled incrementally from event batches.
+    
+    Also keeps running sums so the mean and its standard error are
+    available without storing events.
+    """
+    
+    def __init__(self, bins: Union[int, Sequence[float]] = 100,
+                 range: Tuple[float, float] = (0.0, 1.0)):
+        """
+        Initialize an empty histogram.
+        
+        Args:
+            bins: Number of uniform bins over range, or explicit bin edges
+            range: (low, high) for uniform bins
+        """
+        if np.ndim(bins) == 0:
+            self.edges = np.linspace(range[0], range[1], int(bins) + 1)
+            self._uniform = True
+        else:
+            self.edges = np.asarray(bins, dtype=float)
+            self._uniform = False
+        if self.edges.ndim != 1 or len(self.edges) < 2 or np.any(np.diff(self.edges) <= 0):
+            raise ValueError("bin edges must be strictly increasing")
+        
+        self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+        self.n = 0
+        self.sum = 0.0
+        self.sum_sq = 0.0
+    
+    def fill(self, values: np.ndarray) -> None:
+        """
+        Add a batch of values.
+        
+        Args:
+            values: Values to histogram
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        n_bins = len(self.counts)
+        
+        if self._uniform:
+            low, high = self.edges[0], self.edges[-1]
+            index = np.floor((values - low) * (n_bins / (high - low))).astype(np.int64)
+            # The upper edge belongs to the last bin, as in numpy.histogram
+            index[values == high] = n_bins - 1
+        else:
+            index = np.searchsorted(self.edges, values, side='right') - 1
+            index[values == self.edges[-1]] = n_bins - 1
+        
+        below = index < 0
+        above = index >= n_bins
+        self.underflow += int(np.count_nonzero(below))
+        self.overflow += int(np.count_nonzero(above))
+        inside = index[~(below | above)]
+        self.counts += np.bincount(inside, minlength=n_bins)
+        
+        self.n += len(values)
+        self.sum += float(np.sum(values))
+        self.sum_sq += float(np.dot(values, values))
+    
+    def merge(self, other: 'MissingEnergyHistogram') -> None:
+        """Add another histogram with identical binning."""
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Cannot merge histograms with different binning")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        self.n += other.n
+        self.sum += other.sum
+        self.sum_sq += other.sum_sq
+    
+    @property
+    def mean(self) -> float:
+        """Mean of all filled values."""
+        return self.sum / self.n if self.n else np.nan
+    
+    @property
+    def std_error(self) -> float:
+        """Standard error of the mean."""
+        if self.n < 2:
+            return np.nan
+        variance = (self.sum_sq - self.n * self.mean ** 2) / (self.n - 1)
+        return float(np.sqrt(max(variance, 0.0) / self.n))
+    
+    def __repr__(self) -> str:
+        return f"MissingEnergyHistogram(bins={len(self.counts)}, n={self.n})"
+
+
+class LHCMonteCarlo:
+    """
+    Event-level Monte Carlo of LHC missing energy from I_X transitions.
+    
+    Per event, a transition to I_X happens with probability
+    P(E) = 1 - exp(-(E - E_th)/E_th) above threshold. A transitioned event
+    carries transition_fraction of its energy into I_X, of which the
+    contact point returns η(E) = g_eff(E)² × f_λ × f_ρ × f_T to I_EM, with
+    g_eff served for whole batches from the coupling model's lookup table.
+    The mean missing fraction therefore matches simulate_lhc_collision
+    for transition_fraction = 1.
+    
+    Events are generated in NumPy batches from per-batch child seeds, so a
+    run is reproducible for a given seed and batch size and never holds
+    more than one batch in memory.
+    """
+    
+    def __init__(self,
+                 threshold_energy_gev: float = 15.0,
+                 vmax_x_factor: float = 10.0,
+                 base_coupling: Optional[float] = None,
+                 max_coupling: Optional[float] = None,
+                 transition_fraction: float = 1.0,
+                 resolution: float = 0.0,
+                 seed: Optional[int] = None,
+                 coupling_model: Optional[CouplingModel] = None):
+        """
+        Initialize the Monte Carlo engine.
+        
+        Args:
+            threshold_energy_gev: Energy threshold for I_X transition (GeV)
+            vmax_x_factor: Vmax_X / c ratio
+            base_coupling: Coupling g at the threshold energy (default 1e-40)
+            max_coupling: Upper bound on the effective coupling (default 1e-10)
+            transition_fraction: Fraction of collision energy moved to I_X
+                by a transition
+            resolution: Relative Gaussian resolution of the measured
+                missing energy (σ/E)
+            seed: Seed for the event generator
+            coupling_model: g_eff(E) over energies in J (default the power
+                law min(g₀ (E/E_th)², g_max) from base_coupling and
+                max_coupling; cannot be combined with them)
+        """
+        if threshold_energy_gev <= 0:
+            raise ValueError("threshold_energy_gev must be positive")
+        if not 0 <= transition_fraction <= 1:
+            raise ValueError("transition_fraction must be in [0, 1]")
+        if resolution < 0:
+            raise ValueError("resolution must be non-negative")
+        if coupling_model is not None and (base_coupling is not None or max_coupling is not None):
+            raise ValueError("Give base_coupling/max_coupling or coupling_model, not both")
+        
+        self.threshold_energy_gev = threshold_energy_gev
+        self.vmax_x_factor = vmax_x_factor
+        self.transition_fraction = transition_fraction
+        self.resolution = resolution
+        self.seed = seed
+        if coupling_model is None:
+            self.base_coupling = 1e-40 if base_coupling is None else base_coupling
+            self.max_coupling = 1e-10 if max_coupling is None else max_coupling
+            coupling_model = lhc_coupling_model(threshold_energy_gev, self.base_coupling,
+                                                self.max_coupling)
+        else:
+            self.base_coupling = self.max_coupling = None
+        self.coupling_model = coupling_model
+        
+        # Shared through the _lhc_contact cache, so kept private
+        self._contact = _lhc_contact(vmax_x_factor)
+        self.x_space = self._contact.space_x
+        self.em_space = self._contact.space_em
+    
+    def transition_probability(self, collision_energy_gev: np.ndarray) -> np.ndarray:
+        """
+        Probability that an event transitions to I_X.
+        
+        Args:
+            collision_energy_gev: Collision energies (GeV)
+        
+        Returns:
+            Transition probabilities
+        """
+        E = np.asarray(collision_energy_gev, dtype=float)
+        excess = np.maximum(E - self.threshold_energy_gev, 0.0) / self.threshold_energy_gev
+        return -np.expm1(-excess)
+    
+    def effective_coupling(self, collision_energy_gev: np.ndarray) -> np.ndarray:
+        """
+        Energy-dependent coupling g_eff(E) from the coupling model.
+        
+        Args:
+            collision_energy_gev: Collision energies (GeV)
+        
+        Returns:
+            Effective couplings
+        """
+        E = np.asarray(collision_energy_gev, dtype=float)
+        return self.coupling_model(E * GEV_TO_JOULES)
+    
+    def efficiency(self, collision_energy_gev: np.ndarray) -> np.ndarray:
+        """
+        Contact-point efficiency η(E) at each collision energy.
+        
+        Returns:
+            Efficiencies
+        """
+        return self.effective_coupling(collision_energy_gev) ** 2 * self._contact.compatibility()
+    
+    def expected_missing_fraction(self, collision_energy_gev: np.ndarray) -> np.ndarray:
+        """
+        Mean missing-energy fraction per event at each collision energy.
+        
+        Returns:
+            Expected missing fractions
+        """
+        return (self.transition_probability(collision_energy_gev) * self.transition_fraction *
+                (1.0 - self.efficiency(collision_energy_gev)))
+    
+    def generate(self, n_events: int, collision_energy_gev: EnergySpec,
+                 rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """
+        Generate one batch of events.
+        
+        Args:
+            n_events: Number of events
+            collision_energy_gev: Fixed energy (GeV) or sampler (rng, n) -> energies
+            rng: Random generator
+        
+        Returns:
+            Dictionary of per-event arrays
+        """
+        if callable(collision_energy_gev):
+            E = np.asarray(collision_energy_gev(rng, n_events), dtype=float)
+            if E.shape != (n_events,):
+                raise ValueError(f"energy sampler must return shape ({n_events},)")
+        else:
+            E = np.full(n_events, float(collision_energy_gev))
+        if not np.all(E > 0):
+            raise ValueError("collision energies must be positive")
+        
+        transitioned = rng.random(n_events) < self.transition_probability(E)
+        energy_to_x = np.where(transitioned, self.transition_fraction * E, 0.0)
+        missing = energy_to_x * (1.0 - self.efficiency(E))
+        
+        if self.resolution > 0:
+            missing = missing + rng.normal(0.0, self.resolution, n_events) * E
+        
+        return {
+            'collision_energy_gev': E,
+            'transitioned': transitioned,
+            'missing_energy_gev': missing,
+            'missing_fraction': missing / E,
+        }
+    
+    def iter_batches(self, n_events: int, collision_energy_gev: EnergySpec,
+                     batch_size: int = 1_000_000) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Stream events in bounded-memory batches.
+        
+        Batch k draws from child k of the engine's seed sequence.
+        
+        Args:
+            n_events: Total number of events
+            collision_energy_gev: Fixed energy (GeV) or sampler (rng, n) -> energies
+            batch_size: Events per batch
+        
+        Yields:
+            Dictionaries of per-event arrays
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        n_batches = -(-n_events // batch_size)
+        children = np.random.SeedSequence(self.seed).spawn(n_batches)
+        for k, child in enumerate(children):
+            size = min(batch_size, n_events - k * batch_size)
+            yield self.generate(size, collision_energy_gev, np.random.default_rng(child))
+    
+    def run(self, n_events: int, collision_energy_gev: EnergySpec,
+            batch_size: int = 1_000_000,
+            histogram: Optional[MissingEnergyHistogram] = None) -> Dict[str, object]:
+        """
+        Run the Monte Carlo and accumulate missing-energy statistics.
+        
+        Args:
+            n_events: Total number of events
+            collision_energy_gev: Fixed energy (GeV) or sampler (rng, n) -> energies
+            batch_size: Events per batch
+            histogram: Histogram of missing fractions to fill
+                (default 200 bins over [-0.05, 1])
+        
+        Returns:
+            Dictionary with event counts, mean missing fraction, its standard
+            error, the significance of a nonzero mean, and the histogram
+        """
+        if n_events < 1:
+            raise ValueError("n_events must be at least 1")
+        if histogram is None:
+            histogram = MissingEnergyHistogram(200, range=(-0.05, 1.0))
+        
+        n_transitions = 0
+        for batch in self.iter_batches(n_events, collision_energy_gev, batch_size):
+            histogram.fill(batch['missing_fraction'])
+            n_transitions += int(np.count_nonzero(batch['transitioned']))
+        
+        mean, std_error = histogram.mean, histogram.std_error
+        if std_error > 0:
+            significance = mean / std_error
+        else:
+            significance = 0.0 if mean == 0 else np.inf
+        
+        return {
+            'n_events': n_events,
+            'n_transitions': n_transitions,
+            'mean_missing_fraction': mean,
+            'std_error': std_error,
+            'significance': significance,
+            'histogram': histogram,
+        }
+    
+    def __repr__(self) -> str:
+        return (f"LHCMonteCarlo(threshold={self.threshold_energy_gev:.3g} GeV, "
+                f"Vmax_X={self.vmax_x_factor}c)")
@@ -0,0 +1,285 @@
+"""
+N-body gravity with a finite propagation speed.
+
+A particle-mesh (PM) solver in a periodic box in which gravity travels at
+the Vmax of its information space. The potential at x and time t is
+
+    Φ(x, t) = -G ∫ ρ(x', t - |x - x'|/Vmax) / |x - x'| d³x'
+
+The Green's function is split into spherical delay shells one step
+(Vmax·dt) thick; shell k sees the density of k steps ago. Past densities
+are kept, already Fourier transformed, in a ring buffer of at most
+max_history steps, so one step costs one forward and one inverse FFT
+plus one multiply-add per shell. Shells beyond the buffer are folded into
+the last one, i.e. they see the oldest density kept.
+"""
+
+import os
+from typing import Callable, Dict, Iterator, Optional
+
+import numpy as np
+
+from .._fft import irfftn, rfftn
+from .._io import atomic_savez
+from ..core.constants import GRAVITATIONAL_CONSTANT
+
+
+class RetardedPMSolver:
+    """
+    Periodic particle-mesh gravity with retarded (finite-speed) potentials.
+    """
+    
+    def __init__(self,
+                 space: 'InformationSpace',
+                 box_size: float,
+                 grid_size: int,
+                 dt: float,
+                 softening: Optional[float] = None,
+                 max_history: int = 64,
+                 fft_workers: Optional[int] = None):
+        """
+        Initialize the solver.
+        
+        Args:
+            space: Space whose Vmax is the propagation speed of gravity
+                (e.g. GravitationalSpace(Vmax=...))
+            box_size: Side of the periodic box (m)
+            grid_size: Mesh cells per side
+            dt: Time step (s); sets the delay-shell thickness Vmax·dt
+            softening: Plummer softening length (m), default one cell
+            max_history: Most past densities kept (bounds memory)
+            fft_workers: FFT threads when SciPy is installed (None for all)
+        """
+        if box_size <= 0 or dt <= 0:
+            raise ValueError("box_size and dt must be positive")
+        if grid_size < 2:
+            raise ValueError("grid_size must be at least 2")
+        if max_history < 1:
+            raise ValueError("max_history must be at least 1")
+        
+        self.space = space
+        self.box_size = box_size
+        self.grid_size = grid_size
+        self.dt = dt
+        self.cell = box_size / grid_size
+        self.softening = self.cell if softening is None else softening
+        self.fft_workers = fft_workers
+        self.shape = (grid_size,) * 3
+        
+        # Minimum-image distance of every mesh offset
+        offsets = np.fft.fftfreq(grid_size, d=1.0 / grid_size) * self.cell
+        dx, dy, dz = np.meshgrid(offsets, offsets, offsets, indexing='ij', sparse=True)
+        r = np.sqrt(dx**2 + dy**2 + dz**2)
+        
+        shell_width = space.Vmax * dt
+        if np.isinf(shell_width):
+            shells = np.zeros(r.shape, dtype=np.int64)
+        else:
+            shells = np.rint(r / shell_width).astype(np.int64)
+        self.n_shells = int(min(shells.max() + 1, max_history))
+        self.truncated = bool(shells.max() + 1 > max_history)
+        shells = np.minimum(shells, self.n_shells - 1)
+        
+        green = -GRAVITATIONAL_CONSTANT / np.sqrt(r**2 + self.softening**2) * self.cell**3
+        self._kernels = np.stack([rfftn(np.where(shells == k, green, 0.0), fft_workers)
+                                  for k in range(self.n_shells)])
+        self._history = np.zeros_like(self._kernels)
+        self._head = -1  # slot of the newest density
+        self._filled = 0
+    
+    def deposit(self, positions: np.ndarray, masses: np.ndarray) -> np.ndarray:
+        """
+        Cloud-in-cell mass density on the mesh.
+        
+        Args:
+            positions: Particle positions (N, 3) in [0, box_size)
+            masses: Particle masses (N,) or a scalar (kg)
+        
+        Returns:
+            Density grid (kg/m³)
+        """
+        n = self.grid_size
+        index, fraction = self._cic(positions)
+        masses = np.broadcast_to(np.asarray(masses, dtype=float), (len(positions),))
+        density = np.zeros(n**3)
+        for corner, weight in self._corners(index, fraction):
+            density += np.bincount(corner, weights=masses * weight, minlength=n**3)
+        return density.reshape(self.shape) / self.cell**3
+    
+    def _cic(self, positions: np.ndarray):
+        scaled = np.asarray(positions, dtype=float) / self.cell
+        index = np.floor(scaled).astype(np.int64)
+        return index, scaled - index
+    
+    def _corners(self, index: np.ndarray, fraction: np.ndarray):
+        """Flat mesh index and CIC weight of each of the 8 corners."""
+        n = self.grid_size
+        for ox in (0, 1):
+            wx = fraction[:, 0] if ox else 1.0 - fraction[:, 0]
+            ix = (index[:, 0] + ox) % n
+            for oy in (0, 1):
+                wy = fraction[:, 1] if oy else 1.0 - fraction[:, 1]
+                iy = (index[:, 1] + oy) % n
+                for oz in (0, 1):
+                    wz = fraction[:, 2] if oz else 1.0 - fraction[:, 2]
+                    iz = (index[:, 2] + oz) % n
+                    yield (ix * n + iy) * n + iz, wx * wy * wz
+    
+    def push_density(self, density: np.ndarray) -> None:
+        """
+        Record the density of the newest time step.
+        
+        The first call fills the whole history, i.e. the past is assumed
+        static before the simulation starts.
+        """
+        transformed = rfftn(density, self.fft_workers)
+        if self._filled == 0:
+            self._history[:] = transformed
+            self._filled = self.n_shells
+            self._head = 0
+            return
+        self._head = (self._head + 1) % self.n_shells
+        self._history[self._head] = transformed
+    
+    def potential(self) -> np.ndarray:
+        """Retarded potential on the mesh (J/kg) from the recorded history."""
+        if self._filled == 0:
+            raise RuntimeError("No density recorded yet; call push_density first")
+        # Shell k sees the density pushed k steps ago
+        lag = (self._head - np.arange(self.n_shells)) % self.n_shells
+        total = np.einsum('k...,k...->...', self._kernels, self._history[lag])
+        return irfftn(total, self.shape, self.fft_workers)
+    
+    def field(self) -> np.ndarray:
+        """Gravitational acceleration on the mesh, shape (3, n, n, n)."""
+        phi = self.potential()
+        return np.stack([-(np.roll(phi, -1, axis) - np.roll(phi, 1, axis)) / (2 * self.cell)
+                         for axis in range(3)])
+    
+    def accelerations(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Accelerations of particles, interpolated from the mesh field.
+        
+        Args:
+            positions: Particle positions (N, 3)
+        
+        Returns:
+            Accelerations (N, 3) in m/s²
+        """
+        field = self.field().reshape(3, -1)
+        index, fraction = self._cic(positions)
+        acceleration = np.zeros((len(positions), 3))
+        for corner, weight in self._corners(index, fraction):
+            acceleration += field[:, corner].T * weight[:, None]
+        return acceleration
+    
+    def __repr__(self) -> str:
+        return (f"RetardedPMSolver(grid={self.grid_size}³, shells={self.n_shells}, "
+                f"Vmax={self.space.Vmax:.3e} m/s)")
+
+
+class NBodySimulation:
+    """
+    Kick-drift-kick leapfrog of particles under a RetardedPMSolver.
+    """
+    
+    def __init__(self,
+                 solver: RetardedPMSolver,
+                 positions: np.ndarray,
+                 velocities: np.ndarray,
+                 masses):
+        """
+        Initialize the simulation.
+        
+        Args:
+            solver: Mesh solver (fixes the box and time step)
+            positions: Initial positions (N, 3) (m), wrapped into the box
+            velocities: Initial velocities (N, 3) (m/s)
+            masses: Particle masses (N,) or a scalar (kg)
+        """
+        positions = np.asarray(positions, dtype=float)
+        velocities = np.asarray(velocities, dtype=float)
+        if positions.ndim != 2 or positions.shape[1] != 3 or velocities.shape != positions.shape:
+            raise ValueError("positions and velocities must both have shape (N, 3)")
+        
+        self.solver = solver
+        self.positions = positions % solver.box_size
+        self.velocities = velocities.copy()
+        self.masses = masses
+        self.time = 0.0
+        self.step_count = 0
+        
+        self.solver.push_density(self.solver.deposit(self.positions, self.masses))
+        self._acceleration = self.solver.accelerations(self.positions)
+    
+    def step(self) -> None:
+        """Advance one time step."""
+        dt = self.solver.dt
+        self.velocities += 0.5 * dt * self._acceleration
+        self.positions = (self.positions + dt * self.velocities) % self.solver.box_size
+        self.solver.push_density(self.solver.deposit(self.positions, self.masses))
+        self._acceleration = self.solver.accelerations(self.positions)
+        self.velocities += 0.5 * dt * self._acceleration
+        self.time += dt
+        self.step_count += 1
+    
+    def run(self, n_steps: int,
+            output_dir: Optional[str] = None,
+            snapshot_every: int = 0,
+            progress: Optional[Callable[[int, float], None]] = None) -> None:
+        """
+        Advance n_steps, writing snapshots as the run goes.
+        
+        Args:
+            n_steps: Number of steps
+            output_dir: Snapshot directory (required if snapshot_every > 0)
+            snapshot_every: Steps between snapshots (0 for none)
+            progress: Optional callback (step count, simulation time)
+        """
+        if snapshot_every and output_dir is None:
+            raise ValueError("snapshot_every needs an output_dir")
+        if snapshot_every and self.step_count == 0:
+            write_snapshot(output_dir, self)
+        for _ in range(n_steps):
+            self.step()
+            if snapshot_every and self.step_count % snapshot_every == 0:
+                write_snapshot(output_dir, self)
+            if progress:
+                progress(self.step_count, self.time)
+    
+    def __repr__(self) -> str:
+        return f"NBodySimulation(N={len(self.positions)}, t={self.time:.3e} s, {self.solver})"
+
+
+def write_snapshot(directory: str, simulation: NBodySimulation, dtype=np.float32) -> str:
+    """
+    Write the current particle state atomically as snapshot_<step>.npz.
+    
+    Args:
+        directory: Snapshot directory (created if missing)
+        simulation: Simulation to save
+        dtype: Storage precision of positions and velocities
+    
+    Returns:
+        Path of the written file
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f'snapshot_{simulation.step_count:08d}.npz')
+    atomic_savez(path, positions=simulation.positions.astype(dtype),
+                 velocities=simulation.velocities.astype(dtype),
+                 time=simulation.time, step=simulation.step_count)
+    return path
+
+
+def load_snapshots(directory: str) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Iterate over snapshots in step order, one file in memory at a time.
+    
+    Yields:
+        Dictionary with 'positions', 'velocities', 'time' and 'step'
+    """
+    names = sorted(name for name in os.listdir(directory)
+                   if name.startswith('snapshot_') and name.endswith('.npz'))
+    for name in names:
+        with np.load(os.path.join(directory, name)) as data:
+            yield {key: data[key] for key in data.files}
@@ -0,0 +1,510 @@
+"""
+Columnar on-disk store for simulation results.
+
+A store is a directory of immutable segments, each a subdirectory with
+one .npy file per column, plus a store.json manifest listing the live
+segments with their row counts and per-column zone maps (min, max).
+
+Writers build a segment under a temporary name, rename it into place and
+then add it to the manifest while holding an exclusive flock on the
+store's lock file, so any number of processes can append concurrently.
+Readers take a snapshot of the manifest (replaced atomically) and open
+columns as read-only memory maps. Queries skip segments whose zone maps
+exclude the predicate; inside segments sorted by the leading parameter
+the matching rows are found by binary search.
+
+Compaction merges small segments into one sorted by the parameter
+columns and swaps it into the manifest under the lock. Merged segments
+are deleted only after a retention period, so scans already running
+from an older manifest finish undisturbed. Compaction can run in a
+background thread; a second lock keeps one compactor per store.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .._io import atomic_write_text
+
+
+# A predicate value: a scalar (equality) or an inclusive (low, high) range,
+# where None leaves that side open
+Predicate = Union[float, int, Tuple[Optional[float], Optional[float]]]
+
+
+@contextmanager
+def _flock(path: str, blocking: bool = True) -> Iterator[bool]:
+    """Hold an exclusive flock on path; yields False if non-blocking and busy."""
+    import fcntl
+    
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _zone(values: np.ndarray) -> Optional[List]:
+    """[min, max] of a numeric column ignoring NaN, or None."""
+    if values.dtype.kind not in 'biuf' or len(values) == 0:
+        return None
+    if values.dtype.kind == 'f':
+        finite = values[~np.isnan(values)]
+        if len(finite) == 0:
+            return None
+        return [float(finite.min()), float(finite.max())]
+    return [values.min().item(), values.max().item()]
+
+
+def _bounds(predicate: Predicate) -> Tuple[Optional[Any], Optional[Any]]:
+    if isinstance(predicate, tuple):
+        if len(predicate) != 2:
+            raise ValueError("Range predicates must be (low, high)")
+        return predicate
+    return predicate, predicate
+
+
+class ResultStore:
+    """
+    Append-only columnar store with zone-map pruning and compaction.
+    
+    Rows are typed by a fixed schema; parameter columns are the ones
+    results are looked up by, and compacted segments are sorted by them
+    (leading parameter first). Row order across segments is not preserved
+    by compaction.
+    """
+    
+    MANIFEST = 'store.json'
+    LOCK = '.lock'
+    COMPACT_LOCK = '.compact.lock'
+    
+    def __init__(self,
+                 path: str,
+                 schema: Optional[Mapping[str, Any]] = None,
+                 parameters: Sequence[str] = ()):
+        """
+        Open a store, creating it if schema is given and it does not exist.
+        
+        Args:
+            path: Store directory
+            schema: Column name -> NumPy dtype (required to create)
+            parameters: Columns results are indexed by, leading one first
+        """
+        self.path = path
+        self._compactor: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        
+        manifest_path = os.path.join(path, self.MANIFEST)
+        if schema is None:
+            if not os.path.exists(manifest_path):
+                raise FileNotFoundError(f"No result store at {path}; pass a schema to create one")
+            manifest = self._read_manifest()
+        else:
+            columns = {name: np.dtype(dtype).str for name, dtype in schema.items()}
+            unknown = set(parameters) - set(columns)
+            if unknown:
+                raise ValueError(f"Parameters not in schema: {sorted(unknown)}")
+            os.makedirs(os.path.join(path, 'segments'), exist_ok=True)
+            with self._locked():
+                if os.path.exists(manifest_path):
+                    manifest = self._read_manifest()
+                    if manifest['columns'] != columns or manifest['parameters'] != list(parameters):
+                        raise ValueError(f"{path} holds a store with a different schema")
+                else:
+                    manifest = {'columns': columns, 'parameters': list(parameters),
+                                'segments': [], 'retired': []}
+                    atomic_write_text(manifest_path, json.dumps(manifest, indent=2))
+        
+        self.schema = {name: np.dtype(dtype) for name, dtype in manifest['columns'].items()}
+        self.parameters = tuple(manifest['parameters'])
+    
+    def _locked(self, name: Optional[str] = None, blocking: bool = True):
+        return _flock(os.path.join(self.path, name or self.LOCK), blocking)
+    
+    def _read_manifest(self) -> Dict[str, Any]:
+        with open(os.path.join(self.path, self.MANIFEST)) as f:
+            return json.load(f)
+    
+    def _segment_dir(self, name: str) -> str:
+        return os.path.join(self.path, 'segments', name)
+    
+    def segments(self) -> List[Dict[str, Any]]:
+        """Snapshot of live segments (name, rows, zones, sorted)."""
+        return self._read_manifest()['segments']
+    
+    def __len__(self) -> int:
+        return sum(segment['rows'] for segment in self.segments())
+    
+    def _validate(self, columns: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+        if set(columns) != set(self.schema):
+            raise ValueError(f"Columns must be exactly {sorted(self.schema)}")
+        arrays = {name: np.asarray(columns[name], dtype=dtype) for name, dtype in self.schema.items()}
+        lengths = {len(a) for a in arrays.values()}
+        if len(lengths) != 1 or any(a.ndim != 1 for a in arrays.values()):
+            raise ValueError("Columns must be 1-D arrays of equal length")
+        return arrays
+    
+    def _write_segment(self, arrays: Dict[str, np.ndarray], sort: bool) -> Dict[str, Any]:
+        """Write an immutable segment directory; returns its manifest entry."""
+        if sort and self.parameters:
+            order = np.lexsort([arrays[name] for name in reversed(self.parameters)])
+            arrays = {name: values[order] for name, values in arrays.items()}
+        
+        name = f'seg_{uuid.uuid4().hex}'
+        tmp = self._segment_dir(f'.tmp_{name}')
+        os.makedirs(tmp)
+        for column, values in arrays.items():
+            with open(os.path.join(tmp, f'{column}.npy'), 'wb') as f:
+                np.save(f, values)
+        os.rename(tmp, self._segment_dir(name))
+        return {
+            'name': name,
+            'rows': len(next(iter(arrays.values()))),
+            'zones': {column: _zone(values) for column, values in arrays.items()},
+            'sorted': bool(sort and self.parameters),
+        }
+    
+    def append(self, columns: Mapping[str, Any], sort: bool = True) -> int:
+        """
+        Append rows as a new segment.
+        
+        Safe to call from many processes at once.
+        
+        Args:
+            columns: Column name -> values, one entry per schema column
+            sort: Sort the segment by the parameter columns
+        
+        Returns:
+            Rows appended
+        """
+        arrays = self._validate(columns)
+        if len(next(iter(arrays.values()))) == 0:
+            return 0
+        entry = self._write_segment(arrays, sort)
+        with self._locked():
+            manifest = self._read_manifest()
+            manifest['segments'].append(entry)
+            atomic_write_text(os.path.join(self.path, self.MANIFEST), json.dumps(manifest, indent=2))
+        return entry['rows']
+    
+    def writer(self, chunk_rows: int = 65_536) -> 'StoreWriter':
+        """
+        Buffered writer that appends a segment every chunk_rows rows.
+        
+        Args:
+            chunk_rows: Rows per segment
+        
+        Returns:
+            Writer; use as a context manager so the tail is flushed
+        """
+        return StoreWriter(self, chunk_rows)
+    
+    def _open(self, segment: Dict[str, Any], column: str) -> np.ndarray:
+        return np.load(os.path.join(self._segment_dir(segment['name']), f'{column}.npy'),
+                       mmap_mode='r')
+    
+    def _may_match(self, segment: Dict[str, Any], where: Mapping[str, Predicate]) -> bool:
+        """Zone-map test: False only if no row of the segment can match."""
+        for column, predicate in where.items():
+            zone = segment['zones'].get(column)
+            if zone is None:
+                if self.schema[column].kind in 'biuf':
+                    return False  # All values NaN
+                continue
+            low, high = _bounds(predicate)
+            if (low is not None and zone[1] < low) or (high is not None and zone[0] > high):
+                return False
+        return True
+    
+    def _rows(self, segment: Dict[str, Any],
+              where: Mapping[str, Predicate]) -> Union[slice, np.ndarray]:
+        """Matching rows of a segment: a slice when contiguous, else an index."""
+        rows = slice(0, segment['rows'])
+        remaining = dict(where)
+        leading = self.parameters[0] if self.parameters else None
+        if segment['sorted'] and leading in remaining:
+            low, high = _bounds(remaining.pop(leading))
+            values = self._open(segment, leading)
+            start = 0 if low is None else int(np.searchsorted(values, low, side='left'))
+            stop = len(values) if high is None else int(np.searchsorted(values, high, side='right'))
+            rows = slice(start, max(start, stop))
+        if not remaining:
+            return rows
+        
+        mask = np.ones(rows.stop - rows.start, dtype=bool)
+        for column, predicate in remaining.items():
+            values = self._open(segment, column)[rows]
+            low, high = _bounds(predicate)
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+        return rows.start + np.flatnonzero(mask)
+    
+    def scan(self, columns: Optional[Sequence[str]] = None,
+             where: Optional[Mapping[str, Predicate]] = None) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Stream matching rows segment by segment.
+        
+        Segments excluded by their zone maps are never opened. When the
+        predicate selects a contiguous block (no predicate, or only the
+        leading parameter on a sorted segment) the columns are read-only
+        memory-map views and nothing is copied.
+        
+        Args:
+            columns: Columns to read (default all)
+            where: Column -> scalar (equality) or inclusive (low, high)
+        
+        Yields:
+            Column name -> values for each segment with matches
+        """
+        columns = list(self.schema) if columns is None else list(columns)
+        where = dict(where or {})
+        unknown = (set(columns) | set(where)) - set(self.schema)
+        if unknown:
+            raise ValueError(f"Unknown columns: {sorted(unknown)}")
+        
+        for segment in self.segments():
+            if not self._may_match(segment, where):
+                continue
+            rows = self._rows(segment, where)
+            count = rows.stop - rows.start if isinstance(rows, slice) else len(rows)
+            if count:
+                yield {column: self._open(segment, column)[rows] for column in columns}
+    
+    def select(self, columns: Optional[Sequence[str]] = None,
+               where: Optional[Mapping[str, Predicate]] = None) -> Dict[str, np.ndarray]:
+        """
+        Read matching rows into memory.
+        
+        Args:
+            columns: Columns to read (default all)
+            where: Column -> scalar (equality) or inclusive (low, high)
+        
+        Returns:
+            Column name -> values
+        """
+        columns = list(self.schema) if columns is None else list(columns)
+        parts: Dict[str, List[np.ndarray]] = {column: [] for column in columns}
+        for chunk in self.scan(columns, where):
+            for column in columns:
+                parts[column].append(chunk[column])
+        return {column: np.concatenate(values) if values else np.zeros(0, self.schema[column])
+                for column, values in parts.items()}
+    
+    def column(self, name: str) -> np.ndarray:
+        """
+        One full column.
+        
+        A read-only memory map (zero-copy) when the store has a single
+        segment, as after a full compaction; otherwise a concatenated copy.
+        
+        Args:
+            name: Column name
+        
+        Returns:
+            Column values
+        """
+        if name not in self.schema:
+            raise ValueError(f"Unknown column: {name!r}")
+        segments = self.segments()
+        if len(segments) == 1:
+            return self._open(segments[0], name)
+        return self.select([name])[name]
+    
+    def compact(self, target_rows: int = 1_000_000, min_segments: int = 2,
+                retention: float = 60.0, blocking: bool = True) -> int:
+        """
+        Merge small segments into sorted ones of up to about target_rows.
+        
+        Only one compaction runs per store at a time, across processes;
+        appends may continue meanwhile. Merged segments leave the manifest
+        at once but stay on disk for retention seconds, so scans that
+        started from an older manifest can finish.
+        
+        Args:
+            target_rows: Segments at least this large are left alone
+            min_segments: Smallest group of segments worth merging
+            retention: Seconds before merged segments are deleted
+            blocking: Wait for a running compaction instead of returning
+        
+        Returns:
+            Number of segments merged away
+        """
+        with self._locked(self.COMPACT_LOCK, blocking) as acquired:
+            if not acquired:
+                return 0
+            self._purge(retention)
+            small = [s for s in self.segments() if s['rows'] < target_rows]
+            
+            groups, group, rows = [], [], 0
+            for segment in small:
+                group.append(segment)
+                rows += segment['rows']
+                if rows >= target_rows:
+                    groups.append(group)
+                    group, rows = [], 0
+            groups.append(group)
+            
+            merged = 0
+            for group in groups:
+                if len(group) < max(min_segments, 2):
+                    continue
+                arrays = {column: np.concatenate([self._open(s, column) for s in group])
+                          for column in self.schema}
+                entry = self._write_segment(arrays, sort=True)
+                names = {s['name'] for s in group}
+                with self._locked():
+                    manifest = self._read_manifest()
+                    manifest['segments'] = [s for s in manifest['segments']
+                                            if s['name'] not in names] + [entry]
+                    manifest['retired'] += [{'name': name, 'time': time.time()} for name in sorted(names)]
+                    atomic_write_text(os.path.join(self.path, self.MANIFEST),
+                                       json.dumps(manifest, indent=2))
+                merged += len(group) - 1
+            return merged
+    
+    def _purge(self, retention: float) -> None:
+        """Delete retired segments older than retention seconds."""
+        with self._locked():
+            manifest = self._read_manifest()
+            cutoff = time.time() - retention
+            expired = [r['name'] for r in manifest['retired'] if r['time'] <= cutoff]
+            if not expired:
+                return
+            manifest['retired'] = [r for r in manifest['retired'] if r['time'] > cutoff]
+            atomic_write_text(os.path.join(self.path, self.MANIFEST), json.dumps(manifest, indent=2))
+        for name in expired:
+            shutil.rmtree(self._segment_dir(name), ignore_errors=True)
+    
+    def start_compaction(self, interval: float = 30.0, **kwargs) -> None:
+        """
+        Compact periodically in a daemon thread until stop_compaction().
+        
+        Args:
+            interval: Seconds between compaction passes
+            **kwargs: Passed to compact
+        """
+        if self._compactor is not None:
+            return
+        self._stop.clear()
+        
+        def loop() -> None:
+            while not self._stop.wait(interval):
+                self.compact(blocking=False, **kwargs)
+        
+        self._compactor = threading.Thread(target=loop, name='ResultStore-compactor', daemon=True)
+        self._compactor.start()
+    
+    def stop_compaction(self) -> None:
+        """Stop the background compactor, waiting for a pass in progress."""
+        if self._compactor is None:
+            return
+        self._stop.set()
+        self._compactor.join()
+        self._compactor = None
+    
+    def __enter__(self) -> 'ResultStore':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.stop_compaction()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Workers reopen the store by path; the compactor stays in the parent
+        return {'path': self.path, 'schema': self.schema, 'parameters': self.parameters}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._compactor = None
+        self._stop = threading.Event()
+    
+    def __repr__(self) -> str:
+        return f"ResultStore({self.path!r}, columns={len(self.schema)}, rows={len(self)})"
+
+
+class StoreWriter:
+    """
+    Buffers rows and appends them to a ResultStore in chunks.
+    
+    Accepts single records (dicts, e.g. from simulate_lhc_collision) or
+    column batches; each process should use its own writer.
+    """
+    
+    def __init__(self, store: ResultStore, chunk_rows: int = 65_536):
+        """
+        Initialize the writer.
+        
+        Args:
+            store: Target store
+            chunk_rows: Rows per appended segment
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be positive")
+        self.store = store
+        self.chunk_rows = chunk_rows
+        self._records: List[Mapping[str, Any]] = []
+        self._batches: List[Dict[str, np.ndarray]] = []
+        self._buffered = 0
+        self.rows_written = 0
+    
+    def add(self, record: Mapping[str, Any]) -> None:
+        """
+        Buffer one row; keys outside the schema are ignored.
+        
+        Args:
+            record: Column name -> value
+        """
+        self._records.append(record)
+        self._buffered += 1
+        if self._buffered >= self.chunk_rows:
+            self.flush()
+    
+    def extend(self, columns: Mapping[str, Any]) -> None:
+        """
+        Buffer a batch of rows given as columns.
+        
+        Args:
+            columns: Column name -> values, one entry per schema column
+        """
+        batch = self.store._validate(columns)
+        self._batches.append(batch)
+        self._buffered += len(next(iter(batch.values())))
+        if self._buffered >= self.chunk_rows:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Append everything buffered as one segment."""
+        if self._records:
+            self._batches.append(self.store._validate(
+                {name: [record[name] for record in self._records] for name in self.store.schema}))
+            self._records = []
+        if self._batches:
+            self.rows_written += self.store.append(
+                {name: np.concatenate([b[name] for b in self._batches]) for name in self.store.schema})
+            self._batches = []
+        self._buffered = 0
+    
+    def __enter__(self) -> 'StoreWriter':
+        return self
+    
+    def __exit__(self, exc_type, *exc) -> None:
+        self.flush()
+    
+    def __repr__(self) -> str:
+        return f"StoreWriter({self.store.path!r}, buffered={self._buffered})"
@@ -0,0 +1,336 @@
+"""
+Parameter sweeps over simulation functions.
+
+Spreads grid points over a process pool in adaptively sized chunks,
+writes each finished chunk to disk and resumes interrupted runs.
+"""
+
+import inspect
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .._io import atomic_savez, atomic_write_text
+from .._parallel import make_executor, resolve_workers, stream_rng
+
+
+class ParameterGrid:
+    """
+    Cartesian grid of named parameter values.
+    
+    Points are addressed by a flat index and materialized per range, so
+    grids with millions of points are never expanded in full.
+    """
+    
+    def __init__(self, axes: Mapping[str, Sequence]):
+        """
+        Initialize a grid.
+        
+        Args:
+            axes: Parameter name -> values along that axis
+        """
+        if not axes:
+            raise ValueError("Grid needs at least one axis")
+        self.axes = {name: np.asarray(values) for name, values in axes.items()}
+        for name, values in self.axes.items():
+            if values.ndim != 1 or len(values) == 0:
+                raise ValueError(f"Axis {name!r} must be a non-empty 1-D sequence")
+        self.names = list(self.axes)
+        self.shape = tuple(len(values) for values in self.axes.values())
+        self.size = int(np.prod(self.shape))
+    
+    def points(self, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """
+        Parameter values of flat indices [start, stop).
+        
+        Returns:
+            Parameter name -> array of values
+        """
+        index = np.unravel_index(np.arange(start, stop), self.shape)
+        return {name: self.axes[name][i] for name, i in zip(self.names, index)}
+    
+    def to_json(self) -> Dict[str, List]:
+        return {name: values.tolist() for name, values in self.axes.items()}
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __repr__(self) -> str:
+        return f"ParameterGrid({', '.join(f'{n}={len(v)}' for n, v in self.axes.items())})"
+
+
+class MethodMetric:
+    """
+    Picklable callable that builds an object and evaluates one method.
+    
+    Makes object metrics sweepable, e.g.
+    MethodMetric(ContactPoint, 'transition_efficiency',
+                 init_kwargs={'space_x': x, 'space_em': em},
+                 init_params=('coupling_strength',))
+    sweeps g, and swept parameters not listed in init_params are passed
+    to the method instead.
+    """
+    
+    def __init__(self, factory: Callable, method: str,
+                 init_kwargs: Optional[Dict[str, Any]] = None,
+                 init_params: Sequence[str] = (),
+                 method_kwargs: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the metric.
+        
+        Args:
+            factory: Class or function building the object
+            method: Name of the method to evaluate
+            init_kwargs: Fixed keyword arguments for the factory
+            init_params: Swept parameter names routed to the factory
+            method_kwargs: Fixed keyword arguments for the method
+        """
+        self.factory = factory
+        self.method = method
+        self.init_kwargs = dict(init_kwargs or {})
+        self.init_params = tuple(init_params)
+        self.method_kwargs = dict(method_kwargs or {})
+    
+    def __call__(self, **params):
+        init = dict(self.init_kwargs)
+        call = dict(self.method_kwargs)
+        for name, value in params.items():
+            (init if name in self.init_params else call)[name] = value
+        return getattr(self.factory(**init), self.method)(**call)
+    
+    def __repr__(self) -> str:
+        return f"MethodMetric({getattr(self.factory, '__name__', self.factory)}.{self.method})"
+
+
+def _accepts_rng(func: Callable) -> bool:
+    try:
+        return 'rng' in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _to_python(value):
+    """Unwrap NumPy scalars so per-point results become plain values."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _evaluate_chunk(func: Callable, grid: ParameterGrid, fixed: Dict[str, Any],
+                    seed: int, pass_rng: bool, start: int, stop: int) -> Tuple[Dict[str, np.ndarray], float]:
+    """Evaluate grid points [start, stop); runs in worker processes."""
+    began = time.perf_counter()
+    params = grid.points(start, stop)
+    rows: List[Dict[str, Any]] = []
+    
+    for k, index in enumerate(range(start, stop)):
+        kwargs = dict(fixed)
+        kwargs.update({name: _to_python(values[k]) for name, values in params.items()})
+        if pass_rng:
+            kwargs['rng'] = stream_rng(seed, index)
+        result = func(**kwargs)
+        rows.append(result if isinstance(result, Mapping) else {'result': result})
+    
+    columns = {'index': np.arange(start, stop, dtype=np.int64)}
+    columns.update(params)
+    for key in rows[0]:
+        name = f'result_{key}' if key in columns else key
+        columns[name] = np.asarray([row[key] for row in rows])
+    return columns, time.perf_counter() - began
+
+
+class ParameterSweep:
+    """
+    Resumable, parallel sweep of a callable over a ParameterGrid.
+    
+    Each finished chunk is written atomically to output_dir as
+    chunk_<start>_<stop>.npz holding the flat index, the parameter values
+    and one column per result key (callables returning a scalar give a
+    'result' column). Re-running the same sweep skips chunks already on
+    disk. If the callable accepts an ``rng`` argument it receives a
+    Generator seeded from (seed, point index), so results do not depend
+    on the number of workers or the chunking.
+    """
+    
+    MANIFEST = 'sweep.json'
+    
+    def __init__(self,
+                 func: Callable,
+                 grid: ParameterGrid,
+                 output_dir: str,
+                 fixed: Optional[Dict[str, Any]] = None,
+                 seed: int = 0,
+                 n_workers: Optional[int] = None,
+                 target_chunk_seconds: float = 2.0,
+                 min_chunk: int = 1,
+                 max_chunk: int = 100_000):
+        """
+        Initialize the sweep.
+        
+        Args:
+            func: Picklable callable taking the grid parameters as keywords
+            grid: Parameter grid
+            output_dir: Directory for chunk files and the sweep manifest
+            fixed: Extra keyword arguments passed unchanged to every call
+            seed: Root seed for per-point random streams
+            n_workers: Worker processes (None for all cores, 0/1 in-process)
+            target_chunk_seconds: Wall time a chunk should take
+            min_chunk: Smallest chunk size
+            max_chunk: Largest chunk size
+        """
+        if min_chunk < 1 or max_chunk < min_chunk:
+            raise ValueError("Need 1 <= min_chunk <= max_chunk")
+        
+        self.func = func
+        self.grid = grid
+        self.output_dir = output_dir
+        self.fixed = dict(fixed or {})
+        self.seed = seed
+        self.n_workers = resolve_workers(n_workers)
+        self.target_chunk_seconds = target_chunk_seconds
+        self.min_chunk = min_chunk
+        self.max_chunk = max_chunk
+        self._pass_rng = _accepts_rng(func)
+    
+    def _manifest(self) -> Dict[str, Any]:
+        return {
+            'func': f"{getattr(self.func, '__module__', '')}.{getattr(self.func, '__qualname__', repr(self.func))}",
+            'grid': self.grid.to_json(),
+            'fixed': {k: repr(v) for k, v in sorted(self.fixed.items())},
+            'seed': self.seed,
+        }
+    
+    def _prepare_output(self) -> None:
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, self.MANIFEST)
+        manifest = self._manifest()
+        if os.path.exists(path):
+            with open(path) as f:
+                if json.load(f) != manifest:
+                    raise ValueError(f"{self.output_dir} holds a different sweep")
+        else:
+            atomic_write_text(path, json.dumps(manifest, indent=2))
+    
+    def completed_ranges(self) -> List[Tuple[int, int]]:
+        """Sorted [start, stop) ranges already written to disk."""
+        if not os.path.isdir(self.output_dir):
+            return []
+        ranges = []
+        for name in os.listdir(self.output_dir):
+            if name.startswith('chunk_') and name.endswith('.npz'):
+                start, stop = name[len('chunk_'):-len('.npz')].split('_')
+                ranges.append((int(start), int(stop)))
+        return sorted(ranges)
+    
+    def pending_ranges(self) -> List[Tuple[int, int]]:
+        """Sorted [start, stop) gaps still to be evaluated."""
+        gaps, cursor = [], 0
+        for start, stop in self.completed_ranges():
+            if start > cursor:
+                gaps.append((cursor, start))
+            cursor = max(cursor, stop)
+        if cursor < self.grid.size:
+            gaps.append((cursor, self.grid.size))
+        return gaps
+    
+    def run(self, progress: Optional[Callable[[int, int], None]] = None) -> None:
+        """
+        Evaluate all pending grid points.
+        
+        Args:
+            progress: Optional callback (points done, total points)
+        """
+        self._prepare_output()
+        gaps = self.pending_ranges()
+        done = self.grid.size - sum(stop - start for start, stop in gaps)
+        chunk = self.min_chunk
+        
+        def next_range(size: int) -> Optional[Tuple[int, int]]:
+            if not gaps:
+                return None
+            start, stop = gaps[0]
+            end = min(stop, start + size)
+            if end == stop:
+                gaps.pop(0)
+            else:
+                gaps[0] = (end, stop)
+            return start, end
+        
+        def balanced(size: int) -> int:
+            # Shrink chunks near the end so the last ones spread over workers
+            remaining = sum(stop - start for start, stop in gaps)
+            share = -(-remaining // (2 * max(self.n_workers, 1)))
+            return max(self.min_chunk, min(size, share))
+        
+        args = (self.func, self.grid, self.fixed, self.seed, self._pass_rng)
+        executor = make_executor(self.n_workers)
+        
+        if executor is None:
+            while True:
+                span = next_range(balanced(chunk))
+                if span is None:
+                    break
+                columns, elapsed = _evaluate_chunk(*args, *span)
+                self._write_chunk(columns, *span)
+                done += span[1] - span[0]
+                chunk = self._adapt(chunk, span, elapsed)
+                if progress:
+                    progress(done, self.grid.size)
+            return
+        
+        with executor:
+            in_flight = {}
+            
+            def submit() -> None:
+                while len(in_flight) < 2 * self.n_workers:
+                    span = next_range(balanced(chunk))
+                    if span is None:
+                        return
+                    in_flight[executor.submit(_evaluate_chunk, *args, *span)] = span
+            
+            submit()
+            while in_flight:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    span = in_flight.pop(future)
+                    columns, elapsed = future.result()
+                    self._write_chunk(columns, *span)
+                    done += span[1] - span[0]
+                    chunk = self._adapt(chunk, span, elapsed)
+                    if progress:
+                        progress(done, self.grid.size)
+                submit()
+    
+    def _adapt(self, chunk: int, span: Tuple[int, int], elapsed: float) -> int:
+        """Size the next chunk to take about target_chunk_seconds."""
+        per_point = elapsed / (span[1] - span[0])
+        if per_point <= 0:
+            target = self.max_chunk
+        else:
+            target = int(self.target_chunk_seconds / per_point)
+        # Grow at most 4x per step so one fast chunk cannot overshoot
+        return int(np.clip(target, self.min_chunk, min(self.max_chunk, 4 * chunk)))
+    
+    def _write_chunk(self, columns: Dict[str, np.ndarray], start: int, stop: int) -> None:
+        path = os.path.join(self.output_dir, f'chunk_{start:012d}_{stop:012d}.npz')
+        atomic_savez(path, **columns)
+    
+    def load(self) -> Dict[str, np.ndarray]:
+        """
+        Load all written chunks, ordered by flat index.
+        
+        Returns:
+            Column name -> concatenated values
+        """
+        parts: Dict[str, List[np.ndarray]] = {}
+        for start, stop in self.completed_ranges():
+            path = os.path.join(self.output_dir, f'chunk_{start:012d}_{stop:012d}.npz')
+            with np.load(path) as data:
+                for name in data.files:
+                    parts.setdefault(name, []).append(data[name])
+        return {name: np.concatenate(values) for name, values in parts.items()}
+    
+    def __repr__(self) -> str:
+        return f"ParameterSweep({getattr(self.func, '__name__', self.func)}, {self.grid})"
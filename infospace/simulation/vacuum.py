@@ -0,0 +1,533 @@
+"""
+Vacuum phase transitions on a lattice.
+
+A scalar vacuum field Φ sets the local speed limit (Section 3 of the
+mathematical formalization),
+
+    Vmax(Φ) = c · f(Φ/Φ₀),    f monotonic, f(1) = 1
+
+and evolves in the effective potential
+
+    V_eff(Φ, T, E) = V₀(Φ) + V_T(Φ, T) + V_E(Φ, E)
+
+by the damped Klein-Gordon equation
+
+    ∂²Φ/∂t² + γ ∂Φ/∂t = ∇²Φ - V_eff'(Φ) + ξ
+
+in lattice units (field speed 1), where ξ is thermal noise balancing the
+damping γ. Starting in the false vacuum Φ₀, regions that cross the
+potential barrier form bubbles of the new phase; they are labelled as
+periodic connected components and each newly appearing one is recorded
+as a nucleation. The resulting Vmax map can drive CoupledWaveSolver in
+place of a single Vmax.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .._parallel import stream_rng
+from ..core.constants import SPEED_OF_LIGHT
+from ._lattice import SlabState, laplacian, open_shared, slab_laplacian
+
+
+PREVIOUS, CURRENT, NEXT = 0, 1, 2
+
+
+class PolynomialPotential:
+    """
+    Potential V(Φ) = Σ a_k Φ^k, evaluated by Horner's rule on whole lattices.
+    
+    Terms add with +, so V_eff = V₀ + V_T + V_E is built from the helpers
+    double_well, thermal_correction and energy_correction.
+    """
+    
+    def __init__(self, coefficients: Sequence[float]):
+        """
+        Initialize the potential.
+        
+        Args:
+            coefficients: a_0, a_1, ... in increasing powers of Φ
+        """
+        coefficients = np.trim_zeros(np.asarray(coefficients, dtype=float), 'b')
+        self.coefficients = coefficients if len(coefficients) else np.zeros(1)
+    
+    @staticmethod
+    def _horner(coefficients: np.ndarray, phi):
+        result = np.zeros_like(phi, dtype=float) + coefficients[-1]
+        for a in coefficients[-2::-1]:
+            result *= phi
+            result += a
+        return result
+    
+    def _derivative_coefficients(self, order: int = 1) -> np.ndarray:
+        coefficients = self.coefficients
+        for _ in range(order):
+            if len(coefficients) == 1:
+                return np.zeros(1)
+            coefficients = coefficients[1:] * np.arange(1, len(coefficients))
+        return coefficients
+    
+    def __call__(self, phi):
+        """V(Φ)."""
+        return self._horner(self.coefficients, phi)
+    
+    def derivative(self, phi):
+        """dV/dΦ."""
+        return self._horner(self._derivative_coefficients(1), phi)
+    
+    def curvature(self, phi):
+        """d²V/dΦ²."""
+        return self._horner(self._derivative_coefficients(2), phi)
+    
+    def is_unstable(self, phi) -> Union[bool, np.ndarray]:
+        """Theorem 3.1: the vacuum at Φ is unstable if V''(Φ) < 0."""
+        return self.curvature(phi) < 0
+    
+    def stationary_points(self) -> np.ndarray:
+        """Real Φ with V'(Φ) = 0, sorted."""
+        derivative = self._derivative_coefficients(1)
+        if len(derivative) < 2:
+            return np.empty(0)
+        roots = np.roots(derivative[::-1])
+        return np.sort(roots[np.abs(roots.imag) < 1e-9].real)
+    
+    def __add__(self, other: 'PolynomialPotential') -> 'PolynomialPotential':
+        n = max(len(self.coefficients), len(other.coefficients))
+        return PolynomialPotential(np.pad(self.coefficients, (0, n - len(self.coefficients)))
+                                   + np.pad(other.coefficients, (0, n - len(other.coefficients))))
+    
+    def __repr__(self) -> str:
+        return f"PolynomialPotential({self.coefficients.tolist()})"
+
+
+def double_well(coupling: float = 1.0, phi0: float = 1.0, tilt: float = 0.0) -> PolynomialPotential:
+    """
+    Tree-level V₀(Φ) = λ/4 (Φ² - Φ₀²)² + ε Φ₀³ Φ.
+    
+    A positive tilt ε lifts the Φ₀ minimum above the one near -Φ₀, making
+    Φ₀ a false vacuum that decays through bubble nucleation.
+    """
+    return PolynomialPotential([coupling * phi0**4 / 4, tilt * phi0**3,
+                                -coupling * phi0**2 / 2, 0.0, coupling / 4])
+
+
+def thermal_correction(temperature: float, coefficient: float = 1.0) -> PolynomialPotential:
+    """High-temperature V_T(Φ, T) = ½ D T² Φ², restoring the symmetric phase."""
+    return PolynomialPotential([0.0, 0.0, 0.5 * coefficient * temperature**2])
+
+
+def energy_correction(energy_density: float, coefficient: float = 1.0) -> PolynomialPotential:
+    """Energy-dependent V_E(Φ, E) = -g E Φ, a tilt driven by local energy density."""
+    return PolynomialPotential([0.0, -coefficient * energy_density])
+
+
+def exponential_ratio(slope: float = 1.0) -> Callable[[np.ndarray], np.ndarray]:
+    """f(x) = exp(slope·(x - 1)): monotonic with f(1) = 1."""
+    return lambda x: np.exp(slope * (np.asarray(x) - 1.0))
+
+
+class VmaxField:
+    """
+    Spatially varying speed limit on a periodic grid.
+    
+    Components that accept a Vmax map (e.g. CoupledWaveSolver's
+    vmax_fields) read it in place of a space's single Vmax.
+    """
+    
+    def __init__(self, values: np.ndarray, spacing: float):
+        """
+        Initialize the map.
+        
+        Args:
+            values: Vmax per cell (m/s)
+            spacing: Cell size (m)
+        """
+        self.values = np.asarray(values, dtype=float)
+        self.spacing = spacing
+    
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.values.shape
+    
+    @property
+    def Vmax(self) -> float:
+        """Largest speed on the map (the bound for time steps and causality)."""
+        return float(self.values.max())
+    
+    def at(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Vmax at positions (nearest cell, periodic).
+        
+        Args:
+            positions: Coordinates (m), shape (N, ndim)
+        
+        Returns:
+            Speeds, shape (N,)
+        """
+        cells = np.floor(np.atleast_2d(positions) / self.spacing).astype(np.int64)
+        cells %= np.array(self.shape)
+        return self.values[tuple(cells.T)]
+    
+    def __array__(self, dtype=None, copy=None):
+        return self.values if dtype is None else self.values.astype(dtype)
+    
+    def __repr__(self) -> str:
+        return (f"VmaxField(shape={self.shape}, Vmax in [{self.values.min():.3e}, "
+                f"{self.values.max():.3e}] m/s)")
+
+
+def _roots(n: int, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Connected components of a graph on n nodes given as edge arrays.
+    
+    Hook-and-compress: every round hooks the larger root of each edge onto
+    the smaller and then compresses paths fully, so rounds grow with the
+    logarithm of the component size.
+    
+    Returns:
+        Smallest node index of each node's component
+    """
+    parent = np.arange(n)
+    while True:
+        a, b = parent[sources], parent[targets]
+        differ = a != b
+        if not np.any(differ):
+            return parent
+        np.minimum.at(parent, np.maximum(a[differ], b[differ]), np.minimum(a[differ], b[differ]))
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+
+
+def _label(mask: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Periodic connected components (face neighbours) of a boolean lattice.
+    
+    Uses scipy.ndimage when installed and joins labels across the periodic
+    faces; otherwise labels every site with _roots.
+    
+    Returns:
+        Labels (-1 outside the mask, 0..n-1 inside) and the count n
+    """
+    try:
+        from scipy import ndimage
+    except ImportError:
+        ndimage = None
+    
+    if ndimage is not None:
+        labels, count = ndimage.label(mask)
+        labels = labels.astype(np.int64) - 1
+        sources, targets = [], []
+        for axis in range(mask.ndim):
+            first, last = np.take(labels, 0, axis), np.take(labels, -1, axis)
+            both = (first >= 0) & (last >= 0)
+            sources.append(first[both])
+            targets.append(last[both])
+        roots = _roots(count, np.concatenate(sources), np.concatenate(targets))
+    else:
+        flat = mask.reshape(-1)
+        index = np.arange(flat.size).reshape(mask.shape)
+        sources, targets = [], []
+        for axis in range(mask.ndim):
+            neighbour = np.roll(index, -1, axis).reshape(-1)
+            keep = flat & flat[neighbour]
+            sources.append(index.reshape(-1)[keep])
+            targets.append(neighbour[keep])
+        roots = _roots(flat.size, np.concatenate(sources), np.concatenate(targets))
+        labels = np.where(flat, np.arange(flat.size), -1).reshape(mask.shape)
+    
+    inside = labels >= 0
+    unique, compact = np.unique(roots[labels[inside]], return_inverse=True)
+    labels[inside] = compact
+    return labels, len(unique)
+
+
+def _advance(state: Union[str, np.ndarray], roles: Tuple[int, int, int], lo: int, hi: int,
+             coefficients: np.ndarray, dt: float, spacing: float, damping: float,
+             noise: float, seed: int, step: int) -> None:
+    """Damped leapfrog update of rows lo:hi (first axis) of Φ."""
+    state = open_shared(state)
+    previous, current, following = (state[role] for role in roles)
+    phi = current[lo:hi]
+    
+    force = slab_laplacian(current, lo, hi)
+    force /= spacing**2
+    force -= PolynomialPotential._horner(coefficients, phi)
+    if noise:
+        # One stream per lattice row, so noise is independent of the slab layout
+        for row in range(lo, hi):
+            force[row - lo] += noise * stream_rng(seed, step, row).standard_normal(phi.shape[1:])
+    
+    friction = 0.5 * damping * dt
+    force *= dt**2
+    force += 2.0 * phi
+    force -= (1.0 - friction) * previous[lo:hi]
+    force /= 1.0 + friction
+    following[lo:hi] = force
+
+
+def _slab_task(args) -> None:
+    _advance(*args)
+
+
+class VacuumLattice:
+    """
+    Lattice evolution of the vacuum field Φ with bubble detection.
+    """
+    
+    def __init__(self,
+                 potential: PolynomialPotential,
+                 shape: Sequence[int],
+                 spacing: float = 1.0,
+                 phi0: float = 1.0,
+                 courant: float = 0.5,
+                 damping: float = 0.0,
+                 temperature: float = 0.0,
+                 seed: int = 0,
+                 vmax_ratio: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+                 length_unit: float = 1.0,
+                 threshold: Optional[float] = None,
+                 dtype=np.float64,
+                 n_workers: Optional[int] = 0,
+                 n_slabs: Optional[int] = None,
+                 work_dir: Optional[str] = None):
+        """
+        Initialize the lattice at rest in the false vacuum (the minimum of
+        V_eff nearest Φ₀).
+        
+        Args:
+            potential: Effective potential V_eff(Φ)
+            shape: Lattice sites per axis (periodic boundaries)
+            spacing: Lattice spacing in lattice units
+            phi0: Vacuum expectation value Φ₀ (where Vmax = c)
+            courant: Fraction of the CFL limit spacing/√ndim used as dt
+            damping: Friction γ (Hubble-like damping or a heat bath)
+            temperature: Noise temperature balancing γ (needs damping > 0)
+            seed: Root seed of the thermal noise
+            vmax_ratio: f in Vmax = c·f(Φ/Φ₀) (default exp(Φ/Φ₀ - 1))
+            length_unit: Metres per lattice length unit, for the Vmax map
+            threshold: Φ separating the phases (default the barrier top
+                next to Φ₀)
+            dtype: Field precision
+            n_workers: Worker processes for slab updates (None for all
+                cores, 0/1 in-process)
+            n_slabs: Slabs along the first axis (default one per worker)
+            work_dir: Directory for the shared state file when using workers
+        """
+        self.shape = tuple(int(n) for n in shape)
+        if any(n < 3 for n in self.shape):
+            raise ValueError("Every lattice axis needs at least 3 sites")
+        if spacing <= 0 or phi0 == 0:
+            raise ValueError("spacing must be positive and phi0 nonzero")
+        if not 0 < courant <= 1:
+            raise ValueError("courant must be in (0, 1]")
+        if temperature > 0 and damping <= 0:
+            raise ValueError("Thermal noise needs damping > 0")
+        
+        self.potential = potential
+        self.spacing = spacing
+        self.phi0 = phi0
+        self.dt = float(courant * spacing / np.sqrt(len(self.shape)))
+        self.damping = damping
+        self.temperature = temperature
+        self.seed = seed
+        self.vmax_ratio = vmax_ratio or exponential_ratio()
+        self.length_unit = length_unit
+        self.threshold = self._barrier() if threshold is None else threshold
+        self.time = 0.0
+        self.step_count = 0
+        # Fluctuation-dissipation: <ξξ> = 2γT / (dt · h^ndim)
+        self._noise = float(np.sqrt(2.0 * damping * temperature / (self.dt * spacing**len(self.shape))))
+        
+        self._slab_state = SlabState((3,) + self.shape, self.shape[0], dtype,
+                                     n_workers, n_slabs, work_dir, prefix='vacuum-')
+        self._state = self._slab_state.array
+        self._roles = (PREVIOUS, CURRENT, NEXT)
+        self.false_vacuum = self._nearest_minimum(phi0)
+        self._state[PREVIOUS] = self.false_vacuum
+        self._state[CURRENT] = self.false_vacuum
+        
+        self.nucleations: List[Dict[str, object]] = []
+        self._transitioned = np.zeros(self.shape, dtype=bool)
+    
+    def _barrier(self) -> float:
+        """Stationary point of V_eff between Φ₀ and the neighbouring minimum."""
+        points = self.potential.stationary_points()
+        maxima = points[self.potential.curvature(points) < 0]
+        if len(maxima) == 0:
+            return 0.0
+        return float(maxima[np.argmin(np.abs(maxima - self.phi0))])
+    
+    def _nearest_minimum(self, phi: float) -> float:
+        points = self.potential.stationary_points()
+        minima = points[self.potential.curvature(points) > 0]
+        return float(minima[np.argmin(np.abs(minima - phi))]) if len(minima) else phi
+    
+    @property
+    def field(self) -> np.ndarray:
+        """Current Φ (a view; copy before stepping on)."""
+        return self._state[self._roles[1]]
+    
+    def set_field(self, values: np.ndarray, velocity: Optional[np.ndarray] = None) -> None:
+        """
+        Set Φ and ∂Φ/∂t; the previous step comes from a Taylor expansion.
+        
+        Args:
+            values: Φ on the lattice
+            velocity: ∂Φ/∂t (default zero)
+        """
+        values = np.broadcast_to(np.asarray(values, dtype=float), self.shape)
+        velocity = 0.0 if velocity is None else np.broadcast_to(velocity, self.shape)
+        force = laplacian(values) / self.spacing**2 - self.potential.derivative(values)
+        self._state[self._roles[1]] = values
+        self._state[self._roles[0]] = values - self.dt * velocity + 0.5 * self.dt**2 * force
+        self._transitioned = self.transitioned()
+    
+    def add_bubble(self, center: Sequence[float], radius: float,
+                   value: Optional[float] = None, wall: float = 1.0) -> None:
+        """
+        Seed a bubble of the other phase with a tanh wall.
+        
+        Args:
+            center: Bubble centre (lattice units)
+            radius: Bubble radius (lattice units)
+            value: Φ inside (default the other minimum of V_eff)
+            wall: Wall thickness (lattice units)
+        """
+        if value is None:
+            points = self.potential.stationary_points()
+            minima = points[self.potential.curvature(points) > 0]
+            other = minima[np.sign(minima - self.threshold) != np.sign(self.phi0 - self.threshold)]
+            if len(other) == 0:
+                raise ValueError("V_eff has no second minimum; pass value")
+            value = float(other[np.argmin(np.abs(other - self.threshold))])
+        
+        axes = [np.arange(n) * self.spacing for n in self.shape]
+        box = np.array(self.shape) * self.spacing
+        squared = 0.0
+        for coordinate, c, length in zip(np.meshgrid(*axes, indexing='ij', sparse=True), center, box):
+            offset = (coordinate - c + length / 2) % length - length / 2
+            squared = squared + offset**2
+        profile = 0.5 * (1.0 - np.tanh((np.sqrt(squared) - radius) / wall))
+        phi = np.array(self.field, dtype=float)
+        self.set_field(phi + (value - phi) * profile)
+    
+    def step(self) -> None:
+        """Advance Φ one time step."""
+        self._slab_state.map(_slab_task, [
+            (self._slab_state.reference, self._roles, lo, hi, self.potential._derivative_coefficients(1),
+             self.dt, self.spacing, self.damping, self._noise, self.seed, self.step_count)
+            for lo, hi in self._slab_state.slabs])
+        previous, current, following = self._roles
+        self._roles = (current, following, previous)
+        self.time += self.dt
+        self.step_count += 1
+    
+    def run(self, n_steps: int, detect_every: int = 0, min_volume: float = 0.0,
+            progress: Optional[Callable[[int, float], None]] = None) -> None:
+        """
+        Advance n_steps, recording nucleations as the run goes.
+        
+        Args:
+            n_steps: Number of steps
+            detect_every: Steps between bubble detections (0 for none)
+            min_volume: Smallest bubble counted (see detect)
+            progress: Optional callback (step count, simulation time)
+        """
+        for _ in range(n_steps):
+            self.step()
+            if detect_every and self.step_count % detect_every == 0:
+                self.detect(min_volume)
+            if progress:
+                progress(self.step_count, self.time)
+    
+    def transitioned(self) -> np.ndarray:
+        """Sites on the far side of the barrier from Φ₀."""
+        side = np.sign(self.phi0 - self.threshold)
+        return np.sign(np.asarray(self.field) - self.threshold) == -side
+    
+    def transitioned_fraction(self) -> float:
+        """Fraction of the lattice in the new phase."""
+        return float(np.mean(self.transitioned()))
+    
+    def bubbles(self, min_volume: float = 0.0) -> Tuple[np.ndarray, int]:
+        """
+        Label bubbles of the new phase.
+        
+        Args:
+            min_volume: Smallest bubble kept (lattice units); smaller
+                regions are sub-critical fluctuations
+        
+        Returns:
+            Labels per site (-1 outside bubbles) and the number of bubbles
+        """
+        mask = self.transitioned()
+        labels, count = _label(mask)
+        if count and min_volume > 0:
+            sizes = np.bincount(labels[mask], minlength=count) * self.spacing**len(self.shape)
+            kept = sizes >= min_volume
+            renumber = np.where(kept, np.cumsum(kept) - 1, -1)
+            labels[mask] = renumber[labels[mask]]
+            count = int(kept.sum())
+        return labels, count
+    
+    def detect(self, min_volume: float = 0.0) -> List[Dict[str, object]]:
+        """
+        Record bubbles that appeared since the last detection.
+        
+        A bubble is new if none of its sites were in a bubble at the
+        previous detection (bubbles that merge or grow are not new).
+        
+        Args:
+            min_volume: Smallest bubble counted (lattice units)
+        
+        Returns:
+            The new nucleation records ('step', 'time', 'site', 'volume')
+        """
+        labels, count = self.bubbles(min_volume)
+        mask = labels >= 0
+        found = []
+        if count:
+            sizes = np.bincount(labels[mask], minlength=count)
+            old = np.bincount(labels[mask & self._transitioned], minlength=count)
+            depth = np.abs(np.asarray(self.field)[mask] - self.threshold)
+            for bubble in np.flatnonzero(old == 0):
+                inside = labels[mask] == bubble
+                site = np.argwhere(mask)[inside][np.argmax(depth[inside])]
+                found.append({'step': self.step_count, 'time': self.time,
+                              'site': tuple(int(i) for i in site),
+                              'volume': float(sizes[bubble] * self.spacing**len(self.shape))})
+        self._transitioned = mask
+        self.nucleations.extend(found)
+        return found
+    
+    def vmax_map(self, speed_of_light: float = SPEED_OF_LIGHT) -> VmaxField:
+        """
+        Vmax(Φ) = c·f(Φ/Φ₀) on the lattice.
+        
+        Args:
+            speed_of_light: c (m/s)
+        
+        Returns:
+            VmaxField with cell size spacing·length_unit metres
+        """
+        ratio = self.vmax_ratio(np.asarray(self.field, dtype=float) / self.phi0)
+        return VmaxField(speed_of_light * ratio, self.spacing * self.length_unit)
+    
+    def close(self) -> None:
+        """Stop worker processes and remove the shared state file."""
+        self._slab_state.close()
+        self._state = self._slab_state.array
+    
+    def __enter__(self) -> 'VacuumLattice':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def __repr__(self) -> str:
+        return (f"VacuumLattice(shape={self.shape}, t={self.time:.3g}, "
+                f"transitioned={self.transitioned_fraction():.3f})")
@@ -0,0 +1,353 @@
+"""
+Coupled wave propagation in several information spaces.
+
+Each space carries a scalar field u_s on a shared periodic grid that obeys
+
+    ∂²u_s/∂t² = Vmax_s² ∇²u_s + Σ_contacts κ (u_other - u_s)   (at contact sites)
+
+so every field travels at its own Vmax. A ContactPoint between two spaces
+couples their fields at its sites with a spring of stiffness
+
+    κ = η · Vmax_a · Vmax_b / h²
+
+where η is the contact's transition_efficiency and h the grid spacing, so
+energy flows between spaces only where they touch. Time stepping is
+second-order leapfrog with one time step for all fields, chosen from the
+CFL limit of the fastest space.
+
+A space's single Vmax can be replaced by a per-cell map (e.g. a VmaxField
+from the vacuum lattice), in which case the field obeys V(x)²∇²u.
+
+Large grids are split into slabs along the first axis. With workers, the
+state lives in a memory-mapped file that every worker process maps, each
+worker updates its own slab, and fields never pass through pickling.
+"""
+
+import json
+import os
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ._lattice import SlabState, laplacian, open_shared, slab_laplacian
+
+
+PREVIOUS, CURRENT, NEXT = 0, 1, 2
+META_FILE = 'meta.json'
+
+
+def _advance(state: Union[str, np.ndarray], roles: Tuple[int, int, int], lo: int, hi: int,
+             coefficients: Sequence[Union[float, str, np.ndarray]],
+             couplings: Sequence[Tuple[int, int, np.ndarray, np.ndarray]]) -> None:
+    """
+    Leapfrog update of rows lo:hi (first axis) of every field.
+    
+    Args:
+        state: Array (3, n_spaces, *shape) of previous/current/next fields,
+            or the path of its shared file
+        roles: Slots of the previous, current and next fields in state
+        lo, hi: Slab rows
+        coefficients: (Vmax·dt/h)² per space, a number or a grid reference
+        couplings: (space a, space b, κ·dt² per site, flat site indices in the slab)
+    """
+    state = open_shared(state)
+    previous, current, following = (state[role] for role in roles)
+    for s, coefficient in enumerate(coefficients):
+        if not np.isscalar(coefficient):
+            coefficient = open_shared(coefficient)[lo:hi]
+        update = slab_laplacian(current[s], lo, hi)
+        update *= coefficient
+        update += 2.0 * current[s, lo:hi]
+        update -= previous[s, lo:hi]
+        following[s, lo:hi] = update
+    
+    for a, b, strength, sites in couplings:
+        if len(sites) == 0:
+            continue
+        pull = strength * (current[b].reshape(-1)[sites] - current[a].reshape(-1)[sites])
+        following[a].reshape(-1)[sites] += pull
+        following[b].reshape(-1)[sites] -= pull
+
+
+def _slab_task(args) -> None:
+    _advance(*args)
+
+
+class CoupledWaveSolver:
+    """
+    Finite-difference wave fields in several spaces joined by contact points.
+    """
+    
+    def __init__(self,
+                 spaces: Sequence['InformationSpace'],
+                 shape: Sequence[int],
+                 spacing: float,
+                 contacts: Sequence[Tuple['ContactPoint', Optional[np.ndarray]]] = (),
+                 courant: float = 0.5,
+                 dtype=np.float64,
+                 n_workers: Optional[int] = 0,
+                 n_slabs: Optional[int] = None,
+                 work_dir: Optional[str] = None,
+                 vmax_fields: Optional[Mapping['InformationSpace', np.ndarray]] = None):
+        """
+        Initialize the solver with all fields at rest.
+        
+        Args:
+            spaces: Spaces with one field each (finite Vmax)
+            shape: Grid cells per axis (periodic boundaries)
+            spacing: Cell size h (m)
+            contacts: (ContactPoint, sites) pairs. Sites are a boolean mask
+                of the grid, an (n, ndim) array of cell indices, or None
+                for every cell. Both spaces of a contact must be in spaces.
+            courant: Fraction of the CFL limit h / (Vmax·√ndim) used as dt
+            dtype: Field precision (float32 halves memory on large grids)
+            n_workers: Worker processes for slab updates (None for all
+                cores, 0/1 in-process)
+            n_slabs: Slabs along the first axis (default one per worker)
+            work_dir: Directory for the shared state file when using workers
+            vmax_fields: Optional per-cell Vmax maps (a VmaxField or an
+                array of the grid shape, m/s) used in place of a space's
+                single Vmax
+        """
+        self.spaces = list(spaces)
+        self.shape = tuple(int(n) for n in shape)
+        if not self.spaces:
+            raise ValueError("Need at least one space")
+        if any(n < 3 for n in self.shape):
+            raise ValueError("Every grid axis needs at least 3 cells")
+        if spacing <= 0:
+            raise ValueError("spacing must be positive")
+        if not 0 < courant <= 1:
+            raise ValueError("courant must be in (0, 1]")
+        
+        # Per-space speed: the space's Vmax or a per-cell map
+        self._speed_maps: List[Union[float, np.ndarray]] = [space.Vmax for space in self.spaces]
+        for space, values in (vmax_fields or {}).items():
+            values = np.asarray(values, dtype=float)
+            if values.shape != self.shape:
+                raise ValueError("Vmax maps must match the grid shape")
+            self._speed_maps[self._index(space)] = values
+        self.speeds = np.array([np.max(v) for v in self._speed_maps], dtype=float)
+        if not np.all(np.isfinite(self.speeds)) or any(np.min(v) <= 0 for v in self._speed_maps):
+            raise ValueError("Wave fields need finite, positive Vmax")
+        
+        self.spacing = spacing
+        self.dt = courant * spacing / (self.speeds.max() * np.sqrt(len(self.shape)))
+        self.time = 0.0
+        self.step_count = 0
+        self._contacts = [self._resolve_contact(contact, sites) for contact, sites in contacts]
+        
+        self._slab_state = SlabState((3, len(self.spaces)) + self.shape, self.shape[0], dtype,
+                                     n_workers, n_slabs, work_dir, prefix='waves-')
+        self._state = self._slab_state.array
+        self.n_workers = self._slab_state.n_workers
+        self._coefficients = [(v * self.dt / spacing)**2 for v in self._speed_maps]
+        self._coefficient_refs = [c if np.isscalar(c) else self._slab_state.share(f'coefficient{s}', c)
+                                  for s, c in enumerate(self._coefficients)]
+        self._roles = (PREVIOUS, CURRENT, NEXT)
+    
+    def _index(self, space: Union['InformationSpace', int]) -> int:
+        if isinstance(space, (int, np.integer)):
+            return int(space)
+        try:
+            return self.spaces.index(space)
+        except ValueError:
+            raise ValueError(f"Space {space.name} is not simulated by this solver") from None
+    
+    def _resolve_contact(self, contact: 'ContactPoint',
+                         sites: Optional[np.ndarray]) -> Tuple[int, int, np.ndarray, np.ndarray]:
+        a, b = self._index(contact.space_x), self._index(contact.space_em)
+        if a == b:
+            raise ValueError("A contact must join two different spaces")
+        
+        size = int(np.prod(self.shape))
+        if sites is None:
+            flat = np.arange(size)
+        else:
+            sites = np.asarray(sites)
+            if sites.dtype == bool:
+                if sites.shape != self.shape:
+                    raise ValueError("Site mask must match the grid shape")
+                flat = np.flatnonzero(sites)
+            else:
+                flat = np.unique(np.ravel_multi_index(tuple(np.atleast_2d(sites).T), self.shape))
+        
+        def speed_at(s):
+            speed = self._speed_maps[s]
+            return speed if np.isscalar(speed) else speed.reshape(-1)[flat]
+        
+        kappa = contact.transition_efficiency() * speed_at(a) * speed_at(b) / self.spacing**2
+        return a, b, np.broadcast_to(kappa, flat.shape), flat
+    
+    def _slab_couplings(self, lo: int, hi: int) -> List[Tuple[int, int, np.ndarray, np.ndarray]]:
+        plane = int(np.prod(self.shape[1:]))
+        couplings = []
+        for a, b, kappa, flat in self._contacts:
+            first, last = np.searchsorted(flat, [lo * plane, hi * plane])
+            couplings.append((a, b, kappa[first:last] * self.dt**2, flat[first:last]))
+        return couplings
+    
+    def field(self, space: Union['InformationSpace', int]) -> np.ndarray:
+        """Current field of one space (a view; copy before stepping on)."""
+        return self._state[self._roles[1], self._index(space)]
+    
+    def set_field(self, space: Union['InformationSpace', int], values: np.ndarray,
+                  velocity: Optional[np.ndarray] = None) -> None:
+        """
+        Set the field of one space and its time derivative.
+        
+        The previous step is filled from a second-order Taylor expansion,
+        ignoring contact coupling.
+        
+        Args:
+            space: Space (or its index)
+            values: Field values on the grid
+            velocity: ∂u/∂t on the grid (default zero)
+        """
+        s = self._index(space)
+        values = np.broadcast_to(np.asarray(values, dtype=float), self.shape)
+        velocity = np.zeros(self.shape) if velocity is None else np.broadcast_to(velocity, self.shape)
+        previous = (values - self.dt * velocity
+                    + 0.5 * self._coefficients[s] * laplacian(values))
+        self._state[self._roles[1], s] = values
+        self._state[self._roles[0], s] = previous
+    
+    def step(self) -> None:
+        """Advance all fields one time step."""
+        self._slab_state.map(_slab_task, [
+            (self._slab_state.reference, self._roles, lo, hi, self._coefficient_refs,
+             self._slab_couplings(lo, hi)) for lo, hi in self._slab_state.slabs])
+        
+        previous, current, following = self._roles
+        self._roles = (current, following, previous)
+        self.time += self.dt
+        self.step_count += 1
+    
+    def run(self, n_steps: int,
+            output_dir: Optional[str] = None,
+            snapshot_every: int = 0,
+            progress: Optional[Callable[[int, float], None]] = None) -> None:
+        """
+        Advance n_steps, writing snapshots as the run goes.
+        
+        Args:
+            n_steps: Number of steps
+            output_dir: Snapshot directory (required if snapshot_every > 0)
+            snapshot_every: Steps between snapshots (0 for none)
+            progress: Optional callback (step count, simulation time)
+        """
+        if snapshot_every and output_dir is None:
+            raise ValueError("snapshot_every needs an output_dir")
+        if snapshot_every and self.step_count == 0:
+            write_field_snapshot(output_dir, self)
+        for _ in range(n_steps):
+            self.step()
+            if snapshot_every and self.step_count % snapshot_every == 0:
+                write_field_snapshot(output_dir, self)
+            if progress:
+                progress(self.step_count, self.time)
+    
+    def energies(self) -> np.ndarray:
+        """
+        Field energy of each space (field² · m^ndim / s²).
+        
+        Uses the discrete energy that leapfrog conserves exactly for
+        uniform Vmax,
+        
+            E_s = ½ Σ [(u - u_prev)²/dt² - Vmax² u·∇²u_prev] h^ndim
+        
+        Returns:
+            Energies, shape (n_spaces,)
+        """
+        previous, current, _ = self._roles
+        cell = self.spacing ** len(self.shape)
+        energies = np.empty(len(self.spaces))
+        for s, speed in enumerate(self._speed_maps):
+            u = np.asarray(self._state[current, s], dtype=float)
+            u_prev = np.asarray(self._state[previous, s], dtype=float)
+            kinetic = np.sum((u - u_prev)**2) / self.dt**2
+            potential = -np.sum(speed**2 * u * laplacian(u_prev)) / self.spacing**2
+            energies[s] = 0.5 * (kinetic + potential) * cell
+        return energies
+    
+    def contact_energy(self) -> float:
+        """Energy stored in contact springs, in the units of energies()."""
+        previous, current, _ = self._roles
+        cell = self.spacing ** len(self.shape)
+        total = 0.0
+        for a, b, kappa, flat in self._contacts:
+            now = self._state[current, a].reshape(-1)[flat] - self._state[current, b].reshape(-1)[flat]
+            before = (self._state[previous, a].reshape(-1)[flat]
+                      - self._state[previous, b].reshape(-1)[flat])
+            total += 0.5 * np.sum(kappa * now.astype(float) * before) * cell
+        return total
+    
+    def total_energy(self) -> float:
+        """Conserved total of field and contact energies."""
+        return float(self.energies().sum() + self.contact_energy())
+    
+    def close(self) -> None:
+        """Stop worker processes and remove the shared state file."""
+        self._slab_state.close()
+        self._state = self._slab_state.array
+    
+    def __enter__(self) -> 'CoupledWaveSolver':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def __repr__(self) -> str:
+        names = ', '.join(space.name for space in self.spaces)
+        return (f"CoupledWaveSolver(spaces=[{names}], grid={self.shape}, "
+                f"contacts={len(self._contacts)}, dt={self.dt:.3e} s)")
+
+
+def write_field_snapshot(directory: str, solver: CoupledWaveSolver, dtype=np.float32) -> str:
+    """
+    Write the current fields atomically as a memory-mappable fields_<step>.npy.
+    
+    Fields are copied one space at a time, so snapshots of large grids
+    never need a second full copy in memory.
+    
+    Args:
+        directory: Snapshot directory (created if missing)
+        solver: Solver to save
+        dtype: Storage precision
+    
+    Returns:
+        Path of the written file
+    """
+    os.makedirs(directory, exist_ok=True)
+    meta = {'spaces': [space.name for space in solver.spaces],
+            'Vmax': solver.speeds.tolist(), 'spacing': solver.spacing, 'dt': solver.dt}
+    with open(os.path.join(directory, META_FILE), 'w') as f:
+        json.dump(meta, f, indent=2)
+    
+    path = os.path.join(directory, f'fields_{solver.step_count:08d}.npy')
+    tmp = path + '.tmp'
+    out = np.lib.format.open_memmap(tmp, mode='w+', dtype=dtype,
+                                    shape=(len(solver.spaces),) + solver.shape)
+    for s in range(len(solver.spaces)):
+        out[s] = solver.field(s)
+    out.flush()
+    del out
+    os.replace(tmp, path)
+    return path
+
+
+def load_field_snapshots(directory: str) -> Iterator[Dict[str, object]]:
+    """
+    Iterate over field snapshots in step order as read-only memory maps.
+    
+    Yields:
+        Dictionary with 'step', 'time' and 'fields' (n_spaces, *shape)
+    """
+    with open(os.path.join(directory, META_FILE)) as f:
+        dt = json.load(f)['dt']
+    names = sorted(name for name in os.listdir(directory)
+                   if name.startswith('fields_') and name.endswith('.npy'))
+    for name in names:
+        step = int(name[len('fields_'):-len('.npy')])
+        yield {'step': step, 'time': step * dt,
+               'fields': np.load(os.path.join(directory, name), mmap_mode='r')}
@@ -0,0 +1,459 @@
+"""
+Unit tests for the observational analysis tools.
+"""
+
+import pytest
+import numpy as np
+import sys
+sys.path.append('..')
+
+from infospace.core import EMSpace, HypotheticalSpace
+from infospace.core.constants import SPEED_OF_LIGHT, MEGAPARSEC
+from infospace.analysis import (
+    EventList, CoincidenceEngine, angular_separation, predicted_delay, delay_window,
+    AngularCorrelation, horizon_angle, super_horizon_report,
+    PhotonList, BurstCatalog, DispersionFitter, to_joules, from_joules,
+    AbsorberCatalog, ManyMultipletFitter, RedshiftTrend,
+    MissingEnergyLikelihood, EnsembleSampler,
+)
+from infospace.simulation import LHCMonteCarlo
+
+
+def brute_force_pairs(t_first, t_second, window):
+    """All pairs by direct comparison, for checking the sorted merge."""
+    dt = t_second[None, :] - t_first[:, None]
+    i, j = np.nonzero((dt >= window[0]) & (dt <= window[1]))
+    return set(zip(i.tolist(), j.tolist()))
+
+
+class TestCoincidenceEngine:
+    """Test the multi-messenger coincidence engine."""
+    
+    @pytest.fixture
+    def detectors(self):
+        rng = np.random.default_rng(0)
+        return {
+            'EM': EventList(rng.uniform(0, 1000, 400), rng.uniform(0, 360, 400),
+                            rng.uniform(-90, 90, 400), name='EM'),
+            'GW': EventList(rng.uniform(0, 1000, 300), rng.uniform(0, 360, 300),
+                            rng.uniform(-90, 90, 300), name='GW'),
+        }
+    
+    def test_matches_brute_force(self, detectors):
+        """Test the sorted merge against all-pairs comparison."""
+        engine = CoincidenceEngine(detectors, block_pairs=7)
+        window = (-0.5, 3.0)
+        pairs = engine.pairs('GW', window)
+        
+        gw, em = detectors['GW'], detectors['EM']
+        t_gw = np.empty(len(gw))
+        t_gw[gw.index] = gw.times
+        t_em = np.empty(len(em))
+        t_em[em.index] = em.times
+        
+        found = set(zip(pairs['precursor_index'].tolist(), pairs['trigger_index'].tolist()))
+        assert found == brute_force_pairs(t_gw, t_em, window)
+        assert len(found) == len(pairs['delay'])
+        np.testing.assert_allclose(pairs['delay'],
+                                   t_em[pairs['trigger_index']] - t_gw[pairs['precursor_index']])
+    
+    def test_sky_cut(self, detectors):
+        """Test that max_separation keeps only pairs close on the sky."""
+        engine = CoincidenceEngine(detectors)
+        all_pairs = engine.pairs('GW', (0.0, 5.0))
+        close = engine.pairs('GW', (0.0, 5.0), max_separation=30.0)
+        assert len(close['delay']) == np.count_nonzero(all_pairs['separation'] <= 30.0)
+    
+    def test_injected_precursor_found(self):
+        """Test that an injected Vmax_X precursor is found and attributed."""
+        vmax = SPEED_OF_LIGHT + 2.0 ** -22  # exactly representable, ε ~ 1e-15
+        distance = 100 * MEGAPARSEC
+        lead = predicted_delay(distance, vmax)
+        assert lead == pytest.approx(distance * 2.0 ** -22 / SPEED_OF_LIGHT / vmax, rel=1e-12)
+        
+        engine = CoincidenceEngine({
+            'EM': EventList(np.array([50.0, 500.0 + lead])),
+            'Neutrino': EventList(np.array([500.0, 900.0])),
+        })
+        results = engine.search((SPEED_OF_LIGHT, vmax), 200 * MEGAPARSEC, tolerance=0.1)
+        pairs = results['Neutrino']
+        assert pairs['precursor_index'].tolist() == [0]
+        assert pairs['trigger_index'].tolist() == [1]
+        
+        counts = CoincidenceEngine.consistent_counts(
+            pairs['delay'], np.array([distance]), [vmax, 2 * SPEED_OF_LIGHT], tolerance=0.01)
+        assert counts.tolist() == [1, 0]
+    
+    def test_predictions_and_window(self):
+        """Test predicted delays and the search window they imply."""
+        delays = predicted_delay(np.array([1.0, 2.0]) * MEGAPARSEC,
+                                 np.array([SPEED_OF_LIGHT, 2 * SPEED_OF_LIGHT]))
+        assert delays.shape == (2, 2)
+        assert np.all(delays[:, 0] == 0)
+        assert delays[1, 1] == pytest.approx(2 * delays[0, 1])
+        
+        lo, hi = delay_window((SPEED_OF_LIGHT, 2 * SPEED_OF_LIGHT), MEGAPARSEC, tolerance=1.0)
+        assert lo == -1.0
+        assert hi == pytest.approx(delays[0, 1] + 1.0)
+    
+    def test_angular_separation(self):
+        """Test great-circle separations, including at the pole."""
+        assert angular_separation(0.0, 0.0, 90.0, 0.0) == pytest.approx(90.0)
+        assert angular_separation(10.0, 90.0, 200.0, 90.0) == pytest.approx(0.0, abs=1e-9)
+    
+    def test_validation(self, detectors):
+        """Test rejection of unknown detectors, empty windows and bad sky columns."""
+        with pytest.raises(KeyError):
+            CoincidenceEngine(detectors, reference='Fermi')
+        with pytest.raises(ValueError):
+            CoincidenceEngine(detectors).pairs('GW', (1.0, 0.0))
+        with pytest.raises(ValueError):
+            EventList(np.zeros(3), ra=np.zeros(3))
+
+
+def cell_center_map(n_rings, rng):
+    """One pixel at the center of every grid cell, with random temperatures."""
+    z = (np.arange(n_rings) + 0.5) / n_rings * 2 - 1
+    phi = (np.arange(2 * n_rings) + 0.5) / (2 * n_rings) * 360.0
+    lat = np.degrees(np.arcsin(np.repeat(z, 2 * n_rings)))
+    lon = np.tile(phi, n_rings)
+    return rng.normal(size=len(lat)), lon, lat
+
+
+class TestAngularCorrelation:
+    """Test the CMB angular correlation estimator."""
+    
+    def test_matches_pixel_pairs(self):
+        """Test against a direct pixel-pair sum on a map with one pixel per cell."""
+        values, lon, lat = cell_center_map(6, np.random.default_rng(1))
+        # Edges at least one cell (~24°) apart, away from the grid's separations
+        bins = np.array([0.0, 37.0, 71.0, 99.0, 131.0, 180.0])
+        estimator = AngularCorrelation(bins, n_rings=6, chunk_size=17,
+                                       memory_limit=1000, n_workers=0)
+        estimator.accumulate(values, lon, lat)
+        result = estimator.compute(remove_monopole=False)
+        
+        # Direct sum over distinct pixel pairs
+        sep = angular_separation(lon[:, None], lat[:, None], lon[None, :], lat[None, :])
+        product = np.outer(values, values)
+        off_diagonal = ~np.eye(len(values), dtype=bool)
+        expected = []
+        for lo, hi in zip(bins[:-1], bins[1:]):
+            mask = off_diagonal & (sep > lo) & (sep <= hi)
+            expected.append(product[mask].mean() if mask.any() else np.nan)
+        np.testing.assert_allclose(result['correlation'], expected, atol=1e-12)
+    
+    def test_dipole_and_workers(self):
+        """Test that a dipole gives C(θ) ∝ cos θ, and that parallel blocks match serial."""
+        rng = np.random.default_rng(2)
+        lon = rng.uniform(0, 360, 20_000)
+        lat = np.degrees(np.arcsin(rng.uniform(-1, 1, 20_000)))
+        values = np.sin(np.radians(lat))  # pure dipole: C(θ) ∝ cos θ
+        
+        serial = AngularCorrelation(np.linspace(0, 180, 7), n_rings=16, n_workers=0)
+        parallel = AngularCorrelation(np.linspace(0, 180, 7), n_rings=16,
+                                      memory_limit=20_000, n_workers=2)
+        for estimator in (serial, parallel):
+            for part in np.array_split(np.arange(20_000), 3):
+                estimator.accumulate(values[part], lon[part], lat[part])
+        
+        c_serial = serial.compute()['correlation']
+        np.testing.assert_allclose(parallel.compute()['correlation'], c_serial)
+        assert c_serial[0] > 0 > c_serial[-1]
+        assert np.all(np.diff(c_serial) < 0)
+    
+    def test_super_horizon_report(self):
+        """Test horizon angles and the power inside and beyond each horizon."""
+        theta = np.array([30.0, 75.0, 105.0, 165.0])
+        correlation = np.array([1.0, 0.5, 0.0, 0.0])
+        fast = HypotheticalSpace(Vmax=120 * SPEED_OF_LIGHT, name='I_fast')
+        report = super_horizon_report(theta, correlation, [EMSpace(), fast])
+        
+        em, x = report
+        assert horizon_angle(SPEED_OF_LIGHT) == pytest.approx(1.0)
+        assert horizon_angle(SPEED_OF_LIGHT, light_horizon=2.0) == pytest.approx(2.0)
+        assert not em['predicts_super_horizon']
+        assert x['predicts_super_horizon']
+        assert x['horizon_deg'] == pytest.approx(120.0)
+        assert x['predicted_power'] == pytest.approx(0.125)
+        assert x['excluded_power'] == 0.0
+        assert np.isnan(em['predicted_power'])
+    
+    def test_validation(self):
+        """Test rejection of bad and under-resolved bins and of empty maps."""
+        with pytest.raises(ValueError):
+            AngularCorrelation([10.0, 5.0])
+        with pytest.raises(ValueError):
+            AngularCorrelation(np.linspace(0.0, 180.0, 37), n_rings=16)
+        with pytest.raises(ValueError):
+            AngularCorrelation(n_rings=4).compute()
+
+
+def dispersed_burst(n, dv_dE, rng, distance=1000 * MEGAPARSEC, name='GRB'):
+    """Photons emitted with a 0.5 s spread and delayed by vacuum dispersion."""
+    energies = to_joules(rng.uniform(0.1, 100.0, n), 'GeV')
+    delays = -distance / SPEED_OF_LIGHT**2 * dv_dE * energies
+    return PhotonList(rng.normal(0.0, 0.5, n) + delays, energies, distance=distance, name=name)
+
+
+class TestDispersionFitter:
+    """Test the GRB vacuum-dispersion fitter."""
+    
+    # Linear Lorentz violation at E_QG = 10^17 GeV
+    DV_DE = -SPEED_OF_LIGHT / to_joules(1e17, 'GeV')
+    
+    def test_unit_conversions(self):
+        """Test energy, frequency and wavelength conversions to and from joules."""
+        assert to_joules(1.0, 'GeV') == pytest.approx(1.602176634e-10)
+        energies = to_joules(np.array([1e14, 5e14]), 'Hz')
+        np.testing.assert_allclose(from_joules(energies, 'Hz'), [1e14, 5e14])
+        np.testing.assert_allclose(from_joules(to_joules([500e-9], 'm'), 'eV'), [2.4797], rtol=1e-4)
+        with pytest.raises(ValueError):
+            to_joules(1.0, 'erg')
+    
+    def test_fit_recovers_dispersion(self):
+        """Test that the chunked fit recovers an injected ∂v/∂E and peaks the likelihood."""
+        photons = dispersed_burst(50_000, self.DV_DE, np.random.default_rng(0))
+        fitter = DispersionFitter(chunk_size=7_000, n_workers=0)
+        result = fitter.fit(photons)
+        
+        assert abs(result['dv_dE'] - self.DV_DE) < 4 * result['dv_dE_error']
+        assert result['energy_scale'] == pytest.approx(to_joules(1e17, 'GeV'), rel=0.01)
+        
+        # Same answer in one chunk, and the likelihood peaks at the fit
+        assert DispersionFitter(n_workers=0).fit(photons)['slope'] == pytest.approx(result['slope'])
+        grid = result['dv_dE'] + result['dv_dE_error'] * np.array([-1.0, 0.0, 1.0])
+        log_l = fitter.log_likelihood(photons, grid)
+        assert log_l[1] > log_l[0] and log_l[1] > log_l[2]
+        assert log_l[1] - log_l[0] == pytest.approx(0.5, rel=1e-3)
+    
+    def test_catalog_roundtrip(self, tmp_path):
+        """Test that memory-mapped catalog bursts fit like the in-memory ones."""
+        rng = np.random.default_rng(1)
+        bursts = [dispersed_burst(3_000, self.DV_DE, rng, name='A'),
+                  dispersed_burst(2_000, 0.0, rng, name='B')]
+        catalog = BurstCatalog.write(str(tmp_path), bursts)
+        
+        assert catalog.names == ['A', 'B']
+        assert isinstance(catalog['B'].times, np.memmap)
+        fitter = DispersionFitter(chunk_size=1_000, n_workers=0)
+        for burst, stored in zip(bursts, catalog):
+            assert fitter.fit(stored)['slope'] == pytest.approx(fitter.fit(burst)['slope'])
+    
+    def test_resampling(self, tmp_path):
+        """Test bootstrap errors, worker independence and permutation p-values."""
+        rng = np.random.default_rng(2)
+        signal = dispersed_burst(5_000, self.DV_DE, rng)
+        null = dispersed_burst(5_000, 0.0, rng)
+        catalog = BurstCatalog.write(str(tmp_path), [signal])
+        
+        serial = DispersionFitter(chunk_size=2_000, n_workers=0)
+        parallel = DispersionFitter(chunk_size=2_000, n_workers=2)
+        replicates = serial.bootstrap(signal, 200, seed=3)
+        np.testing.assert_allclose(parallel.bootstrap(catalog[0], 200, seed=3), replicates)
+        assert np.std(replicates) == pytest.approx(serial.fit(signal)['dv_dE_error'], rel=0.25)
+        
+        assert serial.permutation_test(signal, 49, seed=4)['p_value'] == pytest.approx(0.02)
+        assert serial.permutation_test(null, 49, seed=4)['p_value'] > 0.05
+
+
+def synthetic_absorbers(n_absorbers, rng, trend=1e-6):
+    """Absorbers with Δα/α = trend · (z - 1.5) and 1e-8 wavelength noise."""
+    n_lines = rng.integers(3, 10, n_absorbers)
+    offsets = np.concatenate([[0], np.cumsum(n_lines)])
+    redshift = rng.uniform(0.5, 3.0, n_absorbers)
+    delta_alpha = trend * (redshift - 1.5)
+    
+    lab = rng.uniform(3e6, 6e6, offsets[-1])  # m⁻¹
+    q = rng.uniform(-2e5, 2e5, offsets[-1])   # m⁻¹
+    x = np.repeat((1 + delta_alpha)**2 - 1, n_lines)
+    wavelength = (1 + np.repeat(redshift, n_lines)) / (lab + q * x)
+    error = 1e-8 * wavelength
+    columns = {
+        'wavelength': wavelength + error * rng.normal(size=offsets[-1]),
+        'wavelength_error': error,
+        'lab_wavenumber': lab,
+        'q': q,
+    }
+    return columns, offsets, redshift, delta_alpha
+
+
+class TestQuasarAnalysis:
+    """Test the many-multiplet fits and the Δc/c redshift trend."""
+    
+    def test_absorber_fits(self):
+        """Test per-absorber Δα/α pulls and that batching does not change the fits."""
+        columns, offsets, redshift, delta_alpha = synthetic_absorbers(2_000, np.random.default_rng(0))
+        catalog = AbsorberCatalog.from_arrays(columns, offsets)
+        result = ManyMultipletFitter(chunk_size=500).fit(catalog)
+        
+        pulls = (result['delta_alpha'] - delta_alpha) / result['delta_alpha_error']
+        assert np.std(pulls) == pytest.approx(1.0, abs=0.1)
+        np.testing.assert_allclose(result['delta_c'], -result['delta_alpha'])
+        np.testing.assert_allclose(result['redshift'], redshift, atol=1e-6)
+        
+        # Batching does not change the answer
+        whole = ManyMultipletFitter().fit(catalog)
+        np.testing.assert_allclose(whole['delta_alpha'], result['delta_alpha'], rtol=1e-6)
+    
+    def test_catalog_on_disk(self, tmp_path):
+        """Test that an on-disk catalog fits like the in-memory arrays."""
+        columns, offsets, _, _ = synthetic_absorbers(50, np.random.default_rng(1))
+        absorbers = [{name: values[a:b] for name, values in columns.items()}
+                     for a, b in zip(offsets[:-1], offsets[1:])]
+        absorbers[0]['name'] = 'J0000+0000'
+        catalog = AbsorberCatalog.write(str(tmp_path), absorbers)
+        
+        assert catalog.names[0] == 'J0000+0000'
+        assert isinstance(catalog.columns['q'], np.memmap)
+        in_memory = ManyMultipletFitter().fit(AbsorberCatalog.from_arrays(columns, offsets))
+        np.testing.assert_allclose(ManyMultipletFitter().fit(catalog)['delta_alpha'],
+                                   in_memory['delta_alpha'])
+    
+    def test_single_line_absorber_is_nan(self):
+        """Test that an absorber with one line gives NaN without affecting others."""
+        columns, offsets, _, _ = synthetic_absorbers(3, np.random.default_rng(2))
+        columns = {name: values[offsets[1] - 1:] for name, values in columns.items()}
+        offsets = np.concatenate([[0], offsets[1:] - offsets[1] + 1])
+        result = ManyMultipletFitter().fit(AbsorberCatalog.from_arrays(columns, offsets))
+        assert np.isnan(result['delta_alpha'][0])
+        assert np.all(np.isfinite(result['delta_alpha'][1:]))
+    
+    def test_redshift_trend(self):
+        """Test the Δc/c trend fit, its bootstrap error and permutation significance."""
+        columns, offsets, _, _ = synthetic_absorbers(1_000, np.random.default_rng(3), trend=1e-7)
+        fits = ManyMultipletFitter().fit(AbsorberCatalog.from_arrays(columns, offsets))
+        args = (fits['redshift'], fits['delta_c'], fits['delta_c_error'])
+        
+        trend = RedshiftTrend(n_workers=0)
+        result = trend.fit(*args)
+        assert abs(result['slope'] + 1e-7) < 4 * result['slope_error']
+        
+        replicates = trend.bootstrap(*args, n_resamples=300, seed=1)
+        assert np.std(replicates) == pytest.approx(result['slope_error'], rel=0.25)
+        np.testing.assert_allclose(RedshiftTrend(n_workers=2).bootstrap(*args, n_resamples=300, seed=1),
+                                   replicates)
+        assert trend.permutation_test(*args, n_permutations=99, seed=2)['p_value'] == pytest.approx(0.01)
+        
+        null = RedshiftTrend(n_workers=0).permutation_test(
+            fits['redshift'], np.random.default_rng(4).permutation(fits['delta_c']),
+            fits['delta_c_error'], n_permutations=99)
+        assert null['p_value'] > 0.05
+
+
+class TestInference:
+    """Tests for the LHC likelihood and the ensemble sampler."""
+    
+    def _likelihood(self, **kwargs):
+        E = np.linspace(5.0, 200.0, 40)
+        return MissingEnergyLikelihood(E, np.full(40, 0.5), sigma=0.05, **kwargs)
+    
+    def test_model_matches_monte_carlo(self):
+        """Test the vectorized model against LHCMonteCarlo, walker by walker."""
+        likelihood = self._likelihood(vmax_x_factor=5.0, base_coupling=0.1, max_coupling=1.0)
+        theta = np.array([[15.0, 1.0], [40.0, 0.3], [120.0, 0.75]])
+        model = likelihood.model(theta)
+        for row, (threshold, fraction) in zip(model, theta):
+            mc = LHCMonteCarlo(threshold, 5.0, base_coupling=0.1, max_coupling=1.0,
+                               transition_fraction=fraction)
+            np.testing.assert_allclose(row, mc.expected_missing_fraction(likelihood.collision_energy_gev))
+    
+    def test_log_likelihood_vectorized(self):
+        """Test batched evaluation, covariance input and the prior box."""
+        E = np.linspace(5.0, 200.0, 10)
+        sigma = np.linspace(0.01, 0.1, 10)
+        data = np.random.default_rng(0).random(10)
+        diagonal = MissingEnergyLikelihood(E, data, sigma=sigma)
+        full = MissingEnergyLikelihood(E, data, covariance=np.diag(sigma ** 2))
+        theta = diagonal.sample_prior(np.random.default_rng(1), 50).reshape(5, 10, 2)
+        
+        batched = diagonal.log_likelihood(theta)
+        assert batched.shape == (5, 10)
+        single = [diagonal.log_likelihood(t) for t in theta.reshape(-1, 2)]
+        np.testing.assert_allclose(batched.ravel(), single)
+        np.testing.assert_allclose(full.log_likelihood(theta), batched)
+        
+        outside = theta.copy()
+        outside[0, :, 0] = 1e5
+        posterior = diagonal(outside)
+        assert np.all(np.isneginf(posterior[0])) and np.all(np.isfinite(posterior[1:]))
+    
+    def test_validation(self):
+        """Test that spectra no threshold in the prior can explain are rejected."""
+        with pytest.raises(ValueError):
+            self._likelihood(bounds={'threshold_energy_gev': (500.0, 1000.0)})
+        with pytest.raises(ValueError):
+            self._likelihood(bounds={'transition_fraction': (0.0, 2.0)})
+        with pytest.raises(ValueError):
+            self._likelihood(bounds={'vmax_x_factor': (1.0, 10.0)})
+    
+    def test_sampler_recovers_parameters(self):
+        """Test that the posterior constrains and brackets every sampled parameter."""
+        E = np.linspace(5.0, 200.0, 20)
+        mc = LHCMonteCarlo(threshold_energy_gev=15.0, transition_fraction=0.6,
+                           resolution=0.05, seed=1)
+        runs = [mc.run(10_000, e, batch_size=10_000) for e in E]
+        likelihood = MissingEnergyLikelihood.from_runs(
+            E, runs, bounds={'threshold_energy_gev': (1.0, 100.0)})
+        initial = likelihood.sample_prior(np.random.default_rng(0), 32)
+        
+        sampler = EnsembleSampler(likelihood, initial, n_workers=0, block_size=250).run(1500)
+        samples = sampler.get_chain(burn=500, flat=True)
+        assert samples.shape == (1000 * 32, 2)
+        assert 0.2 < sampler.acceptance_fraction.mean() < 0.9
+        truth = np.array([15.0, 0.6])
+        spread = np.std(samples, axis=0)
+        assert np.all(np.abs(np.mean(samples, axis=0) - truth) < 4 * spread + 1e-3)
+        prior_width = np.diff(likelihood.bounds, axis=1).ravel()
+        assert np.all(spread < 0.05 * prior_width)
+    
+    def test_sampler_parallel_and_resume(self, tmp_path):
+        """Test worker-count independence and resume from a checkpoint."""
+        likelihood = self._likelihood()
+        initial = likelihood.sample_prior(np.random.default_rng(1), 48)
+        reference = EnsembleSampler(likelihood, initial, n_workers=0, block_size=50).run(200)
+        assert reference.n_ensembles == 6
+        
+        EnsembleSampler(likelihood, initial, output_dir=str(tmp_path), n_workers=2,
+                        block_size=50).run(100)
+        resumed = EnsembleSampler(likelihood, initial, output_dir=str(tmp_path), n_workers=0,
+                                  block_size=50)
+        assert resumed.n_steps == 100
+        resumed.run(200)
+        np.testing.assert_array_equal(resumed.get_chain(), reference.get_chain())
+        np.testing.assert_array_equal(resumed.get_log_prob(), reference.get_log_prob())
+        np.testing.assert_array_equal(resumed.accepted, reference.accepted)
+        
+        with pytest.raises(ValueError):
+            EnsembleSampler(likelihood, initial, output_dir=str(tmp_path), block_size=100)
+    
+    def test_sampler_resume_after_interrupted_checkpoint(self, tmp_path, monkeypatch):
+        """Test a crash after the walkers are written but before the state."""
+        import infospace.analysis.inference as inference
+        
+        likelihood = self._likelihood()
+        initial = likelihood.sample_prior(np.random.default_rng(1), 48)
+        reference = EnsembleSampler(likelihood, initial, n_workers=0, block_size=50).run(200)
+        
+        first = EnsembleSampler(likelihood, initial, output_dir=str(tmp_path), n_workers=0,
+                                block_size=50).run(100)
+        
+        def crash(path, text):
+            raise RuntimeError("interrupted")
+        
+        monkeypatch.setattr(inference, 'atomic_write_text', crash)
+        with pytest.raises(RuntimeError):
+            first.run(150)
+        monkeypatch.undo()
+        
+        resumed = EnsembleSampler(likelihood, initial, output_dir=str(tmp_path), n_workers=0,
+                                  block_size=50)
+        assert resumed.n_steps == 100
+        resumed.run(200)
+        np.testing.assert_array_equal(resumed.get_chain(), reference.get_chain())
+        np.testing.assert_array_equal(resumed.accepted, reference.accepted)
+        assert [p.name for p in tmp_path.glob('walkers_*.npz')] == ['walkers_00004.npz']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
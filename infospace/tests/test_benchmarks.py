@@ -0,0 +1,44 @@
+"""
+Unit tests for the benchmark runner.
+"""
+
+import pytest
+import sys
+sys.path.append('..')
+
+from infospace.benchmarks import BENCHMARKS, run_benchmarks, compare_results, save_results, load_results
+
+
+class TestBenchmarkRunner:
+    """Tests for running and comparing benchmarks."""
+    
+    def test_registry_covers_hot_paths(self):
+        """Test that every hot path has a benchmark."""
+        groups = {spec['group'] for spec in BENCHMARKS.values()}
+        assert {'gamma_factor', 'lorentz', 'contact', 'energy', 'projection', 'lhc'} <= groups
+    
+    def test_run_and_roundtrip(self, tmp_path):
+        """Test a quick run and JSON round trip."""
+        document = run_benchmarks(['gamma_factor.array'], sizes=[10, 100], repeat=2, min_time=0.001)
+        assert 'numpy' in document['metadata']
+        entries = document['results']['gamma_factor.array']['sizes']
+        assert [e['size'] for e in entries] == [10, 100]
+        
+        path = tmp_path / 'bench.json'
+        save_results(document, str(path))
+        assert load_results(str(path))['results'] == document['results']
+    
+    def test_compare_flags_slowdown(self):
+        """Test that slowdowns beyond the tolerance are flagged."""
+        def doc(best):
+            return {'results': {'b': {'group': 'b', 'sizes': [{'size': 1, 'best': best}]}}}
+        
+        rows = compare_results(doc(1.0), doc(1.2), tolerance=0.25)
+        assert not rows[0]['regression']
+        rows = compare_results(doc(1.0), doc(1.5), tolerance=0.25)
+        assert rows[0]['regression'] and rows[0]['ratio'] == 1.5
+        assert compare_results(doc(1.0), {'results': {}}) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,340 @@
+"""
+Unit tests for contact points between information spaces.
+"""
+
+import pytest
+import numpy as np
+import sys
+sys.path.append('..')
+
+from infospace.core import EMSpace, HypotheticalSpace, GravitationalSpace, Energy, EnergyArray
+from infospace.core.constants import SPEED_OF_LIGHT
+from infospace.interactions import ContactPoint, ContactNetwork, create_ligo_contact_point
+from infospace.interactions import (CouplingModel, PowerLawCoupling, ThresholdCoupling,
+                                    TabulatedCoupling)
+from infospace.interactions import ContactKinetics, ContactHamiltonian, LevelStructure
+from infospace.interactions.hamiltonian import spectrum_sweep
+from infospace.interactions.kinetics import GOLDEN_RULE_PREFACTOR
+
+
+@pytest.fixture
+def contact():
+    x_space = HypotheticalSpace(Vmax=10 * SPEED_OF_LIGHT, lambda_scale=1e-10, rho_density=1e28)
+    return ContactPoint(x_space, EMSpace(), coupling_strength=0.5)
+
+
+class TestContactPointCache:
+    """Tests for memoized efficiency and invalidation."""
+    
+    def test_efficiency_value(self, contact):
+        """Test η = g² × f_λ × f_ρ × f_T."""
+        expected = 0.25 * 1.0 * np.exp(-np.log(10.0)) * 1.0
+        assert np.isclose(contact.transition_efficiency(), expected)
+        assert contact.transition_efficiency() is contact.transition_efficiency()
+    
+    def test_coupling_change_invalidates(self, contact):
+        """Test that changing g updates the efficiency."""
+        eta = contact.transition_efficiency()
+        contact.g = 0.25
+        assert np.isclose(contact.transition_efficiency(), eta / 4)
+        with pytest.raises(ValueError):
+            contact.g = 2.0
+    
+    def test_space_change_invalidates(self, contact):
+        """Test that reattaching a space recomputes the factors."""
+        assert contact.topology_compatibility() == 1.0
+        contact.space_x = HypotheticalSpace(Vmax=10 * SPEED_OF_LIGHT, lambda_scale=1e-10,
+                                            rho_density=1e28, topology='global')
+        assert contact.topology_compatibility() == 0.1
+        with pytest.raises(TypeError):
+            contact.space_em = 'I_EM'
+    
+    def test_transition_many(self, contact):
+        """Test the array transition path against energy_transition."""
+        energies = EnergyArray(contact.space_x, [1.0, 2.0, 4.0])
+        converted = contact.transition_many(energies)
+        assert converted.space is contact.space_em
+        single = contact.energy_transition(Energy(contact.space_x, 2.0))
+        assert converted.carrier_energies[1] == single.carrier_energy
+        assert np.allclose(contact.transition_many([1.0, 2.0]),
+                           np.array([1.0, 2.0]) * contact.transition_efficiency())
+        with pytest.raises(ValueError):
+            contact.transition_many(EnergyArray(contact.space_em, [1.0]))
+
+
+class TestContactNetwork:
+    """Tests for multi-hop contact networks."""
+    
+    def test_matches_contact_points(self):
+        """Test that pairwise efficiencies match individual contact points."""
+        spaces = [EMSpace()] + [HypotheticalSpace(Vmax=k * SPEED_OF_LIGHT, lambda_scale=1e-10 * k,
+                                                  rho_density=1e29 / k)
+                                for k in (2, 3, 5)]
+        network = ContactNetwork(spaces, coupling=0.5, block_size=2)
+        for a in spaces:
+            for b in spaces:
+                if a is not b:
+                    expected = ContactPoint(a, b, 0.5).transition_efficiency()
+                    assert np.isclose(network.efficiency(a, b), expected)
+        assert network.efficiency(spaces[0], spaces[0]) == 0.0
+        assert np.allclose(network.to_dense(), network.to_dense().T)
+    
+    def test_multi_hop_beats_direct(self):
+        """Test that routing through an intermediate space can win."""
+        em = EMSpace()
+        mid = HypotheticalSpace(Vmax=2 * SPEED_OF_LIGHT, lambda_scale=2e-10, rho_density=1e29)
+        far = HypotheticalSpace(Vmax=4 * SPEED_OF_LIGHT, lambda_scale=4e-10, rho_density=1e29)
+        network = ContactNetwork([far, mid, em])
+        
+        path, eta = network.max_efficiency_path(far, em)
+        assert path == [far, mid, em]
+        assert np.isclose(eta, network.efficiency(far, mid) * network.efficiency(mid, em))
+        assert eta > network.efficiency(far, em)
+        assert np.isclose(network.path_efficiencies(em)[0], eta)
+    
+    def test_cutoff_and_unreachable(self):
+        """Test sparse storage above the cutoff."""
+        em = EMSpace()
+        far = HypotheticalSpace(Vmax=4 * SPEED_OF_LIGHT, lambda_scale=1e-3, rho_density=1e29)
+        network = ContactNetwork([em, far], cutoff=1e-6)
+        assert network.n_edges == 0
+        assert network.max_efficiency_path(far, em) == ([], 0.0)
+    
+    def test_from_contact_points(self):
+        """Test building a network from factory contact points."""
+        em, gw = EMSpace(), GravitationalSpace()
+        ligo = create_ligo_contact_point(gw, em)
+        network = ContactNetwork.from_contact_points([ligo])
+        assert len(network) == 2
+        assert network.efficiency(em, gw) == ligo.transition_efficiency()
+
+
+class TestCouplingModels:
+    """Tests for energy-dependent couplings and their lookup tables."""
+    
+    ENERGIES = np.geomspace(1e-15, 1e-3, 10_001)
+    
+    def test_tables_match_models(self):
+        """Test table lookups against exact evaluation."""
+        models = [PowerLawCoupling(1e-3, 1e-9, exponent=2.0, max_coupling=0.1),
+                  ThresholdCoupling(1e-9, coupling_above=0.2, coupling_below=0.01, width=0.5),
+                  TabulatedCoupling([1e-12, 1e-9, 1e-6], [1e-4, 3e-3, 5e-2])]
+        for model in models:
+            np.testing.assert_allclose(model(self.ENERGIES), model.evaluate(self.ENERGIES),
+                                       rtol=1e-3)
+        # Exact outside the table
+        power = models[0]
+        assert power(1e20) == power.evaluate(1e20) == 0.1
+    
+    def test_equal_models_share_tables(self):
+        """Test that rebuilt models reuse one table."""
+        a = PowerLawCoupling(1e-3, 1e-9, exponent=2.0)
+        b = PowerLawCoupling(1e-3, 1e-9, exponent=2.0)
+        assert a == b and a.table() is b.table()
+        assert PowerLawCoupling(1e-3, 1e-9, exponent=3.0).table() is not a.table()
+        with pytest.raises(TypeError):
+            CouplingModel()
+    
+    def test_contact_point_uses_model(self, contact):
+        """Test energy_transition and transition_many with g_eff(E)."""
+        assert contact.effective_coupling(1e-9) == contact.g
+        model = ThresholdCoupling(1e-9, coupling_above=0.5, coupling_below=0.0)
+        contact.coupling_model = model
+        
+        below = contact.energy_transition(Energy(contact.space_x, 1e-10))
+        above = contact.energy_transition(Energy(contact.space_x, 1e-8))
+        assert below.carrier_energy == 0.0
+        assert np.isclose(above.carrier_energy, 1e-8 * 0.25 * contact.compatibility())
+        
+        energies = np.array([1e-10, 1e-8, 1e-7])
+        many = contact.transition_many(EnergyArray(contact.space_x, energies))
+        np.testing.assert_allclose(many.carrier_energies,
+                                   energies * contact.efficiency_at(energies))
+        with pytest.raises(TypeError):
+            contact.coupling_model = 0.5
+    
+    def test_lhc_uses_models(self):
+        """Test the default LHC coupling and a pluggable model."""
+        from infospace.core.constants import GEV_TO_JOULES
+        from infospace.simulation import LHCMonteCarlo, simulate_lhc_collision
+        
+        engine = LHCMonteCarlo(threshold_energy_gev=15.0)
+        E = np.array([5.0, 15.0, 30.0, 1e6])
+        np.testing.assert_allclose(engine.effective_coupling(E),
+                                   np.minimum(1e-40 * (E / 15.0)**2, 1e-10), rtol=1e-10)
+        
+        step = ThresholdCoupling(20.0 * GEV_TO_JOULES, coupling_above=0.5)
+        engine = LHCMonteCarlo(threshold_energy_gev=15.0, coupling_model=step)
+        assert engine.efficiency(np.array([19.0]))[0] == 0.0
+        result = simulate_lhc_collision(30.0, threshold_energy_gev=15.0, coupling_model=step)
+        assert result['effective_coupling'] == pytest.approx(0.5)
+        with pytest.raises(ValueError):
+            LHCMonteCarlo(threshold_energy_gev=15.0, max_coupling=0.1, coupling_model=step)
+
+
+
+class TestContactKinetics:
+    """Tests for Fermi-golden-rule population dynamics."""
+    
+    @pytest.fixture
+    def kinetics(self):
+        spaces = [EMSpace()] + [HypotheticalSpace(Vmax=k * SPEED_OF_LIGHT, lambda_scale=1e-10 * k,
+                                                  rho_density=1e29 / k)
+                                for k in (2, 3, 5)]
+        rho = np.array([1.0, 2.0, 0.5, 4.0]) / GOLDEN_RULE_PREFACTOR
+        return ContactKinetics(ContactNetwork(spaces, coupling=0.5), rho)
+    
+    def test_two_space_relaxation(self):
+        """Test the analytic two-level solution of the master equation."""
+        em = EMSpace()
+        x = HypotheticalSpace(Vmax=2 * SPEED_OF_LIGHT, lambda_scale=1e-10, rho_density=1e29)
+        cp = ContactPoint(x, em, coupling_strength=0.5)
+        kinetics = ContactKinetics.from_contact_points([cp], lambda s: 3e-35 if s is em else 1e-35)
+        a, b = kinetics.rate(x, em), kinetics.rate(em, x)
+        assert a > 0 and np.isclose(a, GOLDEN_RULE_PREFACTOR * cp.transition_efficiency() * 3e-35)
+        assert np.isclose(a, 3 * b)
+        
+        times = np.linspace(0, 5 / (a + b), 7)
+        P = kinetics.evolve([1.0, 0.0], times)
+        assert kinetics.spaces[0] is x
+        np.testing.assert_allclose(P[:, 0], (a * np.exp(-(a + b) * times) + b) / (a + b))
+    
+    def test_generator_and_equilibrium(self, kinetics):
+        """Test the rate matrix, conservation and the t → ∞ limit."""
+        pytest.importorskip('scipy')
+        K = kinetics.rate_matrix(sparse=False)
+        np.testing.assert_allclose(K.sum(axis=0), 0.0, atol=1e-12 * np.abs(K).max())
+        np.testing.assert_allclose(kinetics.rate_matrix().toarray(), K)
+        
+        P0 = np.array([[1.0, 0.0], [0.0, 1.0], [0.0, 0.0], [0.0, 0.0]])
+        np.testing.assert_allclose(kinetics.derivative(P0), K @ P0)
+        P = kinetics.evolve(P0, [0.0, 1e-3, 1e3])
+        np.testing.assert_allclose(P[0], P0, atol=1e-12)
+        np.testing.assert_allclose(P.sum(axis=1), 1.0)
+        np.testing.assert_allclose(P[-1], kinetics.equilibrium(P0), atol=1e-10)
+        rho = kinetics.state_density
+        np.testing.assert_allclose(kinetics.equilibrium(P0)[:, 0], rho / rho.sum())
+        np.testing.assert_allclose(kinetics.evolve(P0, [1e-3, 0.5], method='krylov'),
+                                   kinetics.evolve(P0, [1e-3, 0.5]), atol=1e-10)
+        assert np.all(kinetics.relaxation_times() > 0)
+    
+    def test_disconnected_components(self):
+        """Test that isolated groups keep their own totals."""
+        em = EMSpace()
+        far = HypotheticalSpace(Vmax=4 * SPEED_OF_LIGHT, lambda_scale=1e-3, rho_density=1e29)
+        kinetics = ContactKinetics(ContactNetwork([em, far], cutoff=1e-6), 1e-34)
+        P0 = np.array([0.3, 0.7])
+        assert list(kinetics.components()) == [0, 1]
+        np.testing.assert_allclose(kinetics.evolve(P0, [1e6])[0], P0)
+        np.testing.assert_allclose(kinetics.equilibrium(P0), P0)
+    
+    def test_sweep_matches_evolve(self, kinetics):
+        """Test batched parameter sets against single propagation."""
+        P0 = np.array([1.0, 0.0, 0.0, 0.0])
+        times = [0.0, 0.1, 1.0]
+        scales = np.array([0.5, 1.0, 2.0])
+        result = kinetics.sweep(P0, times, efficiency_scale=scales, batch_size=2, n_workers=0)
+        assert result.shape == (3, 3, 4)
+        np.testing.assert_allclose(result[1], kinetics.evolve(P0, times), atol=1e-12)
+        # Scaling every rate is the same as scaling time
+        np.testing.assert_allclose(result[2, 1], kinetics.evolve(P0, [0.2])[0], atol=1e-12)
+        
+        rho = np.tile(kinetics.state_density, (2, 1))
+        rho[1] *= 10.0
+        result = kinetics.sweep(P0, times, state_density=rho, n_workers=0)
+        np.testing.assert_allclose(result[1, 1], kinetics.evolve(P0, [1.0])[0], atol=1e-12)
+    
+    def test_asymmetric_efficiency_rejected(self, kinetics):
+        """Test that η_ij ≠ η_ji breaks detailed balance and is refused."""
+        coupling = np.full((4, 4), 0.5)
+        coupling[0, 1] = 0.25
+        with pytest.raises(ValueError):
+            ContactKinetics(ContactNetwork(kinetics.spaces, coupling=coupling), 1e-34)
+        
+        scale = np.ones((1, len(kinetics.rates)))
+        scale[0, 0] = 2.0
+        with pytest.raises(ValueError):
+            kinetics.sweep(np.ones(4), [1.0], efficiency_scale=scale, n_workers=0)
+
+
+
+class TestContactHamiltonian:
+    """Tests for the sparse contact-point Hamiltonian."""
+    
+    @pytest.fixture
+    def levels(self):
+        em = EMSpace()
+        x = HypotheticalSpace(Vmax=2 * SPEED_OF_LIGHT, lambda_scale=1e-10, rho_density=1e29)
+        return ContactPoint(x, em, 0.3), LevelStructure(em, 40), LevelStructure(x, 30)
+    
+    def test_levels(self, levels):
+        """Test the ladder ω = 2π Vmax / λ and space checks."""
+        contact, em_levels, x_levels = levels
+        quantum = 6.62607015e-34 * 2 * SPEED_OF_LIGHT / 1e-10
+        assert np.isclose(x_levels.spacing, quantum)
+        assert np.isclose(x_levels.energies[0], quantum / 2)
+        assert LevelStructure(EMSpace(), 40) == em_levels
+        with pytest.raises(ValueError):
+            ContactHamiltonian(contact, x_levels, em_levels)
+    
+    @pytest.mark.parametrize('window', [None, 3e-15])
+    def test_operator_and_spectrum(self, levels, window):
+        """Test matvec, sparse assembly and eigenpairs against dense algebra."""
+        pytest.importorskip('scipy')
+        hamiltonian = ContactHamiltonian(*levels, window=window)
+        dense = hamiltonian.to_sparse().toarray()
+        assert np.allclose(dense, dense.T)
+        psi = np.random.default_rng(0).normal(size=(hamiltonian.dimension, 2))
+        np.testing.assert_allclose(hamiltonian.matvec(psi), dense @ psi, rtol=1e-12, atol=1e-28)
+        
+        reference = np.linalg.eigvalsh(dense)
+        low, high = hamiltonian.spectral_bounds()
+        assert low <= reference[0] and reference[-1] <= high
+        energies, states = hamiltonian.spectrum(5)
+        scale = abs(reference).max()
+        np.testing.assert_allclose(energies, reference[:5], rtol=1e-10, atol=1e-12 * scale)
+        np.testing.assert_allclose(dense @ states, states * energies, atol=1e-10 * scale)
+    
+    def test_evolution(self, levels):
+        """Test Lanczos propagation against the dense matrix exponential."""
+        pytest.importorskip('scipy')
+        from scipy.linalg import expm
+        from infospace.core.constants import HBAR
+        
+        hamiltonian = ContactHamiltonian(*levels)
+        dense = hamiltonian.to_sparse().toarray()
+        psi0 = np.zeros(hamiltonian.dimension)
+        psi0[hamiltonian.n_em + 3] = 1.0
+        times = np.array([3e-18, 0.0, 1e-19])
+        states = hamiltonian.evolve(psi0, times)
+        for t, state in zip(times, states):
+            np.testing.assert_allclose(state, expm(-1j * dense * t / HBAR) @ psi0, atol=1e-8)
+        populations = hamiltonian.populations(states)
+        np.testing.assert_allclose(populations.sum(axis=1), 1.0)
+        assert populations[1, 0] == 0.0 and populations[0, 0] > 0.1
+    
+    def test_spectra_cached_per_coupling(self, levels):
+        """Test that spectra are cached by (levels, g) and reused by sweeps."""
+        pytest.importorskip('scipy')
+        contact, em_levels, x_levels = levels
+        a = ContactHamiltonian(contact, em_levels, x_levels).spectrum(4)
+        b = ContactHamiltonian(contact, LevelStructure(EMSpace(), 40), x_levels).spectrum(4)
+        assert a is b
+        with pytest.raises(ValueError):
+            a[0][0] = 0.0
+        loose = ContactHamiltonian(contact, em_levels, x_levels).spectrum(4, tol=1e-2)
+        assert loose is not a
+        assert ContactHamiltonian(contact, em_levels, x_levels).spectrum(4) is a
+        
+        g = contact.g * em_levels.spacing
+        couplings = [0.5 * g, g, 2 * g]
+        sweep = spectrum_sweep(contact, em_levels, x_levels, couplings, k=4)
+        np.testing.assert_allclose(sweep[1], a[0])
+        strong = ContactHamiltonian(contact, em_levels, x_levels, coupling=2 * g)
+        assert strong.spectrum(4)[0][0] == sweep[2, 0]
+        # Stronger coupling pushes the collective state further down
+        assert np.all(np.diff(sweep[:, 0]) < 0)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
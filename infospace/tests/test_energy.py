@@ -0,0 +1,73 @@
+"""
+Unit tests for energy calculations.
+"""
+
+import pytest
+import numpy as np
+import sys
+sys.path.append('..')
+
+from infospace.core import EMSpace, HypotheticalSpace, Energy, EnergyArray
+from infospace.core.constants import SPEED_OF_LIGHT
+
+
+class TestEnergyArray:
+    """Tests for struct-of-arrays energies."""
+    
+    def test_formulas_match_energy(self):
+        """Test that vectorized formulas match the scalar Energy helpers."""
+        x_space = HypotheticalSpace(Vmax=10 * SPEED_OF_LIGHT)
+        scalar = Energy(x_space)
+        energies = EnergyArray(x_space)
+        masses = np.array([1e-30, 1e-27, 1e-20])
+        velocities = np.array([0.0, 1.0, 5.0]) * SPEED_OF_LIGHT
+        
+        assert np.allclose(energies.total_energy(masses),
+                           [scalar.total_energy(m) for m in masses])
+        assert np.allclose(energies.relativistic_energy(masses * 1e8, masses),
+                           [scalar.relativistic_energy(m * 1e8, m) for m in masses])
+        assert np.allclose(energies.kinetic_energy(velocities, masses),
+                           [scalar.kinetic_energy(v, m) for v, m in zip(velocities, masses)])
+        
+        wavelengths = np.array([500e-9, 1e-10])
+        photon = energies.wavelength_to_energy(wavelengths)
+        assert np.allclose(energies.energy_to_wavelength(photon), wavelengths)
+        assert np.allclose(energies.photon_energy(energies.photon_frequency(photon)), photon)
+    
+    def test_reductions(self):
+        """Test sum, mean and histogram."""
+        em = EMSpace()
+        energies = EnergyArray(em, np.arange(1.0, 11.0))
+        assert energies.sum().carrier_energy == 55.0
+        assert energies.mean().carrier_energy == 5.5
+        assert energies.sum().space is em
+        counts, edges = energies.histogram(bins=5)
+        assert counts.sum() == 10 and len(edges) == 6
+    
+    def test_arithmetic(self):
+        """Test arithmetic with arrays and single energies."""
+        em = EMSpace()
+        energies = EnergyArray(em, [1.0, 2.0, 3.0])
+        assert np.array_equal((energies + energies).carrier_energies, [2.0, 4.0, 6.0])
+        assert np.array_equal((Energy(em, 1.0) + energies).carrier_energies, [2.0, 3.0, 4.0])
+        assert np.array_equal((2 * energies - energies).carrier_energies, [1.0, 2.0, 3.0])
+        assert energies[1].carrier_energy == 2.0
+        assert len(energies[1:]) == 2
+    
+    def test_space_mismatch(self):
+        """Test that energies from different spaces cannot be combined."""
+        em_energies = EnergyArray(EMSpace(), [1.0])
+        x_energies = EnergyArray(HypotheticalSpace(Vmax=10 * SPEED_OF_LIGHT), [1.0])
+        with pytest.raises(ValueError):
+            em_energies + x_energies
+    
+    def test_from_energies(self):
+        """Test packing Energy objects."""
+        em = EMSpace()
+        packed = EnergyArray.from_energies([Energy(em, 1.0), Energy(em, 2.0)])
+        assert packed.carrier_energies.dtype == np.float64
+        assert packed.sum().carrier_energy == 3.0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
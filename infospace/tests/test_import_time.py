@@ -0,0 +1,53 @@
+"""
+Import-time budget for ``import infospace``.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Cold-import budget in seconds; override with INFOSPACE_IMPORT_BUDGET
+IMPORT_BUDGET_SECONDS = float(os.environ.get('INFOSPACE_IMPORT_BUDGET', '0.25'))
+
+PACKAGE_PARENT = str(Path(__file__).resolve().parents[2])
+
+
+def run_fresh(code: str) -> str:
+    """Run code in a fresh interpreter with the package importable."""
+    env = dict(os.environ, PYTHONPATH=PACKAGE_PARENT)
+    return subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+
+class TestImportTime:
+    """Tests for lazy loading and the cold-import budget."""
+    
+    def test_cold_import_within_budget(self):
+        """Test that a cold import stays within the budget (best of 3)."""
+        code = ("import time; t = time.perf_counter(); import infospace; "
+                "print(time.perf_counter() - t)")
+        best = min(float(run_fresh(code)) for _ in range(3))
+        assert best < IMPORT_BUDGET_SECONDS, f"import infospace took {best:.3f}s"
+    
+    def test_import_is_lazy(self):
+        """Test that importing the package loads no subsystem or NumPy."""
+        loaded = run_fresh("import sys, infospace; "
+                           "print(sorted(m for m in sys.modules "
+                           "if m == 'numpy' or m.startswith('infospace.')))")
+        assert loaded == '[]'
+    
+    def test_lazy_attributes(self):
+        """Test that top-level names and subpackages load on access."""
+        import infospace
+        assert infospace.EMSpace().name == 'I_EM'
+        assert infospace.transforms.LorentzTransform is not None
+        assert 'interactions' in dir(infospace)
+        with pytest.raises(AttributeError):
+            infospace.does_not_exist
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
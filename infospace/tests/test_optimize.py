@@ -0,0 +1,143 @@
+"""
+Unit tests for multi-objective optimization.
+"""
+
+import pytest
+import numpy as np
+import sys
+sys.path.append('..')
+
+from infospace.core import EMSpace
+from infospace.optimize import (ParetoArchive, ParetoOptimizer, SacrificialInterfaceProblem,
+                                crowding_distance, non_dominated_sort)
+
+
+def brute_force_ranks(F):
+    """Reference front peeling with an all-pairs dominance matrix."""
+    dominates = np.all(F[:, None] <= F[None], axis=2) & np.any(F[:, None] < F[None], axis=2)
+    ranks = np.full(len(F), -1)
+    remaining = np.ones(len(F), dtype=bool)
+    k = 0
+    while remaining.any():
+        front = remaining & ~dominates[remaining].any(axis=0)
+        ranks[front] = k
+        remaining &= ~front
+        k += 1
+    return ranks
+
+
+class TestNonDominatedSort:
+    """Tests for front ranks and crowding."""
+    
+    @pytest.mark.parametrize('m', [1, 2, 3])
+    def test_matches_brute_force(self, m):
+        """Test ranks against front peeling, including ties and duplicates."""
+        rng = np.random.default_rng(m)
+        for _ in range(20):
+            F = rng.integers(0, 6, (60, m)).astype(float)
+            np.testing.assert_array_equal(non_dominated_sort(F), brute_force_ranks(F))
+    
+    def test_constraints_rank_last(self):
+        """Test that infeasible points follow every feasible front."""
+        F = np.array([[0.0, 0.0], [1.0, 1.0], [-1.0, -1.0], [-2.0, -2.0]])
+        violation = np.array([0.0, 0.0, 0.5, 0.1])
+        np.testing.assert_array_equal(non_dominated_sort(F, violation), [0, 1, 3, 2])
+    
+    def test_crowding_distance(self):
+        """Test boundary and interior crowding on one front."""
+        F = np.array([[0.0, 4.0], [1.0, 3.0], [3.0, 1.0], [4.0, 0.0]])
+        distance = crowding_distance(F, np.zeros(4, dtype=int))
+        assert np.isinf(distance[[0, 3]]).all()
+        np.testing.assert_allclose(distance[1:3], [1.5, 1.5])
+
+
+class TestParetoOptimizer:
+    """Tests for the archive, resumable runs and the Section 8 problem."""
+    
+    def test_archive_is_incremental_front(self):
+        """Test that batch-wise merging equals the front of everything."""
+        rng = np.random.default_rng(0)
+        X, F = rng.random((500, 3)), rng.random((500, 2))
+        archive = ParetoArchive(3, 2)
+        for start in range(0, 500, 100):
+            archive.update(X[start:start + 100], F[start:start + 100])
+        expected = F[brute_force_ranks(F) == 0]
+        assert sorted(map(tuple, archive.objectives)) == sorted(map(tuple, expected))
+    
+    def test_problem_matches_contact_point(self):
+        """Test vectorized compatibility against ContactPoint."""
+        problem = SacrificialInterfaceProblem()
+        params = problem.decode(np.random.default_rng(1).random((20, 5)))
+        f = problem.compatibility(params)
+        for i in range(20):
+            contact = problem.contact_point(params, i)
+            assert contact.space_em == EMSpace()
+            assert np.isclose(f[i], contact.compatibility())
+    
+    def test_resume_matches_uninterrupted_run(self, tmp_path):
+        """Test resume and worker-count independence."""
+        problem = SacrificialInterfaceProblem(epsilon=0.05)
+        reference = ParetoOptimizer(problem, population_size=40, seed=3, n_workers=0)
+        reference.run(6)
+        
+        first = ParetoOptimizer(problem, population_size=40, seed=3, n_workers=2,
+                                output_dir=str(tmp_path))
+        first.run(3)
+        resumed = ParetoOptimizer(problem, population_size=40, seed=3, n_workers=0,
+                                  output_dir=str(tmp_path))
+        assert resumed.generation == 3 and resumed.n_evaluated == 120
+        resumed.run(6)
+        
+        np.testing.assert_array_equal(resumed.unit, reference.unit)
+        np.testing.assert_array_equal(resumed.archive.objectives, reference.archive.objectives)
+        with pytest.raises(ValueError):
+            ParetoOptimizer(problem, population_size=60, seed=3, output_dir=str(tmp_path))
+        with pytest.raises(ValueError):
+            ParetoOptimizer(problem, population_size=40, seed=3, output_dir=str(tmp_path),
+                            archive_size=10)
+    
+    def test_resume_after_interrupted_checkpoint(self, tmp_path, monkeypatch):
+        """Test a crash after the population is written but before the state."""
+        import infospace.optimize.pareto as pareto
+        
+        problem = SacrificialInterfaceProblem(epsilon=0.05)
+        reference = ParetoOptimizer(problem, population_size=40, seed=3, n_workers=0)
+        reference.run(6)
+        
+        first = ParetoOptimizer(problem, population_size=40, seed=3, n_workers=0,
+                                output_dir=str(tmp_path))
+        first.run(3)
+        
+        def crash(path, text):
+            raise RuntimeError("interrupted")
+        
+        monkeypatch.setattr(pareto, 'atomic_write_text', crash)
+        with pytest.raises(RuntimeError):
+            first.run(4)
+        monkeypatch.undo()
+        
+        resumed = ParetoOptimizer(problem, population_size=40, seed=3, n_workers=0,
+                                  output_dir=str(tmp_path))
+        assert resumed.generation == 3
+        resumed.run(6)
+        np.testing.assert_array_equal(resumed.unit, reference.unit)
+        np.testing.assert_array_equal(resumed.archive.objectives, reference.archive.objectives)
+        assert sorted(p.name for p in tmp_path.glob('*.npz')) == ['archive_00006.npz',
+                                                                  'population_00006.npz']
+    
+    def test_front_is_feasible_and_improves(self):
+        """Test that the archived front respects P(collapse) ≤ ε."""
+        problem = SacrificialInterfaceProblem(epsilon=0.01)
+        optimizer = ParetoOptimizer(problem, population_size=60, seed=0, n_workers=0)
+        optimizer.run(1)
+        initial = -optimizer.archive.objectives[:, 0].min()
+        optimizer.run(30)
+        
+        front = optimizer.front()
+        assert np.all(front['collapse_probability'] <= 0.01)
+        assert -front['neg_mutual_information'].min() > initial
+        assert non_dominated_sort(optimizer.archive.objectives).max() == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,480 @@
+"""
+Unit tests for simulation engines.
+"""
+
+import pytest
+import numpy as np
+import sys
+sys.path.append('..')
+
+from infospace.core import EMSpace, HypotheticalSpace, GravitationalSpace
+from infospace.core.constants import SPEED_OF_LIGHT, GRAVITATIONAL_CONSTANT
+from infospace.interactions import ContactPoint
+from infospace.simulation import simulate_lhc_collision, LHCMonteCarlo, MissingEnergyHistogram
+from infospace.simulation import ParameterGrid, ParameterSweep, MethodMetric
+from infospace.simulation import RetardedPMSolver, NBodySimulation, load_snapshots
+from infospace.simulation import CoupledWaveSolver, load_field_snapshots
+from infospace.simulation import (VacuumLattice, VmaxField, double_well, thermal_correction,
+                                  energy_correction)
+from infospace.simulation import ResultStore
+
+
+class TestLHCExpectation:
+    """Tests for the deterministic LHC expectation."""
+    
+    def test_below_threshold(self):
+        """Test that nothing is missing below threshold."""
+        result = simulate_lhc_collision(10000, threshold_energy_gev=15000)
+        assert result['transition_probability'] == 0.0
+        assert result['missing_fraction'] == 0.0
+    
+    def test_above_threshold(self):
+        """Test the transition probability above threshold."""
+        result = simulate_lhc_collision(30000, threshold_energy_gev=15000)
+        assert np.isclose(result['transition_probability'], 1 - np.exp(-1))
+        assert np.isclose(result['missing_energy_gev'], 30000 * result['missing_fraction'])
+
+
+class TestLHCMonteCarlo:
+    """Tests for the event-level Monte Carlo."""
+    
+    def test_mean_matches_expectation(self):
+        """Test that sampled events reproduce the expected missing fraction."""
+        engine = LHCMonteCarlo(threshold_energy_gev=15000, seed=1)
+        result = engine.run(200_000, collision_energy_gev=20000, batch_size=50_000)
+        expected = simulate_lhc_collision(20000, threshold_energy_gev=15000)['missing_fraction']
+        assert abs(result['mean_missing_fraction'] - expected) < 5 * result['std_error']
+        assert result['histogram'].counts.sum() == 200_000
+    
+    def test_reproducible(self):
+        """Test that a seed fixes the event stream."""
+        a = LHCMonteCarlo(threshold_energy_gev=15.0, resolution=0.01, seed=7)
+        b = LHCMonteCarlo(threshold_energy_gev=15.0, resolution=0.01, seed=7)
+        batches_a = list(a.iter_batches(1000, 20.0, batch_size=300))
+        batches_b = list(b.iter_batches(1000, 20.0, batch_size=300))
+        assert [len(x['missing_fraction']) for x in batches_a] == [300, 300, 300, 100]
+        for x, y in zip(batches_a, batches_b):
+            assert np.array_equal(x['missing_fraction'], y['missing_fraction'])
+    
+    def test_energy_sampler(self):
+        """Test sampling collision energies per event."""
+        engine = LHCMonteCarlo(threshold_energy_gev=15.0, seed=3)
+        sampler = lambda rng, n: rng.uniform(5.0, 14.0, n)
+        result = engine.run(10_000, sampler, batch_size=4096)
+        assert result['n_transitions'] == 0
+        assert result['significance'] == 0.0
+    
+    def test_run_needs_events(self):
+        """Test that an empty run is rejected instead of reporting infinite significance."""
+        with pytest.raises(ValueError):
+            LHCMonteCarlo(threshold_energy_gev=15.0, seed=0).run(0, 20.0)
+    
+    def test_energies_must_be_positive(self):
+        """Test that zero or negative collision energies are rejected."""
+        engine = LHCMonteCarlo(threshold_energy_gev=15.0, seed=0)
+        rng = np.random.default_rng(0)
+        with pytest.raises(ValueError):
+            engine.generate(5, 0.0, rng)
+        with pytest.raises(ValueError):
+            engine.run(10, lambda rng, n: rng.uniform(-1.0, 1.0, n))
+
+
+class TestMissingEnergyHistogram:
+    """Tests for the incremental histogram."""
+    
+    def test_matches_numpy(self):
+        """Test incremental fills against numpy.histogram."""
+        values = np.random.default_rng(0).uniform(-0.2, 1.2, 10_000)
+        hist = MissingEnergyHistogram(50, range=(0.0, 1.0))
+        for chunk in np.array_split(values, 7):
+            hist.fill(chunk)
+        counts, _ = np.histogram(values, bins=50, range=(0.0, 1.0))
+        assert np.array_equal(hist.counts, counts)
+        assert hist.underflow == np.count_nonzero(values < 0)
+        assert np.isclose(hist.mean, values.mean())
+    
+    def test_merge(self):
+        """Test merging histograms with the same binning."""
+        a = MissingEnergyHistogram([0.0, 0.5, 1.0])
+        b = MissingEnergyHistogram([0.0, 0.5, 1.0])
+        a.fill([0.1, 0.7])
+        b.fill([1.0])
+        a.merge(b)
+        assert list(a.counts) == [1, 2]
+        with pytest.raises(ValueError):
+            a.merge(MissingEnergyHistogram(3))
+
+
+def noisy_square(x, rng):
+    """Sweep target using the per-point random stream."""
+    return {'square': x * x, 'noise': rng.random()}
+
+
+class TestParameterSweep:
+    """Tests for the resumable sweep scheduler."""
+    
+    def test_sweep_lhc(self, tmp_path):
+        """Test sweeping simulate_lhc_collision over a grid."""
+        grid = ParameterGrid({'threshold_energy_gev': [10000, 15000],
+                              'vmax_x_factor': [2.0, 10.0, 50.0]})
+        sweep = ParameterSweep(simulate_lhc_collision, grid, str(tmp_path),
+                               fixed={'collision_energy_gev': 20000}, n_workers=0)
+        sweep.run()
+        results = sweep.load()
+        assert list(results['index']) == list(range(6))
+        assert results['missing_fraction'][0] > results['missing_fraction'][3]
+        assert sweep.pending_ranges() == []
+    
+    def test_resume_and_worker_independence(self, tmp_path):
+        """Test that resumed and parallel runs reproduce a serial run."""
+        grid = ParameterGrid({'x': np.arange(40.0)})
+        serial = ParameterSweep(noisy_square, grid, str(tmp_path / 'serial'), seed=5, n_workers=0)
+        serial.run()
+        expected = serial.load()
+        
+        partial = ParameterSweep(noisy_square, grid, str(tmp_path / 'parallel'), seed=5, n_workers=0)
+        partial._prepare_output()
+        partial._write_chunk({k: v[:10] for k, v in expected.items()}, 0, 10)
+        assert partial.pending_ranges() == [(10, 40)]
+        
+        resumed = ParameterSweep(noisy_square, grid, str(tmp_path / 'parallel'), seed=5, n_workers=2)
+        resumed.run()
+        results = resumed.load()
+        assert np.array_equal(results['noise'], expected['noise'])
+        assert np.array_equal(results['square'], np.arange(40.0) ** 2)
+    
+    def test_manifest_mismatch(self, tmp_path):
+        """Test that a directory cannot be reused for a different sweep."""
+        ParameterSweep(noisy_square, ParameterGrid({'x': [1.0]}), str(tmp_path), n_workers=0).run()
+        with pytest.raises(ValueError):
+            ParameterSweep(noisy_square, ParameterGrid({'x': [2.0]}), str(tmp_path), n_workers=0).run()
+    
+    def test_method_metric(self, tmp_path):
+        """Test sweeping a ContactPoint metric over g."""
+        x_space = HypotheticalSpace(Vmax=10 * SPEED_OF_LIGHT, lambda_scale=1e-10, rho_density=1e29)
+        metric = MethodMetric(ContactPoint, 'transition_efficiency',
+                              init_kwargs={'space_x': x_space, 'space_em': EMSpace()},
+                              init_params=('coupling_strength',))
+        sweep = ParameterSweep(metric, ParameterGrid({'coupling_strength': [0.1, 0.5]}),
+                               str(tmp_path), n_workers=0)
+        sweep.run()
+        assert np.allclose(sweep.load()['result'], [0.01, 0.25])
+
+
+class TestRetardedNBody:
+    """Tests for the finite-propagation-speed particle-mesh solver."""
+    
+    MASS = 1e10
+    SOURCE = np.array([[0.5, 0.5, 0.5]])
+    
+    def test_newtonian_limit(self):
+        """Test that instant propagation reproduces G M / r²."""
+        solver = RetardedPMSolver(GravitationalSpace(), 1.0, 32, dt=1.0)
+        assert solver.n_shells == 1
+        solver.push_density(solver.deposit(self.SOURCE, self.MASS))
+        
+        for d in (0.2, 0.3):
+            a = solver.accelerations(np.array([[0.5 + d, 0.5, 0.5]]))[0]
+            assert a[0] == pytest.approx(-GRAVITATIONAL_CONSTANT * self.MASS / d**2, rel=0.01)
+            assert abs(a[1]) < 1e-6 * abs(a[0])
+    
+    def test_retardation(self):
+        """Test that a probe feels a moved mass only after r / Vmax."""
+        space = GravitationalSpace(Vmax=0.05)  # 0.3 m takes 6 steps
+        solver = RetardedPMSolver(space, 1.0, 32, dt=1.0)
+        instant = RetardedPMSolver(GravitationalSpace(), 1.0, 32, dt=1.0)
+        probe = np.array([[0.8, 0.5, 0.5]])
+        moved = np.array([[0.5, 0.8, 0.5]])
+        
+        solver.push_density(solver.deposit(self.SOURCE, self.MASS))
+        before = solver.accelerations(probe)
+        for step in range(14):
+            solver.push_density(solver.deposit(moved, self.MASS))
+            if step < 4:
+                np.testing.assert_allclose(solver.accelerations(probe), before, atol=1e-9)
+        
+        instant.push_density(instant.deposit(moved, self.MASS))
+        np.testing.assert_allclose(solver.accelerations(probe), instant.accelerations(probe), atol=1e-9)
+    
+    @pytest.mark.filterwarnings('error::DeprecationWarning')
+    def test_numpy_fft_fallback(self, monkeypatch):
+        """Test that the no-SciPy FFT path matches SciPy and raises no deprecations."""
+        import infospace._fft as fft
+        
+        probe = np.array([[0.7, 0.5, 0.5]])
+        solver = RetardedPMSolver(GravitationalSpace(), 1.0, 16, dt=1.0)
+        solver.push_density(solver.deposit(self.SOURCE, self.MASS))
+        expected = solver.accelerations(probe)
+        
+        monkeypatch.setattr(fft, '_scipy_fft', None)
+        fallback = RetardedPMSolver(GravitationalSpace(), 1.0, 16, dt=1.0)
+        fallback.push_density(fallback.deposit(self.SOURCE, self.MASS))
+        np.testing.assert_allclose(fallback.accelerations(probe), expected,
+                                   rtol=1e-10, atol=1e-12 * np.abs(expected).max())
+    
+    def test_history_is_bounded(self):
+        """Test that max_history caps the delay shells and flags truncation."""
+        solver = RetardedPMSolver(GravitationalSpace(Vmax=0.01), 1.0, 16, dt=1.0, max_history=8)
+        assert solver.n_shells == 8
+        assert solver.truncated
+    
+    def test_simulation_and_snapshots(self, tmp_path):
+        """Test a short N-body run and its on-disk snapshots."""
+        rng = np.random.default_rng(0)
+        positions = rng.uniform(0.4, 0.6, (500, 3))
+        solver = RetardedPMSolver(GravitationalSpace(Vmax=1.0), 1.0, 16, dt=0.5)
+        simulation = NBodySimulation(solver, positions, np.zeros((500, 3)), masses=2e3)
+        simulation.run(6, output_dir=str(tmp_path), snapshot_every=2)
+        
+        snapshots = list(load_snapshots(str(tmp_path)))
+        assert [int(s['step']) for s in snapshots] == [0, 2, 4, 6]
+        assert snapshots[-1]['time'] == pytest.approx(3.0)
+        np.testing.assert_allclose(snapshots[-1]['positions'], simulation.positions, rtol=1e-6)
+        # The cloud contracts under its own gravity
+        spread = [np.std(s['positions']) for s in snapshots]
+        assert spread[-1] < spread[0]
+        
+        with pytest.raises(ValueError):
+            simulation.run(1, snapshot_every=1)
+
+
+class TestCoupledWaves:
+    """Tests for the coupled multi-space wave solver."""
+    
+    @staticmethod
+    def _spaces():
+        fast = HypotheticalSpace(Vmax=2*SPEED_OF_LIGHT, lambda_scale=1e-10,
+                                 rho_density=1e29, topology='extended')
+        return fast, EMSpace()
+    
+    def test_cfl_time_step(self):
+        """Test that dt follows the CFL limit of the fastest space."""
+        fast, em = self._spaces()
+        solver = CoupledWaveSolver([em, fast], (8, 8), spacing=2.0, courant=0.5)
+        assert np.isclose(solver.dt, 0.5 * 2.0 / (2*SPEED_OF_LIGHT * np.sqrt(2)))
+        with pytest.raises(ValueError):
+            CoupledWaveSolver([em], (8,), spacing=1.0, courant=1.5)
+    
+    def test_pulse_travels_at_vmax(self):
+        """Test that a right-moving pulse moves Vmax·t in each space."""
+        fast, em = self._spaces()
+        n, h = 400, 1.0
+        x = np.arange(n) * h
+        solver = CoupledWaveSolver([fast, em], (n,), h, courant=0.5)
+        for space in (fast, em):
+            pulse = np.exp(-((x - 100) / 6)**2)
+            solver.set_field(space, pulse, velocity=-space.Vmax * np.gradient(pulse, h))
+        solver.run(200)
+        for space in (fast, em):
+            peak = x[np.argmax(solver.field(space))]
+            assert abs(peak - 100 - space.Vmax * solver.time) <= 2 * h
+    
+    def test_energy_exchange_at_contacts(self):
+        """Test energy flow through a contact and exact conservation."""
+        fast, em = self._spaces()
+        n = 200
+        pulse = np.exp(-((np.arange(n) - 50) / 5.0)**2)
+        sites = np.zeros(n, dtype=bool)
+        sites[40:60] = True
+        
+        transferred = []
+        for g in (0.0, 0.3):
+            contact = ContactPoint(fast, em, coupling_strength=g)
+            solver = CoupledWaveSolver([fast, em], (n,), 1.0, contacts=[(contact, sites)])
+            solver.set_field(fast, pulse)
+            start = solver.total_energy()
+            solver.run(300)
+            assert np.isclose(solver.total_energy(), start, rtol=1e-10)
+            transferred.append(solver.energies()[1])
+        assert transferred[0] == 0.0
+        assert transferred[1] > 0.0
+    
+    def test_slabs_on_workers_match_serial(self, tmp_path):
+        """Test slab decomposition on workers and memory-mapped snapshots."""
+        fast, em = self._spaces()
+        contact = ContactPoint(fast, em, coupling_strength=0.3)
+        rng = np.random.default_rng(4)
+        shape = (12, 8, 6)
+        initial = rng.normal(size=shape)
+        sites = rng.random(shape) < 0.3
+        
+        fields = []
+        for n_workers in (0, 2):
+            with CoupledWaveSolver([fast, em], shape, 1.0, contacts=[(contact, sites)],
+                                   n_workers=n_workers, n_slabs=3,
+                                   work_dir=str(tmp_path)) as solver:
+                solver.set_field(fast, initial)
+                solver.run(12, output_dir=str(tmp_path / f'run{n_workers}'), snapshot_every=4)
+                fields.append(np.array(solver.field(em)))
+        np.testing.assert_array_equal(fields[0], fields[1])
+        
+        snapshots = list(load_field_snapshots(str(tmp_path / 'run2')))
+        assert [s['step'] for s in snapshots] == [0, 4, 8, 12]
+        assert isinstance(snapshots[-1]['fields'], np.memmap)
+        np.testing.assert_allclose(snapshots[-1]['fields'][1], fields[1], rtol=1e-6, atol=1e-6)
+
+
+class TestVacuumLattice:
+    """Tests for the vacuum phase-transition lattice."""
+    
+    def test_effective_potential(self):
+        """Test V_eff terms, stationary points and Theorem 3.1."""
+        tree = double_well(1.0, 1.0)
+        np.testing.assert_allclose(tree.stationary_points(), [-1.0, 0.0, 1.0], atol=1e-12)
+        assert tree.is_unstable(0.0) and not tree.is_unstable(1.0)
+        
+        hot = tree + thermal_correction(temperature=2.0)
+        np.testing.assert_allclose(hot.stationary_points(), [0.0], atol=1e-12)
+        tilted = tree + energy_correction(energy_density=0.1)
+        assert tilted(1.0) < tilted(-1.0)
+    
+    def test_seeded_bubble_grows_and_lowers_vmax(self):
+        """Test true-vacuum bubble expansion and the resulting Vmax map."""
+        lattice = VacuumLattice(double_well(1.0, 1.0, tilt=0.15), (48, 48),
+                                spacing=0.5, damping=0.2)
+        lattice.add_bubble((12.0, 12.0), radius=4.0)
+        start = lattice.transitioned_fraction()
+        lattice.run(60)
+        assert 2 * start < lattice.transitioned_fraction() < 1.0
+        
+        vmax = lattice.vmax_map()
+        inside = lattice.transitioned()
+        assert isinstance(vmax, VmaxField)
+        assert vmax.values[inside].max() < 0.5 * SPEED_OF_LIGHT
+        assert vmax.values[~inside].min() > vmax.values[inside].max()
+        assert vmax.Vmax == vmax.values.max()
+    
+    def test_thermal_nucleation_and_workers(self):
+        """Test nucleation records and worker-count independent noise."""
+        potential = double_well(1.0, 1.0, tilt=0.2)
+        fields = []
+        for n_workers in (0, 2):
+            with VacuumLattice(potential, (32, 32), damping=0.5, temperature=0.2, seed=1,
+                               n_workers=n_workers, n_slabs=3) as lattice:
+                lattice.run(300, detect_every=10, min_volume=8)
+                fields.append(np.array(lattice.field))
+                records = lattice.nucleations
+        np.testing.assert_array_equal(fields[0], fields[1])
+        assert len(records) >= 1
+        assert all(r['volume'] >= 8 for r in records)
+        assert [r['step'] for r in records] == sorted(r['step'] for r in records)
+    
+    def test_bubbles_wrap_periodically(self):
+        """Test that a bubble across the boundary is labelled once."""
+        lattice = VacuumLattice(double_well(1.0, 1.0, tilt=0.15), (24, 24))
+        lattice.add_bubble((0.0, 12.0), radius=4.0)
+        lattice.add_bubble((12.0, 0.0), radius=3.0, value=-1.0)
+        labels, count = lattice.bubbles()
+        assert count == 2
+        assert labels[0, 12] == labels[-1, 12]
+    
+    def test_vmax_map_drives_wave_solver(self):
+        """Test that a VmaxField replaces a space's single Vmax."""
+        lattice = VacuumLattice(double_well(1.0, 1.0, tilt=0.15), (16, 16), length_unit=1.0)
+        lattice.add_bubble((8.0, 8.0), radius=3.0)
+        vmax = lattice.vmax_map()
+        em = EMSpace()
+        solver = CoupledWaveSolver([em], (16, 16), vmax.spacing, vmax_fields={em: vmax})
+        assert np.isclose(solver.dt, 0.5 * vmax.spacing / (vmax.Vmax * np.sqrt(2)))
+        solver.set_field(em, np.random.default_rng(0).normal(size=(16, 16)))
+        solver.run(10)
+        assert np.all(np.isfinite(solver.field(em)))
+
+
+STORE_SCHEMA = {'threshold_gev': 'f8', 'collision_energy_gev': 'f8', 'run': 'i8',
+                'missing_fraction': 'f8'}
+
+
+def append_lhc_rows(task):
+    """Worker that streams simulate_lhc_collision results into a store."""
+    path, worker = task
+    with ResultStore(path).writer(chunk_rows=50) as writer:
+        for i in range(200):
+            result = simulate_lhc_collision(5.0 + (i * 37 % 200), threshold_energy_gev=10.0 + worker)
+            writer.add(dict(result, run=worker * 200 + i))
+    return writer.rows_written
+
+
+class TestResultStore:
+    """Tests for the columnar result store."""
+    
+    def _columns(self, n, seed):
+        rng = np.random.default_rng(seed)
+        return {'threshold_gev': rng.choice([10.0, 15.0, 20.0], n),
+                'collision_energy_gev': rng.uniform(0, 100, n),
+                'run': np.arange(n) + 1000 * seed,
+                'missing_fraction': rng.random(n)}
+    
+    def test_predicate_pushdown(self, tmp_path, monkeypatch):
+        """Test queries against a NumPy mask and that zone maps skip segments."""
+        store = ResultStore(str(tmp_path), STORE_SCHEMA, parameters=['threshold_gev'])
+        batches = [self._columns(500, seed) for seed in range(4)]
+        for k, batch in enumerate(batches):
+            store.append(batch, sort=k % 2 == 0)
+        far = {'threshold_gev': np.full(10, 99.0), 'collision_energy_gev': np.full(10, 500.0),
+               'run': np.arange(10), 'missing_fraction': np.zeros(10)}
+        store.append(far)
+        assert len(store) == 2010
+        
+        everything = {k: np.concatenate([b[k] for b in batches]) for k in STORE_SCHEMA}
+        where = {'threshold_gev': 15.0, 'collision_energy_gev': (20.0, 40.0)}
+        expected = ((everything['threshold_gev'] == 15.0) &
+                    (everything['collision_energy_gev'] >= 20.0) &
+                    (everything['collision_energy_gev'] <= 40.0))
+        
+        opened = []
+        original = store._open
+        monkeypatch.setattr(store, '_open', lambda segment, column: (
+            opened.append(segment['name']), original(segment, column))[1])
+        result = store.select(['run'], where)
+        assert sorted(result['run']) == sorted(everything['run'][expected])
+        assert store.segments()[-1]['name'] not in opened
+        
+        assert len(store.select(where={'collision_energy_gev': (None, -1.0)})['run']) == 0
+        with pytest.raises(ValueError):
+            ResultStore(str(tmp_path), dict(STORE_SCHEMA, extra='f4'))
+    
+    def test_compaction_and_zero_copy(self, tmp_path):
+        """Test that compaction keeps every row and yields memory-mapped columns."""
+        store = ResultStore(str(tmp_path), STORE_SCHEMA,
+                            parameters=['threshold_gev', 'collision_energy_gev'])
+        for seed in range(5):
+            store.append(self._columns(200, seed), sort=False)
+        before = store.select(where={'threshold_gev': (10.0, 15.0)})
+        
+        assert store.compact(target_rows=10 ** 6) == 4
+        assert len(store.segments()) == 1 and len(store) == 1000
+        segment = store.segments()[0]
+        assert segment['sorted']
+        assert isinstance(store.column('run'), np.memmap)
+        
+        after = store.select(where={'threshold_gev': (10.0, 15.0)})
+        assert sorted(after['run']) == sorted(before['run'])
+        view = next(store.scan(['collision_energy_gev'], {'threshold_gev': (10.0, 15.0)}))
+        assert isinstance(view['collision_energy_gev'], np.memmap)
+        
+        # Merged segments stay on disk for running scans until the retention expires
+        assert len(list((tmp_path / 'segments').iterdir())) == 6
+        store.compact(retention=0.0)
+        assert len(list((tmp_path / 'segments').iterdir())) == 1
+    
+    def test_concurrent_writers(self, tmp_path):
+        """Test appends from several processes with a background compactor."""
+        from concurrent.futures import ProcessPoolExecutor
+        
+        store = ResultStore(str(tmp_path), STORE_SCHEMA, parameters=['threshold_gev'])
+        store.start_compaction(interval=0.01, target_rows=400, retention=0.0)
+        with ProcessPoolExecutor(3) as executor:
+            written = sum(executor.map(append_lhc_rows, [(str(tmp_path), k) for k in range(6)]))
+        store.stop_compaction()
+        
+        runs = store.column('run')
+        assert written == 1200
+        assert np.array_equal(np.sort(runs), np.arange(1200))
+        rows = store.select(where={'threshold_gev': 12.0})
+        assert np.array_equal(np.sort(rows['run']), np.arange(400, 600))
+        assert np.all((rows['collision_energy_gev'] <= 12.0) == (rows['missing_fraction'] == 0))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -7,7 +7,8 @@ import numpy as np
 import sys
 sys.path.append('..')
 
-from infospace.core import EMSpace, GravitationalSpace, HypotheticalSpace, SourceSpace
+from infospace.core import (EMSpace, GravitationalSpace, HypotheticalSpace, SourceSpace,
+                            InformationSpace, LightConeIndex)
 from infospace.core.constants import SPEED_OF_LIGHT
 
 
@@ -100,6 +101,162 @@ class TestSpaceComparison:
         em = EMSpace()
         x = HypotheticalSpace(Vmax=10*SPEED_OF_LIGHT)
         assert em != x
+    
+    def test_topology_and_carrier_distinguish(self):
+        """Test that spaces differing only in topology or carrier are distinct."""
+        local = HypotheticalSpace(Vmax=10*SPEED_OF_LIGHT, topology='local')
+        extended = HypotheticalSpace(Vmax=10*SPEED_OF_LIGHT, topology='extended')
+        assert local != extended
+        assert len({local, extended}) == 2
+        assert InformationSpace(SPEED_OF_LIGHT, 1e-7, 1e20, carrier='a') != \
+            InformationSpace(SPEED_OF_LIGHT, 1e-7, 1e20, carrier='b')
+        
+        from infospace.interactions import ContactNetwork
+        assert len(ContactNetwork([local, extended], 0.1).spaces) == 2
+
+
+class TestInterning:
+    """Tests for immutable, interned spaces."""
+    
+    def test_identity(self):
+        """Test that equal parameters give the same object."""
+        assert EMSpace() is EMSpace()
+        assert HypotheticalSpace(Vmax=10*SPEED_OF_LIGHT) is HypotheticalSpace(Vmax=10*SPEED_OF_LIGHT)
+        assert GravitationalSpace() is not GravitationalSpace(Vmax=2*SPEED_OF_LIGHT)
+    
+    def test_hashable(self):
+        """Test that spaces can key dicts and sets."""
+        table = {EMSpace(): 'em', SourceSpace(): 'source'}
+        assert table[EMSpace()] == 'em'
+        assert len({EMSpace(), EMSpace(), GravitationalSpace()}) == 2
+    
+    def test_immutable(self):
+        """Test that spaces reject attribute assignment."""
+        em = EMSpace()
+        with pytest.raises(AttributeError):
+            em.Vmax = 1.0
+        with pytest.raises(AttributeError):
+            em.extra = 1.0
+    
+    def test_derived_constants(self):
+        """Test precomputed derived constants."""
+        x_space = HypotheticalSpace(Vmax=10*SPEED_OF_LIGHT, lambda_scale=1e-15)
+        assert x_space.Vmax_sq == x_space.Vmax**2
+        assert np.isclose(x_space.inv_Vmax_sq * x_space.Vmax_sq, 1.0)
+        assert np.isclose(x_space.log10_lambda_scale, -15.0)
+        assert SourceSpace().inv_Vmax_sq == 0.0
+    
+    def test_pickle_roundtrip(self):
+        """Test that unpickling returns the interned instance."""
+        import copy
+        import pickle
+        x_space = HypotheticalSpace(Vmax=10*SPEED_OF_LIGHT, name='I_X(10c)')
+        assert pickle.loads(pickle.dumps(x_space)) is x_space
+        assert copy.deepcopy(x_space) is x_space
+
+
+class TestArrayKinematics:
+    """Tests for broadcasting metric, causality and gamma factor."""
+    
+    def test_gamma_matches_scalar(self):
+        """Test that array gamma equals the scalar path element-wise."""
+        em = EMSpace()
+        velocities = np.linspace(-0.99, 0.99, 101) * SPEED_OF_LIGHT
+        gammas = em.gamma_factor(velocities)
+        expected = np.array([em.gamma_factor(v) for v in velocities])
+        assert np.array_equal(gammas, expected)
+    
+    def test_gamma_invalid_policies(self):
+        """Test raise/nan/mask handling of super-Vmax entries."""
+        em = EMSpace()
+        velocities = np.array([0.0, 0.6, 1.0, 2.0]) * SPEED_OF_LIGHT
+        with pytest.raises(ValueError):
+            em.gamma_factor(velocities)
+        
+        gammas = em.gamma_factor(velocities, invalid='nan')
+        assert abs(gammas[1] - 1.25) < 1e-12
+        assert np.isnan(gammas[2:]).all()
+        
+        masked = em.gamma_factor(velocities, invalid='mask')
+        assert list(masked.mask) == [False, False, True, True]
+        
+        assert np.isnan(em.gamma_factor(2 * SPEED_OF_LIGHT, invalid='nan'))
+        with pytest.raises(ValueError):
+            em.gamma_factor(velocities, invalid='ignore')
+    
+    @pytest.mark.parametrize('velocity', [np.nan, np.array([0.0, np.nan])])
+    def test_gamma_nan_velocity(self, velocity):
+        """Test that NaN follows the invalid policy on the scalar and array paths."""
+        em = EMSpace()
+        with pytest.raises(ValueError):
+            em.gamma_factor(velocity)
+        assert np.isnan(em.gamma_factor(velocity, invalid='nan')).any()
+        masked = em.gamma_factor(velocity, invalid='mask')
+        assert np.ma.getmaskarray(masked).ravel()[-1]
+    
+    def test_metric_and_causality_broadcast(self):
+        """Test that metric and causality broadcast over arrays."""
+        em = EMSpace()
+        dt = np.array([0.5, 1.0, 2.0])
+        ds2 = em.metric_signature(dt, SPEED_OF_LIGHT, 0, 0)
+        assert ds2.shape == (3,)
+        assert ds2[0] > 0 and ds2[2] < 0
+        assert list(em.is_causal(dt, SPEED_OF_LIGHT)) == [False, False, True]
+    
+    def test_source_space_array_causality(self):
+        """Test that I_0 returns an all-True boolean array."""
+        i0 = SourceSpace()
+        result = i0.is_causal(np.zeros((2, 3)), 1e10)
+        assert result.dtype == bool
+        assert result.shape == (2, 3)
+        assert result.all()
+
+
+class TestLightConeIndex:
+    """Tests for batch light-cone queries."""
+    
+    @staticmethod
+    def _events(n=400, seed=3):
+        rng = np.random.default_rng(seed)
+        times = rng.uniform(0, 1.0, n)
+        positions = rng.uniform(-1, 1, (n, 3)) * SPEED_OF_LIGHT
+        return times, positions
+    
+    def test_counts_match_is_causal(self):
+        """Test counts for several spaces against brute force."""
+        times, positions = self._events()
+        index = LightConeIndex(times, positions, leaf_size=8)
+        spaces = [EMSpace(), GravitationalSpace(Vmax=0.5*SPEED_OF_LIGHT),
+                  HypotheticalSpace(Vmax=10*SPEED_OF_LIGHT)]
+        
+        counts = index.count(spaces, direction='past')
+        dt = times[:, None] - times[None, :]
+        dx = np.linalg.norm(positions[:, None, :] - positions[None, :, :], axis=2)
+        for k, space in enumerate(spaces):
+            expected = np.sum(space.is_causal(dt, dx), axis=1)
+            np.testing.assert_array_equal(counts[:, k], expected)
+    
+    def test_past_future_symmetry(self):
+        """Test that past and future adjacency are transposes."""
+        times, positions = self._events(200)
+        index = LightConeIndex(times, positions, leaf_size=4)
+        future = set(zip(*index.pairs(EMSpace(), direction='future')))
+        past = set(zip(*index.pairs(EMSpace(), direction='past')))
+        assert future == {(j, i) for i, j in past}
+        
+        both = index.count([EMSpace()], direction='both')[:, 0]
+        assert both.sum() == 2 * len(future)
+        cone = index.cone(7, EMSpace(), direction='future')
+        assert list(cone) == sorted(j for i, j in future if i == 7)
+    
+    def test_source_space_shortcut(self):
+        """Test that I_0 connects every pair of events."""
+        times, positions = self._events(50)
+        index = LightConeIndex(times, positions)
+        counts = index.count([SourceSpace(), EMSpace()], queries=[0, 1])
+        np.testing.assert_array_equal(counts[:, 0], 49)
+        assert np.all(counts[:, 1] < 49)
+        assert len(index.cone(0, SourceSpace())) == 49
 
 
 if __name__ == '__main__':
@@ -0,0 +1,144 @@
+"""
+Unit tests for transformations between information spaces.
+"""
+
+import pytest
+import numpy as np
+import sys
+sys.path.append('..')
+
+from infospace.core import EMSpace, HypotheticalSpace, Energy, EnergyArray
+from infospace.core.constants import SPEED_OF_LIGHT
+from infospace.transforms import LorentzTransform, BatchedLorentzTransform, compose_transforms
+from infospace.transforms import ProjectionOperator
+from infospace.interactions import ContactPoint
+
+
+class TestBatchedLorentzTransform:
+    """Tests for batched Lorentz boosts."""
+    
+    def test_matches_scalar_transforms(self):
+        """Test that each batch entry matches a scalar LorentzTransform."""
+        em = EMSpace()
+        velocities = np.array([-0.5, 0.1, 0.9]) * SPEED_OF_LIGHT
+        batch = BatchedLorentzTransform(em, velocities)
+        
+        x, t = 3.0e8, 2.0
+        x_b, t_b = batch.transform_position(x, t)
+        for i, v in enumerate(velocities):
+            x_s, t_s = LorentzTransform(em, v).transform_position(x, t)
+            assert np.isclose(x_b[i], x_s) and np.isclose(t_b[i], t_s)
+            assert np.isclose(batch.transform_velocity(0.3 * SPEED_OF_LIGHT)[i],
+                              LorentzTransform(em, v).transform_velocity(0.3 * SPEED_OF_LIGHT))
+    
+    def test_transform_events(self):
+        """Test pairwise and outer event transforms against the matrices."""
+        em = EMSpace()
+        rng = np.random.default_rng(0)
+        batch = BatchedLorentzTransform(em, rng.uniform(-0.9, 0.9, 5) * SPEED_OF_LIGHT)
+        events = rng.normal(size=(5, 4)) * [1.0, SPEED_OF_LIGHT, 1.0, 1.0]
+        
+        expected = np.einsum('nij,nj->ni', batch.matrices, events)
+        assert np.allclose(batch.transform_events(events), expected)
+        
+        outer = batch.transform_events_outer(events[:3])
+        assert outer.shape == (5, 3, 4)
+        assert np.allclose(outer[2, 1], batch.matrices[2] @ events[1])
+    
+    def test_interval_invariant(self):
+        """Test that boosts preserve the spacetime interval."""
+        x_space = HypotheticalSpace(Vmax=10 * SPEED_OF_LIGHT)
+        batch = BatchedLorentzTransform(x_space, [2 * SPEED_OF_LIGHT, -7 * SPEED_OF_LIGHT])
+        event = np.array([1.0, 5e8, 1.0, 2.0])
+        boosted = batch.transform_events(event)
+        ds2 = x_space.metric_signature(*event)
+        assert np.allclose(x_space.metric_signature(*boosted.T), ds2)
+    
+    def test_rejects_super_vmax(self):
+        """Test that boosts at or above Vmax are rejected."""
+        with pytest.raises(ValueError):
+            BatchedLorentzTransform(EMSpace(), [0.5 * SPEED_OF_LIGHT, SPEED_OF_LIGHT])
+
+
+class TestComposition:
+    """Tests for composing Lorentz transformations."""
+    
+    def test_two_transforms_velocity_addition(self):
+        """Test that composing two boosts gives relativistic velocity addition."""
+        em = EMSpace()
+        composed = compose_transforms(LorentzTransform(em, 0.5 * SPEED_OF_LIGHT),
+                                      LorentzTransform(em, 0.5 * SPEED_OF_LIGHT))
+        assert np.isclose(composed.v, 0.8 * SPEED_OF_LIGHT)
+    
+    def test_chain_matches_batch(self):
+        """Test that chained composition matches the batched reduction."""
+        em = EMSpace()
+        velocities = np.full(1000, 0.01 * SPEED_OF_LIGHT)
+        batch = BatchedLorentzTransform(em, velocities)
+        chained = compose_transforms(*[LorentzTransform(em, v) for v in velocities[:10]])
+        
+        assert np.isclose(batch.cumulative().v[9], chained.v)
+        assert np.isclose(batch.compose().rapidity, batch.rapidity.sum())
+        assert batch.compose().v < SPEED_OF_LIGHT
+    
+    def test_mixed_spaces_rejected(self):
+        """Test that transforms from different spaces cannot be composed."""
+        with pytest.raises(ValueError):
+            compose_transforms(LorentzTransform(EMSpace(), 0.0),
+                               LorentzTransform(HypotheticalSpace(Vmax=10 * SPEED_OF_LIGHT), 0.0))
+
+
+class TestArrayProjection:
+    """Test array and streaming projections."""
+    
+    @pytest.fixture
+    def projection(self):
+        return ProjectionOperator(HypotheticalSpace(Vmax=10 * SPEED_OF_LIGHT), EMSpace())
+    
+    def test_matches_scalar(self, projection):
+        """Test that array projections match the scalar methods element-wise."""
+        velocities = np.array([-20.0, -0.5, 0.0, 0.5, 3.0]) * SPEED_OF_LIGHT
+        
+        projected = projection.project_velocity(velocities)
+        loss = projection.information_loss(velocities)
+        for k, v in enumerate(velocities):
+            assert projected[k] == pytest.approx(projection.project_velocity(float(v)))
+            assert loss[k] == pytest.approx(projection.information_loss(float(v)))
+        
+        scales = np.array([1e-20, 1e-7, 1e-3])
+        assert projection.is_observable(scales).tolist() == [projection.is_observable(s) for s in scales]
+    
+    def test_project_energy_array(self, projection):
+        """Test projecting an EnergyArray through a contact point."""
+        x_space = projection.source
+        contact = ContactPoint(x_space, EMSpace(), coupling_strength=0.5)
+        energies = EnergyArray(x_space, np.array([1.0, 2.0, 4.0]))
+        
+        projected = projection.project_energy(energies, contact)
+        assert projected.space == EMSpace()
+        expected = projection.project_energy(Energy(x_space, 2.0), contact).carrier_energy
+        assert projected.carrier_energies[1] == pytest.approx(expected)
+    
+    def test_stream(self, projection):
+        """Test chunked projection and its running loss statistics."""
+        rng = np.random.default_rng(0)
+        velocities = rng.uniform(-5, 5, 1000) * SPEED_OF_LIGHT
+        
+        outputs = list(projection.project_stream(np.array_split(velocities, 7)))
+        projected = np.concatenate([chunk for chunk, _ in outputs])
+        stats = outputs[-1][1]
+        
+        assert np.array_equal(projected, projection.project_velocity(velocities))
+        assert stats.n == 1000
+        assert stats.mean_loss == pytest.approx(projection.information_loss(velocities).mean())
+        assert stats.lossy_fraction == pytest.approx(np.mean(np.abs(velocities) > SPEED_OF_LIGHT))
+        assert outputs[0][1].n < stats.n
+    
+    def test_stream_rejects_unknown_quantity(self, projection):
+        """Test that streaming an unknown quantity raises ValueError."""
+        with pytest.raises(ValueError):
+            next(projection.project_stream([np.ones(3)], quantity='momentum'))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -4,10 +4,13 @@ Transformations between information spaces.
 Includes Lorentz transformations and projection operators.
 """
 
-from .lorentz import LorentzTransform
-from .projection import ProjectionOperator
+from .lorentz import LorentzTransform, BatchedLorentzTransform, compose_transforms
+from .projection import ProjectionOperator, ProjectionStats
 
 __all__ = [
     'LorentzTransform',
+    'BatchedLorentzTransform',
+    'compose_transforms',
     'ProjectionOperator',
+    'ProjectionStats',
 ]
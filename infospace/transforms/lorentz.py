@@ -5,7 +5,10 @@ Generalized Lorentz transformations with Vmax as parameter.
 """
 
 import numpy as np
-from typing import Tuple
+from typing import Sequence, Tuple, Union
+
+
+ArrayLike = Union[float, np.ndarray]
 
 
 class LorentzTransform:
@@ -52,7 +55,7 @@ class LorentzTransform:
             (x', t') in transformed frame
         """
         x_prime = self.gamma * (x - self.v * t)
-        t_prime = self.gamma * (t - self.v * x / self.space.Vmax**2)
+        t_prime = self.gamma * (t - self.v * x / self.space.Vmax_sq)
         return x_prime, t_prime
     
     def transform_velocity(self, u: float) -> float:
@@ -68,7 +71,7 @@ class LorentzTransform:
             Velocity in transformed frame (m/s)
         """
         numerator = u - self.v
-        denominator = 1 - (u * self.v) / self.space.Vmax**2
+        denominator = 1 - (u * self.v) / self.space.Vmax_sq
         return numerator / denominator
     
     def transform_momentum(self, p: float, E: float) -> Tuple[float, float]:
@@ -85,10 +88,28 @@ class LorentzTransform:
         Returns:
             (p', E') in transformed frame
         """
-        p_prime = self.gamma * (p - self.v * E / self.space.Vmax**2)
+        p_prime = self.gamma * (p - self.v * E / self.space.Vmax_sq)
         E_prime = self.gamma * (E - self.v * p)
         return p_prime, E_prime
     
+    @property
+    def rapidity(self) -> float:
+        """
+        Rapidity φ = artanh(v/Vmax).
+        
+        Rapidities of collinear boosts add under composition.
+        """
+        return float(np.arctanh(self.beta))
+    
+    def matrix(self) -> np.ndarray:
+        """
+        Get the 4x4 boost matrix acting on (t, x, y, z) event vectors.
+        
+        Returns:
+            Boost matrix
+        """
+        return _boost_matrices(np.array([self.v]), self.gamma, self.space)[0]
+    
     def inverse(self) -> 'LorentzTransform':
         """
         Get inverse transformation.
@@ -102,26 +123,260 @@ class LorentzTransform:
         return f"LorentzTransform(space={self.space.name}, v={self.v:.2e}, γ={self.gamma:.4f})"
 
 
+class BatchedLorentzTransform:
+    """
+    N collinear Lorentz boosts (along x) in one information space.
+    
+    Boosts are stored as velocity, gamma and rapidity arrays, so event
+    arrays are transformed in a single vectorized call instead of building
+    one LorentzTransform per boost. Events are (t, x, y, z) rows.
+    """
+    
+    def __init__(self, space: 'InformationSpace', velocities: ArrayLike):
+        """
+        Initialize a batch of Lorentz transformations.
+        
+        Args:
+            space: Information space
+            velocities: Relative velocities between frames (m/s), shape (N,)
+        """
+        from ..core.space import InformationSpace
+        
+        if not isinstance(space, InformationSpace):
+            raise TypeError("space must be an InformationSpace instance")
+        
+        velocities = np.atleast_1d(np.asarray(velocities, dtype=float))
+        if velocities.ndim != 1:
+            raise ValueError("velocities must be a 1-D array")
+        
+        self.space = space
+        self.v = velocities
+        self.gamma = space.gamma_factor(velocities)
+        self.beta = velocities / space.Vmax
+    
+    @classmethod
+    def from_rapidities(cls, space: 'InformationSpace',
+                        rapidities: ArrayLike) -> 'BatchedLorentzTransform':
+        """
+        Build a batch from rapidities φ, with v = Vmax·tanh(φ).
+        
+        Args:
+            space: Information space
+            rapidities: Boost rapidities, shape (N,)
+            
+        Returns:
+            Batched transformation
+        """
+        return cls(space, _rapidity_to_velocity(np.asarray(rapidities, dtype=float), space.Vmax))
+    
+    @classmethod
+    def from_transforms(cls, transforms: Sequence[LorentzTransform]) -> 'BatchedLorentzTransform':
+        """
+        Stack individual transformations sharing one space.
+        
+        Args:
+            transforms: Lorentz transformations
+            
+        Returns:
+            Batched transformation
+        """
+        if len(transforms) == 0:
+            raise ValueError("Need at least one transform")
+        space = transforms[0].space
+        if any(t.space != space for t in transforms[1:]):
+            raise ValueError("Transforms must be in the same space")
+        return cls(space, np.array([t.v for t in transforms]))
+    
+    @property
+    def rapidity(self) -> np.ndarray:
+        """Rapidities φ = artanh(v/Vmax), shape (N,)."""
+        return np.arctanh(self.beta)
+    
+    @property
+    def matrices(self) -> np.ndarray:
+        """Stacked boost matrices acting on (t, x, y, z), shape (N, 4, 4)."""
+        return _boost_matrices(self.v, self.gamma, self.space)
+    
+    def transform_position(self, x: ArrayLike, t: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Transform position coordinates, broadcasting against the N boosts.
+        
+        Args:
+            x: Positions in original frame (m)
+            t: Times in original frame (s)
+            
+        Returns:
+            (x', t') in transformed frames
+        """
+        x = np.asarray(x, dtype=float)
+        t = np.asarray(t, dtype=float)
+        x_prime = self.gamma * (x - self.v * t)
+        t_prime = self.gamma * (t - self.v * x * self.space.inv_Vmax_sq)
+        return x_prime, t_prime
+    
+    def transform_velocity(self, u: ArrayLike) -> np.ndarray:
+        """
+        Transform velocities, broadcasting against the N boosts.
+        
+        u' = (u - v) / (1 - uv/Vmax²)
+        
+        Args:
+            u: Velocities in original frame (m/s)
+            
+        Returns:
+            Velocities in transformed frames (m/s)
+        """
+        u = np.asarray(u, dtype=float)
+        return (u - self.v) / (1 - (u * self.v) * self.space.inv_Vmax_sq)
+    
+    def transform_momentum(self, p: ArrayLike, E: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Transform momenta and energies, broadcasting against the N boosts.
+        
+        Args:
+            p: Momenta in original frame (kg·m/s)
+            E: Energies in original frame (J)
+            
+        Returns:
+            (p', E') in transformed frames
+        """
+        p = np.asarray(p, dtype=float)
+        E = np.asarray(E, dtype=float)
+        p_prime = self.gamma * (p - self.v * E * self.space.inv_Vmax_sq)
+        E_prime = self.gamma * (E - self.v * p)
+        return p_prime, E_prime
+    
+    def transform_events(self, events: np.ndarray) -> np.ndarray:
+        """
+        Apply boost i to event i.
+        
+        Args:
+            events: (t, x, y, z) rows, shape (N, 4), or a single (4,) event
+                transformed by every boost
+            
+        Returns:
+            Transformed events, shape (N, 4)
+        """
+        events = np.asarray(events, dtype=float)
+        if events.shape not in ((4,), (len(self), 4)):
+            raise ValueError(f"events must have shape (4,) or ({len(self)}, 4), got {events.shape}")
+        return self._boost(np.broadcast_to(events, (len(self), 4)), self.v, self.gamma)
+    
+    def transform_events_outer(self, events: np.ndarray) -> np.ndarray:
+        """
+        Apply every boost to every event.
+        
+        The result holds N·M·4 floats; split long event arrays into chunks
+        if that does not fit in memory.
+        
+        Args:
+            events: (t, x, y, z) rows, shape (M, 4)
+            
+        Returns:
+            Transformed events, shape (N, M, 4)
+        """
+        events = np.asarray(events, dtype=float)
+        if events.ndim != 2 or events.shape[1] != 4:
+            raise ValueError(f"events must have shape (M, 4), got {events.shape}")
+        return self._boost(events[np.newaxis, :, :], self.v[:, np.newaxis],
+                           self.gamma[:, np.newaxis])
+    
+    def _boost(self, events: np.ndarray, v: np.ndarray, gamma: np.ndarray) -> np.ndarray:
+        t = events[..., 0]
+        x = events[..., 1]
+        out = np.empty(np.broadcast(events, v[..., np.newaxis]).shape)
+        out[..., 0] = gamma * (t - v * x * self.space.inv_Vmax_sq)
+        out[..., 1] = gamma * (x - v * t)
+        out[..., 2:] = events[..., 2:]
+        return out
+    
+    def compose(self) -> LorentzTransform:
+        """
+        Compose the whole batch into one transformation.
+        
+        Returns:
+            Transformation whose rapidity is the sum of the batch rapidities
+        """
+        return LorentzTransform(self.space, _compose_velocities(self.v, self.space.Vmax))
+    
+    def cumulative(self) -> 'BatchedLorentzTransform':
+        """
+        Running compositions: boost k is the composition of boosts 0..k.
+        
+        Returns:
+            Batched transformation of partial compositions
+        """
+        if not np.isfinite(self.space.Vmax):
+            return BatchedLorentzTransform(self.space, np.cumsum(self.v))
+        return BatchedLorentzTransform.from_rapidities(self.space, np.cumsum(self.rapidity))
+    
+    def inverse(self) -> 'BatchedLorentzTransform':
+        """
+        Get inverse transformations.
+        
+        Returns:
+            Batched transformation with -v
+        """
+        return BatchedLorentzTransform(self.space, -self.v)
+    
+    def __len__(self) -> int:
+        return len(self.v)
+    
+    def __getitem__(self, index):
+        if np.ndim(index) == 0 and not isinstance(index, slice):
+            return LorentzTransform(self.space, float(self.v[index]))
+        return BatchedLorentzTransform(self.space, self.v[index])
+    
+    def __repr__(self) -> str:
+        return f"BatchedLorentzTransform(space={self.space.name}, n={len(self)})"
+
+
+def _boost_matrices(v: np.ndarray, gamma: ArrayLike, space: 'InformationSpace') -> np.ndarray:
+    """Stack (N, 4, 4) x-boost matrices for (t, x, y, z) event vectors."""
+    matrices = np.zeros((len(v), 4, 4))
+    matrices[:, 0, 0] = gamma
+    matrices[:, 0, 1] = -gamma * v * space.inv_Vmax_sq
+    matrices[:, 1, 0] = -gamma * v
+    matrices[:, 1, 1] = gamma
+    matrices[:, 2, 2] = 1.0
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+def _rapidity_to_velocity(rapidity: ArrayLike, Vmax: float) -> ArrayLike:
+    return Vmax * np.tanh(rapidity)
+
+
+def _compose_velocities(velocities: np.ndarray, Vmax: float) -> float:
+    """Compose collinear velocities by summing rapidities."""
+    if not np.isfinite(Vmax):
+        # No speed limit: composition is Galilean
+        return float(np.sum(velocities))
+    return float(_rapidity_to_velocity(np.sum(np.arctanh(velocities / Vmax)), Vmax))
+
+
 def compose_transforms(transform1: LorentzTransform, 
-                       transform2: LorentzTransform) -> LorentzTransform:
+                       transform2: LorentzTransform,
+                       *more: LorentzTransform) -> LorentzTransform:
     """
-    Compose two Lorentz transformations.
+    Compose a chain of Lorentz transformations.
+    
+    The chain is reduced by adding rapidities, so only the final
+    transformation is constructed. For two transforms this is the
+    velocity addition formula v = (v1 + v2) / (1 + v1·v2/Vmax²).
     
     Args:
         transform1: First transformation
         transform2: Second transformation
+        *more: Further transformations in the chain
         
     Returns:
         Composed transformation
     """
-    if transform1.space != transform2.space:
+    transforms = (transform1, transform2) + more
+    space = transform1.space
+    if any(t.space != space for t in transforms[1:]):
         raise ValueError("Transforms must be in the same space")
     
-    # Velocity addition formula
-    v1 = transform1.v
-    v2 = transform2.v
-    Vmax = transform1.space.Vmax
-    
-    v_total = (v1 + v2) / (1 + v1 * v2 / Vmax**2)
-    
-    return LorentzTransform(transform1.space, v_total)
+    velocities = np.array([t.v for t in transforms])
+    return LorentzTransform(space, _compose_velocities(velocities, space.Vmax))
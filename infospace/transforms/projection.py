@@ -5,7 +5,57 @@ Projects phenomena from one space to another, implementing the measurement filte
 """
 
 import numpy as np
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+
+ArrayLike = Union[float, np.ndarray]
+
+
+class ProjectionStats:
+    """
+    Running statistics of a projected stream.
+    
+    Tracks sample counts, information loss and the summed magnitude going
+    into and coming out of the projection, in constant memory.
+    """
+    
+    def __init__(self):
+        self.n = 0
+        self.n_lossy = 0
+        self.sum_loss = 0.0
+        self.max_loss = 0.0
+        self.sum_in = 0.0
+        self.sum_out = 0.0
+    
+    def update(self, loss: np.ndarray, magnitude_in: np.ndarray, magnitude_out: np.ndarray) -> None:
+        """Add one chunk of per-sample losses and magnitudes."""
+        loss = np.asarray(loss, dtype=float)
+        self.n += loss.size
+        self.n_lossy += int(np.count_nonzero(loss > 0))
+        self.sum_loss += float(np.sum(loss))
+        if loss.size:
+            self.max_loss = max(self.max_loss, float(np.max(loss)))
+        self.sum_in += float(np.sum(magnitude_in))
+        self.sum_out += float(np.sum(magnitude_out))
+    
+    @property
+    def mean_loss(self) -> float:
+        """Mean information loss per sample."""
+        return self.sum_loss / self.n if self.n else 0.0
+    
+    @property
+    def lossy_fraction(self) -> float:
+        """Fraction of samples that lost information."""
+        return self.n_lossy / self.n if self.n else 0.0
+    
+    def copy(self) -> 'ProjectionStats':
+        stats = ProjectionStats()
+        stats.__dict__.update(self.__dict__)
+        return stats
+    
+    def __repr__(self) -> str:
+        return (f"ProjectionStats(n={self.n}, mean_loss={self.mean_loss:.3e}, "
+                f"lossy={self.lossy_fraction:.3%})")
 
 
 class ProjectionOperator:
@@ -31,67 +81,75 @@ class ProjectionOperator:
             raise TypeError("source_space must be an InformationSpace instance")
         if not isinstance(target_space, InformationSpace):
             raise TypeError("target_space must be an InformationSpace instance")
-            
+        
         self.source = source_space
         self.target = target_space
     
-    def project_velocity(self, v_real: float) -> float:
+    def project_velocity(self, v_real: ArrayLike) -> ArrayLike:
         """
         Project velocity from source to target space.
         
         v_measured = min(v_real, Vmax_target)
         
         Args:
-            v_real: Real velocity in source space (m/s)
-            
+            v_real: Real velocity in source space (m/s), scalar or array
+        
         Returns:
             Measured velocity in target space (m/s)
         """
+        if np.ndim(v_real) > 0:
+            v_real = np.asarray(v_real, dtype=float)
+            return np.minimum(np.abs(v_real), self.target.Vmax) * np.sign(v_real)
         return min(abs(v_real), self.target.Vmax) * np.sign(v_real)
     
-    def information_loss(self, v_real: float) -> float:
+    def information_loss(self, v_real: ArrayLike) -> ArrayLike:
         """
         Calculate information loss in projection.
         
         If v_real > Vmax_target, information is lost.
         
         Args:
-            v_real: Real velocity (m/s)
-            
+            v_real: Real velocity (m/s), scalar or array
+        
         Returns:
             Information loss factor (0 = no loss, 1 = complete loss)
         """
+        if np.ndim(v_real) > 0:
+            speed = np.abs(np.asarray(v_real, dtype=float))
+            with np.errstate(divide='ignore'):
+                return np.where(speed <= self.target.Vmax, 0.0, 1.0 - self.target.Vmax / speed)
+        
         if abs(v_real) <= self.target.Vmax:
             return 0.0
         else:
             # Information about true speed is lost
             return 1.0 - self.target.Vmax / abs(v_real)
     
-    def project_energy(self, energy_source: 'Energy', 
-                      contact_point: Optional['ContactPoint'] = None) -> 'Energy':
+    def project_energy(self, energy_source: Union['Energy', 'EnergyArray'],
+                      contact_point: Optional['ContactPoint'] = None) -> Union['Energy', 'EnergyArray']:
         """
         Project energy from source to target space.
         
         Requires a contact point for energy conversion.
         
         Args:
-            energy_source: Energy in source space
+            energy_source: Energy or EnergyArray in source space
             contact_point: Contact point for transition (optional)
-            
+        
         Returns:
-            Energy in target space
+            Energy (or EnergyArray) in target space
         """
-        from ..core.energy import Energy
+        from ..core.energy import Energy, EnergyArray
         
         if energy_source.space != self.source:
             raise ValueError("Energy must be in source space")
         
-        if contact_point is None:
-            # No contact point - assume perfect projection
-            efficiency = 1.0
-        else:
-            # Use contact point efficiency
-            efficiency = contact_point.transition_efficiency()
+        efficiency = self._efficiency(contact_point)
+        
+        if isinstance(energy_source, EnergyArray):
+            if energy_source.carrier_energies is None:
+                return EnergyArray(self.target, None)
+            return EnergyArray(self.target, energy_source.carrier_energies * efficiency)
         
         # Convert energy
         if energy_source.carrier_energy is None:
@@ -100,18 +158,59 @@ class ProjectionOperator:
         converted_energy = energy_source.carrier_energy * efficiency
         return Energy(self.target, converted_energy)
     
-    def is_observable(self, phenomenon_scale: float) -> bool:
+    def _efficiency(self, contact_point: Optional['ContactPoint']) -> float:
+        if contact_point is None:
+            # No contact point - assume perfect projection
+            return 1.0
+        # Use contact point efficiency
+        return contact_point.transition_efficiency()
+    
+    def project_stream(self, chunks: Iterable[np.ndarray], quantity: str = 'velocity',
+                       contact_point: Optional['ContactPoint'] = None
+                       ) -> Iterator[Tuple[np.ndarray, ProjectionStats]]:
+        """
+        Project an arbitrarily long stream chunk by chunk.
+        
+        Only one chunk is held at a time, so memory stays constant.
+        
+        Args:
+            chunks: Iterable of arrays of source-space velocities (m/s) or
+                energies (J)
+            quantity: 'velocity' or 'energy'
+            contact_point: Contact point for energy projection (optional)
+        
+        Yields:
+            (projected chunk, snapshot of running ProjectionStats)
+        """
+        if quantity not in ('velocity', 'energy'):
+            raise ValueError(f"quantity must be 'velocity' or 'energy', got {quantity!r}")
+        
+        stats = ProjectionStats()
+        efficiency = self._efficiency(contact_point)
+        
+        for chunk in chunks:
+            chunk = np.asarray(chunk, dtype=float)
+            if quantity == 'velocity':
+                projected = self.project_velocity(np.atleast_1d(chunk))
+                stats.update(self.information_loss(np.atleast_1d(chunk)),
+                             np.abs(chunk), np.abs(projected))
+            else:
+                projected = chunk * efficiency
+                stats.update(np.full(chunk.size, 1.0 - efficiency), chunk, projected)
+            yield projected, stats.copy()
+    
+    def is_observable(self, phenomenon_scale: ArrayLike) -> Union[bool, np.ndarray]:
         """
         Check if phenomenon at given scale is observable in target space.
         
         Args:
-            phenomenon_scale: Characteristic scale of phenomenon (m)
-            
+            phenomenon_scale: Characteristic scale of phenomenon (m), scalar or array
+        
         Returns:
-            True if observable
+            True if observable (boolean array for array input)
         """
         # Phenomenon must be compatible with target space scale
-        scale_ratio = abs(np.log10(phenomenon_scale / self.target.lambda_scale))
+        scale_ratio = abs(np.log10(phenomenon_scale) - self.target.log10_lambda_scale)
         
         # Observable if within ~5 orders of magnitude
         return scale_ratio < 5.0
@@ -122,7 +221,7 @@ class ProjectionOperator:
         
         Args:
             dimensions: Number of spacetime dimensions (default 4)
-            
+        
         Returns:
             Projection matrix
         """